@@ -6,43 +6,18 @@ Subpackages organized by function:
 - Parsers: parsers/ (markdown, yaml, notion)
 - Formatters: formatters/ (adf, markdown)
 - Infrastructure: async_base/, cache/, config/
-"""
-
-# Trackers
-# Infrastructure - Cache
-from .asana import AsanaAdapter
-from .cache import (
-    CacheBackend,
-    CacheEntry,
-    CacheKeyBuilder,
-    CacheManager,
-    CacheStats,
-    FileCache,
-    MemoryCache,
-)
 
-# Infrastructure - Config
-from .config import EnvironmentConfigProvider
-from .formatters import ADFFormatter
-from .jira import BatchOperation, BatchResult, JiraAdapter, JiraBatchClient
-
-# LLM Providers (optional, requires anthropic/openai/google-generativeai)
-from .llm import (
-    LLMConfig,
-    LLMManager,
-    LLMMessage,
-    LLMProvider,
-    LLMResponse,
-    LLMRole,
-    create_llm_manager,
-)
+Exports are resolved lazily (PEP 562): ``from spectryn.adapters import
+JiraAdapter`` imports the Jira adapter only, not every tracker, LLM
+provider and server this package re-exports.
+"""
 
-# Parsers & Formatters
-from .parsers import MarkdownParser
+import importlib
+from typing import TYPE_CHECKING, Any
 
 
-# Infrastructure - Async (optional, requires aiohttp)
-try:
+if TYPE_CHECKING:
+    from .asana import AsanaAdapter
     from .async_base import (
         AsyncHttpClient,
         AsyncRateLimiter,
@@ -52,28 +27,119 @@ try:
         gather_with_limit,
         run_parallel,
     )
+    from .cache import (
+        CacheBackend,
+        CacheEntry,
+        CacheKeyBuilder,
+        CacheManager,
+        CacheStats,
+        FileCache,
+        MemoryCache,
+    )
+    from .config import EnvironmentConfigProvider
+    from .formatters import ADFFormatter
+    from .jira import BatchOperation, BatchResult, JiraAdapter, JiraBatchClient
+    from .llm import (
+        LLMConfig,
+        LLMManager,
+        LLMMessage,
+        LLMProvider,
+        LLMResponse,
+        LLMRole,
+        create_llm_manager,
+    )
+    from .parsers import MarkdownParser
+    from .resilience import (
+        CircuitBreaker,
+        ResilienceManager,
+        RetryPolicy,
+        SlidingWindowRateLimiter,
+        TokenBucketRateLimiter,
+        create_resilience_manager,
+    )
+    from .websocket import (
+        AioHttpWebSocketServer,
+        SimpleWebSocketServer,
+        SyncEventBroadcaster,
+        WebSocketBridge,
+        create_websocket_server,
+    )
+
+
+# Exported name -> subpackage that defines it
+_EXPORTS: dict[str, str] = {
+    # Trackers
+    "AsanaAdapter": "asana",
+    "BatchOperation": "jira",
+    "BatchResult": "jira",
+    "JiraAdapter": "jira",
+    "JiraBatchClient": "jira",
+    # Infrastructure - Async (optional, requires aiohttp)
+    "AsyncHttpClient": "async_base",
+    "AsyncRateLimiter": "async_base",
+    "ParallelExecutor": "async_base",
+    "ParallelResult": "async_base",
+    "batch_execute": "async_base",
+    "gather_with_limit": "async_base",
+    "run_parallel": "async_base",
+    # Infrastructure - Cache
+    "CacheBackend": "cache",
+    "CacheEntry": "cache",
+    "CacheKeyBuilder": "cache",
+    "CacheManager": "cache",
+    "CacheStats": "cache",
+    "FileCache": "cache",
+    "MemoryCache": "cache",
+    # Infrastructure - Config
+    "EnvironmentConfigProvider": "config",
+    # LLM Providers (optional, requires anthropic/openai/google-generativeai)
+    "LLMConfig": "llm",
+    "LLMManager": "llm",
+    "LLMMessage": "llm",
+    "LLMProvider": "llm",
+    "LLMResponse": "llm",
+    "LLMRole": "llm",
+    "create_llm_manager": "llm",
+    # Parsers & Formatters
+    "ADFFormatter": "formatters",
+    "MarkdownParser": "parsers",
+    # Resilience (rate limiting, retry, circuit breaker)
+    "CircuitBreaker": "resilience",
+    "ResilienceManager": "resilience",
+    "RetryPolicy": "resilience",
+    "SlidingWindowRateLimiter": "resilience",
+    "TokenBucketRateLimiter": "resilience",
+    "create_resilience_manager": "resilience",
+    # WebSocket (real-time sync updates)
+    "AioHttpWebSocketServer": "websocket",
+    "SimpleWebSocketServer": "websocket",
+    "SyncEventBroadcaster": "websocket",
+    "WebSocketBridge": "websocket",
+    "create_websocket_server": "websocket",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import an exported adapter on first access."""
+    if name == "ASYNC_AVAILABLE":
+        try:
+            importlib.import_module(".async_base", __name__)
+            value: Any = True
+        except ImportError:
+            value = False
+    else:
+        module_name = _EXPORTS.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+
+    globals()[name] = value
+    return value
 
-    ASYNC_AVAILABLE = True
-except ImportError:
-    ASYNC_AVAILABLE = False
 
-# WebSocket (real-time sync updates)
-# Resilience (rate limiting, retry, circuit breaker)
-from .resilience import (
-    CircuitBreaker,
-    ResilienceManager,
-    RetryPolicy,
-    SlidingWindowRateLimiter,
-    TokenBucketRateLimiter,
-    create_resilience_manager,
-)
-from .websocket import (
-    AioHttpWebSocketServer,
-    SimpleWebSocketServer,
-    SyncEventBroadcaster,
-    WebSocketBridge,
-    create_websocket_server,
-)
+def __dir__() -> list[str]:
+    """List module attributes including not-yet-imported exports."""
+    return sorted(set(globals()) | set(__all__))
 
 
 __all__ = [
@@ -9,6 +9,7 @@ This module provides the foundation for API clients:
 - AsyncHttpClient: Base async HTTP client with retry and rate limiting
 - Parallel execution utilities for batch operations
 - Bounded concurrency with per-tracker limits and ordering guarantees
+- ConditionalRequestCache: ETag / Last-Modified revalidation of GET requests
 
 Requires aiohttp for async features: pip install aiohttp
 """
@@ -26,6 +27,7 @@ from .bounded_concurrency import (
     create_async_bounded_executor,
     create_bounded_executor,
 )
+from .conditional import ConditionalRequestCache
 from .http_client import AsyncHttpClient
 from .http_client_sync import BaseHttpClient
 from .parallel import (
@@ -59,6 +61,7 @@ __all__ = [
     "BaseHttpClient",
     "BoundedExecutor",
     "ConcurrencyStats",
+    "ConditionalRequestCache",
     "GitHubRateLimiter",
     "JiraRateLimiter",
     "LinearRateLimiter",
@@ -0,0 +1,190 @@
+"""
+Conditional Requests - ETag / Last-Modified revalidation for GET requests.
+
+A response cache keyed by TTL has to refetch the full payload once an
+entry expires, even when nothing changed. ConditionalRequestCache keeps
+the validators (``ETag``, ``Last-Modified``) and body of each GET response
+and lets a client send ``If-None-Match`` / ``If-Modified-Since`` on the
+next request for the same URL. A ``304 Not Modified`` reply then costs
+no body transfer and is answered from the stored body; GitHub and GitLab
+also don't count 304s against their rate limits.
+
+Usage in a client's request method:
+
+    key, cached = self._conditional_cache.prepare(method, url, kwargs)
+    response = session.request(method, url, **kwargs)
+    if response.status_code == 304 and cached is not None:
+        return self._conditional_cache.not_modified(cached)
+    result = handle(response)
+    self._conditional_cache.store(key, response, result)
+"""
+
+import logging
+import threading
+from typing import Any
+from urllib.parse import urlencode
+
+import requests
+
+from spectryn.adapters.cache import CacheBackend, MemoryCache
+
+
+# Request headers that make a GET conditional
+_CONDITIONAL_HEADERS = ("If-None-Match", "If-Modified-Since")
+
+
+class ConditionalRequestCache:
+    """
+    Validator and body store for conditional GET requests.
+
+    Entries are kept in a CacheBackend, so a persistent backend (e.g.
+    SqliteCache) carries validators across CLI runs. Stored values are
+    plain dicts and must be JSON-serializable for such backends.
+
+    Example:
+        >>> client = GitHubApiClient(
+        ...     token, owner, repo, conditional_cache=ConditionalRequestCache()
+        ... )
+        >>> client.get("repos/o/r/issues/1")  # 200, validators stored
+        >>> client.get("repos/o/r/issues/1")  # 304, stored body returned
+    """
+
+    DEFAULT_MAX_SIZE = 1000
+    DEFAULT_TTL = 24 * 3600.0  # Validators stay useful long after a TTL cache expires
+
+    def __init__(
+        self,
+        backend: CacheBackend | None = None,
+        max_size: int = DEFAULT_MAX_SIZE,
+        ttl: float | None = DEFAULT_TTL,
+    ):
+        """
+        Initialize the conditional request cache.
+
+        Args:
+            backend: Where validators and bodies are stored (defaults to an
+                in-memory LRU of max_size entries)
+            max_size: Maximum entries of the default in-memory store
+            ttl: How long a stored response can be revalidated
+        """
+        self.backend = backend or MemoryCache(max_size=max_size, default_ttl=ttl)
+        self.ttl = ttl
+        self.logger = logging.getLogger("ConditionalRequestCache")
+
+        self._lock = threading.Lock()
+        self._conditional = 0
+        self._revalidated = 0
+        self._stored = 0
+
+    @staticmethod
+    def key_for(url: str, params: Any = None) -> str:
+        """Build the cache key of a GET request."""
+        if not params:
+            return f"http:{url}"
+        if isinstance(params, dict):
+            params = sorted(params.items())
+        return f"http:{url}?{urlencode(params, doseq=True)}"
+
+    def prepare(
+        self, method: str, url: str, kwargs: dict[str, Any]
+    ) -> tuple[str | None, dict[str, Any] | None]:
+        """
+        Make a GET request conditional if a validated response is stored.
+
+        Adds ``If-None-Match`` / ``If-Modified-Since`` to ``kwargs["headers"]``.
+        Requests other than GET, and requests that already carry conditional
+        headers, are left alone.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            kwargs: Keyword arguments for ``session.request`` (modified)
+
+        Returns:
+            Tuple of the cache key (None if the request is not cacheable)
+            and the stored response it revalidates (None if there is none)
+        """
+        if method.upper() != "GET":
+            return None, None
+
+        headers = kwargs.get("headers") or {}
+        if any(name in headers for name in _CONDITIONAL_HEADERS):
+            return None, None
+
+        key = self.key_for(url, kwargs.get("params"))
+        cached = self.backend.get(key)
+        if cached is None:
+            return key, None
+
+        conditional = {}
+        if cached.get("etag"):
+            conditional["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            conditional["If-Modified-Since"] = cached["last_modified"]
+        kwargs["headers"] = {**headers, **conditional}
+        with self._lock:
+            self._conditional += 1
+        return key, cached
+
+    def not_modified(self, cached: dict[str, Any]) -> Any:
+        """
+        Answer a 304 response from the stored body.
+
+        Args:
+            cached: Stored response returned by prepare
+
+        Returns:
+            The stored response body
+        """
+        with self._lock:
+            self._revalidated += 1
+        return cached["body"]
+
+    def store(self, key: str | None, response: requests.Response, body: Any) -> None:
+        """
+        Store the validators and body of a successful GET response.
+
+        Responses without an ``ETag`` or ``Last-Modified`` header are not
+        stored, since they cannot be revalidated.
+
+        Args:
+            key: Cache key returned by prepare (None skips storing)
+            response: The HTTP response
+            body: The parsed response body
+        """
+        if key is None:
+            return
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not isinstance(etag, str):
+            etag = None
+        if not isinstance(last_modified, str):
+            last_modified = None
+        if etag is None and last_modified is None:
+            return
+
+        self.backend.set(
+            key,
+            {"etag": etag, "last_modified": last_modified, "body": body},
+            ttl=self.ttl,
+        )
+        with self._lock:
+            self._stored += 1
+
+    def clear(self) -> int:
+        """Drop every stored response."""
+        return self.backend.clear()
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Get revalidation statistics."""
+        with self._lock:
+            conditional = self._conditional
+            return {
+                "conditional": conditional,
+                "revalidated": self._revalidated,
+                "stored": self._stored,
+                "not_modified_rate": self._revalidated / conditional if conditional else 0.0,
+                "size": self.backend.size,
+            }
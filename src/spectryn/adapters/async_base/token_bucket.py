@@ -140,6 +140,17 @@ class TokenBucketRateLimiter:
 
             return False
 
+    def refund(self) -> None:
+        """
+        Return the token of a request the server did not count.
+
+        For example GitHub and GitLab don't count ``304 Not Modified``
+        responses against the rate limit.
+        """
+        with self._lock:
+            self._tokens = min(float(self.burst_size), self._tokens + 1.0)
+            self._total_requests = max(0, self._total_requests - 1)
+
     @property
     def available_tokens(self) -> float:
         """Get the current number of available tokens."""
@@ -5,6 +5,8 @@ Provides caching to reduce API calls and improve performance:
 - CacheBackend: Abstract interface for cache storage
 - MemoryCache: In-memory LRU cache with TTL support
 - FileCache: File-based persistent cache
+- SqliteCache: Single-file SQLite (WAL) persistent cache with bulk get/set
+- TieredCache: In-memory LRU over a persistent/shared backend
 - RedisCache: Redis-based distributed cache for high-concurrency environments
 - CacheManager: High-level cache management
 - MetadataCache: Smart caching for tracker metadata with aggressive TTLs
@@ -51,7 +53,7 @@ For smart metadata caching with type-specific TTLs:
 from .backend import CacheBackend, CacheEntry, CacheStats
 from .file_cache import FileCache
 from .keys import CacheKeyBuilder
-from .manager import CacheManager
+from .manager import CACHE_BACKENDS, CacheManager, create_cache_backend
 from .memory import MemoryCache
 from .metadata import (
     DEFAULT_METADATA_TTLS,
@@ -61,6 +63,9 @@ from .metadata import (
     MetadataType,
     create_metadata_cache,
 )
+from .single_flight import SingleFlight
+from .sqlite_cache import SqliteCache
+from .tiered_cache import TieredCache
 
 
 # Redis cache is optional - import only if redis is available
@@ -75,6 +80,7 @@ except ImportError:
     create_redis_cluster_cache = None  # type: ignore[misc,assignment]
 
 __all__ = [
+    "CACHE_BACKENDS",
     "DEFAULT_METADATA_TTLS",
     "CacheBackend",
     "CacheEntry",
@@ -88,6 +94,10 @@ __all__ = [
     "MetadataCacheStats",
     "MetadataType",
     "RedisCache",
+    "SingleFlight",
+    "SqliteCache",
+    "TieredCache",
+    "create_cache_backend",
     "create_metadata_cache",
     "create_redis_cache",
     "create_redis_cluster_cache",
@@ -65,7 +65,9 @@ class CacheStats:
     """
     Cache statistics.
 
-    Tracks hits, misses, and other cache metrics.
+    Tracks hits, misses, and other cache metrics. Promotions, demotions
+    and coalesced loads are only recorded by tiered caches and cache
+    managers that deduplicate concurrent fetches.
     """
 
     hits: int = 0
@@ -74,6 +76,9 @@ class CacheStats:
     deletes: int = 0
     evictions: int = 0
     expirations: int = 0
+    promotions: int = 0
+    demotions: int = 0
+    coalesced: int = 0
 
     @property
     def total_requests(self) -> int:
@@ -117,6 +122,18 @@ class CacheStats:
         """Record an expiration."""
         self.expirations += 1
 
+    def record_promotion(self) -> None:
+        """Record an entry copied up from a slower tier."""
+        self.promotions += 1
+
+    def record_demotion(self) -> None:
+        """Record an entry evicted from a faster tier that a slower one keeps."""
+        self.demotions += 1
+
+    def record_coalesced(self) -> None:
+        """Record a load that waited for another caller's fetch of the same key."""
+        self.coalesced += 1
+
     def reset(self) -> None:
         """Reset all statistics."""
         self.hits = 0
@@ -125,6 +142,9 @@ class CacheStats:
         self.deletes = 0
         self.evictions = 0
         self.expirations = 0
+        self.promotions = 0
+        self.demotions = 0
+        self.coalesced = 0
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -135,6 +155,9 @@ class CacheStats:
             "deletes": self.deletes,
             "evictions": self.evictions,
             "expirations": self.expirations,
+            "promotions": self.promotions,
+            "demotions": self.demotions,
+            "coalesced": self.coalesced,
             "total_requests": self.total_requests,
             "hit_rate": round(self.hit_rate, 4),
         }
@@ -149,6 +172,7 @@ class CacheBackend(ABC):
     - Key-value storage with optional TTL
     - Tag-based invalidation
     - Statistics tracking
+    - Bulk get/set (looping over get/set unless a backend batches them)
     """
 
     @abstractmethod
@@ -248,6 +272,40 @@ class CacheBackend(ABC):
         """Get the current number of entries in the cache."""
         ...
 
+    def get_many(self, keys: list[str]) -> dict[str, T]:
+        """
+        Get several values from the cache.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Values of the keys found and not expired, by key
+        """
+        found: dict[str, T] = {}
+        for key in keys:
+            value = self.get(key)
+            if value is not None:
+                found[key] = value
+        return found
+
+    def set_many(
+        self,
+        items: dict[str, T],
+        ttl: float | None = None,
+        tags: set[str] | None = None,
+    ) -> None:
+        """
+        Set several values in the cache.
+
+        Args:
+            items: Values to cache, by key
+            ttl: Time-to-live in seconds for every entry (None = use default)
+            tags: Optional tags applied to every entry
+        """
+        for key, value in items.items():
+            self.set(key, value, ttl=ttl, tags=tags)
+
     def get_or_set(
         self,
         key: str,
@@ -7,11 +7,16 @@ sensible defaults for different resource types.
 
 import logging
 from collections.abc import Callable
+from pathlib import Path
 from typing import Any, TypeVar
 
 from .backend import CacheBackend, CacheStats
+from .file_cache import FileCache
 from .keys import CacheKeyBuilder
 from .memory import MemoryCache
+from .single_flight import SingleFlight
+from .sqlite_cache import SqliteCache
+from .tiered_cache import TieredCache
 
 
 T = TypeVar("T")
@@ -34,6 +39,49 @@ DEFAULT_TTLS = {
 }
 
 
+# Backends selectable by name
+CACHE_BACKENDS = ("memory", "file", "sqlite", "tiered")
+
+
+def create_cache_backend(
+    kind: str = "memory",
+    path: str | Path | None = None,
+    default_ttl: float | None = 300.0,
+    max_size: int = 1000,
+) -> CacheBackend:
+    """
+    Create a cache backend by name.
+
+    Args:
+        kind: "memory", "file", "sqlite" or "tiered" (memory over sqlite)
+        path: Cache directory (file) or database file (sqlite, tiered);
+            defaults to the backend's own location under ~/.spectra
+        default_ttl: Default TTL in seconds
+        max_size: Maximum entries held in memory (memory, tiered)
+
+    Returns:
+        The cache backend
+
+    Raises:
+        ValueError: If the backend kind is unknown
+    """
+    if kind == "memory":
+        return MemoryCache(max_size=max_size, default_ttl=default_ttl)
+    if kind == "file":
+        if path is None:
+            return FileCache(default_ttl=default_ttl)
+        return FileCache(cache_dir=path, default_ttl=default_ttl)
+    if kind in ("sqlite", "tiered"):
+        if path is None:
+            sqlite = SqliteCache(default_ttl=default_ttl)
+        else:
+            sqlite = SqliteCache(db_path=path, default_ttl=default_ttl)
+        if kind == "tiered":
+            return TieredCache(sqlite, l1_max_size=max_size)
+        return sqlite
+    raise ValueError(f"Unknown cache backend: {kind!r} (expected one of {CACHE_BACKENDS})")
+
+
 class CacheManager:
     """
     High-level cache manager for API clients.
@@ -44,6 +92,7 @@ class CacheManager:
     - Convenient get/set methods
     - Invalidation helpers
     - Statistics and monitoring
+    - Coalescing of concurrent get_or_fetch calls for the same key
 
     Example:
         >>> manager = CacheManager()
@@ -63,7 +112,7 @@ class CacheManager:
 
     def __init__(
         self,
-        backend: CacheBackend | None = None,
+        backend: CacheBackend | str | None = None,
         key_builder: CacheKeyBuilder | None = None,
         ttls: dict[str, float] | None = None,
         enabled: bool = True,
@@ -72,15 +121,19 @@ class CacheManager:
         Initialize the cache manager.
 
         Args:
-            backend: Cache backend (defaults to MemoryCache)
+            backend: Cache backend, or a backend name for
+                create_cache_backend (defaults to MemoryCache)
             key_builder: Key builder (defaults to "jira" namespace)
             ttls: Custom TTLs per resource type
             enabled: Whether caching is enabled
         """
+        if isinstance(backend, str):
+            backend = create_cache_backend(backend)
         self.backend = backend or MemoryCache()
         self.keys = key_builder or CacheKeyBuilder("jira")
         self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
         self.enabled = enabled
+        self._flight = SingleFlight()
 
         self.logger = logging.getLogger("CacheManager")
 
@@ -88,6 +141,42 @@ class CacheManager:
         """Get TTL for a resource type."""
         return self.ttls.get(resource_type)
 
+    def _fetch_once(
+        self,
+        key: str,
+        get: Callable[[], T | None],
+        fetch: Callable[[], T],
+        store: Callable[[T], None],
+    ) -> T:
+        """
+        Fetch and cache a missing value, once for all concurrent callers.
+
+        Args:
+            key: Cache key the value is stored under
+            get: Reads the cached value
+            fetch: Fetches the value on a miss
+            store: Caches the fetched value
+
+        Returns:
+            The cached or fetched value
+        """
+        if not self.enabled:
+            return fetch()
+
+        def load() -> T:
+            # Another caller may have cached the value since our miss
+            cached = get()
+            if cached is not None:
+                return cached
+            data = fetch()
+            store(data)
+            return data
+
+        data, shared = self._flight.do(key, load)
+        if shared:
+            self.get_stats().record_coalesced()
+        return data
+
     # -------------------------------------------------------------------------
     # Issue Caching
     # -------------------------------------------------------------------------
@@ -168,9 +257,34 @@ class CacheManager:
         if cached is not None:
             return cached
 
-        data = fetch_fn()
-        self.set_issue(issue_key, data, fields, ttl)
-        return data
+        return self._fetch_once(
+            self.keys.issue(issue_key, fields),
+            lambda: self.get_issue(issue_key, fields),
+            fetch_fn,
+            lambda data: self.set_issue(issue_key, data, fields, ttl),
+        )
+
+    def get_issues(
+        self,
+        issue_keys: list[str],
+        fields: list[str] | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Get several cached issues in one backend call.
+
+        Args:
+            issue_keys: Issue keys
+            fields: Fields that were requested
+
+        Returns:
+            Cached issue data by issue key (missing keys are left out)
+        """
+        if not self.enabled:
+            return {}
+
+        cache_keys = {self.keys.issue(issue_key, fields): issue_key for issue_key in issue_keys}
+        cached: dict[str, dict[str, Any]] = self.backend.get_many(list(cache_keys))
+        return {cache_keys[key]: data for key, data in cached.items()}
 
     # -------------------------------------------------------------------------
     # Epic Children Caching
@@ -221,9 +335,12 @@ class CacheManager:
         if cached is not None:
             return cached
 
-        data = fetch_fn()
-        self.set_epic_children(epic_key, data, fields, ttl)
-        return data
+        return self._fetch_once(
+            self.keys.epic_children(epic_key, fields),
+            lambda: self.get_epic_children(epic_key, fields),
+            fetch_fn,
+            lambda data: self.set_epic_children(epic_key, data, fields, ttl),
+        )
 
     # -------------------------------------------------------------------------
     # Comments Caching
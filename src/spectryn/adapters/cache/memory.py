@@ -10,6 +10,7 @@ import logging
 import threading
 import time
 from collections import OrderedDict
+from collections.abc import Callable
 from typing import Any, TypeVar
 
 from .backend import CacheBackend, CacheEntry, CacheStats
@@ -41,6 +42,7 @@ class MemoryCache(CacheBackend):
         max_size: int = 1000,
         default_ttl: float | None = 300.0,  # 5 minutes default
         cleanup_interval: float = 60.0,  # Clean expired entries every 60s
+        on_evict: Callable[[str, CacheEntry], None] | None = None,
     ):
         """
         Initialize the memory cache.
@@ -49,10 +51,12 @@ class MemoryCache(CacheBackend):
             max_size: Maximum number of entries before LRU eviction
             default_ttl: Default TTL in seconds (None = no expiry)
             cleanup_interval: How often to clean expired entries (seconds)
+            on_evict: Called with the key and entry of every LRU eviction
         """
         self.max_size = max_size
         self.default_ttl = default_ttl
         self.cleanup_interval = cleanup_interval
+        self.on_evict = on_evict
 
         # OrderedDict maintains insertion order for LRU
         self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
@@ -220,9 +224,12 @@ class MemoryCache(CacheBackend):
 
         # First item is least recently used
         key = next(iter(self._cache))
+        entry = self._cache[key]
         self._delete_entry(key)
         self._stats.record_eviction()
         self.logger.debug(f"Evicted LRU entry: {key}")
+        if self.on_evict is not None:
+            self.on_evict(key, entry)
 
     def _maybe_cleanup(self) -> None:
         """Run cleanup if enough time has passed. Must hold lock."""
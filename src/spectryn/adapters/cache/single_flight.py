@@ -0,0 +1,86 @@
+"""
+Single Flight - Coalesce concurrent loads of the same cache key.
+
+When several workers miss the same key at once, each would fetch it from
+the tracker (a cache stampede). SingleFlight lets the first caller run
+the fetch while the others wait for and share its result.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from typing import Any, Generic, TypeVar
+
+
+T = TypeVar("T")
+
+
+class _Call(Generic[T]):
+    """A fetch in progress."""
+
+    __slots__ = ("done", "error", "result")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: T | None = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """
+    Runs at most one load per key at a time.
+
+    Example:
+        >>> flight = SingleFlight()
+        >>> value, shared = flight.do("issue:PROJ-1", lambda: fetch("PROJ-1"))
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no loads in flight."""
+        self._calls: dict[str, _Call[Any]] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, fn: Callable[[], T]) -> tuple[T, bool]:
+        """
+        Run ``fn`` for ``key``, or wait for the run already in flight.
+
+        Args:
+            key: Key the load is for
+            fn: Loads the value
+
+        Returns:
+            Tuple of the value and whether it came from another caller's run
+
+        Raises:
+            Exception: Whatever the run raised, in the caller and all waiters
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True  # type: ignore[return-value]
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    @property
+    def in_flight(self) -> int:
+        """Number of loads currently running."""
+        with self._lock:
+            return len(self._calls)
@@ -0,0 +1,365 @@
+"""
+SQLite Cache - Single-file persistent cache.
+
+Stores every cache entry as a row of one SQLite database in WAL mode.
+Compared to FileCache (one JSON file per entry plus one per tag), reads
+don't rewrite anything, tag invalidation is one indexed query, and bulk
+reads and writes share a single statement or transaction.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+from .backend import CacheBackend, CacheStats
+
+
+# Keys per IN (...) query, below SQLite's default host parameter limit
+_BATCH_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL,
+    hit_count INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS entries_expires_at ON entries (expires_at);
+CREATE TABLE IF NOT EXISTS entry_tags (
+    tag TEXT NOT NULL,
+    key TEXT NOT NULL,
+    PRIMARY KEY (tag, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS entry_tags_key ON entry_tags (key);
+"""
+
+
+class SqliteCache(CacheBackend):
+    """
+    SQLite-based persistent cache.
+
+    Features:
+    - Persistence across restarts in a single database file
+    - WAL journaling, so other processes can read while one writes
+    - Indexed TTL and tag columns for expiry cleanup and invalidation
+    - Hit counts buffered in memory and flushed in batches
+    - Bulk get_many/set_many in one query/transaction
+    - Thread-safe operations
+
+    Example:
+        >>> cache = SqliteCache(
+        ...     db_path="~/.spectra/cache.db",
+        ...     default_ttl=3600,  # 1 hour
+        ... )
+        >>> cache.set_many({"issue:PROJ-1": issue1, "issue:PROJ-2": issue2})
+        >>> issues = cache.get_many(["issue:PROJ-1", "issue:PROJ-2"])
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path = "~/.spectra/cache.db",
+        default_ttl: float | None = 3600.0,  # 1 hour default
+        cleanup_on_start: bool = True,
+        hit_flush_threshold: int = 100,
+        mmap_size: int = 64 * 1024 * 1024,
+    ):
+        """
+        Initialize the SQLite cache.
+
+        Args:
+            db_path: Database file (":memory:" for a private in-memory cache)
+            default_ttl: Default TTL in seconds
+            cleanup_on_start: Whether to delete expired entries on init
+            hit_flush_threshold: Buffered hits that trigger a hit-count flush
+            mmap_size: Bytes of the database to memory-map for reads (0 = off)
+        """
+        self.db_path = db_path if db_path == ":memory:" else Path(db_path).expanduser()
+        self.default_ttl = default_ttl
+        self.hit_flush_threshold = hit_flush_threshold
+        self._stats = CacheStats()
+        self._pending_hits: Counter[str] = Counter()
+        self._pending_total = 0
+        self._lock = threading.RLock()
+
+        self.logger = logging.getLogger("SqliteCache")
+
+        if isinstance(self.db_path, Path):
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(str(self.db_path), timeout=30.0, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(f"PRAGMA mmap_size={int(mmap_size)}")
+        self._conn.executescript(_SCHEMA)
+
+        if cleanup_on_start:
+            self.cleanup_expired()
+
+    def get(self, key: str) -> Any | None:
+        """Get a value from the cache."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self._stats.record_miss()
+                return None
+            return self._read_row(key, *row)
+
+    def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Get several values from the cache with one query per batch of keys."""
+        found: dict[str, Any] = {}
+        with self._lock:
+            for batch in _batches(list(dict.fromkeys(keys))):
+                rows = self._conn.execute(
+                    "SELECT key, value, expires_at FROM entries "
+                    f"WHERE key IN ({', '.join('?' * len(batch))})",
+                    batch,
+                ).fetchall()
+                for key, value, expires_at in rows:
+                    found_value = self._read_row(key, value, expires_at)
+                    if found_value is not None:
+                        found[key] = found_value
+                for _ in range(len(batch) - len(rows)):
+                    self._stats.record_miss()
+        return found
+
+    def set_many(
+        self,
+        items: dict[str, Any],
+        ttl: float | None = None,
+        tags: set[str] | None = None,
+    ) -> None:
+        """Set several values in the cache in one transaction."""
+        if ttl is None:
+            ttl = self.default_ttl
+
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+
+        try:
+            rows = [
+                (key, json.dumps(value, default=str), now, expires_at)
+                for key, value in items.items()
+            ]
+        except (TypeError, ValueError) as e:
+            self.logger.error(f"Failed to cache {list(items)[:5]}: {e}")
+            return
+
+        with self._lock:
+            try:
+                with self._conn:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO entries (key, value, created_at, expires_at) "
+                        "VALUES (?, ?, ?, ?)",
+                        rows,
+                    )
+                    self._delete_tags([row[0] for row in rows])
+                    if tags:
+                        self._conn.executemany(
+                            "INSERT INTO entry_tags (tag, key) VALUES (?, ?)",
+                            [(tag, row[0]) for row in rows for tag in tags],
+                        )
+            except sqlite3.Error as e:
+                self.logger.error(f"Failed to cache {len(rows)} entries: {e}")
+                return
+
+            for key, *_ in rows:
+                self._pending_hits.pop(key, None)
+                self._stats.record_set()
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: float | None = None,
+        tags: set[str] | None = None,
+    ) -> None:
+        """Set a value in the cache."""
+        self.set_many({key: value}, ttl=ttl, tags=tags)
+
+    def delete(self, key: str) -> bool:
+        """Delete a key from the cache."""
+        with self._lock:
+            deleted = self._delete_keys([key]) > 0
+            if deleted:
+                self._stats.record_delete()
+            return deleted
+
+    def exists(self, key: str) -> bool:
+        """Check if a key exists and is not expired."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT expires_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return False
+            if row[0] is not None and time.time() > row[0]:
+                self._delete_keys([key])
+                return False
+            return True
+
+    def clear(self) -> int:
+        """Clear all entries from the cache."""
+        with self._lock, self._conn:
+            count = self._conn.execute("DELETE FROM entries").rowcount
+            self._conn.execute("DELETE FROM entry_tags")
+            self._pending_hits.clear()
+            return count
+
+    def invalidate_by_tag(self, tag: str) -> int:
+        """Invalidate all entries with a given tag."""
+        with self._lock:
+            keys = [
+                row[0]
+                for row in self._conn.execute("SELECT key FROM entry_tags WHERE tag = ?", (tag,))
+            ]
+            count = self._delete_keys(keys)
+            for _ in range(count):
+                self._stats.record_delete()
+            return count
+
+    def get_stats(self) -> CacheStats:
+        """Get cache statistics."""
+        return self._stats
+
+    @property
+    def size(self) -> int:
+        """Get the current number of unexpired entries in the cache."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*) FROM entries WHERE expires_at IS NULL OR expires_at > ?",
+                (time.time(),),
+            ).fetchone()
+            return int(row[0])
+
+    # -------------------------------------------------------------------------
+    # Maintenance
+    # -------------------------------------------------------------------------
+
+    def get_hit_count(self, key: str) -> int:
+        """Get the number of hits recorded for a key, including unflushed ones."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT hit_count FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return 0
+            return int(row[0]) + self._pending_hits[key]
+
+    def flush(self) -> int:
+        """
+        Write buffered hit counts to the database.
+
+        Returns:
+            Number of entries whose hit count was updated
+        """
+        with self._lock:
+            if not self._pending_hits:
+                return 0
+            pending = [(hits, key) for key, hits in self._pending_hits.items()]
+            self._pending_hits.clear()
+            self._pending_total = 0
+            with self._conn:
+                self._conn.executemany(
+                    "UPDATE entries SET hit_count = hit_count + ? WHERE key = ?", pending
+                )
+            return len(pending)
+
+    def cleanup_expired(self) -> int:
+        """
+        Delete all expired entries.
+
+        Returns:
+            Number of entries deleted
+        """
+        with self._lock:
+            keys = [
+                row[0]
+                for row in self._conn.execute(
+                    "SELECT key FROM entries WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                    (time.time(),),
+                )
+            ]
+            count = self._delete_keys(keys)
+            for _ in range(count):
+                self._stats.record_expiration()
+
+        if count > 0:
+            self.logger.debug(f"Cleaned up {count} expired entries")
+        return count
+
+    def close(self) -> None:
+        """Flush buffered hit counts and close the database."""
+        with self._lock:
+            self.flush()
+            self._conn.close()
+
+    def __enter__(self) -> SqliteCache:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    # -------------------------------------------------------------------------
+    # Internals (callers hold the lock)
+    # -------------------------------------------------------------------------
+
+    def _read_row(self, key: str, value: str, expires_at: float | None) -> Any | None:
+        """Decode a fetched row, dropping it if expired or corrupt."""
+        if expires_at is not None and time.time() > expires_at:
+            self._delete_keys([key])
+            self._stats.record_expiration()
+            self._stats.record_miss()
+            return None
+
+        try:
+            decoded = json.loads(value)
+        except json.JSONDecodeError as e:
+            self.logger.warning(f"Corrupt cache entry {key}: {e}")
+            self._delete_keys([key])
+            self._stats.record_miss()
+            return None
+
+        self._stats.record_hit()
+        self._pending_hits[key] += 1
+        self._pending_total += 1
+        if self._pending_total >= self.hit_flush_threshold:
+            self.flush()
+        return decoded
+
+    def _delete_keys(self, keys: list[str]) -> int:
+        """Delete entries and their tags, returning the entries deleted."""
+        count = 0
+        with self._conn:
+            for batch in _batches(keys):
+                placeholders = ", ".join("?" * len(batch))
+                count += self._conn.execute(
+                    f"DELETE FROM entries WHERE key IN ({placeholders})", batch
+                ).rowcount
+                self._conn.execute(f"DELETE FROM entry_tags WHERE key IN ({placeholders})", batch)
+        for key in keys:
+            self._pending_hits.pop(key, None)
+        return count
+
+    def _delete_tags(self, keys: list[str]) -> None:
+        """Drop the tags of entries about to be rewritten."""
+        for batch in _batches(keys):
+            self._conn.execute(
+                f"DELETE FROM entry_tags WHERE key IN ({', '.join('?' * len(batch))})", batch
+            )
+
+
+def _batches(keys: list[str]) -> Iterator[list[str]]:
+    """Split keys into batches that fit one IN (...) query."""
+    for start in range(0, len(keys), _BATCH_SIZE):
+        yield keys[start : start + _BATCH_SIZE]
@@ -0,0 +1,227 @@
+"""
+Tiered Cache - In-memory L1 over a persistent or shared L2.
+
+MemoryCache is fast but lost between CLI runs; FileCache, SqliteCache and
+RedisCache survive restarts and can be shared, but every read pays for
+disk or network I/O. TieredCache reads through a small in-memory LRU (L1)
+and falls back to the slower backend (L2), copying L2 hits into L1.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+from .backend import CacheBackend, CacheEntry, CacheStats
+from .memory import MemoryCache
+from .single_flight import SingleFlight
+
+
+T = TypeVar("T")
+
+
+class TieredCache(CacheBackend):
+    """
+    Two-tier cache: an in-memory LRU (L1) over another backend (L2).
+
+    Features:
+    - Reads try L1, then L2; L2 hits are promoted into L1
+    - Writes go through to both tiers, so L2 always holds every entry
+    - L1 evictions are demotions: the entry is still served from L2
+    - get_or_set coalesces concurrent loads of the same key
+    - Promotion, demotion and coalescing counts in CacheStats
+
+    L2 does not report an entry's tags or remaining TTL, so promoted
+    entries live in L1 for ``l1_ttl`` at most and are dropped from L1 by
+    any tag invalidation.
+
+    Example:
+        >>> cache = TieredCache(
+        ...     SqliteCache(db_path="~/.spectra/cache.db"),
+        ...     l1_max_size=500,
+        ... )
+        >>> issue = cache.get_or_set("issue:PROJ-1", lambda: fetch("PROJ-1"))
+    """
+
+    def __init__(
+        self,
+        l2: CacheBackend,
+        l1_max_size: int = 1000,
+        l1_ttl: float | None = 60.0,
+    ):
+        """
+        Initialize the tiered cache.
+
+        Args:
+            l2: Persistent or shared backend every entry is written to
+            l1_max_size: Maximum entries held in memory
+            l1_ttl: Longest time an entry stays in L1 (None = L2's TTL only
+                for entries written here, no limit for promoted ones)
+        """
+        self.l2 = l2
+        self.l1_ttl = l1_ttl
+        self.l1 = MemoryCache(max_size=l1_max_size, default_ttl=l1_ttl, on_evict=self._demoted)
+        self._stats = CacheStats()
+        self._flight = SingleFlight()
+        # L1 keys promoted from L2, whose tags are unknown
+        self._promoted: set[str] = set()
+        self._lock = threading.Lock()
+
+        self.logger = logging.getLogger("TieredCache")
+
+    def get(self, key: str) -> Any | None:
+        """Get a value from L1, or from L2 and promote it."""
+        value = self.l1.get(key)
+        if value is not None:
+            self._stats.record_hit()
+            return value
+
+        value = self.l2.get(key)
+        if value is None:
+            self._stats.record_miss()
+            return None
+
+        self._stats.record_hit()
+        self._promote(key, value)
+        return value
+
+    def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Get several values, reading L2 once for all L1 misses."""
+        found: dict[str, Any] = self.l1.get_many(keys)
+        missing = [key for key in keys if key not in found]
+        if missing:
+            promoted: dict[str, Any] = self.l2.get_many(missing)
+            for key, value in promoted.items():
+                self._promote(key, value)
+            found.update(promoted)
+
+        for key in keys:
+            if key in found:
+                self._stats.record_hit()
+            else:
+                self._stats.record_miss()
+        return found
+
+    def set_many(
+        self,
+        items: dict[str, Any],
+        ttl: float | None = None,
+        tags: set[str] | None = None,
+    ) -> None:
+        """Set several values in both tiers."""
+        self.l2.set_many(items, ttl=ttl, tags=tags)
+        self.l1.set_many(items, ttl=self._l1_ttl_for(ttl), tags=tags)
+        with self._lock:
+            self._promoted.difference_update(items)
+        for _ in items:
+            self._stats.record_set()
+
+    def get_or_set(
+        self,
+        key: str,
+        factory: Callable[[], T],
+        ttl: float | None = None,
+        tags: set[str] | None = None,
+    ) -> T:
+        """
+        Get from cache or compute and store, with one computation per key.
+
+        Concurrent callers that miss the same key wait for the first
+        caller's factory instead of running their own.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value  # type: ignore[no-any-return]
+
+        def load() -> T:
+            # Another caller may have stored the key since our miss
+            cached = self.get(key)
+            if cached is not None:
+                return cached  # type: ignore[no-any-return]
+            loaded = factory()
+            self.set(key, loaded, ttl=ttl, tags=tags)
+            return loaded
+
+        loaded, shared = self._flight.do(key, load)
+        if shared:
+            self._stats.record_coalesced()
+        return loaded
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: float | None = None,
+        tags: set[str] | None = None,
+    ) -> None:
+        """Set a value in both tiers."""
+        self.l2.set(key, value, ttl=ttl, tags=tags)
+        self.l1.set(key, value, ttl=self._l1_ttl_for(ttl), tags=tags)
+        with self._lock:
+            self._promoted.discard(key)
+        self._stats.record_set()
+
+    def delete(self, key: str) -> bool:
+        """Delete a key from both tiers."""
+        in_l1 = self.l1.delete(key)
+        in_l2 = self.l2.delete(key)
+        with self._lock:
+            self._promoted.discard(key)
+        if in_l1 or in_l2:
+            self._stats.record_delete()
+            return True
+        return False
+
+    def exists(self, key: str) -> bool:
+        """Check if a key exists and is not expired in either tier."""
+        return self.l1.exists(key) or self.l2.exists(key)
+
+    def clear(self) -> int:
+        """Clear both tiers, returning the entries cleared from L2."""
+        self.l1.clear()
+        with self._lock:
+            self._promoted.clear()
+        return self.l2.clear()
+
+    def invalidate_by_tag(self, tag: str) -> int:
+        """Invalidate tagged entries in both tiers, and all promoted ones in L1."""
+        self.l1.invalidate_by_tag(tag)
+        with self._lock:
+            promoted = list(self._promoted)
+            self._promoted.clear()
+        for key in promoted:
+            self.l1.delete(key)
+        return self.l2.invalidate_by_tag(tag)
+
+    def get_stats(self) -> CacheStats:
+        """Get statistics of the cache as a whole (per tier: l1/l2.get_stats())."""
+        return self._stats
+
+    @property
+    def size(self) -> int:
+        """Get the number of entries, all of which L2 holds."""
+        return self.l2.size
+
+    def _l1_ttl_for(self, ttl: float | None) -> float | None:
+        """Cap an entry's TTL at the L1 TTL."""
+        if ttl is None:
+            return self.l1_ttl
+        if self.l1_ttl is None:
+            return ttl
+        return min(ttl, self.l1_ttl)
+
+    def _promote(self, key: str, value: Any) -> None:
+        """Copy an L2 hit into L1."""
+        self.l1.set(key, value, ttl=self.l1_ttl)
+        with self._lock:
+            self._promoted.add(key)
+        self._stats.record_promotion()
+
+    def _demoted(self, key: str, entry: CacheEntry) -> None:
+        """Count an L1 eviction; the entry remains in L2."""
+        with self._lock:
+            self._promoted.discard(key)
+        self._stats.record_eviction()
+        self._stats.record_demotion()
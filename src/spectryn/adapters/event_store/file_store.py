@@ -1,38 +1,52 @@
 """
 File-based Event Store - Persist events to local JSON files.
 
-Stores events in append-only JSON files, one file per stream.
-This provides durable event storage without requiring a database.
+Stores events in append-only JSON files, one set of segment files per
+stream. This provides durable event storage without requiring a database.
+
+Each stream has a binary sidecar index with one fixed-size record per
+line (segment, byte offset, length, global position), so reads seek
+straight to a sequence number and cross-stream queries merge streams in
+global order without decoding events they skip. Segments roll over once
+they reach ``max_segment_bytes``; the index is rebuilt or caught up from
+the segment files whenever it is missing or behind. Projection snapshots
+are kept beside the stream, one file per projection.
 
 File structure:
     .spectra/events/
         sync/
             PROJ-100/
-                session-abc123.jsonl
-                session-def456.jsonl
+                session-abc123.jsonl      # First segment
+                session-abc123.jsonl.1    # Rolled segments
+                session-abc123.jsonl.idx  # Offset index
+                session-abc123.jsonl.snap-SyncSessionProjection  # Snapshot
         epic/
             PROJ-100.jsonl
-            PROJ-200.jsonl
-        _global_index.json  # Optional global position tracking
+            PROJ-100.jsonl.idx
+        _global_position.txt  # Global position counter
 """
 
 import contextlib
+import glob
+import heapq
 import json
 import logging
 import os
 import re
+import struct
 import sys
 from collections.abc import Iterator
 from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
-from typing import IO, Any
+from typing import IO, Any, NamedTuple
 
 from spectryn.core.domain.events import DomainEvent
 from spectryn.core.ports.event_store import (
     ConcurrencyError,
     EventQuery,
     EventStorePort,
+    ProjectionSnapshot,
     StoredEvent,
     StreamInfo,
 )
@@ -72,18 +86,53 @@ else:
 
 logger = logging.getLogger(__name__)
 
+# Size at which a stream starts a new segment file
+DEFAULT_MAX_SEGMENT_BYTES = 8 * 1024 * 1024
+
+# Index file layout: header (magic, unreadable line count), then one
+# record per line (segment, length, byte offset, global position)
+_INDEX_MAGIC = b"SPXIDX01"
+_INDEX_HEADER = struct.Struct("<8sQ")
+_INDEX_RECORD = struct.Struct("<IIQq")
+
+# Global position recorded for blank or unparseable lines
+_UNREADABLE = -1
+
+# Index records resolved per batch while reading
+_READ_CHUNK = 256
+
+
+class _IndexEntry(NamedTuple):
+    """Location of one stream line, as stored in the index."""
+
+    segment: int
+    length: int
+    offset: int
+    global_position: int
+
+
+class _IndexState(NamedTuple):
+    """Summary of a stream index after it has been brought up to date."""
+
+    lines: int  # Indexed lines, including unreadable ones
+    unreadable: int  # Blank or unparseable lines
+    segment: int  # Last segment number
+    end: int  # Indexed bytes in the last segment
+
 
 class FileEventStore(EventStorePort):
     """
     File-based event store implementation.
 
     Stores events in JSON Lines format (.jsonl) for efficient appending.
-    Each stream gets its own file organized by type.
+    Each stream gets its own segment files organized by type.
 
     Features:
     - Append-only writes for durability
     - File locking for concurrency safety
-    - JSON Lines format for streaming reads
+    - Offset index for direct seeks by sequence number
+    - Cross-stream queries merged in global position order
+    - Size-based segment rolling
     - Organized directory structure
     - Automatic directory creation
 
@@ -96,6 +145,7 @@ class FileEventStore(EventStorePort):
         self,
         base_path: Path | str,
         create_dirs: bool = True,
+        max_segment_bytes: int = DEFAULT_MAX_SEGMENT_BYTES,
     ):
         """
         Initialize the file event store.
@@ -103,8 +153,10 @@ class FileEventStore(EventStorePort):
         Args:
             base_path: Base directory for event files.
             create_dirs: Whether to create directories if they don't exist.
+            max_segment_bytes: Segment size after which appends start a new segment.
         """
         self.base_path = Path(base_path)
+        self.max_segment_bytes = max_segment_bytes
         self._global_position = 0
         self._global_position_file = self.base_path / "_global_position.txt"
 
@@ -259,12 +311,252 @@ class FileEventStore(EventStorePort):
                 timestamp=event_data.get("timestamp", datetime.now()),
             )
 
+    def _segment_path(self, path: Path, segment: int) -> Path:
+        """Get the file for a segment of the stream stored at ``path``."""
+        return path if segment == 0 else path.with_name(f"{path.name}.{segment}")
+
+    def _index_path(self, path: Path) -> Path:
+        """Get the offset index file of the stream stored at ``path``."""
+        return path.with_name(f"{path.name}.idx")
+
+    def _snapshot_path(self, path: Path, name: str) -> Path:
+        """Get the snapshot file of a projection of the stream stored at ``path``."""
+        return path.with_name(f"{path.name}.snap-{self._sanitize_filename(name)}")
+
+    def _delete_snapshots(self, path: Path) -> None:
+        """Delete all projection snapshots of the stream stored at ``path``."""
+        for snapshot_path in path.parent.glob(f"{glob.escape(path.name)}.snap-*"):
+            snapshot_path.unlink(missing_ok=True)
+
+    @contextlib.contextmanager
+    def _locked_index(self, path: Path) -> Iterator[IO[bytes]]:
+        """
+        Open a stream's index file under an exclusive lock.
+
+        The index lock guards the whole stream: appends, index updates
+        and compaction all happen while it is held.
+        """
+        index_path = self._index_path(path)
+        index_path.touch(exist_ok=True)
+
+        with open(index_path, "r+b") as f:
+            _lock_file_exclusive(f)
+            try:
+                yield f
+            finally:
+                _unlock_file(f)
+
+    def _sync_index(self, path: Path, f: IO[bytes]) -> _IndexState:
+        """
+        Bring a stream's index up to date with its segment files.
+
+        Lines written since the last update (including by older versions
+        or by hand) are indexed incrementally. A missing, damaged or
+        out-of-date index is rebuilt from scratch.
+
+        Args:
+            path: Path of the stream's first segment.
+            f: The locked index file.
+
+        Returns:
+            The state of the updated index.
+        """
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        records_size = size - _INDEX_HEADER.size
+
+        state: _IndexState | None = None
+        if records_size >= 0 and records_size % _INDEX_RECORD.size == 0:
+            f.seek(0)
+            magic, unreadable = _INDEX_HEADER.unpack(f.read(_INDEX_HEADER.size))
+            if magic == _INDEX_MAGIC:
+                count = records_size // _INDEX_RECORD.size
+                segment, end = 0, 0
+                if count:
+                    f.seek(size - _INDEX_RECORD.size)
+                    last = _IndexEntry(*_INDEX_RECORD.unpack(f.read(_INDEX_RECORD.size)))
+                    segment, end = last.segment, last.offset + last.length
+                state = _IndexState(count, unreadable, segment, end)
+
+        if state is not None:
+            segment_path = self._segment_path(path, state.segment)
+            if not segment_path.exists() or segment_path.stat().st_size < state.end:
+                # Segments were rewritten behind the index's back
+                state = None
+
+        if state is None:
+            f.seek(0)
+            f.truncate()
+            f.write(_INDEX_HEADER.pack(_INDEX_MAGIC, 0))
+            state = _IndexState(0, 0, 0, 0)
+
+        return self._index_new_lines(path, f, state)
+
+    def _index_new_lines(self, path: Path, f: IO[bytes], state: _IndexState) -> _IndexState:
+        """Index complete lines written after the end recorded in ``state``."""
+        records: list[bytes] = []
+        unreadable = state.unreadable
+        segment, end = state.segment, state.end
+
+        while True:
+            segment_path = self._segment_path(path, segment)
+            if segment_path.exists():
+                with open(segment_path, "rb") as data:
+                    data.seek(end)
+                    for line in data:
+                        if not line.endswith(b"\n"):
+                            # Torn write; indexed once the line is terminated
+                            break
+                        global_position = self._line_global_position(line)
+                        if global_position == _UNREADABLE:
+                            logger.warning(
+                                f"Unreadable line {state.lines + len(records)} in {path}"
+                            )
+                            unreadable += 1
+                        records.append(_INDEX_RECORD.pack(segment, len(line), end, global_position))
+                        end += len(line)
+
+            if not self._segment_path(path, segment + 1).exists():
+                break
+            segment, end = segment + 1, 0
+
+        if records:
+            f.seek(0, os.SEEK_END)
+            f.write(b"".join(records))
+            if unreadable != state.unreadable:
+                f.seek(0)
+                f.write(_INDEX_HEADER.pack(_INDEX_MAGIC, unreadable))
+            f.flush()
+
+        return _IndexState(state.lines + len(records), unreadable, segment, end)
+
+    def _line_global_position(self, line: bytes) -> int:
+        """Get the global position of a stored line, or ``_UNREADABLE``."""
+        try:
+            data = json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return _UNREADABLE
+
+        if not isinstance(data, dict):
+            return _UNREADABLE
+
+        global_position = data.get("global_position")
+        return global_position if isinstance(global_position, int) else 0
+
+    def _refresh_index(self, path: Path) -> _IndexState:
+        """Update a stream's index and return its state."""
+        with self._locked_index(path) as f:
+            return self._sync_index(path, f)
+
+    def _read_lines(
+        self,
+        path: Path,
+        start: int,
+        stop: int,
+        reverse: bool = False,
+    ) -> Iterator[tuple[int, bytes]]:
+        """
+        Read the readable lines in a sequence range via the index.
+
+        Lines are resolved in batches so no file stays open between
+        yields.
+
+        Args:
+            path: Path of the stream's first segment.
+            start: First sequence number (inclusive).
+            stop: Last sequence number (exclusive).
+            reverse: Yield the newest line first.
+
+        Yields:
+            (sequence number, raw line) pairs.
+        """
+        batches = range(max(start, 0), stop, _READ_CHUNK)
+        for batch_start in reversed(batches) if reverse else batches:
+            lines = self._read_batch(path, batch_start, min(batch_start + _READ_CHUNK, stop))
+            yield from reversed(lines) if reverse else lines
+
+    def _read_batch(self, path: Path, start: int, stop: int) -> list[tuple[int, bytes]]:
+        """Read the readable lines for the index records ``start:stop``."""
+        with open(self._index_path(path), "rb") as f:
+            f.seek(_INDEX_HEADER.size + start * _INDEX_RECORD.size)
+            raw = f.read((stop - start) * _INDEX_RECORD.size)
+        raw = raw[: len(raw) - len(raw) % _INDEX_RECORD.size]
+
+        lines: list[tuple[int, bytes]] = []
+        with contextlib.ExitStack() as stack:
+            segments: dict[int, IO[bytes]] = {}
+            for position, record in enumerate(_INDEX_RECORD.iter_unpack(raw)):
+                entry = _IndexEntry(*record)
+                if entry.global_position == _UNREADABLE:
+                    continue
+
+                data = segments.get(entry.segment)
+                if data is None:
+                    data = stack.enter_context(open(self._segment_path(path, entry.segment), "rb"))
+                    segments[entry.segment] = data
+
+                data.seek(entry.offset)
+                lines.append((start + position, data.read(entry.length)))
+
+        return lines
+
+    def _read_events(
+        self,
+        stream_id: str,
+        path: Path,
+        start: int,
+        stop: int,
+        reverse: bool = False,
+    ) -> Iterator[StoredEvent]:
+        """Decode the events in a sequence range of a stream."""
+        for sequence, line in self._read_lines(path, start, stop, reverse):
+            try:
+                stored = self._to_stored_event(json.loads(line), stream_id, sequence)
+            except (json.JSONDecodeError, KeyError) as e:
+                logger.warning(f"Failed to parse event {sequence} of stream '{stream_id}': {e}")
+                continue
+            yield stored
+
+    def _to_stored_event(self, data: dict[str, Any], stream_id: str, sequence: int) -> StoredEvent:
+        """
+        Build a StoredEvent from a decoded stream line.
+
+        Args:
+            data: The decoded line.
+            stream_id: Stream the line was read from.
+            sequence: Position of the line in the stream.
+
+        Returns:
+            The stored event.
+        """
+        event = self._deserialize_event(data)
+
+        # Parse stored_at back to datetime
+        stored_at = data.get("stored_at")
+        if isinstance(stored_at, str):
+            try:
+                stored_at = datetime.fromisoformat(stored_at)
+            except ValueError:
+                stored_at = datetime.now()
+        elif not isinstance(stored_at, datetime):
+            stored_at = datetime.now()
+
+        return StoredEvent(
+            event=event,
+            stream_id=data.get("stream_id", stream_id),
+            sequence_number=data.get("sequence_number", sequence),
+            global_position=data.get("global_position"),
+            stored_at=stored_at,
+            metadata=data.get("metadata", {}),
+        )
+
     def append(
         self,
         stream_id: str,
         events: list[DomainEvent],
         expected_version: int | None = None,
         metadata: dict[str, Any] | None = None,
+        sync: bool = True,
     ) -> list[StoredEvent]:
         """Append events to a stream."""
         if not events:
@@ -275,54 +567,69 @@ class FileEventStore(EventStorePort):
 
         stored_events: list[StoredEvent] = []
 
-        # Use file locking for concurrency safety
-        mode = "a+" if file_path.exists() else "w+"
-
-        with open(file_path, mode, encoding="utf-8") as f:
-            # Acquire exclusive lock
-            _lock_file_exclusive(f)
-
-            try:
-                # Get current sequence number
-                f.seek(0)
-                lines = f.readlines()
-                current_sequence = len(lines)
-
-                # Check expected version for optimistic concurrency
-                if expected_version is not None and current_sequence != expected_version:
-                    raise ConcurrencyError(stream_id, expected_version, current_sequence)
-
-                # Append events
-                now = datetime.now()
-                for event in events:
-                    self._global_position += 1
-                    sequence = current_sequence
-                    current_sequence += 1
-
-                    stored = StoredEvent(
-                        event=event,
-                        stream_id=stream_id,
-                        sequence_number=sequence,
-                        global_position=self._global_position,
-                        stored_at=now,
-                        metadata=metadata or {},
-                    )
-
-                    # Write JSON line
-                    line = json.dumps(stored.to_dict(), default=str) + "\n"
-                    f.write(line)
-
-                    stored_events.append(stored)
-
+        # The index lock serializes writers to the stream
+        with self._locked_index(file_path) as index:
+            state = self._sync_index(file_path, index)
+
+            segment_path = self._segment_path(file_path, state.segment)
+            if segment_path.exists() and segment_path.stat().st_size > state.end:
+                # Terminate a torn line so it is indexed and skipped
+                with open(segment_path, "ab") as f:
+                    f.write(b"\n")
+                state = self._index_new_lines(file_path, index, state)
+
+            # Current sequence number is the number of indexed lines
+            current_sequence = state.lines
+
+            # Check expected version for optimistic concurrency
+            if expected_version is not None and current_sequence != expected_version:
+                raise ConcurrencyError(stream_id, expected_version, current_sequence)
+
+            segment, offset = state.segment, state.end
+            if offset >= self.max_segment_bytes:
+                segment, offset = segment + 1, 0
+
+            # Append events
+            now = datetime.now()
+            lines: list[bytes] = []
+            records: list[bytes] = []
+            for event in events:
+                self._global_position += 1
+                sequence = current_sequence
+                current_sequence += 1
+
+                stored = StoredEvent(
+                    event=event,
+                    stream_id=stream_id,
+                    sequence_number=sequence,
+                    global_position=self._global_position,
+                    stored_at=now,
+                    metadata=metadata or {},
+                )
+
+                line = (json.dumps(stored.to_dict(), default=str) + "\n").encode("utf-8")
+                lines.append(line)
+                records.append(
+                    _INDEX_RECORD.pack(segment, len(line), offset, self._global_position)
+                )
+                offset += len(line)
+
+                stored_events.append(stored)
+
+            with open(self._segment_path(file_path, segment), "ab") as f:
+                f.write(b"".join(lines))
                 f.flush()
-                os.fsync(f.fileno())  # Ensure durability
+                if sync:
+                    os.fsync(f.fileno())  # Ensure durability
 
-            finally:
-                _unlock_file(f)
+            # The index can always be rebuilt from the segments, so it is
+            # written after them and not fsynced
+            index.seek(0, os.SEEK_END)
+            index.write(b"".join(records))
+            index.flush()
 
-        # Save global position periodically
-        if self._global_position % 100 == 0:
-            self._save_global_position()
+        # Persist the counter so positions stay ordered across restarts
+        self._save_global_position()
 
         logger.debug(
             f"Appended {len(events)} events to stream '{stream_id}' "
@@ -343,76 +650,54 @@ class FileEventStore(EventStorePort):
         if not file_path.exists():
             return
 
-        with open(file_path, encoding="utf-8") as f:
-            # Acquire shared lock for reading
-            _lock_file_shared(f)
-
-            try:
-                for line_num, line in enumerate(f):
-                    if line_num < from_sequence:
-                        continue
-                    if to_sequence is not None and line_num > to_sequence:
-                        break
-
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    try:
-                        data = json.loads(line)
-                        event = self._deserialize_event(data)
-
-                        # Parse stored_at back to datetime
-                        stored_at = data.get("stored_at")
-                        if isinstance(stored_at, str):
-                            try:
-                                stored_at = datetime.fromisoformat(stored_at)
-                            except ValueError:
-                                stored_at = datetime.now()
-                        elif not isinstance(stored_at, datetime):
-                            stored_at = datetime.now()
-
-                        yield StoredEvent(
-                            event=event,
-                            stream_id=data.get("stream_id", stream_id),
-                            sequence_number=data.get("sequence_number", line_num),
-                            global_position=data.get("global_position"),
-                            stored_at=stored_at,
-                            metadata=data.get("metadata", {}),
-                        )
-                    except (json.JSONDecodeError, KeyError) as e:
-                        logger.warning(f"Failed to parse event at line {line_num}: {e}")
-                        continue
+        state = self._refresh_index(file_path)
+        stop = state.lines if to_sequence is None else min(state.lines, to_sequence + 1)
 
-            finally:
-                _unlock_file(f)
+        yield from self._read_events(stream_id, file_path, from_sequence, stop)
 
     def query(self, query: EventQuery) -> Iterator[StoredEvent]:
-        """Query events across streams."""
-        # If specific stream requested, just read that stream
-        if query.stream_id:
-            for event in self.read(
-                query.stream_id,
-                from_sequence=query.from_sequence or 0,
-                to_sequence=query.to_sequence,
-            ):
-                if self._matches_query(event, query):
-                    yield event
-            return
+        """
+        Query events across streams.
 
-        # Otherwise, scan all streams
-        streams = self.list_streams()
-        if query.reverse:
-            streams = list(reversed(streams))
+        Streams are merged by global position (newest first when
+        ``query.reverse`` is set), decoding each stream lazily.
+        """
+        stream_ids = [query.stream_id] if query.stream_id else self.list_streams()
+
+        streams: list[Iterator[StoredEvent]] = []
+        for stream_id in stream_ids:
+            file_path = self._stream_to_path(stream_id)
+            if not file_path.exists():
+                continue
+
+            state = self._refresh_index(file_path)
+            stop = state.lines
+            if query.to_sequence is not None:
+                stop = min(stop, query.to_sequence + 1)
+
+            streams.append(
+                self._read_events(
+                    stream_id,
+                    file_path,
+                    query.from_sequence or 0,
+                    stop,
+                    reverse=query.reverse,
+                )
+            )
+
+        merged = heapq.merge(
+            *streams,
+            key=lambda stored: stored.global_position or 0,
+            reverse=query.reverse,
+        )
 
         count = 0
-        for stream_id in streams:
-            for event in self.read(stream_id):
-                if self._matches_query(event, query):
-                    yield event
-                    count += 1
-                    if query.limit and count >= query.limit:
-                        return
+        for event in merged:
+            if self._matches_query(event, query):
+                yield event
+                count += 1
+                if query.limit and count >= query.limit:
+                    return
 
     def _matches_query(self, event: StoredEvent, query: EventQuery) -> bool:
         """Check if an event matches query criteria."""
@@ -432,21 +717,17 @@ class FileEventStore(EventStorePort):
         if not file_path.exists():
             return None
 
-        event_count = 0
-        first_event_at: datetime | None = None
-        last_event_at: datetime | None = None
+        state = self._refresh_index(file_path)
+        event_count = state.lines - state.unreadable
 
-        for event in self.read(stream_id):
-            event_count += 1
-            if first_event_at is None:
-                first_event_at = event.stored_at
-            last_event_at = event.stored_at
+        first = next(self._read_events(stream_id, file_path, 0, state.lines), None)
+        last = next(self._read_events(stream_id, file_path, 0, state.lines, reverse=True), None)
 
         return StreamInfo(
             stream_id=stream_id,
             event_count=event_count,
-            first_event_at=first_event_at,
-            last_event_at=last_event_at,
+            first_event_at=first.stored_at if first else None,
+            last_event_at=last.stored_at if last else None,
             last_sequence=event_count - 1 if event_count > 0 else 0,
         )
 
@@ -492,44 +773,54 @@ class FileEventStore(EventStorePort):
         if not file_path.exists():
             return None
 
-        # Read last line efficiently
-        with open(file_path, "rb") as f:
-            # Seek to end
-            f.seek(0, 2)
-            file_size = f.tell()
+        state = self._refresh_index(file_path)
+        return next(self._read_events(stream_id, file_path, 0, state.lines, reverse=True), None)
 
-            if file_size == 0:
-                return None
+    def save_snapshot(self, stream_id: str, snapshot: ProjectionSnapshot) -> None:
+        """
+        Save a projection snapshot beside the stream.
 
-            # Read backwards to find last newline
-            buffer_size = min(4096, file_size)
-            f.seek(max(0, file_size - buffer_size))
-            last_lines = f.read().decode("utf-8").strip().split("\n")
+        The snapshot file holds a JSON header line followed by the
+        serialized state, and is replaced atomically.
+        """
+        file_path = self._stream_to_path(stream_id)
+        snapshot_path = self._snapshot_path(file_path, snapshot.name)
+        header = {
+            "name": snapshot.name,
+            "sequence": snapshot.sequence,
+            "event_id": snapshot.event_id,
+            "version": snapshot.version,
+            "created_at": snapshot.created_at.isoformat(),
+        }
 
-            if not last_lines:
-                return None
+        snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = snapshot_path.with_name(f"{snapshot_path.name}.tmp")
+        with open(temp_path, "wb") as f:
+            f.write(json.dumps(header).encode("utf-8") + b"\n")
+            f.write(snapshot.data)
+            f.flush()
+            os.fsync(f.fileno())
+        temp_path.replace(snapshot_path)
 
-            last_line = last_lines[-1]
+    def load_snapshot(self, stream_id: str, name: str) -> ProjectionSnapshot | None:
+        """Load the latest snapshot of a projection for a stream."""
+        snapshot_path = self._snapshot_path(self._stream_to_path(stream_id), name)
 
         try:
-            data = json.loads(last_line)
-            event = self._deserialize_event(data)
-
-            stored_at = data.get("stored_at")
-            if isinstance(stored_at, str):
-                stored_at = datetime.fromisoformat(stored_at)
-            elif not isinstance(stored_at, datetime):
-                stored_at = datetime.now()
-
-            return StoredEvent(
-                event=event,
-                stream_id=data.get("stream_id", stream_id),
-                sequence_number=data.get("sequence_number", 0),
-                global_position=data.get("global_position"),
-                stored_at=stored_at,
-                metadata=data.get("metadata", {}),
+            header_line, _, data = snapshot_path.read_bytes().partition(b"\n")
+            header = json.loads(header_line)
+            return ProjectionSnapshot(
+                name=header["name"],
+                sequence=header["sequence"],
+                event_id=header["event_id"],
+                data=data,
+                version=header.get("version", ""),
+                created_at=datetime.fromisoformat(header["created_at"]),
             )
-        except (json.JSONDecodeError, KeyError):
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable snapshot {snapshot_path}: {e}")
             return None
 
     def delete_stream(self, stream_id: str) -> bool:
@@ -550,7 +841,14 @@ class FileEventStore(EventStorePort):
         if not file_path.exists():
             return False
 
+        segment = 1
+        while (segment_path := self._segment_path(file_path, segment)).exists():
+            segment_path.unlink()
+            segment += 1
+
         file_path.unlink()
+        self._index_path(file_path).unlink(missing_ok=True)
+        self._delete_snapshots(file_path)
         logger.info(f"Deleted stream '{stream_id}'")
 
         # Clean up empty directories
@@ -563,6 +861,10 @@ class FileEventStore(EventStorePort):
         """
         Compact a stream by removing corrupted lines.
 
+        Only segments that contain corrupted lines are rewritten. Removing
+        lines renumbers the events after them, so projection snapshots of a
+        compacted stream are deleted.
+
         Args:
             stream_id: The stream to compact.
 
@@ -574,23 +876,52 @@ class FileEventStore(EventStorePort):
         if not file_path.exists():
             return 0
 
-        # Read all valid events
-        valid_events: list[str] = []
-
-        with open(file_path, encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
+        with self._locked_index(file_path) as index:
+            state = self._sync_index(file_path, index)
+            if not state.unreadable:
+                return state.lines
+
+            index.seek(_INDEX_HEADER.size)
+            entries = [
+                _IndexEntry(*record)
+                for record in _INDEX_RECORD.iter_unpack(
+                    index.read(state.lines * _INDEX_RECORD.size)
+                )
+            ]
+            dirty = {entry.segment for entry in entries if entry.global_position == _UNREADABLE}
+
+            records: list[bytes] = []
+            for segment in sorted({entry.segment for entry in entries}):
+                segment_entries = [entry for entry in entries if entry.segment == segment]
+                if segment not in dirty:
+                    records.extend(_INDEX_RECORD.pack(*entry) for entry in segment_entries)
                     continue
-                try:
-                    json.loads(line)
-                    valid_events.append(line)
-                except json.JSONDecodeError:
-                    logger.warning(f"Removing corrupted line from {stream_id}")
-
-        # Rewrite file with valid events only
-        with open(file_path, "w", encoding="utf-8") as f:
-            for line in valid_events:
-                f.write(line + "\n")
-
-        return len(valid_events)
+
+                # Rewrite valid lines only
+                segment_path = self._segment_path(file_path, segment)
+                temp_path = segment_path.with_name(f"{segment_path.name}.tmp")
+                offset = 0
+                with open(segment_path, "rb") as src, open(temp_path, "wb") as dst:
+                    for entry in segment_entries:
+                        if entry.global_position == _UNREADABLE:
+                            logger.warning(f"Removing corrupted line from {stream_id}")
+                            continue
+                        src.seek(entry.offset)
+                        dst.write(src.read(entry.length))
+                        records.append(
+                            _INDEX_RECORD.pack(segment, entry.length, offset, entry.global_position)
+                        )
+                        offset += entry.length
+                    dst.flush()
+                    os.fsync(dst.fileno())
+                temp_path.replace(segment_path)
+
+            index.seek(0)
+            index.truncate()
+            index.write(_INDEX_HEADER.pack(_INDEX_MAGIC, 0))
+            index.write(b"".join(records))
+            index.flush()
+
+            self._delete_snapshots(file_path)
+
+        return len(records)
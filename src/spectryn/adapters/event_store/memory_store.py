@@ -17,6 +17,7 @@ from spectryn.core.ports.event_store import (
     ConcurrencyError,
     EventQuery,
     EventStorePort,
+    ProjectionSnapshot,
     StoredEvent,
     StreamInfo,
 )
@@ -38,6 +39,7 @@ class MemoryEventStore(EventStorePort):
     def __init__(self) -> None:
         """Initialize the in-memory store."""
         self._streams: dict[str, list[StoredEvent]] = defaultdict(list)
+        self._snapshots: dict[tuple[str, str], ProjectionSnapshot] = {}
         self._global_position = 0
 
     def append(
@@ -46,6 +48,7 @@ class MemoryEventStore(EventStorePort):
         events: list[DomainEvent],
         expected_version: int | None = None,
         metadata: dict[str, Any] | None = None,
+        sync: bool = True,
     ) -> list[StoredEvent]:
         """Append events to a stream."""
         if not events:
@@ -169,12 +172,23 @@ class MemoryEventStore(EventStorePort):
 
         return stream[-1]
 
+    def save_snapshot(self, stream_id: str, snapshot: ProjectionSnapshot) -> None:
+        """Save a projection snapshot for a stream."""
+        self._snapshots[(stream_id, snapshot.name)] = snapshot
+
+    def load_snapshot(self, stream_id: str, name: str) -> ProjectionSnapshot | None:
+        """Load the latest snapshot of a projection for a stream."""
+        return self._snapshots.get((stream_id, name))
+
     def clear(self) -> None:
         """Clear all events (for testing)."""
         self._streams.clear()
+        self._snapshots.clear()
         self._global_position = 0
 
     def clear_stream(self, stream_id: str) -> None:
         """Clear a specific stream (for testing)."""
         if stream_id in self._streams:
             del self._streams[stream_id]
+        for key in [key for key in self._snapshots if key[0] == stream_id]:
+            del self._snapshots[key]
@@ -16,6 +16,7 @@ import logging
 import re
 from typing import Any
 
+from spectryn.adapters.async_base import ConditionalRequestCache
 from spectryn.core.ports.issue_tracker import (
     IssueData,
     IssueLink,
@@ -102,6 +103,8 @@ class GitHubAdapter(IssueTrackerPort):
             repo=repo,
             base_url=base_url,
             dry_run=dry_run,
+            # 304 revalidations are not counted against the rate limit
+            conditional_cache=ConditionalRequestCache(),
         )
 
         # Cache for issue -> milestone mappings
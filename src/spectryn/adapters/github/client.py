@@ -14,6 +14,7 @@ from requests.adapters import HTTPAdapter
 
 from spectryn.adapters.async_base import (
     RETRYABLE_STATUS_CODES,
+    ConditionalRequestCache,
     GitHubRateLimiter,
     calculate_delay,
     get_retry_after,
@@ -74,6 +75,8 @@ class GitHubApiClient:
         requests_per_second: float | None = DEFAULT_REQUESTS_PER_SECOND,
         burst_size: int = DEFAULT_BURST_SIZE,
         timeout: float = DEFAULT_TIMEOUT,
+        *,
+        conditional_cache: ConditionalRequestCache | None = None,
     ):
         """
         Initialize the GitHub client.
@@ -92,6 +95,8 @@ class GitHubApiClient:
             requests_per_second: Maximum request rate (None to disable)
             burst_size: Maximum burst capacity
             timeout: Request timeout in seconds
+            conditional_cache: Store for ETag/Last-Modified revalidation of GET
+                requests (None disables conditional requests)
         """
         self.token = token
         self.owner = owner
@@ -99,6 +104,7 @@ class GitHubApiClient:
         self.base_url = base_url.rstrip("/")
         self.dry_run = dry_run
         self.timeout = timeout
+        self._conditional_cache = conditional_cache
         self.logger = logging.getLogger("GitHubApiClient")
 
         # Retry configuration
@@ -169,6 +175,13 @@ class GitHubApiClient:
 
         last_exception: Exception | None = None
 
+        # Revalidate a stored GET response instead of downloading it again
+        conditional_cache = self._conditional_cache
+        conditional_key: str | None = None
+        conditional: dict[str, Any] | None = None
+        if conditional_cache is not None:
+            conditional_key, conditional = conditional_cache.prepare(method, url, kwargs)
+
         for attempt in range(self.max_retries + 1):
             # Apply rate limiting
             if self._rate_limiter is not None:
@@ -216,7 +229,15 @@ class GitHubApiClient:
                         issue_key=endpoint,
                     )
 
-                return self._handle_response(response, endpoint)
+                if conditional_cache and conditional is not None and response.status_code == 304:
+                    if self._rate_limiter is not None:
+                        self._rate_limiter.refund()
+                    return conditional_cache.not_modified(conditional)
+
+                result = self._handle_response(response, endpoint)
+                if conditional_cache is not None:
+                    conditional_cache.store(conditional_key, response, result)
+                return result
 
             except requests.exceptions.ConnectionError as e:
                 last_exception = e
@@ -16,6 +16,7 @@ import logging
 import re
 from typing import Any
 
+from spectryn.adapters.async_base import ConditionalRequestCache
 from spectryn.core.ports.issue_tracker import (
     IssueData,
     IssueTrackerError,
@@ -130,6 +131,8 @@ class GitLabAdapter(IssueTrackerPort):
                 project_id=project_id,
                 base_url=base_url,
                 dry_run=dry_run,
+                # 304 revalidations are not counted against the rate limit
+                conditional_cache=ConditionalRequestCache(),
             )
             self.logger.info("Using custom GitLab API client")
 
@@ -14,6 +14,7 @@ from requests.adapters import HTTPAdapter
 
 from spectryn.adapters.async_base import (
     RETRYABLE_STATUS_CODES,
+    ConditionalRequestCache,
     calculate_delay,
     get_retry_after,
 )
@@ -51,6 +52,10 @@ class GitLabRateLimiter:
             time.sleep(sleep_time)
         self.last_request_time = time.time()
 
+    def refund(self) -> None:
+        """Don't hold an uncounted request (e.g. a 304) against the next one."""
+        self.last_request_time -= self.min_delay
+
     def update_from_response(self, response: requests.Response) -> None:
         """Update rate limiter state from response headers."""
         # GitLab doesn't provide rate limit headers like GitHub
@@ -101,6 +106,8 @@ class GitLabApiClient:
         jitter: float = DEFAULT_JITTER,
         requests_per_hour: float = DEFAULT_REQUESTS_PER_HOUR,
         timeout: float = DEFAULT_TIMEOUT,
+        *,
+        conditional_cache: ConditionalRequestCache | None = None,
     ):
         """
         Initialize the GitLab client.
@@ -117,12 +124,15 @@ class GitLabApiClient:
             jitter: Random jitter factor (0.1 = 10%)
             requests_per_hour: Maximum request rate per hour
             timeout: Request timeout in seconds
+            conditional_cache: Store for ETag/Last-Modified revalidation of GET
+                requests (None disables conditional requests)
         """
         self.token = token
         self.project_id = project_id
         self.base_url = base_url.rstrip("/")
         self.dry_run = dry_run
         self.timeout = timeout
+        self._conditional_cache = conditional_cache
         self.logger = logging.getLogger("GitLabApiClient")
 
         # Retry configuration
@@ -191,6 +201,13 @@ class GitLabApiClient:
 
         last_exception: Exception | None = None
 
+        # Revalidate a stored GET response instead of downloading it again
+        conditional_cache = self._conditional_cache
+        conditional_key: str | None = None
+        conditional: dict[str, Any] | None = None
+        if conditional_cache is not None:
+            conditional_key, conditional = conditional_cache.prepare(method, url, kwargs)
+
         for attempt in range(self.max_retries + 1):
             # Apply rate limiting
             if self._rate_limiter is not None:
@@ -238,7 +255,15 @@ class GitLabApiClient:
                         issue_key=endpoint,
                     )
 
-                return self._handle_response(response, endpoint)
+                if conditional_cache and conditional is not None and response.status_code == 304:
+                    if self._rate_limiter is not None:
+                        self._rate_limiter.refund()
+                    return conditional_cache.not_modified(conditional)  # type: ignore[no-any-return]
+
+                result = self._handle_response(response, endpoint)
+                if conditional_cache is not None:
+                    conditional_cache.store(conditional_key, response, result)
+                return result
 
             except requests.exceptions.ConnectionError as e:
                 last_exception = e
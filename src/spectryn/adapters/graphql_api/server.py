@@ -9,7 +9,6 @@ Provides a lightweight GraphQL server that:
 """
 
 import base64
-import http.server
 import json
 import logging
 import re
@@ -21,6 +20,11 @@ from datetime import datetime
 from typing import Any
 from uuid import uuid4
 
+from spectryn.adapters.http.server import (
+    HTTPServerConfig,
+    PooledHTTPServer,
+    PooledRequestHandler,
+)
 from spectryn.core.domain.entities import Epic, Subtask, UserStory
 from spectryn.core.domain.enums import Priority, Status
 from spectryn.core.domain.events import EventBus
@@ -244,10 +248,11 @@ class SpectraGraphQLServer(GraphQLServerPort):
         self._response_middlewares: list[ResponseMiddleware] = []
         self._subscriptions: dict[str, tuple[GraphQLRequest, SubscriptionHandler]] = {}
 
-        self._server: http.server.HTTPServer | None = None
+        self._server: PooledHTTPServer | None = None
         self._server_thread: threading.Thread | None = None
         self._running = False
         self._stats = ServerStats()
+        self._stats_lock = threading.Lock()
 
         self._setup_resolvers()
         self._logger = logging.getLogger("SpectraGraphQLServer")
@@ -842,7 +847,7 @@ class SpectraGraphQLServer(GraphQLServerPort):
 
         server = self
 
-        class GraphQLHandler(http.server.BaseHTTPRequestHandler):
+        class GraphQLHandler(PooledRequestHandler):
             """HTTP handler for GraphQL requests."""
 
             def log_message(self, format: str, *args: Any) -> None:
@@ -850,9 +855,7 @@ class SpectraGraphQLServer(GraphQLServerPort):
 
             def do_OPTIONS(self) -> None:
                 """Handle CORS preflight."""
-                self.send_response(200)
-                self._set_cors_headers()
-                self.end_headers()
+                self._send_body(200, "text/plain", b"")
 
             def do_GET(self) -> None:
                 """Handle GET requests (playground)."""
@@ -908,17 +911,14 @@ class SpectraGraphQLServer(GraphQLServerPort):
     </script>
 </body>
 </html>"""
-                self.send_response(200)
-                self.send_header("Content-Type", "text/html")
-                self._set_cors_headers()
-                self.end_headers()
-                self.wfile.write(html.encode())
+                self._send_body(200, "text/html", html.encode())
 
             def _handle_graphql(self) -> None:
                 """Handle a GraphQL request."""
                 try:
-                    content_length = int(self.headers.get("Content-Length", 0))
-                    body = self.rfile.read(content_length)
+                    body = self.read_body()
+                    if body is None:
+                        return
                     data = json.loads(body.decode())
 
                     request = GraphQLRequest.from_dict(data)
@@ -927,25 +927,37 @@ class SpectraGraphQLServer(GraphQLServerPort):
                     # Execute synchronously
                     response = server._execute_sync(request, context)
 
-                    self.send_response(200)
-                    self.send_header("Content-Type", "application/json")
-                    self._set_cors_headers()
-                    self.end_headers()
-                    self.wfile.write(json.dumps(response.to_dict()).encode())
+                    self._send_body(
+                        200, "application/json", json.dumps(response.to_dict()).encode()
+                    )
 
                 except json.JSONDecodeError:
                     self.send_error(400, "Invalid JSON")
                 except Exception as e:
                     server._logger.exception("Error handling request")
-                    self.send_response(500)
-                    self.send_header("Content-Type", "application/json")
-                    self.end_headers()
                     error_response = GraphQLResponse.error(str(e))
-                    self.wfile.write(json.dumps(error_response.to_dict()).encode())
+                    self._send_body(
+                        500, "application/json", json.dumps(error_response.to_dict()).encode()
+                    )
 
-        self._server = http.server.HTTPServer(
+            def _send_body(self, status: int, content_type: str, data: bytes) -> None:
+                """Send a complete response with CORS headers."""
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self._set_cors_headers()
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        self._server = PooledHTTPServer(
             (self._config.host, self._config.port),
             GraphQLHandler,
+            HTTPServerConfig(
+                max_workers=self._config.max_workers,
+                max_queue_size=self._config.max_queued_connections,
+                max_body_bytes=self._config.max_request_size,
+                keep_alive_timeout=self._config.keep_alive_timeout,
+            ),
         )
 
         self._running = True
@@ -971,6 +983,7 @@ class SpectraGraphQLServer(GraphQLServerPort):
 
         if self._server:
             self._server.shutdown()
+            self._server.server_close()
             self._server = None
 
         if self._server_thread:
@@ -994,7 +1007,8 @@ class SpectraGraphQLServer(GraphQLServerPort):
     ) -> GraphQLResponse:
         """Synchronous execute implementation."""
         start_time = time.time()
-        self._stats.total_requests += 1
+        with self._stats_lock:
+            self._stats.total_requests += 1
 
         if context is None:
             context = ExecutionContext(request=request)
@@ -1004,14 +1018,15 @@ class SpectraGraphQLServer(GraphQLServerPort):
             result = self._execute_query(request, context)
 
             elapsed_ms = (time.time() - start_time) * 1000
-            self._stats.successful_requests += 1
+            with self._stats_lock:
+                self._stats.successful_requests += 1
 
-            # Update average response time
-            total_successful = self._stats.successful_requests
-            prev_avg = self._stats.average_response_time_ms
-            self._stats.average_response_time_ms = (
-                prev_avg * (total_successful - 1) + elapsed_ms
-            ) / total_successful
+                # Update average response time
+                total_successful = self._stats.successful_requests
+                prev_avg = self._stats.average_response_time_ms
+                self._stats.average_response_time_ms = (
+                    prev_avg * (total_successful - 1) + elapsed_ms
+                ) / total_successful
 
             return GraphQLResponse(
                 data=result,
@@ -1022,7 +1037,8 @@ class SpectraGraphQLServer(GraphQLServerPort):
             )
 
         except Exception as e:
-            self._stats.failed_requests += 1
+            with self._stats_lock:
+                self._stats.failed_requests += 1
             self._logger.exception("Error executing query")
             return GraphQLResponse.error(str(e))
 
@@ -1170,6 +1186,10 @@ class SpectraGraphQLServer(GraphQLServerPort):
         """Get server statistics."""
         return self._stats
 
+    def get_http_stats(self) -> dict[str, Any] | None:
+        """Get worker pool, queue and latency statistics of the HTTP front end."""
+        return self._server.stats_snapshot() if self._server else None
+
     async def subscribe(
         self,
         subscription_id: str,
@@ -1,5 +1,8 @@
 """
 HTTP Utilities - Connection pooling, session management, and HTTP optimizations.
+
+Also provides the pooled HTTP server runtime shared by the webhook,
+REST and GraphQL servers.
 """
 
 from .connection_pool import (
@@ -17,13 +20,23 @@ from .connection_pool import (
     get_pool_stats,
     get_session_for_host,
 )
+from .server import (
+    HTTPServerConfig,
+    HTTPServerStats,
+    PooledHTTPServer,
+    PooledRequestHandler,
+)
 
 
 __all__ = [
     "ConnectionPoolManager",
+    "HTTPServerConfig",
+    "HTTPServerStats",
     "PoolConfig",
     "PoolStats",
     "PoolStrategy",
+    "PooledHTTPServer",
+    "PooledRequestHandler",
     "TunedHTTPAdapter",
     "configure_global_pools",
     "create_azure_devops_adapter",
@@ -0,0 +1,303 @@
+"""
+Pooled HTTP Server - Concurrent stdlib HTTP front end for Spectra servers.
+
+``http.server.HTTPServer`` handles one connection at a time, so a slow
+sync or a large response stalls every other client. ``PooledHTTPServer``
+hands accepted connections to a bounded pool of worker threads instead,
+answers ``503`` once the pool and its queue are full, and keeps HTTP/1.1
+connections alive between requests. ``PooledRequestHandler`` adds body
+size limits and reports per-request latency to the server's stats.
+"""
+
+import logging
+import queue
+import socket
+import threading
+import time
+from collections import deque
+from contextlib import suppress
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Any
+
+
+logger = logging.getLogger(__name__)
+
+# Number of recent requests the latency percentiles are computed over
+LATENCY_WINDOW = 1024
+
+# How often idle workers check whether the server was closed
+WORKER_POLL_SECONDS = 0.5
+
+# Sent as-is when every worker is busy and the queue is full
+_OVERLOADED_RESPONSE = (
+    b"HTTP/1.1 503 Service Unavailable\r\n"
+    b"Content-Length: 0\r\n"
+    b"Retry-After: 1\r\n"
+    b"Connection: close\r\n\r\n"
+)
+
+
+@dataclass
+class HTTPServerConfig:
+    """Configuration for a pooled HTTP server."""
+
+    max_workers: int = 16  # Connections handled concurrently
+    max_queue_size: int = 64  # Accepted connections waiting for a worker
+    max_body_bytes: int = 10 * 1024 * 1024  # Largest accepted request body
+    keep_alive_timeout: float = 5.0  # Idle seconds before a connection is closed
+
+
+@dataclass
+class HTTPServerStats:
+    """Statistics for a pooled HTTP server."""
+
+    connections_accepted: int = 0
+    connections_rejected: int = 0
+    requests_handled: int = 0
+    bodies_rejected: int = 0
+    queue_depth: int = 0
+    peak_queue_depth: int = 0
+    active_workers: int = 0
+    total_queue_wait_ms: float = 0.0
+    total_latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+    recent_latencies_ms: deque[float] = field(
+        default_factory=lambda: deque(maxlen=LATENCY_WINDOW), repr=False
+    )
+
+    @property
+    def avg_queue_wait_ms(self) -> float:
+        """Average time a connection waited for a worker."""
+        served = self.connections_accepted - self.connections_rejected
+        return self.total_queue_wait_ms / served if served > 0 else 0.0
+
+    @property
+    def avg_latency_ms(self) -> float:
+        """Average request handling time."""
+        return self.total_latency_ms / self.requests_handled if self.requests_handled else 0.0
+
+    def latency_percentile(self, percentile: float) -> float:
+        """Latency percentile (0-100) over the most recent requests."""
+        if not self.recent_latencies_ms:
+            return 0.0
+        ordered = sorted(self.recent_latencies_ms)
+        index = min(len(ordered) - 1, int(len(ordered) * percentile / 100))
+        return ordered[index]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "connections_accepted": self.connections_accepted,
+            "connections_rejected": self.connections_rejected,
+            "requests_handled": self.requests_handled,
+            "bodies_rejected": self.bodies_rejected,
+            "queue_depth": self.queue_depth,
+            "peak_queue_depth": self.peak_queue_depth,
+            "active_workers": self.active_workers,
+            "avg_queue_wait_ms": round(self.avg_queue_wait_ms, 3),
+            "avg_latency_ms": round(self.avg_latency_ms, 3),
+            "p95_latency_ms": round(self.latency_percentile(95), 3),
+            "max_latency_ms": round(self.max_latency_ms, 3),
+        }
+
+
+class PooledHTTPServer(HTTPServer):
+    """
+    HTTP server dispatching connections to a bounded worker pool.
+
+    The accept loop (``serve_forever``) only queues connections; worker
+    threads parse and answer them. Connections that find the queue full
+    get an immediate ``503`` so callers such as webhook senders retry
+    instead of timing out.
+    """
+
+    def __init__(
+        self,
+        server_address: tuple[str, int],
+        handler_class: type[BaseHTTPRequestHandler],
+        config: HTTPServerConfig | None = None,
+        bind_and_activate: bool = True,
+    ):
+        """
+        Initialize the server and start its workers.
+
+        Args:
+            server_address: (host, port) to bind to.
+            handler_class: Request handler class.
+            config: Pool and limit configuration.
+            bind_and_activate: Whether to bind and listen immediately.
+        """
+        self.config = config or HTTPServerConfig()
+        self.stats = HTTPServerStats()
+        self._stats_lock = threading.Lock()
+        self._connections: queue.Queue[tuple[socket.socket, Any, float]] = queue.Queue(
+            maxsize=self.config.max_queue_size
+        )
+        self._closing = threading.Event()
+        self.request_queue_size = max(self.config.max_queue_size, 5)
+
+        super().__init__(server_address, handler_class, bind_and_activate)
+
+        self._workers = [
+            threading.Thread(
+                target=self._work,
+                name=f"spectryn-http-{index}",
+                daemon=True,
+            )
+            for index in range(self.config.max_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        """Queue an accepted connection for the worker pool."""
+        try:
+            self._connections.put_nowait((request, client_address, time.perf_counter()))
+        except queue.Full:
+            with self._stats_lock:
+                self.stats.connections_accepted += 1
+                self.stats.connections_rejected += 1
+            logger.warning(f"HTTP worker pool saturated, rejecting {client_address}")
+            with suppress(OSError):
+                request.sendall(_OVERLOADED_RESPONSE)
+            self.shutdown_request(request)
+            return
+
+        with self._stats_lock:
+            self.stats.connections_accepted += 1
+            depth = self._connections.qsize()
+            self.stats.peak_queue_depth = max(self.stats.peak_queue_depth, depth)
+
+    def server_close(self) -> None:
+        """Close the listening socket and stop the workers."""
+        super().server_close()
+
+        # Workers still serving a connection exit once it closes or idles out
+        self._closing.set()
+        while True:
+            try:
+                request, _, _ = self._connections.get_nowait()
+            except queue.Empty:
+                break
+            self.shutdown_request(request)
+
+    def record_request(self, elapsed_ms: float) -> None:
+        """Record the handling time of one request."""
+        with self._stats_lock:
+            self.stats.requests_handled += 1
+            self.stats.total_latency_ms += elapsed_ms
+            self.stats.max_latency_ms = max(self.stats.max_latency_ms, elapsed_ms)
+            self.stats.recent_latencies_ms.append(elapsed_ms)
+
+    def record_body_rejected(self) -> None:
+        """Record a request refused for its body size."""
+        with self._stats_lock:
+            self.stats.bodies_rejected += 1
+
+    def stats_snapshot(self) -> dict[str, Any]:
+        """Get a consistent snapshot of the server statistics."""
+        with self._stats_lock:
+            self.stats.queue_depth = self._connections.qsize()
+            return self.stats.to_dict()
+
+    def _work(self) -> None:
+        """Serve queued connections until the server is closed."""
+        while not self._closing.is_set():
+            try:
+                request, client_address, queued_at = self._connections.get(
+                    timeout=WORKER_POLL_SECONDS
+                )
+            except queue.Empty:
+                continue
+
+            with self._stats_lock:
+                self.stats.active_workers += 1
+                self.stats.total_queue_wait_ms += (time.perf_counter() - queued_at) * 1000
+            try:
+                self.finish_request(request, client_address)
+            except Exception:
+                self.handle_error(request, client_address)
+            finally:
+                self.shutdown_request(request)
+                with self._stats_lock:
+                    self.stats.active_workers -= 1
+
+
+class PooledRequestHandler(BaseHTTPRequestHandler):
+    """
+    Request handler base for ``PooledHTTPServer``.
+
+    Speaks HTTP/1.1 so clients can reuse connections. Responses sent
+    without a Content-Length header fall back to closing the connection,
+    so handlers that stream an unknown amount of data stay correct.
+    """
+
+    protocol_version = "HTTP/1.1"
+    server: PooledHTTPServer
+
+    def setup(self) -> None:
+        """Apply the keep-alive idle timeout to the connection."""
+        self.timeout = self.server.config.keep_alive_timeout  # type: ignore[misc]
+        self._length_sent = False
+        super().setup()
+
+    def handle_one_request(self) -> None:
+        """Handle one request and record how long it took."""
+        self.command = ""
+        self._length_sent = False
+        start = time.perf_counter()
+        super().handle_one_request()
+        if self.command:
+            self.server.record_request((time.perf_counter() - start) * 1000)
+
+    def handle_expect_100(self) -> bool:
+        """Send the interim 100 response without delimiting it."""
+        self._length_sent = True
+        try:
+            return super().handle_expect_100()
+        finally:
+            self._length_sent = False
+
+    def send_header(self, keyword: str, value: str) -> None:
+        """Send a header, noting whether the response is length-delimited."""
+        if keyword.lower() == "content-length":
+            self._length_sent = True
+        super().send_header(keyword, value)
+
+    def end_headers(self) -> None:
+        """Finish the headers, closing undelimited responses."""
+        if not self._length_sent and not self.close_connection:
+            self.send_header("Connection", "close")
+        super().end_headers()
+
+    def read_body(self) -> bytes | None:
+        """
+        Read the request body within the configured size limit.
+
+        Returns:
+            The body bytes, or None if the request was refused and an
+            error response has already been sent.
+        """
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            self.send_error(HTTPStatus.LENGTH_REQUIRED, "Chunked bodies are not supported")
+            return None
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            length = -1
+        if length < 0:
+            self.send_error(HTTPStatus.BAD_REQUEST, "Invalid Content-Length")
+            return None
+
+        if length > self.server.config.max_body_bytes:
+            self.server.record_body_rejected()
+            self.send_error(
+                HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                f"Request body exceeds {self.server.config.max_body_bytes} bytes",
+            )
+            return None
+
+        return self.rfile.read(length) if length else b""
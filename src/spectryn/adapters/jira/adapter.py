@@ -5,9 +5,14 @@ This is the main entry point for Jira integration.
 """
 
 import logging
+import math
 import re
+import threading
+from collections.abc import Iterator, Sequence
+from datetime import datetime, timezone
 from typing import Any
 
+from spectryn.adapters.cache.metadata import MetadataCache, MetadataType
 from spectryn.adapters.formatters.adf import ADFFormatter
 from spectryn.core.constants import IssueType, JiraField
 from spectryn.core.domain.value_objects import CommitRef
@@ -18,10 +23,12 @@ from spectryn.core.ports.issue_tracker import (
     IssueTrackerError,
     IssueTrackerPort,
     LinkType,
+    TransitionError,
 )
 
 from .batch import BatchResult, JiraBatchClient
 from .client import JiraApiClient
+from .workflow import TransitionWalk, WorkflowGraph, status_matches, workflow_name_for
 
 
 class JiraAdapter(IssueTrackerPort):
@@ -34,18 +41,24 @@ class JiraAdapter(IssueTrackerPort):
     # Default Jira field IDs (can be overridden)
     STORY_POINTS_FIELD = "customfield_10014"
 
-    # Workflow transitions (varies by project)
-    DEFAULT_TRANSITIONS = {
-        "Analyze": {"to_open": "7"},
-        "Open": {"to_in_progress": "4", "to_resolved": "5"},
-        "In Progress": {"to_resolved": "5", "to_open": "301"},
-    }
+    # Upper bound on transitions executed for a single transition_issue call
+    MAX_TRANSITION_HOPS = 5
+
+    # Resolution set on transitions whose screen requires one
+    DEFAULT_RESOLUTION = "Done"
+
+    # Minutes added to "updated since" windows to absorb clock skew with the server
+    UPDATED_SINCE_SKEW_MINUTES = 2
+
+    # Keys per "in (...)" clause, keeping JQL well under the server's length limit
+    JQL_KEY_BATCH_SIZE = 100
 
     def __init__(
         self,
         config: TrackerConfig,
         dry_run: bool = True,
         formatter: ADFFormatter | None = None,
+        metadata_cache: MetadataCache | None = None,
     ):
         """
         Initialize the Jira adapter.
@@ -54,12 +67,16 @@ class JiraAdapter(IssueTrackerPort):
             config: Tracker configuration
             dry_run: If True, don't make changes
             formatter: Optional custom ADF formatter
+            metadata_cache: Optional cache for workflow graphs and other metadata
         """
         self.config = config
         self._dry_run = dry_run
         self.formatter = formatter or ADFFormatter()
         self.logger = logging.getLogger("JiraAdapter")
 
+        self._metadata_cache = metadata_cache or MetadataCache(tracker="jira")
+        self._workflow_lock = threading.Lock()
+
         self._client = JiraApiClient(
             base_url=config.url,
             email=config.email,
@@ -101,10 +118,65 @@ class JiraAdapter(IssueTrackerPort):
         return self._parse_issue(data)
 
     def get_epic_children(self, epic_key: str) -> list[IssueData]:
+        return [issue for page in self.iter_epic_children(epic_key) for issue in page]
+
+    def iter_epic_children(self, epic_key: str, prefetch: bool = True) -> Iterator[list[IssueData]]:
         jql = f"{JiraField.PARENT} = {epic_key} ORDER BY {JiraField.KEY} ASC"
-        data = self._client.search_jql(jql, list(JiraField.ISSUE_WITH_SUBTASKS))
+        yield from self.iter_search_jql(jql, list(JiraField.ISSUE_WITH_SUBTASKS), prefetch=prefetch)
 
-        return [self._parse_issue(issue) for issue in data.get("issues", [])]
+    def get_epic_children_updated_since(
+        self,
+        epic_key: str,
+        since: datetime,
+        child_keys: Sequence[str] = (),
+    ) -> list[IssueData] | None:
+        # JQL dates are read in the user's profile time zone, so use a
+        # relative window ("-15m"), which only depends on the server clock.
+        elapsed = (datetime.now(timezone.utc) - since).total_seconds()
+        minutes = max(math.ceil(elapsed / 60), 0) + self.UPDATED_SINCE_SKEW_MINUTES
+        window = f'{JiraField.UPDATED} >= "-{minutes}m" ORDER BY {JiraField.KEY} ASC'
+        fields = [*JiraField.ISSUE_WITH_SUBTASKS, JiraField.PARENT]
+
+        # The first query also covers the epic's direct children; each later
+        # one only adds subtasks of the next batch of known child keys.
+        scopes = [f"{JiraField.PARENT} = {epic_key}"]
+        for i, batch in enumerate(self._key_batches(child_keys)):
+            clause = f"{JiraField.PARENT} in ({', '.join(batch)})"
+            if i == 0:
+                scopes[0] = f"({scopes[0]} OR {clause})"
+            else:
+                scopes.append(clause)
+
+        changed: dict[str, IssueData] = {}
+        stale_parents: set[str] = set()
+        for scope in scopes:
+            for page in self._client.iter_search_jql(f"{scope} AND {window}", fields):
+                for data in page:
+                    parent = data.get(JiraField.FIELDS, {}).get(JiraField.PARENT) or {}
+                    if parent.get(JiraField.KEY, epic_key) == epic_key:
+                        issue = self._parse_issue(data)
+                        changed[issue.key] = issue
+                    else:
+                        # A changed subtask: its parent's subtask list is out of date
+                        stale_parents.add(parent[JiraField.KEY])
+
+        stale_parents -= changed.keys()
+        for batch in self._key_batches(sorted(stale_parents)):
+            jql = f"{JiraField.KEY} in ({', '.join(batch)}) ORDER BY {JiraField.KEY} ASC"
+            for issues in self.iter_search_jql(jql, list(JiraField.ISSUE_WITH_SUBTASKS)):
+                changed.update((issue.key, issue) for issue in issues)
+
+        return list(changed.values())
+
+    def _key_batches(self, keys: Sequence[str]) -> Iterator[Sequence[str]]:
+        """Split issue keys into JQL_KEY_BATCH_SIZE chunks for "in (...)" clauses."""
+        for start in range(0, len(keys), self.JQL_KEY_BATCH_SIZE):
+            yield keys[start : start + self.JQL_KEY_BATCH_SIZE]
+
+    @property
+    def epic_children_include_subtasks(self) -> bool:
+        # Epic children are searched with the same fields get_issue() requests
+        return True
 
     def get_issue_comments(self, issue_key: str) -> list[dict]:
         data = self._client.get(f"issue/{issue_key}/comment")
@@ -115,8 +187,38 @@ class JiraAdapter(IssueTrackerPort):
         return data[JiraField.FIELDS][JiraField.STATUS][JiraField.NAME]
 
     def search_issues(self, query: str, max_results: int = 50) -> list[IssueData]:
-        data = self._client.search_jql(query, list(JiraField.BASIC_FIELDS), max_results=max_results)
-        return [self._parse_issue(issue) for issue in data.get("issues", [])]
+        pages = self.iter_search_jql(query, list(JiraField.BASIC_FIELDS), max_results=max_results)
+        return [issue for page in pages for issue in page]
+
+    def iter_search_jql(
+        self,
+        jql: str,
+        fields: list[str] | None = None,
+        page_size: int = JiraApiClient.DEFAULT_PAGE_SIZE,
+        max_results: int | None = None,
+        prefetch: bool = False,
+    ) -> Iterator[list[IssueData]]:
+        """
+        Run a JQL search and yield parsed issues page by page.
+
+        Args:
+            jql: The JQL query string.
+            fields: Fields to request (defaults to basic fields).
+            page_size: Number of issues per page.
+            max_results: Optional cap on the total number of issues.
+            prefetch: Fetch the next page while the current one is parsed.
+
+        Yields:
+            Lists of IssueData, one list per page.
+        """
+        for page in self._client.iter_search_jql(
+            jql,
+            fields if fields is not None else list(JiraField.BASIC_FIELDS),
+            page_size=page_size,
+            max_results=max_results,
+            prefetch=prefetch,
+        ):
+            yield [self._parse_issue(issue) for issue in page]
 
     # -------------------------------------------------------------------------
     # IssueTrackerPort Implementation - Write Operations
@@ -417,40 +519,88 @@ class JiraAdapter(IssueTrackerPort):
             self.logger.info(f"[DRY-RUN] Would transition {issue_key} to {target_status}")
             return True
 
-        current = self.get_issue_status(issue_key)
+        current, issue_type, project = self._get_workflow_fields(issue_key)
         if current.lower() == target_status.lower():
             return True
 
-        # Get transition path
-        target_lower = target_status.lower()
+        scope = f"{issue_key.rsplit('-', 1)[0]}:{issue_type.get(JiraField.NAME, '')}"
+        graph = self._get_workflow_graph(scope, project.get("id"), issue_type.get("id"))
+        walk = TransitionWalk(graph, current, target_status, self.MAX_TRANSITION_HOPS)
 
-        if "resolved" in target_lower or "done" in target_lower:
-            path = [
-                ("Analyze", "7", None),
-                ("Open", "4", None),
-                ("In Progress", "5", "Done"),
-            ]
-        elif "progress" in target_lower:
-            path = [
-                ("Analyze", "7", None),
-                ("Open", "4", None),
-            ]
-        elif "open" in target_lower:
-            path = [("Analyze", "7", None)]
-        else:
-            self.logger.warning(f"Unknown target status: {target_status}")
-            return False
-
-        # Execute transitions
-        for from_status, transition_id, resolution in path:
-            current = self.get_issue_status(issue_key)
-            if current == from_status:
-                if not self._do_transition(issue_key, transition_id, resolution):
+        try:
+            while not walk.done:
+                with self._workflow_lock:
+                    if walk.needs_transitions:
+                        walk.learn(self.get_available_transitions(issue_key))
+                        self._metadata_cache.set_metadata(MetadataType.WORKFLOWS, graph, scope)
+                    transition = walk.next_transition()
+
+                resolution = self.DEFAULT_RESOLUTION if transition.requires_resolution else None
+                if not self._do_transition(issue_key, transition.id, resolution):
+                    # The cached workflow may be stale; relearn it next time
+                    self._metadata_cache.invalidate(MetadataType.WORKFLOWS, scope)
                     return False
+                walk.advance(transition)
+        except TransitionError as e:
+            self.logger.warning(f"Cannot transition {issue_key}: {e}")
+            return False
 
         # Verify final status
         final = self.get_issue_status(issue_key)
-        return target_lower in final.lower()
+        return status_matches(final, target_status)
+
+    def _get_workflow_fields(self, issue_key: str) -> tuple[str, dict, dict]:
+        """Get an issue's status name, issue type and project in one request."""
+        data = self._client.get(
+            f"issue/{issue_key}",
+            params={
+                JiraField.FIELDS: f"{JiraField.STATUS},{JiraField.ISSUETYPE},{JiraField.PROJECT}"
+            },
+        )
+        fields = data.get(JiraField.FIELDS, {})
+        return (
+            fields.get(JiraField.STATUS, {}).get(JiraField.NAME, ""),
+            fields.get(JiraField.ISSUETYPE) or {},
+            fields.get(JiraField.PROJECT) or {},
+        )
+
+    def _get_workflow_graph(
+        self, scope: str, project_id: str | None, issue_type_id: str | None
+    ) -> WorkflowGraph:
+        """Get the cached workflow graph for a project and issue type."""
+        with self._workflow_lock:
+            return self._metadata_cache.get_or_fetch(
+                MetadataType.WORKFLOWS,
+                lambda: self._load_workflow_graph(project_id, issue_type_id),
+                scope=scope,
+            )
+
+    def _load_workflow_graph(
+        self, project_id: str | None, issue_type_id: str | None
+    ) -> WorkflowGraph:
+        """
+        Create a workflow graph seeded from the workflow definition.
+
+        Reading the definition needs admin permission; without it the graph
+        only learns the transitions of statuses issues are actually in.
+        """
+        graph = WorkflowGraph()
+        if not project_id or not issue_type_id:
+            return graph
+
+        try:
+            scheme = self._client.get("workflowscheme/project", params={"projectId": project_id})
+            name = workflow_name_for(scheme, str(issue_type_id))
+            if name:
+                data = self._client.get(
+                    "workflow/search",
+                    params={"workflowName": name, "expand": "transitions,statuses"},
+                )
+                for workflow in data.get("values", []):
+                    graph.add_definition(workflow)
+        except IssueTrackerError as e:
+            self.logger.debug(f"Workflow definition unavailable for project {project_id}: {e}")
+        return graph
 
     def _do_transition(
         self, issue_key: str, transition_id: str, resolution: str | None = None
@@ -473,7 +623,9 @@ class JiraAdapter(IssueTrackerPort):
     # -------------------------------------------------------------------------
 
     def get_available_transitions(self, issue_key: str) -> list[dict]:
-        data = self._client.get(f"issue/{issue_key}/transitions")
+        data = self._client.get(
+            f"issue/{issue_key}/transitions", params={"expand": "transitions.fields"}
+        )
         return data.get("transitions", [])
 
     def format_description(self, markdown: str) -> Any:
@@ -13,6 +13,7 @@ Example:
     ...     results = await adapter.update_descriptions_async(updates)
 """
 
+import asyncio
 import logging
 from collections.abc import Sequence
 from typing import Any
@@ -20,10 +21,14 @@ from typing import Any
 from spectryn.core.constants import IssueType, JiraField
 from spectryn.core.ports.async_tracker import AsyncIssueTrackerPort
 from spectryn.core.ports.config_provider import TrackerConfig
-from spectryn.core.ports.issue_tracker import IssueData
+from spectryn.core.ports.issue_tracker import IssueData, IssueTrackerError
+
+from .workflow import TransitionWalk, WorkflowGraph, status_matches, workflow_name_for
 
 
 try:
+    from spectryn.adapters.async_base import gather_with_limit
+
     from .async_client import AsyncJiraApiClient
 
     ASYNC_AVAILABLE = True
@@ -42,6 +47,12 @@ class AsyncJiraAdapter(AsyncIssueTrackerPort):
     Requires aiohttp: pip install spectra[async]
     """
 
+    # Upper bound on transitions executed per issue in transition_issues_async
+    MAX_TRANSITION_HOPS = 5
+
+    # Resolution set on transitions whose screen requires one
+    DEFAULT_RESOLUTION = "Done"
+
     def __init__(
         self,
         config: TrackerConfig,
@@ -75,6 +86,9 @@ class AsyncJiraAdapter(AsyncIssueTrackerPort):
             formatter = ADFFormatter()
         self.formatter = formatter
 
+        self._story_points_field = config.story_points_field or JiraField.STORY_POINTS
+        self._workflows: dict[str, WorkflowGraph] = {}
+        self._workflow_locks: dict[str, asyncio.Lock] = {}
         self._client: AsyncJiraApiClient | None = None
 
     async def connect(self) -> None:
@@ -119,12 +133,7 @@ class AsyncJiraAdapter(AsyncIssueTrackerPort):
         fields = ",".join(JiraField.ISSUE_WITH_SUBTASKS)
         results = await client.get_issues_parallel(list(issue_keys), fields=[fields])
 
-        issues = []
-        for _key, data in results.items():
-            if data is not None:
-                issues.append(self._parse_issue(data))
-
-        return issues
+        return [self._parse_issue(data) for data in results.results if data]
 
     async def get_epic_children_async(self, epic_key: str) -> list[IssueData]:
         """Fetch all children of an epic asynchronously."""
@@ -158,12 +167,19 @@ class AsyncJiraAdapter(AsyncIssueTrackerPort):
             self.logger.info(f"[DRY-RUN] Would update {len(updates)} descriptions")
             return [(key, True, None) for key, _ in updates]
 
-        results = await client.update_issues_parallel(list(updates))
-
-        return [
-            (key, result.success, result.error if not result.success else None)
-            for key, result in results.items()
-        ]
+        async def update_one(key: str, description: Any) -> tuple[str, bool, str | None]:
+            if isinstance(description, str):
+                description = self.formatter.format_text(description)
+            try:
+                await client.update_issue(key, {JiraField.DESCRIPTION: description})
+                return (key, True, None)
+            except IssueTrackerError as e:
+                return (key, False, str(e))
+
+        return await gather_with_limit(
+            [update_one(key, description) for key, description in updates],
+            limit=self._concurrency,
+        )
 
     async def create_subtasks_async(
         self,
@@ -176,47 +192,142 @@ class AsyncJiraAdapter(AsyncIssueTrackerPort):
             self.logger.info(f"[DRY-RUN] Would create {len(subtasks)} subtasks")
             return [(None, True, None) for _ in subtasks]
 
-        # Format subtasks for the API
-        api_subtasks = []
-        for st in subtasks:
-            api_subtasks.append(
-                {
-                    JiraField.PROJECT: {JiraField.KEY: st["project_key"]},
-                    JiraField.PARENT: {JiraField.KEY: st["parent_key"]},
-                    JiraField.SUMMARY: st["summary"][:255],
-                    JiraField.DESCRIPTION: st.get("description", ""),
-                    JiraField.ISSUETYPE: {JiraField.NAME: IssueType.JIRA_SUBTASK},
-                }
-            )
-
-        results = await client.create_issues_parallel(api_subtasks)
-
-        output = []
-        for result in results:
-            if result.success:
-                output.append((result.key, True, None))
-            else:
-                output.append((None, False, result.error))
-
-        return output
+        async def create_one(st: dict[str, Any]) -> tuple[str | None, bool, str | None]:
+            description = st.get("description", "")
+            if isinstance(description, str):
+                description = self.formatter.format_text(description)
+
+            fields: dict[str, Any] = {
+                JiraField.PROJECT: {JiraField.KEY: st["project_key"]},
+                JiraField.PARENT: {JiraField.KEY: st["parent_key"]},
+                JiraField.SUMMARY: st["summary"][:255],
+                JiraField.DESCRIPTION: description,
+                JiraField.ISSUETYPE: {JiraField.NAME: IssueType.JIRA_SUBTASK},
+            }
+            if st.get("story_points") is not None:
+                fields[self._story_points_field] = float(st["story_points"])
+
+            try:
+                created = await client.create_issue(fields)
+            except IssueTrackerError as e:
+                return (None, False, str(e))
+
+            key = created.get(JiraField.KEY)
+            if not key:
+                return (None, False, "Failed to create subtask")
+            return (key, True, None)
+
+        return await gather_with_limit(
+            [create_one(st) for st in subtasks],
+            limit=self._concurrency,
+        )
 
     async def transition_issues_async(
         self,
         transitions: Sequence[tuple[str, str]],
     ) -> list[tuple[str, bool, str | None]]:
-        """Transition multiple issues in parallel."""
-        client = self._ensure_connected()
+        """
+        Transition multiple issues in parallel.
+
+        Paths are planned over the same learned workflow graphs the sync
+        adapter uses, shared by all issues of a project and issue type.
+        """
+        self._ensure_connected()
 
         if self._dry_run:
             self.logger.info(f"[DRY-RUN] Would transition {len(transitions)} issues")
             return [(key, True, None) for key, _ in transitions]
 
-        results = await client.transition_issues_parallel(list(transitions))
+        async def transition_one(key: str, target: str) -> tuple[str, bool, str | None]:
+            try:
+                return await self._transition_issue(key, target)
+            except IssueTrackerError as e:
+                return (key, False, str(e))
 
-        return [
-            (key, result.success, result.error if not result.success else None)
-            for key, result in results.items()
-        ]
+        return await gather_with_limit(
+            [transition_one(key, target) for key, target in transitions],
+            limit=self._concurrency,
+        )
+
+    async def _transition_issue(
+        self, issue_key: str, target_status: str
+    ) -> tuple[str, bool, str | None]:
+        """Walk one issue to a target status along the shortest known path."""
+        client = self._ensure_connected()
+
+        data = await client.get_issue(
+            issue_key, fields=[JiraField.STATUS, JiraField.ISSUETYPE, JiraField.PROJECT]
+        )
+        fields = data.get(JiraField.FIELDS, {})
+        current = fields.get(JiraField.STATUS, {}).get(JiraField.NAME, "")
+        issue_type = fields.get(JiraField.ISSUETYPE) or {}
+        if current.lower() == target_status.lower():
+            return (issue_key, True, None)
+
+        scope = f"{issue_key.rsplit('-', 1)[0]}:{issue_type.get(JiraField.NAME, '')}"
+        # Concurrent transitions in one scope wait for a single graph load
+        async with self._workflow_locks.setdefault(scope, asyncio.Lock()):
+            graph = self._workflows.get(scope)
+            if graph is None:
+                project_id = (fields.get(JiraField.PROJECT) or {}).get("id")
+                graph = await self._load_workflow_graph(project_id, issue_type.get("id"))
+                self._workflows[scope] = graph
+        walk = TransitionWalk(graph, current, target_status, self.MAX_TRANSITION_HOPS)
+
+        while not walk.done:
+            if walk.needs_transitions:
+                response = await client.get(
+                    f"issue/{issue_key}/transitions", params={"expand": "transitions.fields"}
+                )
+                walk.learn(response.get("transitions", []) if isinstance(response, dict) else [])
+
+            transition = walk.next_transition()
+            resolution = (
+                {"resolution": {JiraField.NAME: self.DEFAULT_RESOLUTION}}
+                if transition.requires_resolution
+                else None
+            )
+            try:
+                await client.transition_issue(issue_key, transition.id, resolution)
+            except IssueTrackerError:
+                # The learned workflow may be stale; relearn it next time
+                if self._workflows.get(scope) is graph:
+                    del self._workflows[scope]
+                raise
+            walk.advance(transition)
+
+        final = await client.get_issue(issue_key, fields=[JiraField.STATUS])
+        final_status = (
+            final.get(JiraField.FIELDS, {}).get(JiraField.STATUS, {}).get(JiraField.NAME, "")
+        )
+        if not status_matches(final_status, target_status):
+            return (issue_key, False, f"Ended in '{final_status}' instead of '{target_status}'")
+        return (issue_key, True, None)
+
+    async def _load_workflow_graph(
+        self, project_id: str | None, issue_type_id: str | None
+    ) -> WorkflowGraph:
+        """Create a workflow graph seeded from the workflow definition, if readable."""
+        client = self._ensure_connected()
+        graph = WorkflowGraph()
+        if not project_id or not issue_type_id:
+            return graph
+
+        try:
+            scheme = await client.get("workflowscheme/project", params={"projectId": project_id})
+            name = (
+                workflow_name_for(scheme, str(issue_type_id)) if isinstance(scheme, dict) else None
+            )
+            if name:
+                data = await client.get(
+                    "workflow/search",
+                    params={"workflowName": name, "expand": "transitions,statuses"},
+                )
+                for workflow in data.get("values", []) if isinstance(data, dict) else []:
+                    graph.add_definition(workflow)
+        except IssueTrackerError as e:
+            self.logger.debug(f"Workflow definition unavailable for project {project_id}: {e}")
+        return graph
 
     async def add_comments_async(
         self,
@@ -229,12 +340,19 @@ class AsyncJiraAdapter(AsyncIssueTrackerPort):
             self.logger.info(f"[DRY-RUN] Would add {len(comments)} comments")
             return [(key, True, None) for key, _ in comments]
 
-        results = await client.add_comments_parallel(list(comments))
-
-        return [
-            (key, result.success, result.error if not result.success else None)
-            for key, result in results.items()
-        ]
+        async def add_one(key: str, body: Any) -> tuple[str, bool, str | None]:
+            if isinstance(body, str):
+                body = self.formatter.format_text(body)
+            try:
+                await client.add_comment(key, body)
+                return (key, True, None)
+            except IssueTrackerError as e:
+                return (key, False, str(e))
+
+        return await gather_with_limit(
+            [add_one(key, body) for key, body in comments],
+            limit=self._concurrency,
+        )
 
     # -------------------------------------------------------------------------
     # Helper Methods
@@ -5,9 +5,11 @@ Wraps JiraApiClient with transparent caching to reduce API calls.
 """
 
 import logging
+from pathlib import Path
 from typing import Any
 
-from spectryn.adapters.cache import CacheBackend, CacheManager, MemoryCache
+from spectryn.adapters.async_base import ConditionalRequestCache
+from spectryn.adapters.cache import CacheBackend, CacheManager, create_cache_backend
 
 from .client import JiraApiClient
 
@@ -25,6 +27,7 @@ class CachedJiraApiClient(JiraApiClient):
     - Cache invalidation on writes
     - Configurable TTLs per resource type
     - Cache statistics for monitoring
+    - ETag/Last-Modified revalidation of responses once they expire
 
     Example:
         >>> client = CachedJiraApiClient(
@@ -52,9 +55,11 @@ class CachedJiraApiClient(JiraApiClient):
         api_token: str,
         dry_run: bool = True,
         cache_enabled: bool = True,
-        cache_backend: CacheBackend | None = None,
+        cache_backend: CacheBackend | str | None = None,
         cache_ttl: float = 300.0,
         cache_max_size: int = 1000,
+        cache_path: str | Path | None = None,
+        conditional_requests: bool = True,
         **kwargs: Any,
     ):
         """
@@ -66,11 +71,18 @@ class CachedJiraApiClient(JiraApiClient):
             api_token: API token
             dry_run: If True, don't make write operations
             cache_enabled: Whether to enable caching
-            cache_backend: Custom cache backend (defaults to MemoryCache)
+            cache_backend: Custom cache backend, or "memory", "file" or
+                "sqlite" (defaults to MemoryCache)
             cache_ttl: Default cache TTL in seconds
             cache_max_size: Maximum cache entries (for MemoryCache)
+            cache_path: Cache directory/database file for "file"/"sqlite"
+            conditional_requests: Revalidate expired GET responses with
+                If-None-Match/If-Modified-Since instead of refetching them
             **kwargs: Additional arguments for JiraApiClient
         """
+        if conditional_requests and cache_enabled:
+            kwargs.setdefault("conditional_cache", ConditionalRequestCache(max_size=cache_max_size))
+
         super().__init__(
             base_url=base_url,
             email=email,
@@ -83,7 +95,14 @@ class CachedJiraApiClient(JiraApiClient):
         self.logger = logging.getLogger("CachedJiraApiClient")
 
         # Setup cache
-        backend = cache_backend or MemoryCache(max_size=cache_max_size, default_ttl=cache_ttl)
+        backend = cache_backend
+        if backend is None or isinstance(backend, str):
+            backend = create_cache_backend(
+                backend or "memory",
+                path=cache_path,
+                default_ttl=cache_ttl,
+                max_size=cache_max_size,
+            )
 
         self._cache = CacheManager(
             backend=backend,
@@ -196,8 +215,7 @@ class CachedJiraApiClient(JiraApiClient):
 
         def fetch() -> list[dict[str, Any]]:
             jql = f"parent = {epic_key} ORDER BY key ASC"
-            result = self.search_jql(jql, fields)
-            return result.get("issues", [])
+            return [issue for page in self.iter_search_jql(jql, fields) for issue in page]
 
         return self._cache.get_or_fetch_epic_children(
             epic_key=epic_key,
@@ -221,8 +239,12 @@ class CachedJiraApiClient(JiraApiClient):
         jql: str,
         fields: list[str],
         max_results: int = 100,
+        next_page_token: str | None = None,
     ) -> dict[str, Any]:
-        """Execute JQL search (cached)."""
+        """Execute JQL search (cached; continuation pages are not cached)."""
+        if next_page_token:
+            return super().search_jql(jql, fields, max_results, next_page_token)
+
         cached = self._cache.get_search(jql, max_results)
         if cached is not None:
             return cached
@@ -303,11 +325,14 @@ class CachedJiraApiClient(JiraApiClient):
     def cache_stats(self) -> dict[str, Any]:
         """Get cache statistics."""
         stats = self._cache.get_stats()
-        return {
+        result = {
             **stats.to_dict(),
             "size": self._cache.size,
             "enabled": self.cache_enabled,
         }
+        if self._conditional_cache is not None:
+            result["conditional"] = self._conditional_cache.stats
+        return result
 
     @property
     def cache_hit_rate(self) -> float:
@@ -7,6 +7,8 @@ The JiraAdapter uses this to implement the IssueTrackerPort.
 
 import logging
 import time
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any
 
 import requests
@@ -14,6 +16,7 @@ from requests.adapters import HTTPAdapter
 
 from spectryn.adapters.async_base import (
     RETRYABLE_STATUS_CODES,
+    ConditionalRequestCache,
     JiraRateLimiter,
     calculate_delay,
     get_retry_after,
@@ -62,6 +65,9 @@ class JiraApiClient:
     DEFAULT_POOL_BLOCK = False  # Don't block when pool is exhausted
     DEFAULT_TIMEOUT = 30.0  # Request timeout in seconds
 
+    # Default search pagination
+    DEFAULT_PAGE_SIZE = 100  # Issues per search/jql page
+
     def __init__(
         self,
         base_url: str,
@@ -79,6 +85,8 @@ class JiraApiClient:
         pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
         pool_block: bool = DEFAULT_POOL_BLOCK,
         timeout: float = DEFAULT_TIMEOUT,
+        *,
+        conditional_cache: ConditionalRequestCache | None = None,
     ):
         """
         Initialize the Jira client.
@@ -99,6 +107,8 @@ class JiraApiClient:
             pool_maxsize: Maximum connections to save in the pool
             pool_block: Whether to block when pool is full
             timeout: Request timeout in seconds (connect + read)
+            conditional_cache: Store for ETag/Last-Modified revalidation of GET
+                requests (None disables conditional requests)
         """
         self.base_url = base_url.rstrip("/")
         self.api_url = f"{self.base_url}/rest/api/{self.API_VERSION}"
@@ -106,6 +116,7 @@ class JiraApiClient:
         self.dry_run = dry_run
         self.logger = logging.getLogger("JiraApiClient")
         self.timeout = timeout
+        self._conditional_cache = conditional_cache
 
         # Retry configuration
         self.max_retries = max_retries
@@ -184,6 +195,13 @@ class JiraApiClient:
         url = f"{self.api_url}/{endpoint}"
         last_exception: Exception | None = None
 
+        # Revalidate a stored GET response instead of downloading it again
+        conditional_cache = self._conditional_cache
+        conditional_key: str | None = None
+        conditional: dict[str, Any] | None = None
+        if conditional_cache is not None:
+            conditional_key, conditional = conditional_cache.prepare(method, url, kwargs)
+
         for attempt in range(self.max_retries + 1):
             # Apply rate limiting before each request attempt
             if self._rate_limiter is not None:
@@ -233,7 +251,13 @@ class JiraApiClient:
                         issue_key=endpoint,
                     )
 
-                return self._handle_response(response, endpoint)
+                if conditional_cache and conditional is not None and response.status_code == 304:
+                    return conditional_cache.not_modified(conditional)
+
+                result = self._handle_response(response, endpoint)
+                if conditional_cache is not None:
+                    conditional_cache.store(conditional_key, response, result)
+                return result
 
             except requests.exceptions.ConnectionError as e:
                 last_exception = e
@@ -429,26 +453,98 @@ class JiraApiClient:
         """
         return self.get_myself()["accountId"]
 
-    def search_jql(self, jql: str, fields: list[str], max_results: int = 100) -> dict[str, Any]:
+    def search_jql(
+        self,
+        jql: str,
+        fields: list[str],
+        max_results: int = 100,
+        next_page_token: str | None = None,
+    ) -> dict[str, Any]:
         """
-        Execute a JQL search query.
+        Execute a JQL search query (a single page).
 
         Args:
             jql: The JQL query string.
             fields: List of field names to include in results.
             max_results: Maximum number of results to return.
+            next_page_token: Token from a previous page to continue from.
 
         Returns:
-            Dictionary with 'issues' list and pagination info.
-        """
-        return self.post(
-            "search/jql",
-            json={
-                "jql": jql,
-                "maxResults": max_results,
-                "fields": fields,
-            },
-        )
+            Dictionary with 'issues' list and pagination info
+            ('nextPageToken' and 'isLast').
+        """
+        body: dict[str, Any] = {
+            "jql": jql,
+            "maxResults": max_results,
+            "fields": fields,
+        }
+        if next_page_token:
+            body["nextPageToken"] = next_page_token
+        return self.post("search/jql", json=body)
+
+    def iter_search_jql(
+        self,
+        jql: str,
+        fields: list[str],
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_results: int | None = None,
+        prefetch: bool = False,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        Execute a JQL search, yielding results page by page.
+
+        Follows 'nextPageToken' until Jira reports the last page, so results
+        are never silently truncated at one page. Only one page is held in
+        memory at a time (two with prefetch).
+
+        Args:
+            jql: The JQL query string.
+            fields: List of field names to include in results.
+            page_size: Number of issues to request per page.
+            max_results: Optional cap on the total number of issues yielded.
+            prefetch: Fetch the next page in the background while the
+                caller processes the current one.
+
+        Yields:
+            Lists of raw issue dictionaries, one list per page.
+        """
+        remaining = max_results
+
+        def fetch(token: str | None) -> dict[str, Any]:
+            size = page_size if remaining is None else min(page_size, remaining)
+            return self.search_jql(jql, fields, max_results=size, next_page_token=token)
+
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            page = fetch(None)
+            while True:
+                issues = page.get("issues", [])
+                if remaining is not None:
+                    issues = issues[:remaining]
+                    remaining -= len(issues)
+
+                token = page.get("nextPageToken")
+                has_more = (
+                    bool(token)
+                    and not page.get("isLast", False)
+                    and bool(issues)
+                    and (remaining is None or remaining > 0)
+                )
+
+                # Kick off the next request before handing this page back
+                pending: Future[dict[str, Any]] | None = None
+                if has_more and executor is not None:
+                    pending = executor.submit(fetch, token)
+
+                if issues:
+                    yield issues
+
+                if not has_more:
+                    break
+                page = pending.result() if pending is not None else fetch(token)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
 
     def test_connection(self) -> bool:
         """
@@ -0,0 +1,245 @@
+"""
+Jira Workflow Graph - Transition path planning for Jira workflows.
+
+The graph for a project and issue type is seeded from the workflow
+definition (``workflow/search``), when the user may read it, and refined
+one status at a time from ``issue/{key}/transitions`` responses, which
+also say whether a transition needs a resolution. Learning never moves an
+issue: transitions are only executed along a known path to the target.
+Shortest paths are found with a breadth-first search and memoized per
+(current status, target status) pair.
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+from spectryn.core.ports.issue_tracker import TransitionError
+
+
+@dataclass(frozen=True)
+class WorkflowTransition:
+    """A single edge in a Jira workflow."""
+
+    id: str
+    name: str
+    to_status: str
+    requires_resolution: bool = False
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> "WorkflowTransition":
+        """Create from a Jira transitions API entry."""
+        return cls(
+            id=str(data.get("id", "")),
+            name=data.get("name", ""),
+            to_status=data.get("to", {}).get("name", ""),
+            requires_resolution="resolution" in data.get("fields", {}),
+        )
+
+
+def status_matches(status: str, target_status: str) -> bool:
+    """Check whether a status satisfies a (case-insensitive) target status."""
+    status_lower = status.lower()
+    target_lower = target_status.lower()
+    return status_lower == target_lower or target_lower in status_lower
+
+
+@dataclass
+class WorkflowGraph:
+    """
+    Learned workflow graph for one project and issue type.
+
+    Attributes:
+        transitions: Outgoing transitions keyed by lowercased status name.
+        explored: Statuses whose transitions were read from the transitions
+            API (rather than the workflow definition), even if they have none.
+    """
+
+    transitions: dict[str, list[WorkflowTransition]] = field(default_factory=dict)
+    explored: set[str] = field(default_factory=set)
+    _plans: dict[tuple[str, str], list[WorkflowTransition] | None] = field(
+        default_factory=dict, repr=False
+    )
+
+    def knows(self, status: str) -> bool:
+        """Check whether a status's transitions were read from the transitions API."""
+        return status.lower() in self.explored
+
+    def add_transitions(self, status: str, transitions: list[dict[str, Any]]) -> None:
+        """
+        Record the transitions available from a status.
+
+        Args:
+            status: The status the transitions start from.
+            transitions: Entries from the Jira transitions API.
+        """
+        self.transitions[status.lower()] = [
+            WorkflowTransition.from_api(t) for t in transitions if t.get("to", {}).get("name")
+        ]
+        self.explored.add(status.lower())
+        # New edges can shorten or enable any previously planned path
+        self._plans.clear()
+
+    def add_definition(self, workflow: dict[str, Any]) -> None:
+        """
+        Record the edges of a workflow definition.
+
+        Statuses already read from the transitions API keep their edges.
+
+        Args:
+            workflow: A ``workflow/search`` entry expanded with transitions
+                and statuses.
+        """
+        names = {str(s.get("id")): s.get("name", "") for s in workflow.get("statuses", [])}
+        edges: dict[str, list[WorkflowTransition]] = {name.lower(): [] for name in names.values()}
+
+        for data in workflow.get("transitions", []):
+            to_status = names.get(str(data.get("to", "")))
+            if not to_status or data.get("type") == "initial":
+                continue
+            transition = WorkflowTransition(
+                id=str(data.get("id", "")), name=data.get("name", ""), to_status=to_status
+            )
+            # Global transitions have no "from" and are available from every status
+            sources = [names.get(str(f), "") for f in data.get("from", [])] or list(names.values())
+            for source in sources:
+                if source and source.lower() != to_status.lower():
+                    edges[source.lower()].append(transition)
+
+        for status, status_edges in edges.items():
+            if status not in self.explored:
+                self.transitions[status] = status_edges
+        self._plans.clear()
+
+    def plan(self, current_status: str, target_status: str) -> list[WorkflowTransition] | None:
+        """
+        Find the shortest known transition path to a target status.
+
+        Args:
+            current_status: The issue's current status.
+            target_status: The desired status.
+
+        Returns:
+            Transitions to execute in order (empty if already there), or
+            None if no path is known.
+        """
+        key = (current_status.lower(), target_status.lower())
+        if key not in self._plans:
+            self._plans[key] = self._search(current_status, target_status)
+        return self._plans[key]
+
+    def _search(self, start: str, target_status: str) -> list[WorkflowTransition] | None:
+        """Breadth-first search over known edges from ``start``."""
+        if status_matches(start, target_status):
+            return []
+
+        visited = {start.lower()}
+        queue: deque[tuple[str, list[WorkflowTransition]]] = deque([(start, [])])
+
+        while queue:
+            status, path = queue.popleft()
+            for transition in self.transitions.get(status.lower(), []):
+                next_status = transition.to_status
+                if next_status.lower() in visited:
+                    continue
+                next_path = [*path, transition]
+                if status_matches(next_status, target_status):
+                    return next_path
+                visited.add(next_status.lower())
+                queue.append((next_status, next_path))
+
+        return None
+
+
+def workflow_name_for(scheme: dict[str, Any], issue_type_id: str) -> str | None:
+    """
+    Find the workflow an issue type uses in a project's workflow scheme.
+
+    Args:
+        scheme: A ``workflowscheme/project`` response.
+        issue_type_id: The issue type ID.
+
+    Returns:
+        The workflow name, or None if the scheme does not name one.
+    """
+    for value in scheme.get("values", []):
+        workflow_scheme = value.get("workflowScheme", {})
+        mappings = workflow_scheme.get("issueTypeMappings", {})
+        name = mappings.get(issue_type_id) or workflow_scheme.get("defaultWorkflow")
+        if name:
+            return str(name)
+    return None
+
+
+class TransitionWalk:
+    """
+    Step an issue towards a target status along known workflow paths.
+
+    Performs no I/O so the sync and async adapters share it: callers supply
+    the transitions API response when ``needs_transitions`` is set, execute
+    the transition returned by ``next_transition``, then call ``advance``.
+
+    Example:
+        >>> walk = TransitionWalk(graph, "Open", "Done", max_hops=5)
+        >>> while not walk.done:
+        ...     if walk.needs_transitions:
+        ...         walk.learn(get_available_transitions(key))
+        ...     transition = walk.next_transition()
+        ...     execute(key, transition)
+        ...     walk.advance(transition)
+    """
+
+    def __init__(
+        self, graph: WorkflowGraph, current_status: str, target_status: str, max_hops: int
+    ) -> None:
+        """
+        Initialize the walk.
+
+        Args:
+            graph: Workflow graph of the issue's project and issue type.
+            current_status: The issue's current status.
+            target_status: The desired status.
+            max_hops: Maximum number of transitions to execute.
+        """
+        self.graph = graph
+        self.current_status = current_status
+        self.target_status = target_status
+        self.max_hops = max_hops
+        self.hops = 0
+
+    @property
+    def done(self) -> bool:
+        """Whether the issue is in the target status."""
+        return status_matches(self.current_status, self.target_status)
+
+    @property
+    def needs_transitions(self) -> bool:
+        """Whether the current status's transitions must be read before planning."""
+        return not self.graph.knows(self.current_status)
+
+    def learn(self, transitions: list[dict[str, Any]]) -> None:
+        """Record the transitions available from the current status."""
+        self.graph.add_transitions(self.current_status, transitions)
+
+    def next_transition(self) -> WorkflowTransition:
+        """
+        Get the next transition on the shortest known path to the target.
+
+        Raises:
+            TransitionError: If no path is known or the hop limit is reached.
+        """
+        path = self.graph.plan(self.current_status, self.target_status)
+        if not path:
+            raise TransitionError(
+                f"No known transition path from '{self.current_status}' to '{self.target_status}'"
+            )
+        if self.hops >= self.max_hops:
+            raise TransitionError(
+                f"Gave up transitioning to '{self.target_status}' after {self.hops} transitions"
+            )
+        return path[0]
+
+    def advance(self, transition: WorkflowTransition) -> None:
+        """Record that a transition was executed."""
+        self.current_status = transition.to_status
+        self.hops += 1
@@ -561,3 +561,27 @@ class LinearAdapter(IssueTrackerPort):
                 client=self._client,
             )
         return self._batch_client
+
+    def get_async_client(self) -> Any:
+        """
+        Get an async-capable version of this adapter.
+
+        Returns an AsyncLinearAdapter that implements AsyncIssueTrackerPort
+        for parallel operations using asyncio.
+
+        Requires aiohttp: pip install aiohttp
+
+        Returns:
+            AsyncLinearAdapter instance
+
+        Raises:
+            ImportError: If aiohttp is not installed
+        """
+        from .async_adapter import AsyncLinearAdapter
+
+        return AsyncLinearAdapter(
+            api_key=self._client.api_key,
+            team_key=self.team_key,
+            dry_run=self._dry_run,
+            api_url=self._client.api_url,
+        )
@@ -64,6 +64,7 @@ from .obsidian_parser import ObsidianParser
 from .openapi_parser import OpenAPIParser
 from .orgmode_parser import OrgModeParser
 from .parser_utils import parse_blockquote_comments, parse_datetime
+from .pattern_registry import PATTERNS, PatternRegistry
 from .protobuf_parser import ProtobufParser
 
 # Round-trip editing
@@ -174,6 +175,8 @@ from .yaml_plugin import YamlParserPlugin
 
 
 __all__ = [
+    # Pattern registry
+    "PATTERNS",
     "AsciiDocParser",
     "BaseDictParser",
     "ChunkInfo",
@@ -226,6 +229,7 @@ __all__ = [
     "ParseWarning",
     "ParsedStoryWithSpans",
     "ParsedTable",
+    "PatternRegistry",
     "ProtobufParser",
     "RoundtripEditor",
     "RoundtripParseResult",
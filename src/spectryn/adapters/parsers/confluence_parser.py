@@ -58,6 +58,9 @@ class ConfluenceParser(DocumentParserPort):
     ```
     """
 
+    # Sources are Confluence page IDs, not content, so results must not be cached
+    parse_cache_enabled = False
+
     STORY_ID_PATTERN = r"(?:[A-Z]+[-_/]\d+|#\d+)"
 
     def __init__(
@@ -73,6 +73,9 @@ class GoogleDocsParser(DocumentParserPort):
     ```
     """
 
+    # Sources are Google Doc IDs, not content, so results must not be cached
+    parse_cache_enabled = False
+
     STORY_ID_PATTERN = r"(?:[A-Z]+[-_/]\d+|#\d+)"
 
     def __init__(
@@ -59,6 +59,9 @@ class GoogleSheetsParser(DocumentParserPort):
     | PROJ-001 | 1 | Task | 2  | Planned|
     """
 
+    # Sources are Google Sheet IDs, not content, so results must not be cached
+    parse_cache_enabled = False
+
     STORY_ID_PATTERN = r"(?:[A-Z]+[-_/]\d+|#\d+)"
 
     # Column name mappings (case-insensitive)
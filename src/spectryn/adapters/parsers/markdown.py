@@ -26,9 +26,11 @@ from spectryn.core.domain.value_objects import (
     IssueKey,
     StoryId,
 )
+from spectryn.core.parse_pool import get_parse_processes, parse_files
 from spectryn.core.ports.document_parser import DocumentParserPort
 
 from .parser_utils import parse_blockquote_comments
+from .pattern_registry import PATTERNS
 from .tolerant_markdown import (
     ParseErrorCode,
     ParseErrorInfo,
@@ -47,6 +49,44 @@ from .tolerant_markdown import (
 )
 
 
+# Issue key pattern supporting all separator types and numeric IDs
+_ISSUE_KEY_PATTERN = r"(?:[A-Z]+[-_/]\d+|#\d+)"
+
+# Links section rows (| link_type | target_key |) and bullets (- blocks: PROJ-123)
+_LINK_TABLE_PATTERN = re.compile(rf"\|\s*([^|]+)\s*\|\s*({_ISSUE_KEY_PATTERN})\s*\|")
+_LINK_BULLET_PATTERN = re.compile(
+    rf"[-*]\s*(blocks|blocked by|relates to|depends on|duplicates)[:\s]+({_ISSUE_KEY_PATTERN})",
+    re.IGNORECASE,
+)
+
+# Story fields (| **Field** | Value |, > **Field**: Value, **Field**: Value),
+# keyed by field name
+PATTERNS.register_format(
+    "markdown_table_field",
+    lambda field: rf"\|\s*\*\*{field}\*\*\s*\|\s*([^|]+)\s*\|",
+    re.IGNORECASE,
+)
+PATTERNS.register_format(
+    "markdown_blockquote_field",
+    lambda field: rf">\s*\*\*{field}\*\*:\s*(.+?)(?:\s*$)",
+    re.MULTILINE | re.IGNORECASE,
+)
+PATTERNS.register_format(
+    "markdown_inline_field",
+    lambda field: rf"(?<!>)\s*\*\*{field}\*\*:\s*(.+?)(?:\s*$|\s{{2,}}|\n)",
+    re.MULTILINE | re.IGNORECASE,
+)
+
+# Inline links (**Blocks:** PROJ-123, PROJ-456), keyed by bold label
+PATTERNS.register_format(
+    "markdown_link",
+    lambda label: (
+        rf"\*\*{label}[:\s]*\*\*\s*({_ISSUE_KEY_PATTERN}(?:\s*,\s*{_ISSUE_KEY_PATTERN})*)"
+    ),
+    re.IGNORECASE,
+)
+
+
 class MarkdownParser(DocumentParserPort):
     """
     Parser for markdown epic files.
@@ -608,10 +648,10 @@ class MarkdownParser(DocumentParserPort):
             if f.name.lower() != "epic.md" and self._is_story_file(f)
         )
 
-        for story_file in story_files:
-            content = story_file.read_text(encoding="utf-8")
-            self._detected_format = self._detect_format(content)
-            stories_in_file = self._parse_all_stories(content)
+        # Story files parse independently, so large trees may use worker processes
+        processes = get_parse_processes()
+        for parsed in parse_files(self, story_files, max_workers=processes or None):
+            stories_in_file: list[UserStory] = parsed.unwrap()
 
             for story in stories_in_file:
                 story_id = str(story.id) if story.id else ""
@@ -622,7 +662,7 @@ class MarkdownParser(DocumentParserPort):
                     # No ID, just add it
                     all_stories.append(story)
 
-            self.logger.debug(f"Parsed {len(stories_in_file)} stories from {story_file.name}")
+            self.logger.debug(f"Parsed {len(stories_in_file)} stories from {parsed.path.name}")
 
         # Combine: stories with IDs from dict + stories without IDs
         all_stories = list(story_by_id.values()) + all_stories
@@ -1244,22 +1284,24 @@ class MarkdownParser(DocumentParserPort):
         elif field_name == "Points":
             field_variants.append("Story Points")
 
+        lowered = content.lower()
         for variant in field_variants:
+            # Every format needs the bold label, so skip the searches without it
+            if f"**{variant.lower()}**" not in lowered:
+                continue
+
             # Try table format first: | **Field** | Value |
-            table_pattern = rf"\|\s*\*\*{variant}\*\*\s*\|\s*([^|]+)\s*\|"
-            match = re.search(table_pattern, content, re.IGNORECASE)
+            match = PATTERNS.get(variant, "markdown_table_field").search(content)
             if match:
                 return match.group(1).strip()
 
             # Try blockquote format: > **Field**: Value
-            blockquote_pattern = rf">\s*\*\*{variant}\*\*:\s*(.+?)(?:\s*$)"
-            match = re.search(blockquote_pattern, content, re.MULTILINE | re.IGNORECASE)
+            match = PATTERNS.get(variant, "markdown_blockquote_field").search(content)
             if match:
                 return match.group(1).strip()
 
             # Try inline format: **Field**: Value (not in blockquote)
-            inline_pattern = rf"(?<!>)\s*\*\*{variant}\*\*:\s*(.+?)(?:\s*$|\s{{2,}}|\n)"
-            match = re.search(inline_pattern, content, re.MULTILINE | re.IGNORECASE)
+            match = PATTERNS.get(variant, "markdown_inline_field").search(content)
             if match:
                 return match.group(1).strip()
 
@@ -1566,61 +1608,38 @@ class MarkdownParser(DocumentParserPort):
             r"#### (?:Links|Related Issues|Dependencies)\n([\s\S]*?)(?=####|\n---|\Z)", content
         )
 
-        # Issue key pattern supporting all separator types and numeric IDs
-        issue_key_pattern = r"(?:[A-Z]+[-_/]\d+|#\d+)"
-
         if section:
             section_content = section.group(1)
             # Parse table rows: | link_type | target_key |
             # Support custom separators: PROJ-123, PROJ_123, PROJ/123, #123
-            table_pattern = rf"\|\s*([^|]+)\s*\|\s*({issue_key_pattern})\s*\|"
-            for match in re.finditer(table_pattern, section_content):
+            for match in _LINK_TABLE_PATTERN.finditer(section_content):
                 link_type = match.group(1).strip().lower()
                 target_key = match.group(2).strip()
                 if target_key and not link_type.startswith("-"):
                     links.append((link_type, target_key))
 
             # Parse bullet list: - blocks: PROJ-123
-            bullet_pattern = rf"[-*]\s*(blocks|blocked by|relates to|depends on|duplicates)[:\s]+({issue_key_pattern})"
-            for match in re.finditer(bullet_pattern, section_content, re.IGNORECASE):
+            for match in _LINK_BULLET_PATTERN.finditer(section_content):
                 link_type = match.group(1).strip().lower()
                 target_key = match.group(2).strip()
                 links.append((link_type, target_key))
 
         # Pattern for inline links: **Blocks:** PROJ-123, PROJ-456
         # Support custom separators and #123 format
-        inline_patterns = [
-            (
-                rf"\*\*Blocks[:\s]*\*\*\s*({issue_key_pattern}(?:\s*,\s*{issue_key_pattern})*)",
-                "blocks",
-            ),
-            (
-                rf"\*\*Blocked by[:\s]*\*\*\s*({issue_key_pattern}(?:\s*,\s*{issue_key_pattern})*)",
-                "blocked by",
-            ),
-            (
-                rf"\*\*Depends on[:\s]*\*\*\s*({issue_key_pattern}(?:\s*,\s*{issue_key_pattern})*)",
-                "depends on",
-            ),
-            (
-                rf"\*\*Related to[:\s]*\*\*\s*({issue_key_pattern}(?:\s*,\s*{issue_key_pattern})*)",
-                "relates to",
-            ),
-            (
-                rf"\*\*Relates to[:\s]*\*\*\s*({issue_key_pattern}(?:\s*,\s*{issue_key_pattern})*)",
-                "relates to",
-            ),
-            (
-                rf"\*\*Duplicates[:\s]*\*\*\s*({issue_key_pattern}(?:\s*,\s*{issue_key_pattern})*)",
-                "duplicates",
-            ),
+        inline_labels = [
+            ("Blocks", "blocks"),
+            ("Blocked by", "blocked by"),
+            ("Depends on", "depends on"),
+            ("Related to", "relates to"),
+            ("Relates to", "relates to"),
+            ("Duplicates", "duplicates"),
         ]
 
-        for pattern, link_type in inline_patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
+        for label, link_type in inline_labels:
+            match = PATTERNS.get(label, "markdown_link").search(content)
             if match:
                 keys_str = match.group(1)
-                for key in re.findall(issue_key_pattern, keys_str):
+                for key in re.findall(_ISSUE_KEY_PATTERN, keys_str):
                     links.append((link_type, key))
 
         return links
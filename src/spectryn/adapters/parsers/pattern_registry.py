@@ -0,0 +1,131 @@
+"""
+Pattern Registry - Compile-once regex patterns for markdown-family parsers.
+
+Markdown, tolerant markdown and round-trip parsing build field and section
+patterns from names (``rf"\\|\\s*\\*\\*{field}\\*\\*..."``). Building and
+compiling them on every call costs an f-string, a ``re.escape`` and a lookup
+in ``re``'s own cache, which holds a limited number of patterns and is
+shared with every other module, so with many field names and aliases the
+patterns keep getting evicted and recompiled.
+
+The registry compiles each pattern once per (field, format) pair, where a
+format is a named pattern builder registered by the owning parser:
+
+    PATTERNS.register_format("table", lambda name: rf"\\|\\s*{name}\\s*\\|", re.I)
+    pattern = PATTERNS.get("Story Points", "table")
+
+Misses count compilations, so a miss counter that keeps growing across
+parses points at a caller building patterns from unbounded input.
+"""
+
+import re
+import threading
+from collections.abc import Callable
+from typing import Any
+
+
+PatternBuilder = Callable[[str], str]
+
+
+class PatternRegistry:
+    """
+    Thread-safe registry of compiled patterns keyed by (field, format).
+
+    Example:
+        >>> registry = PatternRegistry()
+        >>> registry.register_format("bold", lambda name: rf"\\*\\*{name}\\*\\*")
+        >>> registry.get("Status", "bold") is registry.get("Status", "bold")
+        True
+    """
+
+    __slots__ = ("_formats", "_hits", "_lock", "_misses", "_patterns")
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._formats: dict[str, tuple[PatternBuilder, int]] = {}
+        self._patterns: dict[tuple[str, str], re.Pattern[str]] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def register_format(self, fmt: str, builder: PatternBuilder, flags: int = 0) -> None:
+        """
+        Register a pattern format.
+
+        Re-registering a format drops the patterns compiled for it.
+
+        Args:
+            fmt: Format name, the second half of the registry key.
+            builder: Builds the pattern source from a field name.
+            flags: Flags the patterns are compiled with.
+        """
+        with self._lock:
+            self._formats[fmt] = (builder, flags)
+            for key in [key for key in self._patterns if key[1] == fmt]:
+                del self._patterns[key]
+
+    def get(self, field: str, fmt: str) -> re.Pattern[str]:
+        """
+        Get the compiled pattern for a field in a format.
+
+        Args:
+            field: Field, section or label name passed to the builder.
+            fmt: Registered format name.
+
+        Returns:
+            The compiled pattern, compiled on the first request only.
+
+        Raises:
+            KeyError: If the format is not registered.
+        """
+        key = (field, fmt)
+        pattern = self._patterns.get(key)
+        if pattern is not None:
+            self._hits += 1
+            return pattern
+
+        with self._lock:
+            pattern = self._patterns.get(key)
+            if pattern is None:
+                builder, flags = self._formats[fmt]
+                pattern = re.compile(builder(field), flags)
+                self._patterns[key] = pattern
+                self._misses += 1
+            return pattern
+
+    @property
+    def misses(self) -> int:
+        """Number of patterns compiled."""
+        return self._misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served without compiling."""
+        total = self._hits + self._misses
+        return self._hits / total if total > 0 else 0.0
+
+    @property
+    def size(self) -> int:
+        """Number of compiled patterns held."""
+        return len(self._patterns)
+
+    def clear(self) -> None:
+        """Drop compiled patterns and reset counters, keeping the formats."""
+        with self._lock:
+            self._patterns.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get registry statistics."""
+        return {
+            "size": self.size,
+            "formats": len(self._formats),
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self.hit_rate,
+        }
+
+
+# Registry shared by the markdown-family parsers
+PATTERNS = PatternRegistry()
@@ -48,6 +48,8 @@ from spectryn.core.domain.value_objects import (
     StoryId,
 )
 
+from .pattern_registry import PATTERNS
+
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -248,6 +250,40 @@ class EditOperation:
 # Round-trip Parser
 # =============================================================================
 
+# Story headers, keyed by story ID pattern
+PATTERNS.register_format(
+    "roundtrip_h3",
+    lambda id_pattern: rf"^#{{2,3}}\s*(?:[^\n]*?\s)?({id_pattern})\s*:\s*([^\n]+?)$",
+    re.MULTILINE,
+)
+PATTERNS.register_format(
+    "roundtrip_h1",
+    lambda id_pattern: rf"^#\s*(?:[^\n]*?\s)?({id_pattern})\s*:\s*([^\n]+?)$",
+    re.MULTILINE,
+)
+
+# Field and section spans, keyed by field or section name
+PATTERNS.register_format(
+    "roundtrip_table",
+    lambda name: rf"\|\s*\*\*({re.escape(name)})\*\*\s*\|\s*([^|]+?)\s*\|",
+    re.IGNORECASE,
+)
+PATTERNS.register_format(
+    "roundtrip_inline",
+    lambda name: rf"(?<!>)\s*\*\*({re.escape(name)})\*\*\s*:\s*(.+?)(?:\s*$|\n)",
+    re.MULTILINE | re.IGNORECASE,
+)
+PATTERNS.register_format(
+    "roundtrip_blockquote",
+    lambda name: rf">\s*\*\*({re.escape(name)})\*\*\s*:\s*(.+?)(?:\s*$|\n)",
+    re.MULTILINE | re.IGNORECASE,
+)
+PATTERNS.register_format(
+    "roundtrip_section",
+    lambda name: rf"^(#{{2,4}})\s*({re.escape(name)})\s*\n([\s\S]*?)(?=^#{{2,4}}\s|\Z)",
+    re.MULTILINE | re.IGNORECASE,
+)
+
 
 class RoundtripParser:
     """
@@ -266,6 +302,33 @@ class RoundtripParser:
     INLINE_FIELD_PATTERN = r"\*\*({field})\*\*\s*:\s*(.+?)(?:\s*$|\n)"
     BLOCKQUOTE_FIELD_PATTERN = r">\s*\*\*({field})\*\*\s*:\s*(.+?)(?:\s*$|\n)"
 
+    # Pattern for "As a / I want / So that" format
+    DESCRIPTION_PATTERN = re.compile(
+        r"\*\*As\s+a\*\*\s*(.+?)"
+        r"(?:,?\s*\n\s*(?:>\s*)?)?"
+        r"\*\*I\s+want\*\*\s*(.+?)"
+        r"(?:,?\s*\n\s*(?:>\s*)?)?"
+        r"\*\*So\s+that\*\*\s*(.+?)$",
+        re.MULTILINE | re.IGNORECASE | re.DOTALL,
+    )
+
+    # Acceptance criteria section and its checkboxes
+    AC_SECTION_PATTERN = re.compile(
+        r"#{2,4}\s*Acceptance\s*Criteria\s*\n([\s\S]*?)(?=#{2,4}\s|\Z)",
+        re.IGNORECASE,
+    )
+    CHECKBOX_PATTERN = re.compile(r"^[\s]*[-*+]\s*\[([xX\s]?)\]\s*(.+?)$", re.MULTILINE)
+
+    # Subtasks section and its rows: | number | name | description | sp | status |
+    SUBTASKS_SECTION_PATTERN = re.compile(
+        r"#{2,4}\s*Subtasks\s*\n([\s\S]*?)(?=#{2,4}\s|\Z)",
+        re.IGNORECASE,
+    )
+    SUBTASK_ROW_PATTERN = re.compile(
+        r"^\|\s*(\d+)\s*\|\s*([^|]+)\s*\|\s*([^|]*)\s*\|\s*(\d+)\s*\|\s*([^|]+)\s*\|",
+        re.MULTILINE,
+    )
+
     def __init__(self) -> None:
         """Initialize the round-trip parser."""
         self._content: str = ""
@@ -334,18 +397,12 @@ class RoundtripParser:
         matches: list[tuple[re.Match[str], str]] = []
 
         # H3 pattern (standard): ### [emoji] STORY-001: Title
-        h3_pattern = re.compile(
-            rf"^#{{2,3}}\s*(?:[^\n]*?\s)?({self.STORY_ID_PATTERN})\s*:\s*([^\n]+?)$",
-            re.MULTILINE,
-        )
+        h3_pattern = PATTERNS.get(self.STORY_ID_PATTERN, "roundtrip_h3")
         for match in h3_pattern.finditer(self._content):
             matches.append((match, "h3"))
 
         # H1 pattern (standalone): # STORY-001: Title
-        h1_pattern = re.compile(
-            rf"^#\s*(?:[^\n]*?\s)?({self.STORY_ID_PATTERN_EXTENDED})\s*:\s*([^\n]+?)$",
-            re.MULTILINE,
-        )
+        h1_pattern = PATTERNS.get(self.STORY_ID_PATTERN_EXTENDED, "roundtrip_h1")
         for match in h1_pattern.finditer(self._content):
             # Don't include h1 if we already have h3 matches starting nearby
             if not any(abs(match.start() - m[0].start()) < 10 for m in matches):
@@ -475,14 +532,8 @@ class RoundtripParser:
 
     def _find_field_span(self, content: str, field_name: str, offset: int) -> FieldSpan | None:
         """Find a field's source span in the content."""
-        field_escaped = re.escape(field_name)
-
         # Try table format: | **Field** | Value |
-        table_pattern = re.compile(
-            rf"\|\s*\*\*({field_escaped})\*\*\s*\|\s*([^|]+?)\s*\|",
-            re.IGNORECASE,
-        )
-        match = table_pattern.search(content)
+        match = PATTERNS.get(field_name, "roundtrip_table").search(content)
         if match:
             full_start = offset + match.start()
             full_end = offset + match.end()
@@ -509,11 +560,7 @@ class RoundtripParser:
             )
 
         # Try inline format: **Field**: Value
-        inline_pattern = re.compile(
-            rf"(?<!>)\s*\*\*({field_escaped})\*\*\s*:\s*(.+?)(?:\s*$|\n)",
-            re.MULTILINE | re.IGNORECASE,
-        )
-        match = inline_pattern.search(content)
+        match = PATTERNS.get(field_name, "roundtrip_inline").search(content)
         if match:
             full_start = offset + match.start()
             full_end = offset + match.end()
@@ -539,11 +586,7 @@ class RoundtripParser:
             )
 
         # Try blockquote format: > **Field**: Value
-        blockquote_pattern = re.compile(
-            rf">\s*\*\*({field_escaped})\*\*\s*:\s*(.+?)(?:\s*$|\n)",
-            re.MULTILINE | re.IGNORECASE,
-        )
-        match = blockquote_pattern.search(content)
+        match = PATTERNS.get(field_name, "roundtrip_blockquote").search(content)
         if match:
             full_start = offset + match.start()
             full_end = offset + match.end()
@@ -599,15 +642,8 @@ class RoundtripParser:
         self, content: str, section_name: str, offset: int
     ) -> SectionSpan | None:
         """Find a section's source span."""
-        section_escaped = re.escape(section_name)
-
         # Pattern to find section header and content
-        pattern = re.compile(
-            rf"^(#{{2,4}})\s*({section_escaped})\s*\n([\s\S]*?)(?=^#{{2,4}}\s|\Z)",
-            re.MULTILINE | re.IGNORECASE,
-        )
-
-        match = pattern.search(content)
+        match = PATTERNS.get(section_name, "roundtrip_section").search(content)
         if not match:
             return None
 
@@ -638,17 +674,7 @@ class RoundtripParser:
 
     def _parse_description(self, content: str) -> Description | None:
         """Parse user story description."""
-        # Pattern for "As a / I want / So that" format
-        pattern = re.compile(
-            r"\*\*As\s+a\*\*\s*(.+?)"
-            r"(?:,?\s*\n\s*(?:>\s*)?)?"
-            r"\*\*I\s+want\*\*\s*(.+?)"
-            r"(?:,?\s*\n\s*(?:>\s*)?)?"
-            r"\*\*So\s+that\*\*\s*(.+?)$",
-            re.MULTILINE | re.IGNORECASE | re.DOTALL,
-        )
-
-        match = pattern.search(content)
+        match = self.DESCRIPTION_PATTERN.search(content)
         if match:
             role = match.group(1).strip().rstrip(",.")
             want = match.group(2).strip().rstrip(",.")
@@ -665,11 +691,7 @@ class RoundtripParser:
         spans: list[SourceSpan] = []
 
         # Find acceptance criteria section
-        ac_pattern = re.compile(
-            r"#{2,4}\s*Acceptance\s*Criteria\s*\n([\s\S]*?)(?=#{2,4}\s|\Z)",
-            re.IGNORECASE,
-        )
-        ac_match = ac_pattern.search(content)
+        ac_match = self.AC_SECTION_PATTERN.search(content)
         if not ac_match:
             return items, spans
 
@@ -677,12 +699,7 @@ class RoundtripParser:
         ac_offset = offset + ac_match.start(1)
 
         # Find checkboxes
-        checkbox_pattern = re.compile(
-            r"^[\s]*[-*+]\s*\[([xX\s]?)\]\s*(.+?)$",
-            re.MULTILINE,
-        )
-
-        for match in checkbox_pattern.finditer(ac_content):
+        for match in self.CHECKBOX_PATTERN.finditer(ac_content):
             checked = match.group(1).strip().lower() == "x"
             text = match.group(2).strip()
             items.append((text, checked))
@@ -709,11 +726,7 @@ class RoundtripParser:
         spans: list[SourceSpan] = []
 
         # Find subtasks section
-        subtasks_pattern = re.compile(
-            r"#{2,4}\s*Subtasks\s*\n([\s\S]*?)(?=#{2,4}\s|\Z)",
-            re.IGNORECASE,
-        )
-        subtasks_match = subtasks_pattern.search(content)
+        subtasks_match = self.SUBTASKS_SECTION_PATTERN.search(content)
         if not subtasks_match:
             return subtasks, spans
 
@@ -721,13 +734,7 @@ class RoundtripParser:
         subtasks_offset = offset + subtasks_match.start(1)
 
         # Parse table rows (skip header and separator)
-        # Pattern: | number | name | description | sp | status |
-        row_pattern = re.compile(
-            r"^\|\s*(\d+)\s*\|\s*([^|]+)\s*\|\s*([^|]*)\s*\|\s*(\d+)\s*\|\s*([^|]+)\s*\|",
-            re.MULTILINE,
-        )
-
-        for match in row_pattern.finditer(subtasks_content):
+        for match in self.SUBTASK_ROW_PATTERN.finditer(subtasks_content):
             number = int(match.group(1))
             name = match.group(2).strip()
             description = match.group(3).strip()
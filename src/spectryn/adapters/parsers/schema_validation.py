@@ -1182,6 +1182,9 @@ class ValidatingParser(DocumentParserPort):
         stories = validating.parse_stories("epics.md")  # Validates automatically
     """
 
+    # The wrapped parser is cached itself; validation must run on every call
+    parse_cache_enabled = False
+
     def __init__(
         self,
         parser: DocumentParserPort,
@@ -35,6 +35,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import TYPE_CHECKING
 
+from .pattern_registry import PATTERNS
+
 
 if TYPE_CHECKING:
     from spectryn.core.domain.entities import UserStory
@@ -256,37 +258,9 @@ class TolerantPatterns:
         Returns:
             Compiled regex pattern
         """
-        # Escape special regex chars but allow flexible spacing
-        field_escaped = re.escape(field_name)
-        # Allow optional spaces in field name (e.g., "Story Points" or "Story  Points")
-        field_pattern = field_escaped.replace(r"\ ", r"\s+")
-
-        if format_type == "table":
-            return re.compile(
-                rf"\|\s*\*?\*?{field_pattern}\*?\*?\s*\|\s*([^|]+?)\s*\|",
-                re.IGNORECASE,
-            )
-        if format_type == "inline":
-            return re.compile(
-                rf"(?<!>)\s*\*\*{field_pattern}\*\*\s*:\s*(.+?)(?:\s*$|\s{{2,}}|\n)",
-                re.MULTILINE | re.IGNORECASE,
-            )
-        if format_type == "blockquote":
-            return re.compile(
-                rf">\s*\*\*{field_pattern}\*\*\s*:\s*(.+?)(?:\s*$)",
-                re.MULTILINE | re.IGNORECASE,
-            )
-        # All formats combined
-        return re.compile(
-            rf"(?:"
-            rf"\|\s*\*?\*?{field_pattern}\*?\*?\s*\|\s*([^|]+?)\s*\|"
-            rf"|"
-            rf"(?<!>)\s*\*\*{field_pattern}\*\*\s*:\s*(.+?)(?:\s*$|\s{{2,}}|\n)"
-            rf"|"
-            rf">\s*\*\*{field_pattern}\*\*\s*:\s*(.+?)(?:\s*$)"
-            rf")",
-            re.MULTILINE | re.IGNORECASE,
-        )
+        if format_type not in ("table", "inline", "blockquote"):
+            format_type = "all"
+        return PATTERNS.get(field_name, f"tolerant_{format_type}")
 
     @classmethod
     def section_pattern(cls, section_name: str, levels: str = "2-4") -> re.Pattern[str]:
@@ -301,14 +275,53 @@ class TolerantPatterns:
             Compiled regex pattern matching the section and capturing content
         """
         _ = levels  # Reserved for future use
-        section_escaped = re.escape(section_name)
-        # Allow flexible spacing and optional plural
-        section_pattern = section_escaped.replace(r"\ ", r"\s+")
+        return PATTERNS.get(section_name, "tolerant_section")
+
+
+def _tolerant_name(name: str) -> str:
+    """Escape a field or section name, allowing flexible spacing between words."""
+    # Allow optional spaces in field name (e.g., "Story Points" or "Story  Points")
+    return re.escape(name).replace(r"\ ", r"\s+")
 
-        return re.compile(
-            rf"^(#{{2,4}})\s*{section_pattern}\s*\n([\s\S]*?)(?=^#{{2,4}}\s|\n---|\Z)",
-            re.MULTILINE | re.IGNORECASE,
-        )
+
+def _tolerant_table(name: str) -> str:
+    return rf"\|\s*\*?\*?{_tolerant_name(name)}\*?\*?\s*\|\s*([^|]+?)\s*\|"
+
+
+def _tolerant_inline(name: str) -> str:
+    return rf"(?<!>)\s*\*\*{_tolerant_name(name)}\*\*\s*:\s*(.+?)(?:\s*$|\s{{2,}}|\n)"
+
+
+def _tolerant_blockquote(name: str) -> str:
+    return rf">\s*\*\*{_tolerant_name(name)}\*\*\s*:\s*(.+?)(?:\s*$)"
+
+
+PATTERNS.register_format("tolerant_table", _tolerant_table, re.IGNORECASE)
+PATTERNS.register_format("tolerant_inline", _tolerant_inline, re.MULTILINE | re.IGNORECASE)
+PATTERNS.register_format("tolerant_blockquote", _tolerant_blockquote, re.MULTILINE | re.IGNORECASE)
+PATTERNS.register_format(
+    "tolerant_all",
+    lambda name: (
+        f"(?:{_tolerant_table(name)}|{_tolerant_inline(name)}|{_tolerant_blockquote(name)})"
+    ),
+    re.MULTILINE | re.IGNORECASE,
+)
+PATTERNS.register_format(
+    "tolerant_section",
+    lambda name: rf"^(#{{2,4}})\s*{_tolerant_name(name)}\s*\n([\s\S]*?)(?=^#{{2,4}}\s|\n---|\Z)",
+    re.MULTILINE | re.IGNORECASE,
+)
+# Section bodies for the image and table helpers (exact name, no "---" stop)
+PATTERNS.register_format(
+    "section_body",
+    lambda name: r"#{2,4}\s*" + re.escape(name) + r"\s*\n([\s\S]*?)(?=\n#{2,4}|\Z)",
+    re.IGNORECASE,
+)
+PATTERNS.register_format(
+    "code_section",
+    lambda name: rf"^#+\s*{re.escape(name)}\s*$\n(.*?)(?=\n#|\Z)",
+    re.MULTILINE | re.DOTALL | re.IGNORECASE,
+)
 
 
 # =============================================================================
@@ -1313,17 +1326,7 @@ def extract_images_from_section(
     Returns:
         Tuple of (images, warnings) for images found in the section
     """
-    # Build pattern parts - avoid f-string issues with braces
-    section_start = r"#{2,4}\s*" + re.escape(section_name) + r"\s*\n"
-    section_body = r"([\s\S]*?)"
-    section_end = r"(?=\n#{2,4}|\Z)"
-
-    section_pattern = re.compile(
-        section_start + section_body + section_end,
-        re.IGNORECASE,
-    )
-
-    match = section_pattern.search(content)
+    match = PATTERNS.get(section_name, "section_body").search(content)
     if not match:
         return [], []
 
@@ -1860,17 +1863,7 @@ def extract_table_from_section(
     Returns:
         Tuple of (ParsedTable or None, list of warnings)
     """
-    # Build pattern parts - avoid f-string issues with braces
-    section_start = r"#{2,4}\s*" + re.escape(section_name) + r"\s*\n"
-    section_body = r"([\s\S]*?)"
-    section_end = r"(?=\n#{2,4}|\Z)"
-
-    section_pattern = re.compile(
-        section_start + section_body + section_end,
-        re.IGNORECASE,
-    )
-
-    match = section_pattern.search(content)
+    match = PATTERNS.get(section_name, "section_body").search(content)
     if not match:
         return None, []
 
@@ -2392,12 +2385,7 @@ def extract_code_from_section(
     warnings: list[ParseWarning] = []
 
     # Find section content
-    section_pattern = re.compile(
-        rf"^#+\s*{re.escape(section_name)}\s*$\n(.*?)(?=\n#|\Z)",
-        re.MULTILINE | re.DOTALL | re.IGNORECASE,
-    )
-
-    match = section_pattern.search(content)
+    match = PATTERNS.get(section_name, "code_section").search(content)
     if not match:
         return None, warnings
 
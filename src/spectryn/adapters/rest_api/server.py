@@ -13,10 +13,14 @@ import time
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from datetime import datetime
-from http.server import BaseHTTPRequestHandler, HTTPServer
 from typing import TYPE_CHECKING, Any
 from urllib.parse import parse_qs, urlparse
 
+from spectryn.adapters.http.server import (
+    HTTPServerConfig,
+    PooledHTTPServer,
+    PooledRequestHandler,
+)
 from spectryn.core.domain.entities import Epic, Subtask, UserStory
 from spectryn.core.domain.enums import Priority, Status
 from spectryn.core.ports.rest_api import (
@@ -125,10 +129,11 @@ class SpectraRestServer(RestApiServerPort):
         self._data_store = DataStore()
         self._event_bus = event_bus
 
-        self._server: HTTPServer | None = None
+        self._server: PooledHTTPServer | None = None
         self._server_thread: threading.Thread | None = None
         self._running = False
         self._stats = ServerStats()
+        self._stats_lock = threading.Lock()
 
         # Register built-in routes
         self._register_builtin_routes()
@@ -350,7 +355,16 @@ class SpectraRestServer(RestApiServerPort):
 
         # Create HTTP server
         handler = self._create_request_handler()
-        self._server = HTTPServer((self._config.host, self._config.port), handler)
+        self._server = PooledHTTPServer(
+            (self._config.host, self._config.port),
+            handler,
+            HTTPServerConfig(
+                max_workers=self._config.max_workers,
+                max_queue_size=self._config.max_queued_connections,
+                max_body_bytes=self._config.max_request_size,
+                keep_alive_timeout=self._config.keep_alive_timeout,
+            ),
+        )
 
         # Start in a background thread
         self._server_thread = threading.Thread(target=self._server.serve_forever)
@@ -379,6 +393,7 @@ class SpectraRestServer(RestApiServerPort):
 
         if self._server:
             self._server.shutdown()
+            self._server.server_close()
             self._server = None
 
         if self._server_thread:
@@ -594,11 +609,11 @@ class SpectraRestServer(RestApiServerPort):
         """Clear all data from the data store."""
         self._data_store = DataStore()
 
-    def _create_request_handler(self) -> type[BaseHTTPRequestHandler]:
+    def _create_request_handler(self) -> type[PooledRequestHandler]:
         """Create the HTTP request handler class."""
         server = self
 
-        class RequestHandler(BaseHTTPRequestHandler):
+        class RequestHandler(PooledRequestHandler):
             """HTTP request handler for REST API."""
 
             def log_message(self, format: str, *args: Any) -> None:
@@ -623,8 +638,9 @@ class SpectraRestServer(RestApiServerPort):
             def do_OPTIONS(self) -> None:
                 """Handle CORS preflight requests."""
                 if server._config.enable_cors:
-                    self._send_cors_headers()
                     self.send_response(200)
+                    self._send_cors_headers()
+                    self.send_header("Content-Length", "0")
                     self.end_headers()
                 else:
                     self.send_error(405)
@@ -632,8 +648,9 @@ class SpectraRestServer(RestApiServerPort):
             def _handle_request(self, method: HttpMethod) -> None:
                 """Handle an incoming request."""
                 start_time = time.time()
-                server._stats.total_requests += 1
-                server._stats.active_connections += 1
+                with server._stats_lock:
+                    server._stats.total_requests += 1
+                    server._stats.active_connections += 1
 
                 try:
                     # Parse URL
@@ -652,9 +669,10 @@ class SpectraRestServer(RestApiServerPort):
                     # Parse body for POST/PUT/PATCH
                     body: dict[str, Any] | list[Any] | None = None
                     if method in (HttpMethod.POST, HttpMethod.PUT, HttpMethod.PATCH):
-                        content_length = int(self.headers.get("Content-Length", 0))
-                        if content_length > 0:
-                            raw_body = self.rfile.read(content_length)
+                        raw_body = self.read_body()
+                        if raw_body is None:
+                            return
+                        if raw_body:
                             try:
                                 body = json.loads(raw_body.decode("utf-8"))
                             except json.JSONDecodeError:
@@ -687,30 +705,36 @@ class SpectraRestServer(RestApiServerPort):
                     self._send_response(response)
 
                     # Update stats
-                    if 200 <= response.status.value < 300:
-                        server._stats.successful_requests += 1
-                    elif 400 <= response.status.value < 500:
-                        server._stats.client_errors += 1
-                    else:
-                        server._stats.server_errors += 1
+                    with server._stats_lock:
+                        if 200 <= response.status.value < 300:
+                            server._stats.successful_requests += 1
+                        elif 400 <= response.status.value < 500:
+                            server._stats.client_errors += 1
+                        else:
+                            server._stats.server_errors += 1
 
                 except Exception as e:
                     logger.exception(f"Error handling request: {e}")
                     self._send_error(HttpStatus.INTERNAL_SERVER_ERROR, str(e))
-                    server._stats.server_errors += 1
+                    with server._stats_lock:
+                        server._stats.server_errors += 1
 
                 finally:
-                    server._stats.active_connections -= 1
-
                     # Update average response time
                     elapsed = (time.time() - start_time) * 1000
-                    n = server._stats.total_requests
-                    server._stats.avg_response_time_ms = (
-                        server._stats.avg_response_time_ms * (n - 1) + elapsed
-                    ) / n
+                    with server._stats_lock:
+                        server._stats.active_connections -= 1
+                        n = server._stats.total_requests
+                        server._stats.avg_response_time_ms = (
+                            server._stats.avg_response_time_ms * (n - 1) + elapsed
+                        ) / n
 
             def _send_response(self, response: RestResponse) -> None:
                 """Send a REST response."""
+                body = b""
+                if response.body is not None:
+                    body = json.dumps(response.body, default=str).encode("utf-8")
+
                 self.send_response(response.status.value)
 
                 # Set headers
@@ -724,28 +748,27 @@ class SpectraRestServer(RestApiServerPort):
                 if response.request_id:
                     self.send_header("X-Request-ID", response.request_id)
 
+                self.send_header("Content-Length", str(len(body)))
                 self.end_headers()
-
-                # Send body
-                if response.body is not None:
-                    body_json = json.dumps(response.body, default=str)
-                    self.wfile.write(body_json.encode("utf-8"))
+                self.wfile.write(body)
 
             def _send_error(self, status: HttpStatus, message: str) -> None:
                 """Send an error response."""
-                self.send_response(status.value)
-                self.send_header("Content-Type", "application/json")
-                if server._config.enable_cors:
-                    self._send_cors_headers()
-                self.end_headers()
-
                 error_body = {
                     "error": {
                         "message": message,
                         "status": status.value,
                     }
                 }
-                self.wfile.write(json.dumps(error_body).encode("utf-8"))
+                body = json.dumps(error_body).encode("utf-8")
+
+                self.send_response(status.value)
+                self.send_header("Content-Type", "application/json")
+                if server._config.enable_cors:
+                    self._send_cors_headers()
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
 
             def _send_cors_headers(self) -> None:
                 """Send CORS headers."""
@@ -847,10 +870,10 @@ class SpectraRestServer(RestApiServerPort):
 
     def _handle_stats(self, request: RestRequest) -> RestResponse:
         """Server statistics endpoint."""
-        return RestResponse.success(
-            self._stats.to_dict(),
-            request_id=request.request_id,
-        )
+        stats = self._stats.to_dict()
+        if self._server:
+            stats["http"] = self._server.stats_snapshot()
+        return RestResponse.success(stats, request_id=request.request_id)
 
     def _handle_docs(self, request: RestRequest) -> RestResponse:
         """API documentation endpoint."""
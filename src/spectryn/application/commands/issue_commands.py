@@ -84,18 +84,29 @@ class UpdateDescriptionCommand(Command):
             success = self.tracker.update_issue_description(self.issue_key, self.description)
 
             if success:
-                self._publish_event(
-                    StoryUpdated(
-                        issue_key=self.issue_key,
-                        field_name="description",
-                    )
-                )
+                return self.record_success(current.description)
 
             return CommandResult.ok(success)
 
         except IssueTrackerError as e:
             return CommandResult.fail(str(e))
 
+    def record_success(self, previous: Any = None) -> CommandResult[bool]:
+        """
+        Record an update applied outside ``execute``, e.g. in an async batch.
+
+        Args:
+            previous: The description before the update, if known (for undo).
+        """
+        self._undo_data = previous
+        self._publish_event(
+            StoryUpdated(
+                issue_key=self.issue_key,
+                field_name="description",
+            )
+        )
+        return CommandResult.ok(True)
+
     def undo(self) -> CommandResult[bool] | None:
         if self._undo_data is None:
             return None
@@ -199,22 +210,31 @@ class CreateSubtaskCommand(Command):
             )
 
             if new_key:
-                self._undo_data = new_key
-                self._publish_event(
-                    SubtaskCreated(
-                        parent_key=self.parent_key,
-                        subtask_key=new_key,
-                        subtask_name=self.summary,
-                        story_points=self.story_points or 0,
-                    )
-                )
-                return CommandResult.ok(new_key)
+                return self.record_success(new_key)
 
             return CommandResult.fail("Failed to create subtask")
 
         except IssueTrackerError as e:
             return CommandResult.fail(str(e))
 
+    def record_success(self, new_key: str) -> CommandResult[str]:
+        """
+        Record a subtask created outside ``execute``, e.g. in an async batch.
+
+        Args:
+            new_key: Key of the created subtask.
+        """
+        self._undo_data = new_key
+        self._publish_event(
+            SubtaskCreated(
+                parent_key=self.parent_key,
+                subtask_key=new_key,
+                subtask_name=self.summary,
+                story_points=self.story_points or 0,
+            )
+        )
+        return CommandResult.ok(new_key)
+
 
 @dataclass
 class UpdateSubtaskCommand(Command):
@@ -355,18 +375,23 @@ class AddCommentCommand(Command):
             success = self.tracker.add_comment(self.issue_key, self.body)
 
             if success:
-                self._publish_event(
-                    CommentAdded(
-                        issue_key=self.issue_key,
-                        comment_type="text",
-                    )
-                )
+                return self.record_success()
 
             return CommandResult.ok(success)
 
         except IssueTrackerError as e:
             return CommandResult.fail(str(e))
 
+    def record_success(self) -> CommandResult[bool]:
+        """Record a comment added outside ``execute``, e.g. in an async batch."""
+        self._publish_event(
+            CommentAdded(
+                issue_key=self.issue_key,
+                comment_type="text",
+            )
+        )
+        return CommandResult.ok(True)
+
 
 @dataclass
 class TransitionStatusCommand(Command):
@@ -439,19 +464,30 @@ class TransitionStatusCommand(Command):
             success = self.tracker.transition_issue(self.issue_key, self.target_status)
 
             if success:
-                self._publish_event(
-                    StatusTransitioned(
-                        issue_key=self.issue_key,
-                        from_status=self._undo_data,
-                        to_status=self.target_status,
-                    )
-                )
+                return self.record_success(self._undo_data)
 
             return CommandResult.ok(success)
 
         except IssueTrackerError as e:
             return CommandResult.fail(str(e))
 
+    def record_success(self, from_status: str) -> CommandResult[bool]:
+        """
+        Record a transition made outside ``execute``, e.g. in an async batch.
+
+        Args:
+            from_status: The status before the transition (for undo).
+        """
+        self._undo_data = from_status
+        self._publish_event(
+            StatusTransitioned(
+                issue_key=self.issue_key,
+                from_status=from_status,
+                to_status=self.target_status,
+            )
+        )
+        return CommandResult.ok(True)
+
     def undo(self) -> CommandResult[bool] | None:
         if self._undo_data is None:
             return None
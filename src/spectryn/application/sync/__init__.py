@@ -2,6 +2,7 @@
 Sync Module - Orchestration of synchronization between markdown and issue tracker.
 """
 
+from .async_orchestrator import AsyncSyncOrchestrator
 from .attachments import (
     Attachment,
     AttachmentExtractor,
@@ -106,6 +107,7 @@ from .incremental import (
     ChangeDetectionResult,
     ChangeTracker,
     IncrementalSyncStats,
+    RemoteSnapshot,
     StoryFingerprint,
     compute_story_hash,
     stories_differ,
@@ -115,6 +117,7 @@ from .links import (
     LinkSyncOrchestrator,
     LinkSyncResult,
 )
+from .matching import TitleIndex, normalize_issue_title
 from .merge import (
     MergeAttempt,
     MergeConfig,
@@ -245,6 +248,7 @@ PARALLEL_AVAILABLE = True
 
 __all__ = [
     "PARALLEL_AVAILABLE",
+    "AsyncSyncOrchestrator",
     "Attachment",
     "AttachmentExtractor",
     "AttachmentStatus",
@@ -338,6 +342,7 @@ __all__ = [
     "ProgressSyncPhase",
     "PullChanges",
     "PullResult",
+    "RemoteSnapshot",
     "ResolutionStrategy",
     "RestoreOperation",
     "RestoreResult",
@@ -380,6 +385,7 @@ __all__ = [
     "TimeTrackingSyncer",
     "TimeUnit",
     "TimeValue",
+    "TitleIndex",
     "TrackerFieldMappingConfig",
     "TrackerInfo",
     "TrackerSyncStatus",
@@ -431,6 +437,7 @@ __all__ = [
     "format_time_for_markdown",
     "format_worklogs_as_markdown",
     "is_content_unchanged",
+    "normalize_issue_title",
     "parse_sprint_name",
     "parse_time_estimate",
     "process_files_parallel",
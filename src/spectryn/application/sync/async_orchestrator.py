@@ -0,0 +1,530 @@
+"""
+Async Sync Orchestrator - asyncio engine for the tracker-bound sync phases.
+
+SyncOrchestrator sends its phase requests one after another (or over a small
+thread pool with ``concurrency``), so a cold sync of a large epic costs about
+``requests x latency``. AsyncSyncOrchestrator keeps the analysis, matching,
+incremental/delta bookkeeping and result reporting of SyncOrchestrator, but
+runs each write phase as a batch through an AsyncIssueTrackerPort so the
+requests overlap and a phase costs about its slowest request plus the
+adapter's rate-limit pacing.
+
+Operations without an async port method (subtask updates, comment reads)
+run on worker threads against the sync tracker, bounded by the same
+concurrency limit. Dry runs make no writes and fall back to the sync phases.
+
+Each operation is still described by the command the sync phases execute:
+commands validate the request, and record the batch outcome, publishing the
+same events and keeping the same undo data. The one difference is that
+description updates do not read the previous description first, so their
+commands carry no undo data.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, TypeVar
+
+from spectryn.application.commands import (
+    AddCommentCommand,
+    CreateSubtaskCommand,
+    TransitionStatusCommand,
+    UpdateDescriptionCommand,
+)
+from spectryn.core.domain.events import EventBus
+from spectryn.core.ports.async_tracker import AsyncIssueTrackerPort
+from spectryn.core.ports.config_provider import SyncConfig, ValidationConfig
+from spectryn.core.ports.document_formatter import DocumentFormatterPort
+from spectryn.core.ports.document_parser import DocumentParserPort
+from spectryn.core.ports.issue_tracker import IssueData, IssueTrackerPort
+
+from .orchestrator import SyncOrchestrator, SyncResult
+
+
+if TYPE_CHECKING:
+    from spectryn.core.domain.entities import Subtask, UserStory
+
+    from .backup import BackupManager
+    from .state import StateStore
+
+
+T = TypeVar("T")
+
+# Statuses treated as already complete by the status phase
+_DONE_STATUSES = ("resolved", "done", "closed")
+
+
+class AsyncSyncOrchestrator(SyncOrchestrator):
+    """
+    SyncOrchestrator variant that drives its phases through asyncio.
+
+    Example:
+        >>> async_tracker = jira_adapter.get_async_client()
+        >>> orchestrator = AsyncSyncOrchestrator(
+        ...     tracker=jira_adapter,
+        ...     parser=parser,
+        ...     formatter=formatter,
+        ...     config=config,
+        ...     async_tracker=async_tracker,
+        ... )
+        >>> result = orchestrator.sync("EPIC.md", "PROJ-1")
+
+    Each phase opens the async tracker as a context manager and runs its
+    own event loop, so ``sync`` must not be called from a running loop.
+    """
+
+    DEFAULT_CONCURRENCY = 10
+
+    def __init__(
+        self,
+        tracker: IssueTrackerPort,
+        parser: DocumentParserPort,
+        formatter: DocumentFormatterPort,
+        config: SyncConfig,
+        *,
+        async_tracker: AsyncIssueTrackerPort,
+        event_bus: EventBus | None = None,
+        state_store: StateStore | None = None,
+        backup_manager: BackupManager | None = None,
+        validation_config: ValidationConfig | None = None,
+        max_concurrency: int = DEFAULT_CONCURRENCY,
+    ):
+        """
+        Initialize the async orchestrator.
+
+        Args:
+            tracker: Issue tracker port, used for analysis and operations
+                without an async equivalent
+            parser: Document parser port
+            formatter: Document formatter port
+            config: Sync configuration
+            async_tracker: Async issue tracker port used for batched phases
+            event_bus: Optional event bus
+            state_store: Optional state store for persistence
+            backup_manager: Optional backup manager for pre-sync backups
+            validation_config: Optional validation configuration for constraints
+            max_concurrency: Max sync-tracker calls offloaded to threads at once
+        """
+        super().__init__(
+            tracker=tracker,
+            parser=parser,
+            formatter=formatter,
+            config=config,
+            event_bus=event_bus,
+            state_store=state_store,
+            backup_manager=backup_manager,
+            validation_config=validation_config,
+        )
+        self.async_tracker = async_tracker
+        self.max_concurrency = max(1, max_concurrency)
+        self.logger = logging.getLogger("AsyncSyncOrchestrator")
+
+    # -------------------------------------------------------------------------
+    # Phase Runner
+    # -------------------------------------------------------------------------
+
+    def _run_phase(
+        self,
+        operation: str,
+        phase: Callable[[AsyncIssueTrackerPort], Awaitable[None]],
+        result: SyncResult,
+    ) -> None:
+        """
+        Run one async phase on a fresh event loop with a connected tracker.
+
+        A failure to connect or an unexpected error aborts only this phase;
+        it is recorded on the result like any other failed operation.
+        """
+
+        async def run() -> None:
+            async with self.async_tracker as tracker:
+                await phase(tracker)
+
+        try:
+            asyncio.run(run())
+        except Exception as e:
+            result.add_failed_operation(
+                operation=operation,
+                issue_key="",
+                error=f"Unexpected error: {e}",
+            )
+            self.logger.exception(f"Async phase {operation} failed")
+
+    async def _in_threads(self, calls: list[Callable[[], T]]) -> list[T]:
+        """Run blocking calls on worker threads, bounded by max_concurrency."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def bounded(call: Callable[[], T]) -> T:
+            async with semaphore:
+                return await asyncio.to_thread(call)
+
+        return list(await asyncio.gather(*(bounded(call) for call in calls)))
+
+    # -------------------------------------------------------------------------
+    # Sync Phases
+    # -------------------------------------------------------------------------
+
+    def _sync_descriptions(self, result: SyncResult) -> None:
+        """Update all matched story descriptions in one async batch."""
+        if self.config.dry_run:
+            super()._sync_descriptions(result)
+            return
+
+        stories = [
+            md_story
+            for md_story in self._md_stories
+            if self._should_sync_story(str(md_story.id)) and md_story.description
+        ]
+        if not stories:
+            return
+
+        pending: list[tuple[UserStory, UpdateDescriptionCommand]] = []
+        for md_story in stories:
+            cmd = UpdateDescriptionCommand(
+                tracker=self.tracker,
+                issue_key=self._matches[str(md_story.id)],
+                description=self.formatter.format_story_description(md_story),
+                event_bus=self.event_bus,
+                dry_run=False,
+            )
+            error = cmd.validate()
+            if error:
+                result.add_failed_operation(
+                    operation="update_description",
+                    issue_key=cmd.issue_key,
+                    error=error,
+                    story_id=str(md_story.id),
+                )
+            else:
+                pending.append((md_story, cmd))
+        if not pending:
+            return
+
+        async def phase(tracker: AsyncIssueTrackerPort) -> None:
+            outcomes = await tracker.update_descriptions_async(
+                [(cmd.issue_key, cmd.description) for _, cmd in pending]
+            )
+            for (md_story, cmd), (_, success, error) in zip(pending, outcomes, strict=True):
+                self._update_progress_item(f"{cmd.issue_key}: {md_story.title[:30]}")
+                if success:
+                    result.stories_updated += 1
+                    cmd.record_success()
+                else:
+                    result.add_failed_operation(
+                        operation="update_description",
+                        issue_key=cmd.issue_key,
+                        error=error or "Description update failed",
+                        story_id=str(md_story.id),
+                    )
+
+        self._run_phase("update_descriptions", phase, result)
+
+    def _sync_subtasks(self, result: SyncResult) -> None:
+        """
+        Create and update subtasks for all matched stories.
+
+        Existing subtasks come from the analyze phase where the tracker
+        provides them, and from one parallel fetch otherwise. Subtasks are
+        handled in rounds by markdown position: round N syncs the Nth
+        subtask of every story, with its creates in one async batch and its
+        updates on worker threads. A story's subtasks are therefore synced
+        in markdown order, as in the sync phase, while stories overlap.
+        """
+        if self.config.dry_run:
+            super()._sync_subtasks(result)
+            return
+
+        stories = [
+            md_story
+            for md_story in self._md_stories
+            if self._should_sync_story_subtasks(str(md_story.id))
+        ]
+        if not stories:
+            return
+
+        async def phase(tracker: AsyncIssueTrackerPort) -> None:
+            existing_by_key = {
+                key: dict(subtasks) for key, subtasks in self._prefetched_subtasks.items()
+            }
+            missing = [
+                self._matches[str(s.id)]
+                for s in stories
+                if self._matches[str(s.id)] not in existing_by_key
+            ]
+            if missing:
+                for issue in await tracker.get_issues_async(missing):
+                    existing_by_key[issue.key] = {st.summary.lower(): st for st in issue.subtasks}
+
+            # One partial result per subtask, merged in markdown order so
+            # counters and failures read exactly like a serial run.
+            partials: list[SyncResult] = []
+            rounds: list[
+                tuple[
+                    list[tuple[SyncResult, str, str, Subtask]],
+                    list[tuple[SyncResult, str, Subtask, IssueData]],
+                ]
+            ] = []
+
+            for md_story in stories:
+                story_id = str(md_story.id)
+                issue_key = self._matches[story_id]
+                existing = existing_by_key.get(issue_key)
+
+                if existing is None:
+                    partial = SyncResult(dry_run=result.dry_run)
+                    partial.add_failed_operation(
+                        operation="fetch_issue",
+                        issue_key=issue_key,
+                        error=f"Failed to fetch issue {issue_key}",
+                        story_id=story_id,
+                    )
+                    partials.append(partial)
+                    continue
+
+                for position, md_subtask in enumerate(md_story.subtasks):
+                    self._update_progress_item(f"{issue_key}: {md_subtask.name[:25]}")
+                    partial = SyncResult(dry_run=result.dry_run)
+                    partials.append(partial)
+                    if position == len(rounds):
+                        rounds.append(([], []))
+                    creates, updates = rounds[position]
+                    match = existing.get(md_subtask.name.lower())
+                    if match is not None:
+                        updates.append((partial, story_id, md_subtask, match))
+                    else:
+                        creates.append((partial, story_id, issue_key, md_subtask))
+
+            for creates, updates in rounds:
+                await asyncio.gather(
+                    self._create_subtasks(tracker, creates),
+                    self._in_threads(
+                        [functools.partial(self._update_subtask_safely, *u) for u in updates]
+                    ),
+                )
+
+            for partial in partials:
+                result.merge(partial)
+
+        self._run_phase("sync_subtasks", phase, result)
+
+    def _update_subtask_safely(
+        self, partial: SyncResult, story_id: str, md_subtask: Subtask, existing: IssueData
+    ) -> None:
+        """Update an existing subtask on a worker thread, never raising."""
+        try:
+            self._update_existing_subtask(md_subtask, existing, story_id, partial)
+        except Exception as e:
+            partial.add_failed_operation(
+                operation="sync_subtask",
+                issue_key=existing.key,
+                error=f"Unexpected error: {e}",
+                story_id=story_id,
+            )
+            self.logger.exception(f"Unexpected error updating subtask {existing.key}")
+
+    async def _create_subtasks(
+        self,
+        tracker: AsyncIssueTrackerPort,
+        creates: list[tuple[SyncResult, str, str, Subtask]],
+    ) -> None:
+        """Create subtasks in one async batch, recording each outcome."""
+        pending: list[tuple[SyncResult, str, CreateSubtaskCommand]] = []
+        for partial, story_id, parent_key, md_subtask in creates:
+            cmd = CreateSubtaskCommand(
+                tracker=self.tracker,
+                parent_key=parent_key,
+                project_key=parent_key.split("-")[0],
+                summary=md_subtask.name,
+                description=self.formatter.format_text(md_subtask.description),
+                story_points=md_subtask.story_points,
+                event_bus=self.event_bus,
+                dry_run=False,
+            )
+            error = cmd.validate()
+            if error:
+                partial.add_failed_operation(
+                    operation="create_subtask",
+                    issue_key=parent_key,
+                    error=error,
+                    story_id=story_id,
+                )
+            else:
+                pending.append((partial, story_id, cmd))
+        if not pending:
+            return
+
+        outcomes = await tracker.create_subtasks_async(
+            [
+                {
+                    "parent_key": cmd.parent_key,
+                    "project_key": cmd.project_key,
+                    "summary": cmd.summary,
+                    "description": cmd.description,
+                    "story_points": cmd.story_points,
+                }
+                for _, _, cmd in pending
+            ]
+        )
+
+        for (partial, story_id, cmd), (new_key, success, error) in zip(
+            pending, outcomes, strict=True
+        ):
+            if success and new_key:
+                partial.subtasks_created += 1
+                cmd.record_success(new_key)
+            else:
+                partial.add_failed_operation(
+                    operation="create_subtask",
+                    issue_key=cmd.parent_key,
+                    error=error or "Failed to create subtask",
+                    story_id=story_id,
+                )
+
+    def _sync_comments(self, result: SyncResult) -> None:
+        """Add missing commit comments, reading and writing in parallel."""
+        if self.config.dry_run:
+            super()._sync_comments(result)
+            return
+
+        stories = [
+            md_story
+            for md_story in self._md_stories
+            if md_story.commits and self._should_sync_story(str(md_story.id))
+        ]
+        if not stories:
+            return
+
+        def read_comments(issue_key: str) -> list[dict] | Exception:
+            try:
+                return self.tracker.get_issue_comments(issue_key)
+            except Exception as e:
+                return e
+
+        async def phase(tracker: AsyncIssueTrackerPort) -> None:
+            keys = [self._matches[str(s.id)] for s in stories]
+            existing = await self._in_threads(
+                [functools.partial(read_comments, key) for key in keys]
+            )
+
+            pending: list[tuple[UserStory, AddCommentCommand]] = []
+            for md_story, issue_key, comments in zip(stories, keys, existing, strict=True):
+                self._update_progress_item(f"{issue_key}: {len(md_story.commits)} commits")
+                if isinstance(comments, Exception):
+                    result.add_failed_operation(
+                        operation="add_comment",
+                        issue_key=issue_key,
+                        error=str(comments),
+                        story_id=str(md_story.id),
+                    )
+                    continue
+                if any("Related Commits" in str(c.get("body", "")) for c in comments):
+                    continue
+                cmd = AddCommentCommand(
+                    tracker=self.tracker,
+                    issue_key=issue_key,
+                    body=self.formatter.format_commits_table(md_story.commits),
+                    event_bus=self.event_bus,
+                    dry_run=False,
+                )
+                error = cmd.validate()
+                if error:
+                    result.add_failed_operation(
+                        operation="add_comment",
+                        issue_key=issue_key,
+                        error=error,
+                        story_id=str(md_story.id),
+                    )
+                else:
+                    pending.append((md_story, cmd))
+
+            if not pending:
+                return
+
+            outcomes = await tracker.add_comments_async(
+                [(cmd.issue_key, cmd.body) for _, cmd in pending]
+            )
+            for (md_story, cmd), (_, success, error) in zip(pending, outcomes, strict=True):
+                if success:
+                    result.comments_added += 1
+                    cmd.record_success()
+                else:
+                    result.add_failed_operation(
+                        operation="add_comment",
+                        issue_key=cmd.issue_key,
+                        error=error or "Failed to add comment",
+                        story_id=str(md_story.id),
+                    )
+
+        self._run_phase("add_comments", phase, result)
+
+    def _sync_statuses(self, result: SyncResult, target_status: str = "Resolved") -> None:
+        """Transition open subtasks of completed stories in one async batch."""
+        if self.config.dry_run:
+            super()._sync_statuses(result, target_status)
+            return
+
+        stories = [
+            md_story
+            for md_story in self._md_stories
+            if md_story.status.is_complete() and self._should_sync_story(str(md_story.id))
+        ]
+        if not stories:
+            return
+
+        async def phase(tracker: AsyncIssueTrackerPort) -> None:
+            # Re-read parents: the subtask phase may have just created children
+            keys = [self._matches[str(s.id)] for s in stories]
+            issues = {issue.key: issue for issue in await tracker.get_issues_async(keys)}
+
+            pending: list[tuple[str, IssueData, TransitionStatusCommand]] = []
+            for md_story, issue_key in zip(stories, keys, strict=True):
+                story_id = str(md_story.id)
+                issue = issues.get(issue_key)
+                if issue is None:
+                    result.add_failed_operation(
+                        operation="fetch_issue",
+                        issue_key=issue_key,
+                        error=f"Failed to fetch issue {issue_key}",
+                        story_id=story_id,
+                    )
+                    continue
+                pending.extend(
+                    (
+                        story_id,
+                        subtask,
+                        TransitionStatusCommand(
+                            tracker=self.tracker,
+                            issue_key=subtask.key,
+                            target_status=target_status,
+                            event_bus=self.event_bus,
+                            dry_run=False,
+                        ),
+                    )
+                    for subtask in issue.subtasks
+                    if subtask.status.lower() not in _DONE_STATUSES
+                )
+
+            if not pending:
+                return
+
+            outcomes = await tracker.transition_issues_async(
+                [(cmd.issue_key, cmd.target_status) for _, _, cmd in pending]
+            )
+            for (story_id, subtask, cmd), (_, success, error) in zip(
+                pending, outcomes, strict=True
+            ):
+                if success:
+                    result.statuses_updated += 1
+                    cmd.record_success(subtask.status)
+                else:
+                    result.add_failed_operation(
+                        operation="transition_status",
+                        issue_key=subtask.key,
+                        error=error or "Transition failed",
+                        story_id=story_id,
+                    )
+
+        self._run_phase("sync_statuses", phase, result)
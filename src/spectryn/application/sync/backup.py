@@ -8,14 +8,17 @@ allowing recovery if something goes wrong.
 import hashlib
 import json
 import logging
+import textwrap
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import IO, TYPE_CHECKING, Any
 
 
 if TYPE_CHECKING:
     from spectryn.core.ports.issue_tracker import IssueData, IssueTrackerPort
+    from spectryn.core.security.backup_sanitizer import BackupSanitizer
 
 
 logger = logging.getLogger(__name__)
@@ -327,12 +330,14 @@ class BackupManager:
     DEFAULT_BACKUP_DIR = Path.home() / ".spectra" / "backups"
     DEFAULT_MAX_BACKUPS = 10
     DEFAULT_RETENTION_DAYS = 30
+    DEFAULT_MAX_WORKERS = 8
 
     def __init__(
         self,
         backup_dir: Path | None = None,
         max_backups: int = DEFAULT_MAX_BACKUPS,
         retention_days: int = DEFAULT_RETENTION_DAYS,
+        max_workers: int = DEFAULT_MAX_WORKERS,
     ):
         """
         Initialize the backup manager.
@@ -341,10 +346,13 @@ class BackupManager:
             backup_dir: Directory to store backups. Defaults to ~/.spectra/backups/
             max_backups: Maximum number of backups to keep per epic.
             retention_days: Delete backups older than this many days.
+            max_workers: Maximum concurrent comment reads while creating a
+                backup (1 = sequential).
         """
         self.backup_dir = backup_dir or self.DEFAULT_BACKUP_DIR
         self.max_backups = max_backups
         self.retention_days = retention_days
+        self.max_workers = max_workers
         self._ensure_dir()
 
     def _ensure_dir(self) -> None:
@@ -408,16 +416,8 @@ class BackupManager:
             issues = tracker.get_epic_children(epic_key)
             logger.debug(f"Found {len(issues)} issues to backup")
 
-            for issue_data in issues:
-                # Get comment count
-                try:
-                    comments = tracker.get_issue_comments(issue_data.key)
-                    comments_count = len(comments)
-                except Exception as e:
-                    logger.warning(f"Could not fetch comments for {issue_data.key}: {e}")
-                    comments_count = 0
-
-                # Create snapshot
+            comment_counts = self._fetch_comment_counts(tracker, issues)
+            for issue_data, comments_count in zip(issues, comment_counts, strict=True):
                 snapshot = IssueSnapshot.from_issue_data(issue_data, comments_count)
                 backup.issues.append(snapshot)
 
@@ -434,10 +434,42 @@ class BackupManager:
         logger.info(f"Backup created: {backup_id} ({backup.issue_count} issues)")
         return backup
 
+    def _fetch_comment_counts(
+        self, tracker: "IssueTrackerPort", issues: list["IssueData"]
+    ) -> list[int]:
+        """
+        Count the comments of each issue, reading up to max_workers at once.
+
+        Args:
+            tracker: Issue tracker port to read comments from.
+            issues: Issues to count comments for.
+
+        Returns:
+            Comment counts in the order of issues (0 where a read failed).
+        """
+
+        def count(issue_key: str) -> int:
+            try:
+                return len(tracker.get_issue_comments(issue_key))
+            except Exception as e:
+                logger.warning(f"Could not fetch comments for {issue_key}: {e}")
+                return 0
+
+        keys = [issue.key for issue in issues]
+        workers = min(self.max_workers, len(keys))
+        if workers <= 1:
+            return [count(key) for key in keys]
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="spectryn-backup") as pool:
+            return list(pool.map(count, keys))
+
     def save_backup(self, backup: Backup, sanitize: bool = True) -> Path:
         """
         Save a backup to disk.
 
+        Issues are serialized, sanitized and written one at a time, so the
+        whole backup is never held a second time as a dict.
+
         Args:
             backup: The backup to save.
             sanitize: Whether to sanitize sensitive data before saving.
@@ -451,28 +483,64 @@ class BackupManager:
 
         backup_file = epic_dir / f"{backup.backup_id}.json"
 
-        # Convert to dict
-        data = backup.to_dict()
-
         # Sanitize to remove any secrets before saving
-        if sanitize:
-            try:
-                from spectryn.core.security.backup_sanitizer import BackupSanitizer
-
-                sanitizer = BackupSanitizer()
-                result = sanitizer.sanitize_dict(data)
-                if result.was_sanitized:
-                    logger.info(f"Sanitized {result.fields_sanitized} sensitive fields in backup")
-            except ImportError:
-                # Security module not available, continue without sanitization
-                pass
+        sanitizer = self._create_sanitizer() if sanitize else None
 
         with open(backup_file, "w") as f:
-            json.dump(data, f, indent=2, default=str)
+            fields_sanitized = self._write_backup(f, backup, sanitizer)
 
+        if fields_sanitized:
+            logger.info(f"Sanitized {fields_sanitized} sensitive fields in backup")
         logger.debug(f"Saved backup to {backup_file}")
         return backup_file
 
+    @staticmethod
+    def _create_sanitizer() -> "BackupSanitizer | None":
+        """Create a backup sanitizer, or None if the security module is unavailable."""
+        try:
+            from spectryn.core.security.backup_sanitizer import BackupSanitizer
+        except ImportError:
+            return None
+        return BackupSanitizer()
+
+    @staticmethod
+    def _write_backup(f: IO[str], backup: Backup, sanitizer: "BackupSanitizer | None") -> int:
+        """
+        Stream a backup as JSON, in the layout json.dump(indent=2) produces.
+
+        Args:
+            f: Text file to write to.
+            backup: The backup to write.
+            sanitizer: Sanitizer applied to metadata and each issue, if any.
+
+        Returns:
+            Number of fields the sanitizer redacted.
+        """
+
+        def encode(value: Any) -> str:
+            return textwrap.indent(json.dumps(value, indent=2, default=str), "  ")[2:]
+
+        fields_sanitized = 0
+        metadata = dict(backup.metadata)
+        if sanitizer:
+            fields_sanitized += sanitizer.sanitize_dict({"metadata": metadata}).fields_sanitized
+
+        f.write("{\n")
+        for name in ("backup_id", "epic_key", "markdown_path", "created_at"):
+            f.write(f'  "{name}": {encode(getattr(backup, name))},\n')
+
+        f.write('  "issues": [')
+        for i, issue in enumerate(backup.issues):
+            data = issue.to_dict()
+            if sanitizer:
+                fields_sanitized += sanitizer.sanitize_dict({"issues": [data]}).fields_sanitized
+            f.write("," if i else "")
+            f.write("\n" + textwrap.indent(json.dumps(data, indent=2, default=str), "    "))
+        f.write("\n  ]" if backup.issues else "]")
+
+        f.write(f',\n  "metadata": {encode(metadata)}\n}}')
+        return fields_sanitized
+
     def load_backup(self, backup_id: str, epic_key: str | None = None) -> Backup | None:
         """
         Load a backup from disk.
@@ -30,6 +30,7 @@ from .conflict import (
     SyncSnapshot,
     create_snapshot_from_sync,
 )
+from .matching import TitleIndex
 
 
 @dataclass
@@ -318,6 +319,9 @@ class BidirectionalSyncOrchestrator:
         """Match local stories to remote issues."""
         self._matches = {}
 
+        # Same normalization as _titles_match, applied once per title
+        title_index = TitleIndex([issue.summary.lower().strip() for issue in self._remote_issues])
+
         for story in self._local_stories:
             story_id = str(story.id)
 
@@ -327,10 +331,9 @@ class BidirectionalSyncOrchestrator:
                 continue
 
             # Try to match by title
-            for issue in self._remote_issues:
-                if self._titles_match(story.title, issue.summary):
-                    self._matches[story_id] = issue.key
-                    break
+            position = title_index.first_match(story.title.lower().strip())
+            if position is not None:
+                self._matches[story_id] = self._remote_issues[position].key
 
         self.logger.info(f"Matched {len(self._matches)} stories to issues")
 
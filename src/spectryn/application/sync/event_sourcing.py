@@ -3,19 +3,26 @@ Event Sourcing Integration - Connect EventBus to EventStore.
 
 This module provides:
 - EventSourcedBus: An EventBus that persists events to an EventStore
+- Durability: Write-through or group-commit persistence for EventSourcedBus
 - EventReplayer: Replay events to reconstruct state
 - Projection helpers for building read models from events
 """
 
+import atexit
+import json
 import logging
+import threading
+import weakref
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Generic, TypeVar
+from enum import Enum
+from typing import Any, ClassVar, Generic, TypeVar
 
 from spectryn.core.domain.events import DomainEvent, EventBus
 from spectryn.core.ports.event_store import (
     EventStorePort,
+    ProjectionSnapshot,
     StoredEvent,
     make_epic_stream_id,
     make_sync_stream_id,
@@ -28,6 +35,29 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T")
 
 
+class Durability(Enum):
+    """When events published to an EventSourcedBus reach stable storage."""
+
+    EVENT = "event"  # Append and sync each event as it is published
+    BATCH = "batch"  # Buffer events and append them in group commits, each synced
+    NONE = "none"  # Buffer events and append them in group commits without syncing
+
+
+# Buses with buffered events, flushed at interpreter exit
+_buffered_buses: "weakref.WeakSet[EventSourcedBus]" = weakref.WeakSet()
+_exit_hook_registered = False
+_exit_hook_lock = threading.Lock()
+
+
+def _flush_buffered_buses() -> None:
+    """Flush buffered events of all live buses (atexit hook)."""
+    for bus in list(_buffered_buses):
+        try:
+            bus.flush()
+        except Exception as e:
+            logger.error(f"Failed to flush events for stream '{bus.stream_id}' on exit: {e}")
+
+
 class EventSourcedBus(EventBus):
     """
     An EventBus that persists events to an EventStore.
@@ -35,6 +65,14 @@ class EventSourcedBus(EventBus):
     Extends the standard EventBus to automatically save all published
     events to a durable event store. This enables event sourcing patterns.
 
+    By default every event is appended before subscribers are notified.
+    With ``durability`` set to ``BATCH`` or ``NONE`` the bus writes behind:
+    events are buffered and appended in group commits (one store append,
+    so one lock and one write) once ``flush_size`` events are pending or
+    ``flush_interval`` seconds have passed. Buffered events are flushed by
+    ``flush()``, ``close()``, leaving a ``with`` block, and at interpreter
+    exit.
+
     Example:
         store = FileEventStore(".spectra/events")
         bus = EventSourcedBus(store, stream_id="sync:PROJ-100:session1")
@@ -46,11 +84,18 @@ class EventSourcedBus(EventBus):
         events = replayer.replay("sync:PROJ-100:session1")
     """
 
+    # Upper bound, in seconds, on the backoff between failed timed flushes
+    MAX_FLUSH_RETRY_INTERVAL = 60.0
+
     def __init__(
         self,
         event_store: EventStorePort,
         stream_id: str,
         metadata: dict[str, Any] | None = None,
+        *,
+        durability: Durability | str = Durability.EVENT,
+        flush_size: int = 256,
+        flush_interval: float = 1.0,
     ):
         """
         Initialize the event-sourced bus.
@@ -59,23 +104,50 @@ class EventSourcedBus(EventBus):
             event_store: The event store to persist to.
             stream_id: The stream ID for this session.
             metadata: Optional metadata to attach to all events.
+            durability: When events are persisted (see Durability).
+            flush_size: Buffered events that trigger a group commit.
+            flush_interval: Seconds an event may stay buffered before a group commit.
         """
         super().__init__()
         self._store = event_store
         self._stream_id = stream_id
         self._metadata = metadata or {}
         self._sequence = 0
+        self._durability = Durability(durability)
+        self._flush_size = flush_size
+        self._flush_interval = flush_interval
+
+        # Write-behind state
+        self._buffer: list[DomainEvent] = []
+        self._buffer_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._flush_timer: threading.Timer | None = None
+        self._failed_timed_flushes = 0
 
         # Load current sequence from store
         info = self._store.get_stream_info(stream_id)
         if info:
             self._sequence = info.last_sequence + 1
 
+        if self._durability is not Durability.EVENT:
+            self._register_exit_flush()
+
     @property
     def stream_id(self) -> str:
         """Get the stream ID for this bus."""
         return self._stream_id
 
+    @property
+    def durability(self) -> Durability:
+        """Get when published events are persisted."""
+        return self._durability
+
+    @property
+    def pending_count(self) -> int:
+        """Get the number of buffered events not yet persisted."""
+        with self._buffer_lock:
+            return len(self._buffer)
+
     def publish(self, event: DomainEvent) -> None:
         """
         Publish an event to subscribers and persist to store.
@@ -83,15 +155,11 @@ class EventSourcedBus(EventBus):
         Args:
             event: The event to publish.
         """
-        # Persist to store first (for durability)
-        stored = self._store.append(
-            self._stream_id,
-            [event],
-            metadata=self._metadata,
-        )
-
-        if stored:
-            self._sequence = stored[-1].sequence_number + 1
+        if self._durability is Durability.EVENT:
+            # Persist to store first (for durability)
+            self._append([event])
+        else:
+            self._buffer_events([event])
 
         # Then notify subscribers
         super().publish(event)
@@ -108,19 +176,108 @@ class EventSourcedBus(EventBus):
         if not events:
             return
 
-        # Persist all events atomically
+        if self._durability is Durability.EVENT:
+            # Persist all events atomically
+            self._append(events)
+        else:
+            self._buffer_events(events)
+
+        # Notify subscribers
+        for event in events:
+            super().publish(event)
+
+    def flush(self) -> None:
+        """
+        Persist all buffered events in one group commit.
+
+        If the store append fails, the events stay buffered and the error
+        is raised.
+        """
+        with self._flush_lock:
+            with self._buffer_lock:
+                batch, self._buffer = self._buffer, []
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+
+            if not batch:
+                return
+
+            try:
+                self._append(batch, sync=self._durability is not Durability.NONE)
+            except Exception:
+                with self._buffer_lock:
+                    self._buffer[:0] = batch
+                raise
+            self._failed_timed_flushes = 0
+
+    def close(self) -> None:
+        """Flush buffered events and stop the flush timer."""
+        self.flush()
+        _buffered_buses.discard(self)
+
+    def __enter__(self) -> "EventSourcedBus":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _append(self, events: list[DomainEvent], sync: bool = True) -> None:
+        """Append events to the stream and advance the sequence."""
         stored = self._store.append(
             self._stream_id,
             events,
             metadata=self._metadata,
+            sync=sync,
         )
 
         if stored:
             self._sequence = stored[-1].sequence_number + 1
 
-        # Notify subscribers
-        for event in events:
-            super().publish(event)
+    def _buffer_events(self, events: list[DomainEvent]) -> None:
+        """Buffer events, flushing if the size threshold is reached."""
+        with self._buffer_lock:
+            self._buffer.extend(events)
+            flush_due = len(self._buffer) >= self._flush_size
+            if not flush_due:
+                self._arm_flush_timer(self._flush_interval)
+
+        if flush_due:
+            self.flush()
+
+    def _arm_flush_timer(self, delay: float) -> None:
+        """Start the flush timer unless one is pending. Requires ``_buffer_lock``."""
+        if self._flush_timer is None:
+            self._flush_timer = threading.Timer(delay, self._flush_on_timer)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _flush_on_timer(self) -> None:
+        try:
+            self.flush()
+        except Exception as e:
+            # The batch went back into the buffer; retry it with backoff, since
+            # no further publish may come along to arm the timer again.
+            self._failed_timed_flushes += 1
+            delay = min(
+                self._flush_interval * 2**self._failed_timed_flushes,
+                max(self.MAX_FLUSH_RETRY_INTERVAL, self._flush_interval),
+            )
+            logger.error(
+                f"Failed to flush events for stream '{self._stream_id}', "
+                f"retrying in {delay:.1f}s: {e}"
+            )
+            with self._buffer_lock:
+                if self._buffer:
+                    self._arm_flush_timer(delay)
+
+    def _register_exit_flush(self) -> None:
+        global _exit_hook_registered
+        _buffered_buses.add(self)
+        with _exit_hook_lock:
+            if not _exit_hook_registered:
+                atexit.register(_flush_buffered_buses)
+                _exit_hook_registered = True
 
 
 class EventReplayer:
@@ -213,19 +370,91 @@ class EventReplayer:
         """
         Replay events through a projection to build state.
 
+        For projections with ``snapshot_every`` set, a full replay resumes
+        from the latest valid snapshot saved beside the stream and applies
+        only the events after it. A new snapshot is saved whenever at least
+        ``snapshot_every`` events were applied.
+
         Args:
             stream_id: The stream to replay.
             projection: The projection to apply events to.
-            from_sequence: Start from this sequence.
+            from_sequence: Start from this sequence. Snapshots are only
+                used when replaying from the start of the stream.
 
         Returns:
             The final projection state.
         """
+        use_snapshots = projection.snapshot_every > 0 and from_sequence == 0
+        if use_snapshots:
+            snapshot_sequence = self._restore_snapshot(stream_id, projection)
+            if snapshot_sequence is not None:
+                from_sequence = snapshot_sequence + 1
+
+        applied = 0
+        last: StoredEvent | None = None
         for stored in self._store.read(stream_id, from_sequence):
             projection.apply(stored.event)
+            applied += 1
+            last = stored
+
+        if use_snapshots and last is not None and applied >= projection.snapshot_every:
+            self._save_snapshot(stream_id, projection, last)
 
         return projection.state
 
+    def _restore_snapshot(self, stream_id: str, projection: "Projection[Any]") -> int | None:
+        """
+        Restore a projection from its latest snapshot.
+
+        Snapshots of an older projection version, or whose last event no
+        longer matches the stream (e.g. after compaction), are ignored.
+
+        Returns:
+            Sequence number of the last event in the snapshot, or None if no
+            snapshot was restored.
+        """
+        try:
+            snapshot = self._store.load_snapshot(stream_id, projection.snapshot_name)
+        except Exception as e:
+            logger.warning(f"Cannot load snapshot for stream '{stream_id}': {e}")
+            return None
+
+        if snapshot is None or snapshot.version != projection.snapshot_version:
+            return None
+
+        anchor = list(self._store.read(stream_id, snapshot.sequence, snapshot.sequence))
+        if not anchor or anchor[0].event_id != snapshot.event_id:
+            logger.info(f"Discarding stale {snapshot.name} snapshot for stream '{stream_id}'")
+            return None
+
+        try:
+            projection.restore_state(json.loads(snapshot.data))
+        except Exception as e:
+            logger.warning(f"Cannot restore {snapshot.name} snapshot for '{stream_id}': {e}")
+            return None
+
+        logger.debug(
+            f"Restored {snapshot.name} for stream '{stream_id}' at sequence {snapshot.sequence}"
+        )
+        return snapshot.sequence
+
+    def _save_snapshot(
+        self, stream_id: str, projection: "Projection[Any]", last: StoredEvent
+    ) -> None:
+        """Save a snapshot of a projection after applying ``last``."""
+        try:
+            snapshot = ProjectionSnapshot(
+                name=projection.snapshot_name,
+                sequence=last.sequence_number,
+                event_id=last.event_id,
+                data=json.dumps(projection.snapshot_state()).encode("utf-8"),
+                version=projection.snapshot_version,
+            )
+            self._store.save_snapshot(stream_id, snapshot)
+        except Exception as e:
+            # Snapshots only speed up replay; never fail a replay over one
+            logger.warning(f"Cannot save snapshot for stream '{stream_id}': {e}")
+
     def replay_by_epic(
         self,
         epic_key: str,
@@ -272,6 +501,12 @@ class Projection(Generic[T]):
     A projection transforms a stream of events into a read model.
     Override the `apply` method to handle specific event types.
 
+    Set ``snapshot_every`` to have ``EventReplayer`` save the state every
+    that many events, so later replays only apply the tail of the stream.
+    Snapshots are stored as JSON: override ``snapshot_state``/``restore_state``
+    if ``state`` is not JSON-serializable or the projection keeps state
+    outside it, and bump ``snapshot_version`` when the state's shape changes.
+
     Example:
         @dataclass
         class SyncStats:
@@ -290,6 +525,10 @@ class Projection(Generic[T]):
 
     state: T
 
+    # Events between snapshots (0 disables snapshots)
+    snapshot_every: ClassVar[int] = 0
+    snapshot_version: ClassVar[str] = "1"
+
     def apply(self, event: DomainEvent) -> None:
         """
         Apply an event to update the projection state.
@@ -300,6 +539,24 @@ class Projection(Generic[T]):
             event: The event to apply.
         """
 
+    @property
+    def snapshot_name(self) -> str:
+        """Name the projection's snapshots are stored under."""
+        return type(self).__qualname__
+
+    def snapshot_state(self) -> Any:
+        """Get the JSON-serializable state to save in a snapshot."""
+        return self.state
+
+    def restore_state(self, state: Any) -> None:
+        """
+        Restore state saved by ``snapshot_state``.
+
+        Args:
+            state: The decoded snapshot state.
+        """
+        self.state = state
+
 
 # =============================================================================
 # Built-in Projections
@@ -325,6 +582,47 @@ class SyncSessionStats:
     is_dry_run: bool = True
     is_complete: bool = False
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "session_id": self.session_id,
+            "epic_key": self.epic_key,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "stories_matched": self.stories_matched,
+            "stories_updated": self.stories_updated,
+            "subtasks_created": self.subtasks_created,
+            "comments_added": self.comments_added,
+            "status_transitions": self.status_transitions,
+            "conflicts_detected": self.conflicts_detected,
+            "conflicts_resolved": self.conflicts_resolved,
+            "errors": list(self.errors),
+            "is_dry_run": self.is_dry_run,
+            "is_complete": self.is_complete,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "SyncSessionStats":
+        """Create from dictionary."""
+        started_at = data.get("started_at")
+        completed_at = data.get("completed_at")
+        return cls(
+            session_id=data.get("session_id", ""),
+            epic_key=data.get("epic_key", ""),
+            started_at=datetime.fromisoformat(started_at) if started_at else None,
+            completed_at=datetime.fromisoformat(completed_at) if completed_at else None,
+            stories_matched=data.get("stories_matched", 0),
+            stories_updated=data.get("stories_updated", 0),
+            subtasks_created=data.get("subtasks_created", 0),
+            comments_added=data.get("comments_added", 0),
+            status_transitions=data.get("status_transitions", 0),
+            conflicts_detected=data.get("conflicts_detected", 0),
+            conflicts_resolved=data.get("conflicts_resolved", 0),
+            errors=list(data.get("errors", [])),
+            is_dry_run=data.get("is_dry_run", True),
+            is_complete=data.get("is_complete", False),
+        )
+
 
 class SyncSessionProjection(Projection[SyncSessionStats]):
     """
@@ -337,6 +635,9 @@ class SyncSessionProjection(Projection[SyncSessionStats]):
         print(f"Updated {stats.stories_updated} stories")
     """
 
+    snapshot_every = 500
+    snapshot_version = "2"
+
     def __init__(self) -> None:
         from spectryn.core.domain.events import (
             CommentAdded,
@@ -363,6 +664,14 @@ class SyncSessionProjection(Projection[SyncSessionStats]):
             ConflictResolved: self._handle_conflict_resolved,
         }
 
+    def snapshot_state(self) -> Any:
+        """Get the statistics as a dictionary."""
+        return self.state.to_dict()
+
+    def restore_state(self, state: Any) -> None:
+        """Restore statistics saved by ``snapshot_state``."""
+        self.state = SyncSessionStats.from_dict(state)
+
     def apply(self, event: DomainEvent) -> None:
         """Apply an event to update statistics."""
         handler = self._event_handlers.get(type(event))
@@ -419,6 +728,31 @@ class EpicHistory:
     last_sync_at: datetime | None = None
     sessions: list[SyncSessionStats] = field(default_factory=list)
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "epic_key": self.epic_key,
+            "total_sessions": self.total_sessions,
+            "total_events": self.total_events,
+            "first_sync_at": self.first_sync_at.isoformat() if self.first_sync_at else None,
+            "last_sync_at": self.last_sync_at.isoformat() if self.last_sync_at else None,
+            "sessions": [session.to_dict() for session in self.sessions],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "EpicHistory":
+        """Create from dictionary."""
+        first_sync_at = data.get("first_sync_at")
+        last_sync_at = data.get("last_sync_at")
+        return cls(
+            epic_key=data.get("epic_key", ""),
+            total_sessions=data.get("total_sessions", 0),
+            total_events=data.get("total_events", 0),
+            first_sync_at=datetime.fromisoformat(first_sync_at) if first_sync_at else None,
+            last_sync_at=datetime.fromisoformat(last_sync_at) if last_sync_at else None,
+            sessions=[SyncSessionStats.from_dict(session) for session in data.get("sessions", [])],
+        )
+
 
 class EpicHistoryProjection(Projection[EpicHistory]):
     """
@@ -427,10 +761,27 @@ class EpicHistoryProjection(Projection[EpicHistory]):
     Aggregates data across multiple sync sessions.
     """
 
+    snapshot_version = "2"
+
     def __init__(self, epic_key: str) -> None:
         super().__init__(EpicHistory(epic_key=epic_key))
         self._current_session: SyncSessionStats | None = None
 
+    def snapshot_state(self) -> Any:
+        """Include the session still in progress in snapshots."""
+        current = self._current_session
+        return {
+            "history": self.state.to_dict(),
+            "current_session": current.to_dict() if current else None,
+        }
+
+    def restore_state(self, state: Any) -> None:
+        """Restore the history and the session in progress."""
+        history = EpicHistory.from_dict(state["history"])
+        current = state["current_session"]
+        self._current_session = SyncSessionStats.from_dict(current) if current else None
+        self.state = history
+
     def apply(self, event: DomainEvent) -> None:
         from spectryn.core.domain.events import SyncCompleted, SyncStarted
 
@@ -474,6 +825,7 @@ def create_event_sourced_bus(
     epic_key: str,
     session_id: str,
     user: str | None = None,
+    durability: Durability | str = Durability.EVENT,
 ) -> EventSourcedBus:
     """
     Create an event-sourced bus for a sync session.
@@ -483,6 +835,7 @@ def create_event_sourced_bus(
         epic_key: The epic being synced.
         session_id: The sync session ID.
         user: Optional username for metadata.
+        durability: When events are persisted (see Durability).
 
     Returns:
         Configured EventSourcedBus.
@@ -496,7 +849,7 @@ def create_event_sourced_bus(
     if user:
         metadata["user"] = user
 
-    return EventSourcedBus(event_store, stream_id, metadata)
+    return EventSourcedBus(event_store, stream_id, metadata, durability=durability)
 
 
 def get_epic_history(
@@ -7,6 +7,8 @@ and skip unchanged stories, significantly reducing API calls.
 Components:
 - StoryFingerprint: Hash of story content for change detection
 - ChangeTracker: Persists and compares fingerprints between syncs
+- RemoteSnapshot: Cached epic children plus the high-water mark of the
+  last remote fetch, so later fetches only ask for what changed
 - IncrementalSyncResult: Results with change detection stats
 """
 
@@ -16,11 +18,12 @@ import hashlib
 import json
 import logging
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
 from spectryn.core.domain.entities import UserStory
+from spectryn.core.ports.issue_tracker import IssueData, IssueLink, LinkType
 
 
 logger = logging.getLogger(__name__)
@@ -204,12 +207,157 @@ class ChangeDetectionResult:
         return " ".join(parts)
 
 
+def _issue_to_dict(issue: IssueData) -> dict[str, Any]:
+    """Serialize IssueData for the remote snapshot."""
+    return {
+        "key": issue.key,
+        "summary": issue.summary,
+        "description": issue.description,
+        "status": issue.status,
+        "issue_type": issue.issue_type,
+        "assignee": issue.assignee,
+        "story_points": issue.story_points,
+        "due_date": issue.due_date,
+        "subtasks": [_issue_to_dict(st) for st in issue.subtasks],
+        "comments": issue.comments,
+        "links": [
+            {
+                "link_type": link.link_type.value,
+                "target_key": link.target_key,
+                "source_key": link.source_key,
+            }
+            for link in issue.links
+        ],
+        "labels": issue.labels,
+        "sprint": issue.sprint,
+        "sprint_id": issue.sprint_id,
+        "original_estimate": issue.original_estimate,
+        "remaining_estimate": issue.remaining_estimate,
+        "time_spent": issue.time_spent,
+        "work_logs": issue.work_logs,
+    }
+
+
+def _issue_from_dict(data: dict[str, Any]) -> IssueData:
+    """Rebuild IssueData from its remote snapshot form."""
+    return IssueData(
+        key=data["key"],
+        summary=data.get("summary", ""),
+        description=data.get("description"),
+        status=data.get("status", ""),
+        issue_type=data.get("issue_type", ""),
+        assignee=data.get("assignee"),
+        story_points=data.get("story_points"),
+        due_date=data.get("due_date"),
+        subtasks=[_issue_from_dict(st) for st in data.get("subtasks", [])],
+        comments=data.get("comments", []),
+        links=[
+            IssueLink(
+                link_type=LinkType(link["link_type"]),
+                target_key=link["target_key"],
+                source_key=link.get("source_key"),
+            )
+            for link in data.get("links", [])
+        ],
+        labels=data.get("labels", []),
+        sprint=data.get("sprint"),
+        sprint_id=data.get("sprint_id"),
+        original_estimate=data.get("original_estimate"),
+        remaining_estimate=data.get("remaining_estimate"),
+        time_spent=data.get("time_spent"),
+        work_logs=data.get("work_logs", []),
+    )
+
+
+@dataclass
+class RemoteSnapshot:
+    """
+    Locally cached children of an epic.
+
+    The watermark is the (timezone-aware) time the last remote fetch
+    started, so anything updated by or after that sync is fetched again
+    next time. Children removed from the epic are only noticed by a full
+    fetch, whose time is kept in full_fetched_at.
+
+    Attributes:
+        epic_key: The epic whose children are cached
+        watermark: Start time of the last fetch, full or incremental
+        full_fetched_at: Start time of the last full fetch
+        issues: Epic children in tracker order, keyed by issue key
+    """
+
+    epic_key: str
+    watermark: datetime
+    full_fetched_at: datetime
+    issues: dict[str, IssueData] = field(default_factory=dict)
+
+    @classmethod
+    def from_issues(
+        cls, epic_key: str, issues: list[IssueData], fetched_at: datetime
+    ) -> RemoteSnapshot:
+        """Create a snapshot from a full fetch of the epic's children."""
+        return cls(
+            epic_key=epic_key,
+            watermark=fetched_at,
+            full_fetched_at=fetched_at,
+            issues={issue.key: issue for issue in issues},
+        )
+
+    def merge(self, changed: list[IssueData], fetched_at: datetime) -> RemoteSnapshot:
+        """
+        Create a new snapshot with changed issues replacing cached ones.
+
+        Args:
+            changed: Children updated since this snapshot's watermark
+            fetched_at: Start time of the fetch that returned them
+
+        Returns:
+            The merged snapshot; this one is left untouched
+        """
+        issues = dict(self.issues)
+        for issue in changed:
+            issues[issue.key] = issue
+        return RemoteSnapshot(
+            epic_key=self.epic_key,
+            watermark=fetched_at,
+            full_fetched_at=self.full_fetched_at,
+            issues=issues,
+        )
+
+    def needs_full_fetch(self, now: datetime, max_age: timedelta) -> bool:
+        """Check if the last full fetch is older than max_age."""
+        return now - self.full_fetched_at >= max_age
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "epic_key": self.epic_key,
+            "watermark": self.watermark.isoformat(),
+            "full_fetched_at": self.full_fetched_at.isoformat(),
+            "issues": [_issue_to_dict(issue) for issue in self.issues.values()],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> RemoteSnapshot:
+        """Create from dictionary."""
+        issues = [_issue_from_dict(issue) for issue in data.get("issues", [])]
+        return cls(
+            epic_key=data["epic_key"],
+            watermark=datetime.fromisoformat(data["watermark"]),
+            full_fetched_at=datetime.fromisoformat(data["full_fetched_at"]),
+            issues={issue.key: issue for issue in issues},
+        )
+
+
 class ChangeTracker:
     """
     Tracks story changes between syncs.
 
     Stores fingerprints of synced stories and compares them
-    on subsequent syncs to detect what has changed.
+    on subsequent syncs to detect what has changed. The same state file
+    also keeps a hash of the source file, the story matches and a
+    RemoteSnapshot of the epic, so an unchanged file needn't be parsed
+    and the epic's children needn't all be downloaded again.
 
     Example:
         >>> tracker = ChangeTracker(storage_dir="~/.spectra/sync")
@@ -243,6 +391,9 @@ class ChangeTracker:
         self._current_key: str = ""
         self._previous_fingerprints: dict[str, StoryFingerprint] = {}
         self._current_fingerprints: dict[str, StoryFingerprint] = {}
+        self._previous_source_hash: str | None = None
+        self._previous_matches: dict[str, str] = {}
+        self._remote_snapshot: RemoteSnapshot | None = None
 
         self.logger = logging.getLogger("ChangeTracker")
 
@@ -253,6 +404,14 @@ class ChangeTracker:
         filename = f"{epic_key}_{path_hash}.json"
         return self.storage_dir / filename
 
+    @staticmethod
+    def _hash_source(markdown_path: str) -> str | None:
+        """Hash the source file's bytes, or None if it can't be read."""
+        try:
+            return hashlib.sha256(Path(markdown_path).read_bytes()).hexdigest()
+        except OSError:
+            return None
+
     def load(self, epic_key: str, markdown_path: str) -> bool:
         """
         Load previous sync state.
@@ -266,6 +425,9 @@ class ChangeTracker:
         """
         self._current_key = f"{epic_key}:{markdown_path}"
         self._previous_fingerprints = {}
+        self._previous_source_hash = None
+        self._previous_matches = {}
+        self._remote_snapshot = None
 
         state_path = self._get_state_path(epic_key, markdown_path)
 
@@ -280,15 +442,53 @@ class ChangeTracker:
                 fp = StoryFingerprint.from_dict(fp_data)
                 self._previous_fingerprints[fp.story_id] = fp
 
+            self._previous_source_hash = data.get("source_hash")
+            self._previous_matches = dict(data.get("matches", {}))
+            if data.get("remote"):
+                self._remote_snapshot = RemoteSnapshot.from_dict(data["remote"])
+
             self.logger.info(
                 f"Loaded {len(self._previous_fingerprints)} fingerprints from previous sync"
             )
             return True
 
-        except (json.JSONDecodeError, KeyError) as e:
+        except (json.JSONDecodeError, KeyError, ValueError) as e:
             self.logger.warning(f"Failed to load previous state: {e}")
+            self._previous_fingerprints = {}
+            self._previous_source_hash = None
+            self._previous_matches = {}
+            self._remote_snapshot = None
             return False
 
+    def source_unchanged(self, markdown_path: str) -> bool:
+        """
+        Check if the source file is byte-identical to the last sync.
+
+        When it is, parsing it again would only reproduce the stories of
+        the previous sync, so callers can reuse that sync's results.
+
+        Args:
+            markdown_path: Path to markdown file
+
+        Returns:
+            True if a previous sync recorded the same file hash
+        """
+        if not self._previous_fingerprints or self._previous_source_hash is None:
+            return False
+        return self._hash_source(markdown_path) == self._previous_source_hash
+
+    def reuse_previous_fingerprints(self) -> None:
+        """
+        Carry the previous fingerprints over to the next save.
+
+        Used instead of detect_changes() when the source file is unchanged.
+        """
+        self._current_fingerprints = dict(self._previous_fingerprints)
+
+    def set_remote_snapshot(self, snapshot: RemoteSnapshot) -> None:
+        """Replace the epic snapshot that the next save() persists."""
+        self._remote_snapshot = snapshot
+
     def detect_changes(
         self,
         stories: list[UserStory],
@@ -347,24 +547,36 @@ class ChangeTracker:
 
         return results
 
-    def save(self, epic_key: str, markdown_path: str) -> None:
+    def save(
+        self,
+        epic_key: str,
+        markdown_path: str,
+        matches: dict[str, str] | None = None,
+    ) -> None:
         """
         Save current fingerprints for next sync.
 
-        Call this after a successful sync to update the baseline.
+        Call this after a successful sync to update the baseline. The
+        source file is hashed at save time, so save after anything that
+        rewrites it.
 
         Args:
             epic_key: Epic being synced
             markdown_path: Path to markdown file
+            matches: Story ID to issue key matches of this sync
         """
         state_path = self._get_state_path(epic_key, markdown_path)
 
-        data = {
+        data: dict[str, Any] = {
             "epic_key": epic_key,
             "markdown_path": markdown_path,
             "synced_at": datetime.now().isoformat(),
+            "source_hash": self._hash_source(markdown_path),
+            "matches": matches if matches is not None else self._previous_matches,
             "fingerprints": [fp.to_dict() for fp in self._current_fingerprints.values()],
         }
+        if self._remote_snapshot is not None:
+            data["remote"] = self._remote_snapshot.to_dict()
 
         state_path.write_text(json.dumps(data, indent=2))
         self.logger.info(f"Saved {len(self._current_fingerprints)} fingerprints")
@@ -415,6 +627,16 @@ class ChangeTracker:
         """Get number of stories in previous sync."""
         return len(self._previous_fingerprints)
 
+    @property
+    def previous_matches(self) -> dict[str, str]:
+        """Get the story ID to issue key matches of the previous sync."""
+        return dict(self._previous_matches)
+
+    @property
+    def remote_snapshot(self) -> RemoteSnapshot | None:
+        """Get the cached epic children, if any were saved or set."""
+        return self._remote_snapshot
+
 
 @dataclass
 class IncrementalSyncStats:
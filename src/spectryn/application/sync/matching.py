@@ -0,0 +1,148 @@
+"""
+Title Matching - Indexed story-to-issue matching.
+
+Matching markdown stories to tracker issues by title used to compare every
+story against every issue, re-normalizing both titles for each pair. The
+index here normalizes each title once and answers "first title that equals,
+contains, or is contained in this one" without scanning every pair, while
+keeping the same first-match semantics as ``UserStory.matches_title``.
+
+Components:
+- normalize_issue_title: Normalization applied to external issue titles
+- TitleIndex: Exact-match hash index plus substring index over titles
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_right
+from collections.abc import Sequence
+
+
+_PUNCTUATION_PATTERN = re.compile(r"[^\w\s]")
+
+# Joins indexed titles into a single haystack for containment search.
+_SEPARATOR = "\x00"
+
+
+def normalize_issue_title(title: str) -> str:
+    """
+    Normalize an external issue title for matching.
+
+    Mirrors the normalization ``UserStory.matches_title`` applies to the
+    external side: lowercase, punctuation to spaces, collapsed whitespace.
+
+    Args:
+        title: Raw issue title.
+
+    Returns:
+        Normalized title.
+    """
+    return " ".join(_PUNCTUATION_PATTERN.sub(" ", title.lower()).split())
+
+
+class TitleIndex:
+    """
+    Index over normalized titles for fast fuzzy lookups.
+
+    A title at position ``i`` matches a query when they are equal, the query
+    is a substring of the title, or the title is a substring of the query.
+    ``first_match`` returns the lowest such position, which is exactly what a
+    linear "first match wins" scan over the original list would return.
+
+    Three structures back the lookup:
+    - an exact-match hash index (title -> first position),
+    - a joined haystack of all titles, searched with ``str.find`` for
+      titles containing the query,
+    - per-length substring buckets, probed with the query's substrings for
+      titles contained in the query.
+    """
+
+    def __init__(self, titles: Sequence[str]) -> None:
+        """
+        Build the index.
+
+        Args:
+            titles: Already-normalized titles, in priority order.
+        """
+        self._titles = list(titles)
+        self._exact: dict[str, int] = {}
+        self._by_length: dict[int, dict[str, int]] = {}
+
+        for position, title in enumerate(self._titles):
+            self._exact.setdefault(title, position)
+            self._by_length.setdefault(len(title), {}).setdefault(title, position)
+
+        self._lengths = sorted(self._by_length)
+
+        # The haystack is only usable when no title contains the separator,
+        # otherwise a match could straddle two titles.
+        self._haystack: str | None = None
+        self._starts: list[int] = []
+        if not any(_SEPARATOR in title for title in self._titles):
+            offset = 0
+            for title in self._titles:
+                self._starts.append(offset)
+                offset += len(title) + 1
+            self._haystack = _SEPARATOR.join(self._titles)
+
+    def __len__(self) -> int:
+        """Number of indexed titles."""
+        return len(self._titles)
+
+    def first_match(self, query: str) -> int | None:
+        """
+        Find the first title position that matches the query.
+
+        Args:
+            query: Normalized title to look up.
+
+        Returns:
+            Lowest matching position, or None if nothing matches.
+        """
+        if not self._titles:
+            return None
+
+        best = self._exact.get(query, len(self._titles))
+        if best == 0:
+            return 0
+
+        best = min(best, self._first_containing(query, best))
+        best = min(best, self._first_contained(query, best))
+
+        return best if best < len(self._titles) else None
+
+    def _first_containing(self, query: str, limit: int) -> int:
+        """Lowest position below ``limit`` whose title contains the query."""
+        if self._haystack is None:
+            for position in range(limit):
+                if query in self._titles[position]:
+                    return position
+            return limit
+
+        end = self._starts[limit] if limit < len(self._starts) else len(self._haystack)
+        found = self._haystack.find(query, 0, end)
+        if found < 0:
+            return limit
+        return bisect_right(self._starts, found) - 1
+
+    def _first_contained(self, query: str, limit: int) -> int:
+        """Lowest position below ``limit`` whose title is a substring of the query."""
+        best = limit
+        query_length = len(query)
+
+        for length in self._lengths:
+            if length > query_length:
+                break
+            bucket = self._by_length[length]
+            if length == 0:
+                best = min(best, bucket[""])
+                continue
+            for start in range(query_length - length + 1):
+                position = bucket.get(query[start : start + length])
+                if position is not None and position < best:
+                    best = position
+                    if best == 0:
+                        return 0
+
+        return best
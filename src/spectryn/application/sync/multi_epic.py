@@ -225,6 +225,7 @@ class MultiEpicSyncOrchestrator:
         epic_filter: list[str] | None = None,
         progress_callback: Callable[[str, str, int, int], None] | None = None,
         stop_on_error: bool = False,
+        epics: list[Epic] | None = None,
     ) -> MultiEpicSyncResult:
         """
         Sync multiple epics from a markdown file.
@@ -234,6 +235,7 @@ class MultiEpicSyncOrchestrator:
             epic_filter: Optional list of epic keys to include
             progress_callback: Callback for progress (epic_key, phase, current, total)
             stop_on_error: Whether to stop on first error
+            epics: Epics already parsed from markdown_path (skips parsing)
 
         Returns:
             MultiEpicSyncResult with sync details
@@ -242,8 +244,9 @@ class MultiEpicSyncOrchestrator:
         result = MultiEpicSyncResult(dry_run=self.config.dry_run)
 
         # Parse epics from file
-        self.logger.info(f"Parsing epics from {markdown_path}")
-        epics = self.parser.parse_epics(markdown_path)
+        if epics is None:
+            self.logger.info(f"Parsing epics from {markdown_path}")
+            epics = self.parser.parse_epics(markdown_path)
 
         if not epics:
             result.add_epic_result(
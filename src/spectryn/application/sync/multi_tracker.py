@@ -16,7 +16,9 @@ Components:
 from __future__ import annotations
 
 import logging
+import time
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -62,7 +64,7 @@ class SyncStrategy(Enum):
 
     PARALLEL = "parallel"  # Sync to all trackers in parallel
     SEQUENTIAL = "sequential"  # Sync to trackers one at a time
-    PRIMARY_FIRST = "primary_first"  # Sync to primary, then mirror to others
+    PRIMARY_FIRST = "primary_first"  # Sync to primary, then the others in parallel
 
 
 @dataclass
@@ -77,6 +79,7 @@ class TrackerTarget:
         is_primary: If True, this is the primary tracker (used for ID generation)
         enabled: If False, skip this tracker
         formatter: Optional custom formatter for this tracker
+        max_concurrency: Maximum stories synced concurrently to this tracker
     """
 
     tracker: IssueTrackerPort
@@ -85,6 +88,7 @@ class TrackerTarget:
     is_primary: bool = False
     enabled: bool = True
     formatter: DocumentFormatterPort | None = None
+    max_concurrency: int = 1
 
     def __post_init__(self) -> None:
         if not self.name:
@@ -104,6 +108,7 @@ class TrackerSyncStatus:
     success: bool = True
     started_at: str = field(default_factory=lambda: datetime.now().isoformat())
     completed_at: str = ""
+    duration_seconds: float = 0.0
 
     # Counts
     stories_synced: int = 0
@@ -128,6 +133,18 @@ class TrackerSyncStatus:
         """Add a warning."""
         self.warnings.append(warning)
 
+    def merge(self, other: TrackerSyncStatus) -> None:
+        """Merge counts, errors and key mappings of a partial status."""
+        self.stories_synced += other.stories_synced
+        self.stories_created += other.stories_created
+        self.stories_updated += other.stories_updated
+        self.stories_skipped += other.stories_skipped
+        self.subtasks_synced += other.subtasks_synced
+        for error in other.errors:
+            self.add_error(error)
+        self.warnings.extend(other.warnings)
+        self.key_mappings.update(other.key_mappings)
+
     def complete(self) -> None:
         """Mark sync as complete."""
         self.completed_at = datetime.now().isoformat()
@@ -138,7 +155,8 @@ class TrackerSyncStatus:
         status = "✓" if self.success else "✗"
         return (
             f"{status} {self.tracker_name} ({self.epic_key}): "
-            f"{self.stories_synced} synced, {self.stories_skipped} skipped"
+            f"{self.stories_synced} synced, {self.stories_skipped} skipped "
+            f"in {self.duration_seconds:.2f}s"
         )
 
 
@@ -229,6 +247,7 @@ class MultiTrackerSyncResult:
                     "epic_key": s.epic_key,
                     "success": s.success,
                     "stories_synced": s.stories_synced,
+                    "duration_seconds": s.duration_seconds,
                     "errors": s.errors,
                 }
                 for s in self.tracker_statuses
@@ -245,6 +264,7 @@ class MultiTrackerSyncOrchestrator:
 
     Features:
     - Sync to multiple trackers in parallel or sequentially
+    - Per-target story concurrency (TrackerTarget.max_concurrency)
     - Primary tracker for ID generation
     - Cross-tracker key mappings
     - Independent error handling per tracker
@@ -280,6 +300,8 @@ class MultiTrackerSyncOrchestrator:
         formatter: DocumentFormatterPort | None = None,
         event_bus: EventBus | None = None,
         strategy: SyncStrategy = SyncStrategy.SEQUENTIAL,
+        *,
+        max_workers: int | None = None,
     ):
         """
         Initialize the multi-tracker sync orchestrator.
@@ -290,12 +312,15 @@ class MultiTrackerSyncOrchestrator:
             formatter: Default document formatter.
             event_bus: Optional event bus.
             strategy: Sync strategy (parallel, sequential, primary_first).
+            max_workers: Maximum trackers synced at once by the parallel
+                strategies (default: one worker per tracker).
         """
         self.parser = parser
         self.config = config
         self.formatter = formatter
         self.event_bus = event_bus or EventBus()
         self.strategy = strategy
+        self.max_workers = max_workers
         self.logger = logging.getLogger("MultiTrackerSyncOrchestrator")
 
         self._targets: list[TrackerTarget] = []
@@ -348,12 +373,16 @@ class MultiTrackerSyncOrchestrator:
         """
         Sync markdown to all configured trackers.
 
+        With the parallel strategies the progress callback is invoked from
+        worker threads, one per tracker.
+
         Args:
             markdown_path: Path to markdown file.
             progress_callback: Optional callback(tracker_name, phase, current, total).
 
         Returns:
-            MultiTrackerSyncResult with results from all trackers.
+            MultiTrackerSyncResult with results from all trackers, in target
+            order (primary first for PRIMARY_FIRST).
         """
         result = MultiTrackerSyncResult(dry_run=self.config.dry_run)
 
@@ -387,18 +416,19 @@ class MultiTrackerSyncOrchestrator:
         enabled_targets = [t for t in self._targets if t.enabled]
 
         if self.strategy == SyncStrategy.PRIMARY_FIRST:
-            # Sync primary first, then others
+            # Sync primary first, then the others concurrently
             primary = self.primary_target
             if primary and primary.enabled:
                 status = self._sync_to_tracker(primary, progress_callback)
                 result.add_tracker_status(status)
 
-            for target in enabled_targets:
-                if target != primary:
-                    status = self._sync_to_tracker(target, progress_callback)
-                    result.add_tracker_status(status)
+            others = [target for target in enabled_targets if target is not primary]
+            for status in self._sync_to_trackers_parallel(others, progress_callback):
+                result.add_tracker_status(status)
+        elif self.strategy == SyncStrategy.PARALLEL:
+            for status in self._sync_to_trackers_parallel(enabled_targets, progress_callback):
+                result.add_tracker_status(status)
         else:
-            # Sequential or parallel (sequential for now)
             for target in enabled_targets:
                 status = self._sync_to_tracker(target, progress_callback)
                 result.add_tracker_status(status)
@@ -406,6 +436,48 @@ class MultiTrackerSyncOrchestrator:
         result.complete()
         return result
 
+    def _sync_to_trackers_parallel(
+        self,
+        targets: list[TrackerTarget],
+        progress_callback: Callable[[str, str, int, int], None] | None = None,
+    ) -> list[TrackerSyncStatus]:
+        """
+        Sync to several trackers concurrently, one worker per tracker.
+
+        A failure in one tracker never affects the others; anything that
+        escapes _sync_to_tracker is recorded on that tracker's status.
+
+        Args:
+            targets: Tracker targets to sync.
+            progress_callback: Optional progress callback.
+
+        Returns:
+            TrackerSyncStatus per target, in target order.
+        """
+        workers = min(self.max_workers or len(targets), len(targets))
+        if workers <= 1:
+            return [self._sync_to_tracker(target, progress_callback) for target in targets]
+
+        self.logger.info(f"Syncing {len(targets)} trackers with {workers} workers")
+        statuses: list[TrackerSyncStatus] = []
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="spectryn-tracker"
+        ) as executor:
+            futures = [
+                executor.submit(self._sync_to_tracker, target, progress_callback)
+                for target in targets
+            ]
+            for target, future in zip(targets, futures, strict=True):
+                try:
+                    statuses.append(future.result())
+                except Exception as e:
+                    status = TrackerSyncStatus(tracker_name=target.name, epic_key=target.epic_key)
+                    status.add_error(f"Unexpected error: {e}")
+                    status.complete()
+                    statuses.append(status)
+                    self.logger.exception(f"Unexpected error syncing to {target.name}")
+        return statuses
+
     def _sync_to_tracker(
         self,
         target: TrackerTarget,
@@ -425,46 +497,95 @@ class MultiTrackerSyncOrchestrator:
             tracker_name=target.name,
             epic_key=target.epic_key,
         )
+        started = time.perf_counter()
 
         self.logger.info(f"Syncing to {target.name} (epic: {target.epic_key})")
 
         try:
-            # Test connection
-            if not target.tracker.test_connection():
-                status.add_error(f"Failed to connect to {target.name}")
-                status.complete()
-                return status
+            self._sync_stories_to_tracker(target, status, progress_callback)
+        except Exception as e:
+            status.add_error(str(e))
+            self.logger.error(f"Sync to {target.name} failed: {e}")
+
+        status.duration_seconds = time.perf_counter() - started
+        status.complete()
+        return status
+
+    def _sync_stories_to_tracker(
+        self,
+        target: TrackerTarget,
+        status: TrackerSyncStatus,
+        progress_callback: Callable[[str, str, int, int], None] | None = None,
+    ) -> None:
+        """
+        Sync all parsed stories to a single tracker.
+
+        Up to ``target.max_concurrency`` stories are synced at once; each
+        records into its own partial status, merged in story order.
+
+        Args:
+            target: Tracker target configuration.
+            status: Status to update.
+            progress_callback: Optional progress callback.
+        """
+        # Test connection
+        if not target.tracker.test_connection():
+            status.add_error(f"Failed to connect to {target.name}")
+            return
 
-            # Report progress
-            if progress_callback:
-                progress_callback(target.name, "Connecting", 0, len(self._stories))
+        total = len(self._stories)
 
-            # Fetch existing issues
+        def report(phase: str, current: int) -> None:
+            # Progress is only reported from this (coordinating) thread, and a
+            # failing callback must not abort a sync that is already under way.
+            if not progress_callback:
+                return
             try:
-                existing_issues = target.tracker.get_epic_children(target.epic_key)
-                existing_by_summary = {issue.summary.lower(): issue for issue in existing_issues}
+                progress_callback(target.name, phase, current, total)
             except Exception as e:
-                self.logger.warning(f"Failed to fetch existing issues: {e}")
-                existing_by_summary = {}
-
-            # Sync each story
-            for i, story in enumerate(self._stories):
-                if progress_callback:
-                    progress_callback(target.name, f"Syncing {story.id}", i + 1, len(self._stories))
+                self.logger.warning(f"Progress callback failed for {target.name}: {e}")
 
-                try:
-                    result = self._sync_story_to_tracker(story, target, existing_by_summary, status)
-                    if result:
-                        status.stories_synced += 1
-                except Exception as e:
-                    status.add_warning(f"Failed to sync {story.id}: {e}")
+        report("Connecting", 0)
 
+        # Fetch existing issues
+        try:
+            existing_issues = target.tracker.get_epic_children(target.epic_key)
+            existing_by_summary = {issue.summary.lower(): issue for issue in existing_issues}
         except Exception as e:
-            status.add_error(str(e))
-            self.logger.error(f"Sync to {target.name} failed: {e}")
+            self.logger.warning(f"Failed to fetch existing issues: {e}")
+            existing_by_summary = {}
 
-        status.complete()
-        return status
+        def sync_story(story: UserStory, story_status: TrackerSyncStatus) -> None:
+            try:
+                if self._sync_story_to_tracker(story, target, existing_by_summary, story_status):
+                    story_status.stories_synced += 1
+            except Exception as e:
+                story_status.add_warning(f"Failed to sync {story.id}: {e}")
+
+        workers = min(target.max_concurrency, total)
+        if workers <= 1:
+            for i, story in enumerate(self._stories):
+                report(f"Syncing {story.id}", i + 1)
+                sync_story(story, status)
+            return
+
+        partials = [
+            TrackerSyncStatus(tracker_name=target.name, epic_key=target.epic_key)
+            for _ in self._stories
+        ]
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix=f"spectryn-{target.name}"
+        ) as executor:
+            futures = [
+                executor.submit(sync_story, story, partial)
+                for story, partial in zip(self._stories, partials, strict=True)
+            ]
+            for i, (story, future) in enumerate(zip(self._stories, futures, strict=True)):
+                report(f"Syncing {story.id}", i + 1)
+                future.result()
+
+        for partial in partials:
+            status.merge(partial)
 
     def _sync_story_to_tracker(
         self,
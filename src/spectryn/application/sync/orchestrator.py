@@ -7,8 +7,11 @@ This is the main entry point for sync operations.
 from __future__ import annotations
 
 import logging
+import threading
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -157,6 +160,27 @@ class SyncResult:
         """
         self.warnings.append(warning)
 
+    def merge(self, other: SyncResult) -> None:
+        """
+        Merge operation counts and messages from another result.
+
+        Used to fold per-story partial results back into the main result
+        when phases run concurrently.
+
+        Args:
+            other: Partial result to merge into this one.
+        """
+        self.stories_updated += other.stories_updated
+        self.subtasks_created += other.subtasks_created
+        self.subtasks_updated += other.subtasks_updated
+        self.comments_added += other.comments_added
+        self.statuses_updated += other.statuses_updated
+        self.failed_operations.extend(other.failed_operations)
+        self.errors.extend(other.errors)
+        self.warnings.extend(other.warnings)
+        if not other.success:
+            self.success = False
+
     @property
     def partial_success(self) -> bool:
         """
@@ -299,6 +323,8 @@ class SyncOrchestrator:
         self._md_stories: list[UserStory] = []
         self._jira_issues: list[IssueData] = []
         self._matches: dict[str, str] = {}  # story_id -> issue_key
+        # issue_key -> {subtask_summary_lower: subtask}, from the analyze phase
+        self._prefetched_subtasks: dict[str, dict[str, IssueData]] = {}
         self._state: SyncState | None = None
         self._last_backup: Backup | None = None
 
@@ -308,13 +334,16 @@ class SyncOrchestrator:
         # Incremental sync support
         self._change_tracker: ChangeTracker | None = None
         self._changed_story_ids: set[str] = set()
+        # Set when the source file matches the last incremental sync and wasn't parsed
+        self._source_unchanged = False
 
         # Delta sync support (field-level)
         self._delta_tracker: DeltaTracker | None = None
         self._delta_result: DeltaSyncResult | None = None
 
-        # Progress reporting
+        # Progress reporting (lock guards updates from concurrent phase workers)
         self._progress: ProgressReporter | None = None
+        self._progress_lock = threading.Lock()
         if self.config.incremental:
             from .incremental import ChangeTracker
 
@@ -443,8 +472,9 @@ class SyncOrchestrator:
         self.logger.info(f"Parsed {len(self._md_stories)} stories from markdown")
 
         # Fetch Jira issues
-        self._jira_issues = self.tracker.get_epic_children(epic_key)
+        self._jira_issues = self._fetch_epic_children(epic_key)
         self.logger.info(f"Found {len(self._jira_issues)} issues in Jira epic")
+        self._prefetched_subtasks = self._index_prefetched_subtasks(self._jira_issues)
 
         # Match stories
         self._match_stories(result)
@@ -500,20 +530,33 @@ class SyncOrchestrator:
         if self._progress:
             self._progress.start_phase(SyncPhase.ANALYZING)
         self._report_progress(progress_callback, "Analyzing", 1, total_phases)
-        self.analyze(markdown_path, epic_key)
+        change_tracker = self._active_change_tracker
+        if change_tracker:
+            change_tracker.load(epic_key, markdown_path)
+        self._source_unchanged = bool(
+            change_tracker and change_tracker.source_unchanged(markdown_path)
+        )
+        if change_tracker and self._source_unchanged:
+            self._analyze_unchanged_source(epic_key, change_tracker)
+        else:
+            self.analyze(markdown_path, epic_key)
         result.stories_matched = len(self._matches)
         result.matched_stories = list(self._matches.items())
 
         # Phase 1b: Detect changes (incremental sync)
-        if self.config.incremental and self._change_tracker and not self.config.force_full_sync:
-            self._change_tracker.load(epic_key, markdown_path)
-            changes = self._change_tracker.detect_changes(self._md_stories)
-            self._changed_story_ids = {
-                story_id for story_id, change in changes.items() if change.has_changes
-            }
+        if change_tracker:
+            if self._source_unchanged:
+                change_tracker.reuse_previous_fingerprints()
+                self._changed_story_ids = set()
+                result.stories_skipped = change_tracker.previous_story_count
+            else:
+                changes = change_tracker.detect_changes(self._md_stories)
+                self._changed_story_ids = {
+                    story_id for story_id, change in changes.items() if change.has_changes
+                }
+                result.stories_skipped = len(self._md_stories) - len(self._changed_story_ids)
             result.incremental = True
             result.changed_story_ids = self._changed_story_ids
-            result.stories_skipped = len(self._md_stories) - len(self._changed_story_ids)
 
             if result.stories_skipped > 0:
                 self.logger.info(
@@ -525,7 +568,12 @@ class SyncOrchestrator:
             self._changed_story_ids = {str(s.id) for s in self._md_stories}
 
         # Phase 1c: Delta sync analysis (field-level)
-        if self.config.delta_sync and self._delta_tracker and not self.config.force_full_sync:
+        if (
+            self.config.delta_sync
+            and self._delta_tracker
+            and not self.config.force_full_sync
+            and not self._source_unchanged
+        ):
             self._delta_tracker.load_baseline(epic_key)
             self._delta_result = self._delta_tracker.analyze(
                 local_stories=self._md_stories,
@@ -577,21 +625,13 @@ class SyncOrchestrator:
             self._report_progress(progress_callback, "Syncing statuses", 5, total_phases)
             self._sync_statuses(result)
 
-        # Save incremental sync state (on successful non-dry-run)
-        if (
-            self.config.incremental
-            and self._change_tracker
-            and not self.config.dry_run
-            and result.success
-        ):
-            self._change_tracker.save(epic_key, markdown_path)
-
         # Save delta sync baseline (on successful non-dry-run)
         if (
             self.config.delta_sync
             and self._delta_tracker
             and not self.config.dry_run
             and result.success
+            and not self._source_unchanged
         ):
             self._delta_tracker.save_baseline(epic_key, self._md_stories, self._matches)
 
@@ -602,7 +642,14 @@ class SyncOrchestrator:
             self._report_progress(
                 progress_callback, "Updating source file", total_phases - 1, total_phases
             )
-            self._update_source_file_with_tracker_info(markdown_path, result, epic_key=epic_key)
+            # An unchanged source already carries the tracker info of the last sync
+            if not self._source_unchanged:
+                self._update_source_file_with_tracker_info(markdown_path, result, epic_key=epic_key)
+
+        # Save incremental sync state (on successful non-dry-run), after the
+        # source update so the saved file hash covers its edits
+        if change_tracker and not self.config.dry_run and result.success:
+            change_tracker.save(epic_key, markdown_path, matches=self._matches)
 
         # Final phase: Complete (100%)
         if self._progress:
@@ -742,6 +789,131 @@ class SyncOrchestrator:
         self._sync_statuses(result, target_status)
         return result
 
+    @property
+    def _active_change_tracker(self) -> ChangeTracker | None:
+        """The change tracker, unless incremental sync is off or overridden."""
+        if not self.config.incremental or self.config.force_full_sync:
+            return None
+        return self._change_tracker
+
+    def _analyze_unchanged_source(self, epic_key: str, change_tracker: ChangeTracker) -> None:
+        """
+        Analyze phase for a source file unchanged since the last sync.
+
+        The file isn't parsed: none of its stories can have changed, so
+        the phases have nothing to push and the previous matches are
+        reported. The epic is still fetched to keep the remote snapshot
+        current, which for a quiet epic is a single query.
+
+        Args:
+            epic_key: Jira epic key
+            change_tracker: Change tracker loaded for this sync
+        """
+        self.logger.info("Source file unchanged since last sync, skipping parse")
+        self._md_stories = []
+        self._jira_issues = self._fetch_epic_children(epic_key)
+        self._prefetched_subtasks = {}
+        self._matches = change_tracker.previous_matches
+
+    def _fetch_epic_children(self, epic_key: str) -> list[IssueData]:
+        """
+        Fetch all children of an epic, consuming the tracker's page stream.
+
+        Trackers implementing IssueTrackerPort stream pages through
+        iter_epic_children (paginated adapters prefetch the next page while
+        the current one is parsed); other tracker objects fall back to a
+        single get_epic_children call. With incremental sync, children are
+        read through the remote snapshot instead.
+
+        Args:
+            epic_key: Epic key to fetch children for.
+
+        Returns:
+            All child issues in tracker order.
+        """
+        if not isinstance(self.tracker, IssueTrackerPort):
+            return self.tracker.get_epic_children(epic_key)
+
+        change_tracker = self._active_change_tracker
+        if change_tracker:
+            return self._fetch_epic_children_since_watermark(epic_key, change_tracker)
+        return self._fetch_all_epic_children(epic_key)
+
+    def _fetch_epic_children_since_watermark(
+        self, epic_key: str, change_tracker: ChangeTracker
+    ) -> list[IssueData]:
+        """
+        Fetch an epic's children through the incremental sync snapshot.
+
+        Only children updated since the snapshot's watermark are downloaded
+        and merged over the cached ones. A full fetch replaces the snapshot
+        when there is none for this epic, when the last full fetch is older
+        than ``incremental_full_fetch_hours`` (removed children are only seen
+        then), or when the tracker can't filter by update time.
+
+        Args:
+            epic_key: Epic key to fetch children for.
+            change_tracker: Change tracker holding the snapshot.
+
+        Returns:
+            All child issues, cached ones first in their previous order.
+        """
+        from .incremental import RemoteSnapshot
+
+        fetched_at = datetime.now(timezone.utc)
+        snapshot = change_tracker.remote_snapshot
+        max_age = timedelta(hours=self.config.incremental_full_fetch_hours)
+        if (
+            snapshot is not None
+            and snapshot.epic_key == epic_key
+            and not snapshot.needs_full_fetch(fetched_at, max_age)
+        ):
+            changed = self.tracker.get_epic_children_updated_since(
+                epic_key, snapshot.watermark, list(snapshot.issues)
+            )
+            if changed is not None:
+                self.logger.info(
+                    f"Fetched {len(changed)} issues updated since {snapshot.watermark.isoformat()}"
+                )
+                snapshot = snapshot.merge(changed, fetched_at)
+                change_tracker.set_remote_snapshot(snapshot)
+                return list(snapshot.issues.values())
+
+        issues = self._fetch_all_epic_children(epic_key)
+        change_tracker.set_remote_snapshot(RemoteSnapshot.from_issues(epic_key, issues, fetched_at))
+        return issues
+
+    def _fetch_all_epic_children(self, epic_key: str) -> list[IssueData]:
+        """Fetch every child of an epic from the tracker's page stream."""
+        issues: list[IssueData] = []
+        for page in self.tracker.iter_epic_children(epic_key):
+            issues.extend(page)
+            self.logger.debug(f"Fetched page of {len(page)} issues ({len(issues)} total)")
+        return issues
+
+    def _index_prefetched_subtasks(
+        self, issues: list[IssueData]
+    ) -> dict[str, dict[str, IssueData]]:
+        """
+        Index the subtasks already returned with the epic's children.
+
+        Only trackers that report ``epic_children_include_subtasks`` are
+        indexed; for the others an empty child list can't be told apart from
+        subtasks that were never fetched, so those stories keep reading their
+        issue individually.
+
+        Args:
+            issues: Epic children fetched during analysis.
+
+        Returns:
+            Mapping of issue key to {lowercased subtask summary: subtask}.
+        """
+        if not isinstance(self.tracker, IssueTrackerPort):
+            return {}
+        if not self.tracker.epic_children_include_subtasks:
+            return {}
+        return {issue.key: {st.summary.lower(): st for st in issue.subtasks} for issue in issues}
+
     # -------------------------------------------------------------------------
     # Matching Logic
     # -------------------------------------------------------------------------
@@ -756,16 +928,20 @@ class SyncOrchestrator:
         Args:
             result: SyncResult to update with matching results.
         """
+        from .matching import TitleIndex, normalize_issue_title
+
         self._matches = {}
 
+        # Normalize each issue title once; lookups keep first-match semantics
+        title_index = TitleIndex([normalize_issue_title(i.summary) for i in self._jira_issues])
+
         for md_story in self._md_stories:
             matched_issue = None
 
             # Try to match by title
-            for jira_issue in self._jira_issues:
-                if md_story.matches_title(jira_issue.summary):
-                    matched_issue = jira_issue
-                    break
+            position = title_index.first_match(md_story.normalize_title())
+            if position is not None:
+                matched_issue = self._jira_issues[position]
 
             if matched_issue:
                 self._matches[str(md_story.id)] = matched_issue.key
@@ -781,6 +957,63 @@ class SyncOrchestrator:
     # Sync Phases
     # -------------------------------------------------------------------------
 
+    def _run_story_tasks(
+        self,
+        stories: list[UserStory],
+        task: Callable[[UserStory, SyncResult], None],
+        result: SyncResult,
+    ) -> None:
+        """
+        Run a per-story task for each story, optionally concurrently.
+
+        With ``config.concurrency`` <= 1 tasks run serially against the main
+        result. Otherwise they fan out over a bounded thread pool; each story
+        gets its own partial result, and partials are merged back in story
+        order so counters and failure lists match a serial run. All commands
+        for one story run on the same worker, preserving per-issue ordering.
+        Requests still go through the shared tracker, so its rate limiter
+        throttles the pool as a whole.
+
+        Args:
+            stories: Stories to process.
+            task: Callable that processes one story into a result.
+            result: SyncResult to update with operation counts and errors.
+        """
+        workers = min(self.config.concurrency, len(stories))
+        if workers <= 1:
+            for md_story in stories:
+                task(md_story, result)
+            return
+
+        partials = [SyncResult(dry_run=result.dry_run) for _ in stories]
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="spectryn-sync"
+        ) as executor:
+            futures = [
+                executor.submit(task, md_story, partial)
+                for md_story, partial in zip(stories, partials, strict=True)
+            ]
+            for md_story, partial, future in zip(stories, partials, futures, strict=True):
+                try:
+                    future.result()
+                except Exception as e:
+                    partial.add_failed_operation(
+                        operation="sync_story",
+                        issue_key=self._matches.get(str(md_story.id), ""),
+                        error=f"Unexpected error: {e}",
+                        story_id=str(md_story.id),
+                    )
+                    self.logger.exception(f"Unexpected error syncing story {md_story.id}")
+
+        for partial in partials:
+            result.merge(partial)
+
+    def _update_progress_item(self, item_name: str) -> None:
+        """Advance item-level progress (safe to call from worker threads)."""
+        if self._progress:
+            with self._progress_lock:
+                self._progress.update_item(item_name)
+
     def _sync_descriptions(self, result: SyncResult) -> None:
         """
         Sync story descriptions from markdown to issue tracker.
@@ -791,43 +1024,41 @@ class SyncOrchestrator:
         Args:
             result: SyncResult to update with operation counts and errors.
         """
-        for md_story in self._md_stories:
-            story_id = str(md_story.id)
-            if story_id not in self._matches:
-                continue
-
-            # Skip unchanged stories in incremental mode
-            if self.config.incremental and story_id not in self._changed_story_ids:
-                continue
+        stories = [
+            md_story
+            for md_story in self._md_stories
+            if self._should_sync_story(str(md_story.id)) and md_story.description
+        ]
+        self._run_story_tasks(stories, self._sync_story_description, result)
 
-            issue_key = self._matches[story_id]
+    def _sync_story_description(self, md_story: UserStory, result: SyncResult) -> None:
+        """Update the description of a single matched story."""
+        story_id = str(md_story.id)
+        issue_key = self._matches[story_id]
 
-            # Only update if story has description
-            if md_story.description:
-                # Report progress
-                if self._progress:
-                    self._progress.update_item(f"{issue_key}: {md_story.title[:30]}")
+        # Report progress
+        self._update_progress_item(f"{issue_key}: {md_story.title[:30]}")
 
-                adf = self.formatter.format_story_description(md_story)
+        adf = self.formatter.format_story_description(md_story)
 
-                cmd = UpdateDescriptionCommand(
-                    tracker=self.tracker,
-                    issue_key=issue_key,
-                    description=adf,
-                    event_bus=self.event_bus,
-                    dry_run=self.config.dry_run,
-                )
+        cmd = UpdateDescriptionCommand(
+            tracker=self.tracker,
+            issue_key=issue_key,
+            description=adf,
+            event_bus=self.event_bus,
+            dry_run=self.config.dry_run,
+        )
 
-                cmd_result = cmd.execute()
-                if cmd_result.success:
-                    result.stories_updated += 1
-                elif cmd_result.error:
-                    result.add_failed_operation(
-                        operation="update_description",
-                        issue_key=issue_key,
-                        error=cmd_result.error,
-                        story_id=story_id,
-                    )
+        cmd_result = cmd.execute()
+        if cmd_result.success:
+            result.stories_updated += 1
+        elif cmd_result.error:
+            result.add_failed_operation(
+                operation="update_description",
+                issue_key=issue_key,
+                error=cmd_result.error,
+                story_id=story_id,
+            )
 
     def _sync_subtasks(self, result: SyncResult) -> None:
         """
@@ -840,42 +1071,52 @@ class SyncOrchestrator:
         Args:
             result: SyncResult to update with operation counts and errors.
         """
-        for md_story in self._md_stories:
-            story_id = str(md_story.id)
-
-            # Skip unmatched or unchanged stories
-            if not self._should_sync_story_subtasks(story_id):
-                continue
-
-            issue_key = self._matches[story_id]
-            existing_subtasks = self._fetch_existing_subtasks(issue_key, story_id, result)
-
-            if existing_subtasks is None:
-                continue  # Failed to fetch, already logged
-
-            # Sync each subtask
-            project_key = issue_key.split("-")[0]
-            for md_subtask in md_story.subtasks:
-                # Report progress
-                if self._progress:
-                    self._progress.update_item(f"{issue_key}: {md_subtask.name[:25]}")
+        stories = [
+            md_story
+            for md_story in self._md_stories
+            if self._should_sync_story_subtasks(str(md_story.id))
+        ]
+        self._run_story_tasks(stories, self._sync_story_subtasks, result)
+
+    def _sync_story_subtasks(self, md_story: UserStory, result: SyncResult) -> None:
+        """Sync all subtasks of a single matched story, in markdown order."""
+        story_id = str(md_story.id)
+        issue_key = self._matches[story_id]
+        existing_subtasks = self._fetch_existing_subtasks(issue_key, story_id, result)
+
+        if existing_subtasks is None:
+            return  # Failed to fetch, already logged
+
+        # Sync each subtask
+        project_key = issue_key.split("-")[0]
+        for md_subtask in md_story.subtasks:
+            # Report progress
+            self._update_progress_item(f"{issue_key}: {md_subtask.name[:25]}")
 
-                self._sync_single_subtask(
-                    md_subtask, existing_subtasks, issue_key, project_key, story_id, result
-                )
+            self._sync_single_subtask(
+                md_subtask, existing_subtasks, issue_key, project_key, story_id, result
+            )
 
-    def _should_sync_story_subtasks(self, story_id: str) -> bool:
-        """Check if a story's subtasks should be synced."""
+    def _should_sync_story(self, story_id: str) -> bool:
+        """Check if a story is matched and not skipped by incremental sync."""
         if story_id not in self._matches:
             return False
         return not (self.config.incremental and story_id not in self._changed_story_ids)
 
+    def _should_sync_story_subtasks(self, story_id: str) -> bool:
+        """Check if a story's subtasks should be synced."""
+        return self._should_sync_story(story_id)
+
     def _fetch_existing_subtasks(
         self, issue_key: str, story_id: str, result: SyncResult
     ) -> dict | None:
         """Fetch existing subtasks for an issue. Returns None on failure."""
         from spectryn.core.ports.issue_tracker import IssueTrackerError
 
+        prefetched = self._prefetched_subtasks.get(issue_key)
+        if prefetched is not None:
+            return dict(prefetched)
+
         try:
             jira_issue = self.tracker.get_issue(issue_key)
             return {st.summary.lower(): st for st in jira_issue.subtasks}
@@ -989,74 +1230,71 @@ class SyncOrchestrator:
         Args:
             result: SyncResult to update with operation counts and errors.
         """
+        stories = [
+            md_story
+            for md_story in self._md_stories
+            if md_story.commits and self._should_sync_story(str(md_story.id))
+        ]
+        self._run_story_tasks(stories, self._sync_story_comments, result)
+
+    def _sync_story_comments(self, md_story: UserStory, result: SyncResult) -> None:
+        """Add the commits comment to a single matched story if missing."""
         from spectryn.core.ports.issue_tracker import IssueTrackerError
 
-        for md_story in self._md_stories:
-            story_id = str(md_story.id)
-            if story_id not in self._matches:
-                continue
+        story_id = str(md_story.id)
+        issue_key = self._matches[story_id]
 
-            if not md_story.commits:
-                continue
+        # Report progress
+        self._update_progress_item(f"{issue_key}: {len(md_story.commits)} commits")
 
-            # Skip unchanged stories in incremental mode
-            if self.config.incremental and story_id not in self._changed_story_ids:
-                continue
-
-            issue_key = self._matches[story_id]
-
-            # Report progress
-            if self._progress:
-                self._progress.update_item(f"{issue_key}: {len(md_story.commits)} commits")
-
-            try:
-                # Check if commits comment already exists
-                existing_comments = self.tracker.get_issue_comments(issue_key)
-                has_commits_comment = any(
-                    "Related Commits" in str(c.get("body", "")) for c in existing_comments
-                )
-
-                if has_commits_comment:
-                    continue
+        try:
+            # Check if commits comment already exists
+            existing_comments = self.tracker.get_issue_comments(issue_key)
+            has_commits_comment = any(
+                "Related Commits" in str(c.get("body", "")) for c in existing_comments
+            )
 
-                # Format commits as table
-                adf = self.formatter.format_commits_table(md_story.commits)
+            if has_commits_comment:
+                return
 
-                cmd = AddCommentCommand(
-                    tracker=self.tracker,
-                    issue_key=issue_key,
-                    body=adf,
-                    event_bus=self.event_bus,
-                    dry_run=self.config.dry_run,
-                )
-                cmd_result = cmd.execute()
+            # Format commits as table
+            adf = self.formatter.format_commits_table(md_story.commits)
 
-                if cmd_result.success:
-                    result.comments_added += 1
-                elif cmd_result.error:
-                    result.add_failed_operation(
-                        operation="add_comment",
-                        issue_key=issue_key,
-                        error=cmd_result.error,
-                        story_id=story_id,
-                    )
+            cmd = AddCommentCommand(
+                tracker=self.tracker,
+                issue_key=issue_key,
+                body=adf,
+                event_bus=self.event_bus,
+                dry_run=self.config.dry_run,
+            )
+            cmd_result = cmd.execute()
 
-            except IssueTrackerError as e:
+            if cmd_result.success:
+                result.comments_added += 1
+            elif cmd_result.error:
                 result.add_failed_operation(
                     operation="add_comment",
                     issue_key=issue_key,
-                    error=str(e),
+                    error=cmd_result.error,
                     story_id=story_id,
                 )
-                self.logger.warning(f"Failed to add comment to {issue_key}: {e}")
-            except Exception as e:
-                result.add_failed_operation(
-                    operation="add_comment",
-                    issue_key=issue_key,
-                    error=f"Unexpected error: {e}",
-                    story_id=story_id,
-                )
-                self.logger.exception(f"Unexpected error adding comment to {issue_key}")
+
+        except IssueTrackerError as e:
+            result.add_failed_operation(
+                operation="add_comment",
+                issue_key=issue_key,
+                error=str(e),
+                story_id=story_id,
+            )
+            self.logger.warning(f"Failed to add comment to {issue_key}: {e}")
+        except Exception as e:
+            result.add_failed_operation(
+                operation="add_comment",
+                issue_key=issue_key,
+                error=f"Unexpected error: {e}",
+                story_id=story_id,
+            )
+            self.logger.exception(f"Unexpected error adding comment to {issue_key}")
 
     def _sync_statuses(self, result: SyncResult, target_status: str = "Resolved") -> None:
         """
@@ -1070,75 +1308,78 @@ class SyncOrchestrator:
             result: SyncResult to update with operation counts and errors.
             target_status: The status to transition subtasks to.
         """
+        stories = [
+            md_story
+            for md_story in self._md_stories
+            if md_story.status.is_complete() and self._should_sync_story(str(md_story.id))
+        ]
+
+        def sync_story_statuses(md_story: UserStory, story_result: SyncResult) -> None:
+            self._sync_story_statuses(md_story, story_result, target_status)
+
+        self._run_story_tasks(stories, sync_story_statuses, result)
+
+    def _sync_story_statuses(
+        self, md_story: UserStory, result: SyncResult, target_status: str
+    ) -> None:
+        """Transition the open subtasks of a single completed story."""
         from spectryn.core.ports.issue_tracker import IssueTrackerError
 
-        for md_story in self._md_stories:
-            story_id = str(md_story.id)
-            if story_id not in self._matches:
-                continue
+        story_id = str(md_story.id)
+        issue_key = self._matches[story_id]
 
-            # Only sync done stories
-            if not md_story.status.is_complete():
-                continue
+        try:
+            jira_issue = self.tracker.get_issue(issue_key)
+        except IssueTrackerError as e:
+            result.add_failed_operation(
+                operation="fetch_issue",
+                issue_key=issue_key,
+                error=str(e),
+                story_id=story_id,
+            )
+            self.logger.warning(f"Failed to fetch issue {issue_key} for status sync: {e}")
+            return  # Skip this story but continue with others
 
-            # Skip unchanged stories in incremental mode
-            if self.config.incremental and story_id not in self._changed_story_ids:
+        for jira_subtask in jira_issue.subtasks:
+            if jira_subtask.status.lower() in ("resolved", "done", "closed"):
                 continue
 
-            issue_key = self._matches[story_id]
-
             try:
-                jira_issue = self.tracker.get_issue(issue_key)
-            except IssueTrackerError as e:
-                result.add_failed_operation(
-                    operation="fetch_issue",
-                    issue_key=issue_key,
-                    error=str(e),
-                    story_id=story_id,
+                cmd = TransitionStatusCommand(
+                    tracker=self.tracker,
+                    issue_key=jira_subtask.key,
+                    target_status=target_status,
+                    event_bus=self.event_bus,
+                    dry_run=self.config.dry_run,
                 )
-                self.logger.warning(f"Failed to fetch issue {issue_key} for status sync: {e}")
-                continue  # Skip this story but continue with others
-
-            for jira_subtask in jira_issue.subtasks:
-                if jira_subtask.status.lower() in ("resolved", "done", "closed"):
-                    continue
+                cmd_result = cmd.execute()
 
-                try:
-                    cmd = TransitionStatusCommand(
-                        tracker=self.tracker,
-                        issue_key=jira_subtask.key,
-                        target_status=target_status,
-                        event_bus=self.event_bus,
-                        dry_run=self.config.dry_run,
-                    )
-                    cmd_result = cmd.execute()
-
-                    if cmd_result.success:
-                        result.statuses_updated += 1
-                    elif cmd_result.error:
-                        result.add_failed_operation(
-                            operation="transition_status",
-                            issue_key=jira_subtask.key,
-                            error=cmd_result.error,
-                            story_id=story_id,
-                        )
-
-                except IssueTrackerError as e:
-                    result.add_failed_operation(
-                        operation="transition_status",
-                        issue_key=jira_subtask.key,
-                        error=str(e),
-                        story_id=story_id,
-                    )
-                    self.logger.warning(f"Failed to transition {jira_subtask.key}: {e}")
-                except Exception as e:
+                if cmd_result.success:
+                    result.statuses_updated += 1
+                elif cmd_result.error:
                     result.add_failed_operation(
                         operation="transition_status",
                         issue_key=jira_subtask.key,
-                        error=f"Unexpected error: {e}",
+                        error=cmd_result.error,
                         story_id=story_id,
                     )
-                    self.logger.exception(f"Unexpected error transitioning {jira_subtask.key}")
+
+            except IssueTrackerError as e:
+                result.add_failed_operation(
+                    operation="transition_status",
+                    issue_key=jira_subtask.key,
+                    error=str(e),
+                    story_id=story_id,
+                )
+                self.logger.warning(f"Failed to transition {jira_subtask.key}: {e}")
+            except Exception as e:
+                result.add_failed_operation(
+                    operation="transition_status",
+                    issue_key=jira_subtask.key,
+                    error=f"Unexpected error: {e}",
+                    story_id=story_id,
+                )
+                self.logger.exception(f"Unexpected error transitioning {jira_subtask.key}")
 
     # -------------------------------------------------------------------------
     # Resumable Sync
@@ -3,6 +3,10 @@ Parallel File Processing - Process multiple files concurrently.
 
 Provides concurrent processing of multiple markdown files,
 useful for large projects with many epic files.
+
+Files are parsed up front in worker processes (parsing is CPU-bound and
+would serialize on the GIL), then synced on threads (syncing is
+network-bound).
 """
 
 import logging
@@ -14,7 +18,13 @@ from pathlib import Path
 from threading import Lock
 from typing import TYPE_CHECKING, Any
 
+from spectryn.core.domain.entities import Epic
 from spectryn.core.domain.events import EventBus
+from spectryn.core.parse_pool import (
+    MIN_FILES_FOR_PROCESSES,
+    can_parse_in_processes,
+    parse_files,
+)
 from spectryn.core.ports.document_formatter import DocumentFormatterPort
 from spectryn.core.ports.document_parser import DocumentParserPort
 from spectryn.core.ports.issue_tracker import IssueTrackerPort
@@ -107,6 +117,7 @@ class ParallelFilesConfig:
     fail_fast: bool = False  # Stop all on first failure
     skip_empty_files: bool = True  # Skip files with no epics
     file_pattern: str = "*.md"  # Glob pattern for files
+    parse_processes: int = 0  # Parse stage processes (0 = CPU count, 1 = parse in sync threads)
 
 
 @dataclass
@@ -219,8 +230,8 @@ class ParallelFileProcessor:
     """
     Processes multiple markdown files in parallel.
 
-    Uses thread pool executor to process files concurrently,
-    with configurable worker count and timeout handling.
+    Parses all files in a process pool first, then syncs them on a thread
+    pool with configurable worker count and timeout handling.
     """
 
     def __init__(
@@ -366,6 +377,8 @@ class ParallelFileProcessor:
         progress_callback: Callable[[str, str, float], None] | None,
     ) -> None:
         """Execute file processing in parallel."""
+        parsed_epics = self._parse_files(paths)
+
         max_workers = min(self.parallel_config.max_workers, len(paths))
         self.logger.info(f"Starting parallel processing with {max_workers} workers")
 
@@ -378,6 +391,7 @@ class ParallelFileProcessor:
                     path,
                     epic_filter,
                     progress_callback,
+                    parsed_epics.get(path),
                 )
                 futures[future] = path
 
@@ -434,16 +448,41 @@ class ParallelFileProcessor:
                     if progress_callback:
                         progress_callback(file_path, "error", 1.0)
 
+    def _parse_files(self, paths: list[Path]) -> dict[Path, list[Epic]]:
+        """
+        Parse files in worker processes ahead of syncing.
+
+        Returns the epics of each file that parsed successfully. Files that
+        failed, or all files if the parser cannot run in other processes,
+        are left for the sync threads to parse so errors are reported per
+        file as before.
+        """
+        processes = self.parallel_config.parse_processes
+        if processes == 1 or len(paths) < MIN_FILES_FOR_PROCESSES:
+            return {}
+        if not hasattr(self.parser, "parse_epics"):
+            return {}
+        if not can_parse_in_processes(self.parser):
+            self.logger.debug("Parser cannot be sent to worker processes, parsing in threads")
+            return {}
+
+        parsed_files = parse_files(
+            self.parser, paths, operation="parse_epics", max_workers=processes or None
+        )
+        return {parsed.path: parsed.result for parsed in parsed_files if parsed.ok}
+
     def _process_single_file(
         self,
         path: Path,
         epic_filter: list[str] | None,
         progress_callback: Callable[[str, str, float], None] | None,
+        epics: list[Epic] | None = None,
     ) -> FileSyncResult:
         """
         Process a single file.
 
-        Thread-safe wrapper around the sync logic.
+        Thread-safe wrapper around the sync logic. Parses the file unless
+        its epics were already parsed by the parse stage.
         """
         from .multi_epic import MultiEpicSyncOrchestrator
 
@@ -493,6 +532,7 @@ class ParallelFileProcessor:
             multi_result = orchestrator.sync(
                 markdown_path=file_path,
                 epic_filter=epic_filter,
+                epics=epics,
             )
 
             if progress_callback:
@@ -6,12 +6,18 @@ Jira -> Markdown (as opposed to the main sync which is Markdown -> Jira).
 """
 
 import logging
-from collections.abc import Callable
+import re
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 from spectryn.adapters.formatters.markdown_writer import MarkdownUpdater, MarkdownWriter
+from spectryn.adapters.parsers.roundtrip import (
+    ParsedStoryWithSpans,
+    RoundtripEditor,
+    RoundtripParser,
+)
 from spectryn.core.domain.entities import Epic, Subtask, UserStory
 from spectryn.core.domain.enums import Status
 from spectryn.core.domain.events import EventBus
@@ -19,6 +25,29 @@ from spectryn.core.domain.value_objects import Description, IssueKey, StoryId
 from spectryn.core.ports.config_provider import SyncConfig
 from spectryn.core.ports.issue_tracker import IssueData, IssueTrackerPort
 
+from .matching import TitleIndex, normalize_issue_title
+
+
+# Tracker link written into each story (> **Jira:** [PROJ-123](url))
+_STORY_ISSUE_LINK = re.compile(
+    r">\s*\*\*(?:Issue|Jira|GitHub|Linear|Azure(?:\s*DevOps)?):\*\*\s*\[?([^\]\s(]+)",
+    re.IGNORECASE,
+)
+
+# Changelog fields whose new values a webhook payload carries in plain form
+_PAYLOAD_FIELDS = frozenset({"status", "summary"})
+
+# Changelog fields pull_issues can patch in place, or that the markdown does
+# not show; a change to any other field (description, acceptance criteria,
+# priority, labels, assignee...) needs a full pull
+_PATCHABLE_FIELDS = _PAYLOAD_FIELDS | {"story points", "story point estimate", "resolution"}
+
+
+def _changelog_fields(payload: dict | None) -> set[str]:
+    """Get the lowercased names of the fields a webhook payload's changelog lists."""
+    items = ((payload or {}).get("changelog") or {}).get("items") or []
+    return {str(item.get("field", "")).lower() for item in items}
+
 
 @dataclass
 class PullResult:
@@ -274,6 +303,90 @@ class ReverseSyncOrchestrator:
         self._match_issues_to_stories(stories)
         return self._detect_changes(stories, epic_data)
 
+    def pull_issues(
+        self,
+        epic_key: str,
+        issue_keys: Iterable[str],
+        output_path: str,
+        payloads: dict[str, dict] | None = None,
+    ) -> PullResult:
+        """
+        Pull only the given issues into an existing markdown file.
+
+        Each issue is read from its webhook payload when the payload carries
+        every changed field, and fetched from the tracker otherwise. Its
+        title, status, story points and subtask statuses are then patched
+        in place with span edits, leaving the rest of the file untouched.
+
+        Falls back to a full pull when the file does not exist yet, a
+        payload's changelog names a field that cannot be patched, or an
+        issue cannot be patched in place (new story, added subtask).
+
+        Args:
+            epic_key: Jira epic key the issues belong to.
+            issue_keys: Keys of the issues that changed.
+            output_path: Path of the markdown file to update.
+            payloads: Optional webhook payloads keyed by issue key.
+
+        Returns:
+            PullResult with details of what was pulled.
+        """
+        output = Path(output_path)
+        if not output.exists():
+            return self.pull(epic_key, output_path)
+
+        result = PullResult(dry_run=self.config.dry_run)
+        result.output_path = output_path
+        payloads = payloads or {}
+
+        try:
+            content = output.read_text(encoding="utf-8")
+            parsed = RoundtripParser().parse_with_spans(content, source_name=output_path)
+            by_issue_key, by_story_id = self._index_story_spans(content, parsed.stories)
+            editor = RoundtripEditor(content)
+
+            for key in sorted(set(issue_keys)):
+                unpatchable = _changelog_fields(payloads.get(key)) - _PATCHABLE_FIELDS
+                if unpatchable:
+                    self.logger.info(
+                        f"{key} changed {', '.join(sorted(unpatchable))}, pulling {epic_key}"
+                    )
+                    return self.pull(epic_key, output_path)
+
+                issue = self._issue_from_payload(payloads.get(key))
+                from_payload = issue is not None
+                if issue is None:
+                    issue = self.tracker.get_issue(key)
+
+                story_id = self._extract_story_id(issue.summary)
+                located = by_issue_key.get(issue.key) or (
+                    by_story_id.get(story_id) if story_id else None
+                )
+                patched = None
+                if located is not None:
+                    patched = self._patch_story(editor, content, located, issue, from_payload)
+                if located is None or patched is None:
+                    self.logger.info(f"{key} cannot be patched in place, pulling {epic_key}")
+                    return self.pull(epic_key, output_path)
+
+                result.stories_pulled += 1
+                result.pulled_stories.append((issue.key, located.spans.story_id))
+                if not from_payload:
+                    result.subtasks_pulled += len(issue.subtasks)
+                if patched:
+                    result.stories_updated += 1
+                    result.updated_stories.append(issue.key)
+
+            if result.stories_updated and not self.config.dry_run:
+                output.write_text(editor.apply(), encoding="utf-8")
+                self.logger.info(f"Patched {result.stories_updated} stories in {output_path}")
+
+        except Exception as e:
+            self.logger.error(f"Pull failed: {e}")
+            result.add_error(str(e))
+
+        return result
+
     def _fetch_from_jira(
         self,
         epic_key: str,
@@ -334,6 +447,120 @@ class ReverseSyncOrchestrator:
             external_key=IssueKey(issue.key),
         )
 
+    def _issue_from_payload(self, payload: dict | None) -> IssueData | None:
+        """
+        Build issue data from a webhook payload if it covers every change.
+
+        Returns None when the changelog is empty or touches a field the
+        payload does not carry in plain form, so the issue must be fetched.
+        """
+        changed = _changelog_fields(payload)
+        if not payload or not changed or not changed <= _PAYLOAD_FIELDS:
+            return None
+
+        issue = payload.get("issue") or {}
+        fields = issue.get("fields") or {}
+        status = (fields.get("status") or {}).get("name")
+        if not issue.get("key") or not fields.get("summary") or not status:
+            return None
+
+        return IssueData(
+            key=issue["key"],
+            summary=fields["summary"],
+            status=status,
+            issue_type=(fields.get("issuetype") or {}).get("name", ""),
+        )
+
+    def _index_story_spans(
+        self,
+        content: str,
+        stories: list[ParsedStoryWithSpans],
+    ) -> tuple[dict[str, ParsedStoryWithSpans], dict[str, ParsedStoryWithSpans]]:
+        """Index parsed stories by their linked issue key and by story ID."""
+        by_issue_key: dict[str, ParsedStoryWithSpans] = {}
+        by_story_id: dict[str, ParsedStoryWithSpans] = {}
+
+        for parsed in stories:
+            span = parsed.spans.full_span
+            link = _STORY_ISSUE_LINK.search(content, span.start, span.end)
+            if link:
+                by_issue_key.setdefault(link.group(1), parsed)
+            by_story_id.setdefault(parsed.spans.story_id, parsed)
+
+        return by_issue_key, by_story_id
+
+    def _patch_story(
+        self,
+        editor: RoundtripEditor,
+        content: str,
+        parsed: ParsedStoryWithSpans,
+        issue: IssueData,
+        from_payload: bool,
+    ) -> list[str] | None:
+        """
+        Queue span edits bringing one markdown story in line with its issue.
+
+        Story points and subtasks are only compared for fetched issues, as
+        webhook payloads are only used when those did not change.
+
+        Returns:
+            Names of the changed fields, or None if the story cannot be
+            patched in place and needs a full pull.
+        """
+        md_story = parsed.story
+        spans = parsed.spans
+        changed: list[str] = []
+
+        subtask_edits: list[tuple[int, Status]] = []
+        if not from_payload:
+            md_subtasks = {
+                normalize_issue_title(st.name.replace("\\|", "|")): i
+                for i, st in enumerate(md_story.subtasks)
+            }
+            if len(md_subtasks) != len(issue.subtasks):
+                return None
+            for st in issue.subtasks:
+                position = md_subtasks.get(normalize_issue_title(st.summary))
+                if position is None:
+                    return None
+                new_status = Status.from_string(st.status)
+                if md_story.subtasks[position].status != new_status:
+                    subtask_edits.append((position, new_status))
+
+        # Header carries both the status emoji and the title
+        status = Status.from_string(issue.status)
+        title = self._clean_title(issue.summary, spans.story_id)
+        header = content[spans.header_span.start : spans.header_span.end]
+        title_start = spans.title_span.start - spans.header_span.start
+        title_end = spans.title_span.end - spans.header_span.start
+        prefix = header[:title_start]
+        if status != md_story.status:
+            prefix = prefix.replace(md_story.status.emoji, status.emoji, 1)
+        if title != md_story.title:
+            changed.append("title")
+        new_header = prefix + title + header[title_end:]
+        if new_header != header:
+            editor.update_title(spans.header_span, new_header)
+
+        status_span = spans.fields.get("Status")
+        if status != md_story.status and status_span:
+            editor.update_field_value(status_span, status.display_name)
+            changed.append("status")
+
+        points_span = spans.fields.get("Story Points")
+        if not from_payload and issue.story_points is not None and points_span:
+            points = int(issue.story_points)
+            if points != md_story.story_points:
+                editor.update_field_value(points_span, str(points))
+                changed.append("story_points")
+
+        for position, new_status in subtask_edits:
+            editor.update_subtask_status(spans.subtask_spans[position], new_status)
+        if subtask_edits:
+            changed.append("subtasks")
+
+        return changed
+
     def _extract_story_id(self, summary: str) -> str | None:
         """Extract story ID from summary if present (e.g., 'STORY-001: Title')."""
         import re
@@ -419,25 +646,28 @@ class ReverseSyncOrchestrator:
         """Match Jira issues to existing markdown stories."""
         self._matches = {}
 
+        # Index markdown stories once by external key, ID and normalized title.
+        # The earliest markdown story satisfying any criterion wins, as before.
+        by_external_key: dict[str, int] = {}
+        by_story_id: dict[str, int] = {}
+        for position, md_story in enumerate(self._md_stories):
+            if md_story.external_key:
+                by_external_key.setdefault(str(md_story.external_key), position)
+            by_story_id.setdefault(str(md_story.id), position)
+        title_index = TitleIndex([s.normalize_title() for s in self._md_stories])
+
         for jira_story in jira_stories:
             jira_key = str(jira_story.external_key) if jira_story.external_key else ""
 
             # Try to find matching markdown story
-            for md_story in self._md_stories:
-                # Match by external key if set
-                if md_story.external_key and str(md_story.external_key) == jira_key:
-                    self._matches[jira_key] = str(md_story.id)
-                    break
-
-                # Match by story ID
-                if str(md_story.id) == str(jira_story.id):
-                    self._matches[jira_key] = str(md_story.id)
-                    break
-
-                # Match by title similarity
-                if md_story.matches_title(jira_story.title):
-                    self._matches[jira_key] = str(md_story.id)
-                    break
+            candidates = [
+                by_external_key.get(jira_key),
+                by_story_id.get(str(jira_story.id)),
+                title_index.first_match(normalize_issue_title(jira_story.title)),
+            ]
+            found = [position for position in candidates if position is not None]
+            if found:
+                self._matches[jira_key] = str(self._md_stories[min(found)].id)
 
         self.logger.info(f"Matched {len(self._matches)} Jira issues to markdown stories")
 
@@ -1,16 +1,23 @@
 """
 Watch Mode - Auto-sync on file changes.
 
-Monitors markdown files for changes and automatically triggers
-sync operations when modifications are detected.
+Monitors markdown files or directories of them for changes and
+automatically triggers sync operations when modifications are detected.
 """
 
+import ctypes
+import ctypes.util
+import fnmatch
 import hashlib
 import logging
+import os
+import select
 import signal
+import struct
+import sys
 import threading
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -74,62 +81,301 @@ class WatchStats:
         return f"{secs}s"
 
 
-class FileWatcher:
+class _PollBackend:
     """
-    Watches files for changes using polling.
+    Watch backend that rescans the tree with stat() calls.
 
-    Uses content hashing to detect actual changes (not just mtime),
-    which is more reliable across different filesystems.
+    Files are compared by (mtime_ns, size), so an idle tree costs one stat
+    per file per poll and no reads.
     """
 
+    name = "poll"
+
+    def __init__(
+        self,
+        root: Path,
+        recursive: bool,
+        matches: Callable[[Path], bool],
+        poll_interval: float,
+    ):
+        self.root = root
+        self.recursive = recursive
+        self.matches = matches
+        self.poll_interval = poll_interval
+        self._signatures = self._scan()
+
+    def _scan(self) -> dict[Path, tuple[int, int]]:
+        """Stat every watched file under the root."""
+        signatures: dict[Path, tuple[int, int]] = {}
+        for path in _iter_files(self.root, self.recursive, self.matches):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            signatures[path] = (st.st_mtime_ns, st.st_size)
+        return signatures
+
+    def wait(self, timeout: float) -> set[Path]:
+        """Sleep up to one poll interval, then return files whose stat changed."""
+        time.sleep(min(timeout, self.poll_interval))
+        current = self._scan()
+        previous, self._signatures = self._signatures, current
+        changed = {path for path, sig in current.items() if previous.get(path) != sig}
+        changed.update(previous.keys() - current.keys())
+        return changed
+
+    def close(self) -> None:
+        """Release backend resources (none for polling)."""
+
+
+class _InotifyBackend:
+    """
+    Watch backend using Linux inotify through ctypes.
+
+    Every directory of the tree gets a watch. The thread blocks in select()
+    until the kernel reports an event, so an idle tree costs no CPU or I/O.
+    """
+
+    name = "inotify"
+
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_MOVE_SELF = 0x00000800
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+    IN_NONBLOCK = os.O_NONBLOCK
+    IN_CLOEXEC = 0o2000000
+
+    WATCH_MASK = (
+        IN_MODIFY
+        | IN_CLOSE_WRITE
+        | IN_MOVED_FROM
+        | IN_MOVED_TO
+        | IN_CREATE
+        | IN_DELETE
+        | IN_DELETE_SELF
+        | IN_MOVE_SELF
+    )
+    EVENT_HEADER = struct.Struct("iIII")
+
+    def __init__(self, root: Path, recursive: bool, matches: Callable[[Path], bool]):
+        self.root = root
+        self.recursive = recursive
+        self.matches = matches
+
+        self._libc = self._load_libc()
+        fd = self._libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._fd = fd
+        self._dirs: dict[int, Path] = {}
+        try:
+            self._add_tree(root)
+        except OSError:
+            self.close()
+            raise
+
+    @staticmethod
+    def _load_libc() -> Any:
+        """Load libc, raising OSError where inotify isn't available."""
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError("libc has no inotify support")
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        return libc
+
+    def _add_watch(self, directory: Path) -> None:
+        """Watch one directory."""
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), self.WATCH_MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"inotify_add_watch failed: {os.strerror(errno)}", str(directory))
+        self._dirs[wd] = directory
+
+    def _add_tree(self, directory: Path) -> None:
+        """Watch a directory and, when recursive, every directory below it."""
+        self._add_watch(directory)
+        if self.recursive:
+            for sub in _iter_dirs(directory):
+                self._add_watch(sub)
+
+    def wait(self, timeout: float) -> set[Path]:
+        """Block up to timeout seconds and return the paths events named."""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+
+        changed: set[Path] = set()
+        while True:
+            try:
+                buffer = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            self._parse_events(buffer, changed)
+        return changed
+
+    def _parse_events(self, buffer: bytes, changed: set[Path]) -> None:
+        """Decode a read() buffer of inotify events into changed paths."""
+        offset = 0
+        while offset < len(buffer):
+            wd, mask, _cookie, length = self.EVENT_HEADER.unpack_from(buffer, offset)
+            offset += self.EVENT_HEADER.size
+            name = buffer[offset : offset + length].rstrip(b"\0")
+            offset += length
+
+            if mask & self.IN_Q_OVERFLOW:
+                # Events were dropped: have the watcher rescan the whole tree
+                changed.add(self.root)
+                continue
+            if mask & self.IN_IGNORED:
+                self._dirs.pop(wd, None)
+                continue
+
+            directory = self._dirs.get(wd)
+            if directory is None or not name:
+                continue
+            path = directory / os.fsdecode(name)
+
+            if mask & self.IN_ISDIR:
+                if self.recursive and mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                    # Files may land in the new directory before its watch exists
+                    try:
+                        self._add_tree(path)
+                    except OSError as e:
+                        logger.warning(f"Could not watch {path}: {e}")
+                    changed.add(path)
+                elif mask & (self.IN_DELETE | self.IN_MOVED_FROM):
+                    changed.add(path)
+            elif self.matches(path):
+                changed.add(path)
+
+    def close(self) -> None:
+        """Close the inotify descriptor, dropping all watches."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def _iter_dirs(root: Path) -> Iterator[Path]:
+    """Yield the non-hidden directories below root."""
+    try:
+        entries = list(os.scandir(root))
+    except OSError:
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False) and not entry.name.startswith("."):
+            path = Path(entry.path)
+            yield path
+            yield from _iter_dirs(path)
+
+
+def _iter_files(root: Path, recursive: bool, matches: Callable[[Path], bool]) -> Iterator[Path]:
+    """Yield the files directly in root (or below it) that matches() accepts."""
+    dirs = [root, *_iter_dirs(root)] if recursive else [root]
+    for directory in dirs:
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            continue
+        for entry in entries:
+            path = Path(entry.path)
+            if entry.is_file() and matches(path):
+                yield path
+
+
+class FileWatcher:
+    """
+    Watches a file or a directory tree for changes.
+
+    Changes are picked up by inotify on Linux and by stat() polling
+    elsewhere; neither reads file contents while the tree is idle. A burst
+    of events is coalesced until it has been quiet for debounce_seconds,
+    and the changed files are then hashed so that saves which don't change
+    content (touch, editor autosave) are dropped. Surviving changes are
+    delivered together to on_batch() callbacks and one by one to
+    on_change() callbacks.
+    """
+
+    # A burst is flushed after this many debounce periods even if still active
+    MAX_BATCH_DELAY_FACTOR = 10
+
     def __init__(
         self,
         path: str,
         debounce_seconds: float = 1.0,
         poll_interval: float = 0.5,
+        patterns: tuple[str, ...] = ("*.md",),
+        backend: str = "auto",
     ):
         """
         Initialize the file watcher.
 
         Args:
-            path: Path to the file to watch.
-            debounce_seconds: Minimum time between change notifications.
-            poll_interval: How often to check for changes (seconds).
+            path: Path to the file or directory to watch.
+            debounce_seconds: Quiet period that ends a burst of changes.
+            poll_interval: How often to check for changes (seconds); with
+                inotify, how often the watch thread checks for stop().
+            patterns: Filename patterns watched inside a directory.
+            backend: "inotify", "poll", or "auto" to use inotify when
+                available and fall back to polling.
         """
+        if backend not in ("auto", "inotify", "poll"):
+            raise ValueError(f"Unknown watch backend: {backend}")
+
         self.path = Path(path)
         self.debounce_seconds = debounce_seconds
         self.poll_interval = poll_interval
+        self.patterns = patterns
+        self.backend = backend
 
         self._running = False
         self._thread: threading.Thread | None = None
-        self._last_hash: str | None = None
-        self._last_change_time: float = 0
+        self._backend: _InotifyBackend | _PollBackend | None = None
+        self._hashes: dict[Path, str] = {}
         self._callbacks: list[Callable[[FileChange], None]] = []
+        self._batch_callbacks: list[Callable[[list[FileChange]], None]] = []
         self._lock = threading.Lock()
 
         self.logger = logging.getLogger("FileWatcher")
 
+    @property
+    def backend_name(self) -> str:
+        """Name of the backend in use ("inotify" or "poll"), once started."""
+        return self._backend.name if self._backend else self.backend
+
     def start(self) -> None:
-        """Start watching the file."""
+        """Start watching the file or directory."""
         if self._running:
             return
 
         if not self.path.exists():
             raise FileNotFoundError(f"File not found: {self.path}")
 
-        self._last_hash = self._compute_hash()
+        self._hashes = {path: self._compute_hash(path) for path in self._watched_files()}
+        self._backend = self._create_backend()
         self._running = True
-        self._thread = threading.Thread(target=self._watch_loop, daemon=True)
+        self._thread = threading.Thread(target=self._watch_loop, args=(self._backend,), daemon=True)
         self._thread.start()
 
-        self.logger.info(f"Started watching: {self.path}")
+        self.logger.info(f"Started watching: {self.path} ({self._backend.name})")
 
     def stop(self) -> None:
-        """Stop watching the file."""
+        """Stop watching."""
         self._running = False
         if self._thread:
             self._thread.join(timeout=2.0)
             self._thread = None
+        if self._backend:
+            self._backend.close()
+            self._backend = None
         self.logger.info("Stopped watching")
 
     def on_change(self, callback: Callable[[FileChange], None]) -> None:
@@ -137,87 +383,150 @@ class FileWatcher:
         Register a callback for file changes.
 
         Args:
-            callback: Function to call when file changes.
+            callback: Function to call once per changed file.
         """
         self._callbacks.append(callback)
 
-    def _watch_loop(self) -> None:
+    def on_batch(self, callback: Callable[[list[FileChange]], None]) -> None:
+        """
+        Register a callback for debounced batches of changes.
+
+        Args:
+            callback: Function to call with all changes of a burst.
+        """
+        self._batch_callbacks.append(callback)
+
+    def _matches(self, path: Path) -> bool:
+        """Check if a path is one of the watched files."""
+        if self.path.is_dir():
+            return any(fnmatch.fnmatch(path.name, pattern) for pattern in self.patterns)
+        return path == self.path
+
+    def _watched_files(self) -> list[Path]:
+        """List the watched files that currently exist."""
+        if self.path.is_dir():
+            return list(_iter_files(self.path, True, self._matches))
+        return [self.path] if self.path.is_file() else []
+
+    def _create_backend(self) -> _InotifyBackend | _PollBackend:
+        """Create the configured backend, falling back to polling under "auto"."""
+        is_dir = self.path.is_dir()
+        root = self.path if is_dir else self.path.parent
+        if self.backend != "poll":
+            try:
+                return _InotifyBackend(root, recursive=is_dir, matches=self._matches)
+            except OSError as e:
+                if self.backend == "inotify":
+                    raise
+                self.logger.debug(f"inotify unavailable, polling instead: {e}")
+        return _PollBackend(
+            root, recursive=is_dir, matches=self._matches, poll_interval=self.poll_interval
+        )
+
+    def _watch_loop(self, backend: _InotifyBackend | _PollBackend) -> None:
         """Main watch loop (runs in separate thread)."""
+        max_delay = self.debounce_seconds * self.MAX_BATCH_DELAY_FACTOR
+        pending: set[Path] = set()
+        first_event_at = last_event_at = 0.0
+
         while self._running:
+            timeout = self.poll_interval
+            if pending:
+                flush_at = min(last_event_at + self.debounce_seconds, first_event_at + max_delay)
+                timeout = max(0.0, min(timeout, flush_at - time.monotonic()))
+
             try:
-                self._check_for_changes()
+                paths = backend.wait(timeout)
             except Exception as e:
                 self.logger.error(f"Error in watch loop: {e}")
-                self._notify_change(
-                    FileChange(
-                        path=str(self.path),
-                        event=WatchEvent.ERROR,
-                    )
-                )
+                self._notify_changes([FileChange(path=str(self.path), event=WatchEvent.ERROR)])
+                time.sleep(self.poll_interval)
+                continue
+
+            now = time.monotonic()
+            if paths:
+                if not pending:
+                    first_event_at = now
+                pending |= paths
+                last_event_at = now
+
+            if pending and (
+                now - last_event_at >= self.debounce_seconds or now - first_event_at >= max_delay
+            ):
+                try:
+                    self._notify_changes(self._collect_changes(pending))
+                except Exception as e:
+                    self.logger.error(f"Error in watch loop: {e}")
+                    self._notify_changes([FileChange(path=str(self.path), event=WatchEvent.ERROR)])
+                pending = set()
 
-            time.sleep(self.poll_interval)
+    def _collect_changes(self, paths: set[Path]) -> list[FileChange]:
+        """
+        Turn the paths of a burst into content changes.
 
-    def _check_for_changes(self) -> None:
-        """Check if the file has changed."""
-        if not self.path.exists():
-            if self._last_hash is not None:
-                # File was deleted
-                self._notify_change(
-                    FileChange(
-                        path=str(self.path),
-                        event=WatchEvent.DELETED,
-                        old_hash=self._last_hash or "",
+        Directories (created, removed, or the root after an event overflow)
+        are expanded to the watched files in and below them.
+        """
+        candidates: set[Path] = set()
+        for path in paths:
+            if path.is_dir():
+                candidates.update(_iter_files(path, True, self._matches))
+            if not path.is_file():
+                # Known files under a removed or rescanned directory
+                candidates.update(p for p in self._hashes if p == path or path in p.parents)
+            else:
+                candidates.add(path)
+
+        changes = []
+        for path in sorted(candidates):
+            old_hash = self._hashes.get(path)
+            if not path.is_file():
+                if old_hash is not None:
+                    del self._hashes[path]
+                    changes.append(
+                        FileChange(path=str(path), event=WatchEvent.DELETED, old_hash=old_hash)
                     )
-                )
-                self._last_hash = None
-            return
-
-        current_hash = self._compute_hash()
-
-        if self._last_hash is None:
-            # File was created
-            self._last_hash = current_hash
-            self._notify_change(
-                FileChange(
-                    path=str(self.path),
-                    event=WatchEvent.CREATED,
-                    new_hash=current_hash,
-                )
+                continue
+
+            new_hash = self._compute_hash(path)
+            if new_hash == old_hash:
+                continue
+            self._hashes[path] = new_hash
+            event = WatchEvent.CREATED if old_hash is None else WatchEvent.MODIFIED
+            changes.append(
+                FileChange(path=str(path), event=event, old_hash=old_hash or "", new_hash=new_hash)
             )
-            return
-
-        if current_hash != self._last_hash:
-            # File was modified - apply debouncing
-            now = time.time()
-            if now - self._last_change_time >= self.debounce_seconds:
-                self._notify_change(
-                    FileChange(
-                        path=str(self.path),
-                        event=WatchEvent.MODIFIED,
-                        old_hash=self._last_hash,
-                        new_hash=current_hash,
-                    )
-                )
-                self._last_hash = current_hash
-                self._last_change_time = now
+        return changes
 
-    def _compute_hash(self) -> str:
-        """Compute hash of file contents."""
+    def _compute_hash(self, path: Path | None = None) -> str:
+        """Compute hash of a file's contents (the watched file by default)."""
+        path = path or self.path
         try:
-            content = self.path.read_bytes()
-            return hashlib.md5(content).hexdigest()
+            digest = hashlib.md5()
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(64 * 1024), b""):
+                    digest.update(chunk)
+            return digest.hexdigest()
         except Exception as e:
             self.logger.warning(f"Failed to read file: {e}")
             return ""
 
-    def _notify_change(self, change: FileChange) -> None:
-        """Notify all registered callbacks of a change."""
+    def _notify_changes(self, changes: list[FileChange]) -> None:
+        """Notify all registered callbacks of a batch of changes."""
+        if not changes:
+            return
         with self._lock:
-            for callback in self._callbacks:
+            for batch_callback in self._batch_callbacks:
                 try:
-                    callback(change)
+                    batch_callback(changes)
                 except Exception as e:
                     self.logger.error(f"Callback error: {e}")
+            for change in changes:
+                for callback in self._callbacks:
+                    try:
+                        callback(change)
+                    except Exception as e:
+                        self.logger.error(f"Callback error: {e}")
 
 
 class WatchOrchestrator:
@@ -225,13 +534,23 @@ class WatchOrchestrator:
     Orchestrates watch mode - monitors files and triggers syncs.
 
     Provides a complete watch experience with:
-    - File change detection
-    - Automatic sync triggering
+    - File change detection for a markdown file or a directory of them
+    - Automatic sync triggering, once per debounced batch of changes
     - Debouncing to avoid excessive syncs
     - Graceful shutdown handling
     - Status reporting
+
+    In a watched directory only the changed spec files are synced. A batch
+    that deletes a file, touches EPIC.md (whose story summaries the
+    directory parser merges with the story files), reaches into a
+    subdirectory or changes more than ``MAX_TARGETED_FILES`` files syncs
+    the whole directory once instead.
     """
 
+    # Each sync fetches the epic, so past this many changed files one
+    # sync of the whole directory is cheaper than a sync per file
+    MAX_TARGETED_FILES = 8
+
     def __init__(
         self,
         orchestrator: "SyncOrchestrator",
@@ -242,19 +561,21 @@ class WatchOrchestrator:
         on_sync_start: Callable[[], None] | None = None,
         on_sync_complete: Callable[["SyncResult"], None] | None = None,
         on_change_detected: Callable[[FileChange], None] | None = None,
+        backend: str = "auto",
     ):
         """
         Initialize the watch orchestrator.
 
         Args:
             orchestrator: The sync orchestrator to use.
-            markdown_path: Path to the markdown file to watch.
+            markdown_path: Path to the markdown file or directory to watch.
             epic_key: Jira epic key.
-            debounce_seconds: Minimum time between syncs.
+            debounce_seconds: Quiet period that ends a burst of changes.
             poll_interval: How often to check for changes.
             on_sync_start: Callback when sync starts.
             on_sync_complete: Callback when sync completes.
-            on_change_detected: Callback when file change detected.
+            on_change_detected: Callback for each changed file.
+            backend: Watch backend ("auto", "inotify" or "poll").
         """
         self.orchestrator = orchestrator
         self.markdown_path = markdown_path
@@ -265,6 +586,7 @@ class WatchOrchestrator:
             path=markdown_path,
             debounce_seconds=debounce_seconds,
             poll_interval=poll_interval,
+            backend=backend,
         )
 
         self._running = False
@@ -290,7 +612,7 @@ class WatchOrchestrator:
         self._setup_signal_handlers()
 
         # Register change handler
-        self._watcher.on_change(self._handle_change)
+        self._watcher.on_batch(self._handle_changes)
 
         # Start the file watcher
         self._watcher.start()
@@ -316,7 +638,7 @@ class WatchOrchestrator:
         Use stop() to stop the watcher.
         """
         self._running = True
-        self._watcher.on_change(self._handle_change)
+        self._watcher.on_batch(self._handle_changes)
         self._watcher.start()
         self.logger.info(f"Watch mode started (async) for {self.markdown_path}")
 
@@ -343,44 +665,74 @@ class WatchOrchestrator:
         signal.signal(signal.SIGINT, signal_handler)
         signal.signal(signal.SIGTERM, signal_handler)
 
-    def _handle_change(self, change: FileChange) -> None:
-        """Handle a file change event."""
-        self.stats.changes_detected += 1
+    def _handle_changes(self, changes: list[FileChange]) -> None:
+        """Handle a debounced batch of file changes, syncing what changed."""
+        changed: list[FileChange] = []
+        for change in changes:
+            self.stats.changes_detected += 1
 
-        if self._on_change_detected:
-            self._on_change_detected(change)
+            if self._on_change_detected:
+                self._on_change_detected(change)
 
-        self.logger.info(f"Change detected: {change}")
+            self.logger.info(f"Change detected: {change}")
 
-        if change.event == WatchEvent.DELETED:
-            self.logger.warning("File was deleted, cannot sync")
+            if change.event == WatchEvent.ERROR:
+                self.stats.errors.append(f"Watch error at {change.timestamp}")
+            else:
+                changed.append(change)
+
+        if not changed:
             return
 
-        if change.event == WatchEvent.ERROR:
-            self.stats.errors.append(f"Watch error at {change.timestamp}")
+        if not Path(self.markdown_path).exists():
+            self.logger.warning("File was deleted, cannot sync")
             return
 
         # Trigger sync
-        self._trigger_sync()
+        self._trigger_sync(self._sync_paths(changed))
+
+    def _sync_paths(self, changes: list[FileChange]) -> list[str]:
+        """Get the paths to sync for a batch of changes."""
+        root = Path(self.markdown_path)
+        if not root.is_dir():
+            return [self.markdown_path]
+
+        paths = sorted({change.path for change in changes})
+        whole_directory = len(paths) > self.MAX_TARGETED_FILES or any(
+            change.event == WatchEvent.DELETED
+            or Path(change.path).name.lower() == "epic.md"
+            or Path(change.path).parent.resolve() != root.resolve()
+            for change in changes
+        )
+        return [self.markdown_path] if whole_directory else paths
 
-    def _trigger_sync(self) -> None:
-        """Trigger a sync operation."""
+    def _trigger_sync(self, paths: list[str] | None = None) -> None:
+        """Trigger a sync of each path (the watched path by default)."""
         with self._sync_lock:
             if self._syncing:
                 self.logger.debug("Sync already in progress, skipping")
                 return
             self._syncing = True
 
+        try:
+            for path in paths or [self.markdown_path]:
+                self._sync_path(path)
+        finally:
+            with self._sync_lock:
+                self._syncing = False
+
+    def _sync_path(self, path: str) -> None:
+        """Run one sync of a file or directory and record its outcome."""
         try:
             self.stats.syncs_triggered += 1
 
             if self._on_sync_start:
                 self._on_sync_start()
 
-            self.logger.info("Starting sync...")
+            self.logger.info(f"Starting sync of {path}...")
 
             result = self.orchestrator.sync(
-                markdown_path=self.markdown_path,
+                markdown_path=path,
                 epic_key=self.epic_key,
             )
 
@@ -404,10 +756,6 @@ class WatchOrchestrator:
             self.stats.errors.append(str(e))
             self.logger.error(f"Sync error: {e}")
 
-        finally:
-            with self._sync_lock:
-                self._syncing = False
-
     def get_status(self) -> dict[str, Any]:
         """Get current watch status."""
         return {
@@ -415,6 +763,7 @@ class WatchOrchestrator:
             "syncing": self._syncing,
             "markdown_path": self.markdown_path,
             "epic_key": self.epic_key,
+            "backend": self._watcher.backend_name,
             "uptime": self.stats.uptime_formatted,
             "changes_detected": self.stats.changes_detected,
             "syncs_triggered": self.stats.syncs_triggered,
@@ -449,7 +798,8 @@ class WatchDisplay:
 
         print()
         self._print_colored("👀 Watch Mode Active", "cyan", bold=True)
-        print(f"   File: {markdown_path}")
+        label = "Directory" if Path(markdown_path).is_dir() else "File"
+        print(f"   {label}: {markdown_path}")
         print(f"   Epic: {epic_key}")
         print()
         print("   Watching for changes... (Ctrl+C to stop)")
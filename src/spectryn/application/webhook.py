@@ -16,9 +16,14 @@ from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from http.server import BaseHTTPRequestHandler, HTTPServer
 from typing import TYPE_CHECKING, Any, Optional
 
+from spectryn.adapters.http.server import (
+    HTTPServerConfig,
+    PooledHTTPServer,
+    PooledRequestHandler,
+)
+
 
 if TYPE_CHECKING:
     from .sync.reverse_sync import PullResult, ReverseSyncOrchestrator
@@ -88,6 +93,7 @@ class WebhookStats:
     syncs_triggered: int = 0
     syncs_successful: int = 0
     syncs_failed: int = 0
+    targeted_syncs: int = 0
     errors: list[str] = field(default_factory=list)
 
     @property
@@ -209,7 +215,7 @@ class WebhookParser:
         ]
 
 
-class WebhookHandler(BaseHTTPRequestHandler):
+class WebhookHandler(PooledRequestHandler):
     """
     HTTP request handler for Jira webhooks.
     """
@@ -236,6 +242,7 @@ class WebhookHandler(BaseHTTPRequestHandler):
                         "requests": stats.requests_received,
                         "events": stats.events_processed,
                         "syncs": stats.syncs_triggered,
+                        "http": self.server.stats_snapshot(),
                     },
                 )
             else:
@@ -249,8 +256,9 @@ class WebhookHandler(BaseHTTPRequestHandler):
             self.webhook_server.stats.requests_received += 1
 
         # Read body
-        content_length = int(self.headers.get("Content-Length", 0))
-        body = self.rfile.read(content_length)
+        body = self.read_body()
+        if body is None:
+            return
 
         # Verify signature if configured
         if self.webhook_server and self.webhook_server.secret:
@@ -301,10 +309,12 @@ class WebhookHandler(BaseHTTPRequestHandler):
 
     def _send_response(self, status: int, body: dict) -> None:
         """Send JSON response."""
+        data = json.dumps(body).encode()
         self.send_response(status)
         self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
         self.end_headers()
-        self.wfile.write(json.dumps(body).encode())
+        self.wfile.write(data)
 
 
 class WebhookServer:
@@ -312,7 +322,9 @@ class WebhookServer:
     HTTP server for receiving Jira webhooks.
 
     Listens for webhook events and triggers reverse sync
-    when relevant issues are updated.
+    when relevant issues are updated. Issue keys from a burst of
+    events are collected and only those issues are pulled into
+    the markdown file once the burst settles.
     """
 
     def __init__(
@@ -327,6 +339,7 @@ class WebhookServer:
         on_event: Callable[[WebhookEvent], None] | None = None,
         on_sync_start: Callable[[], None] | None = None,
         on_sync_complete: Callable[["PullResult"], None] | None = None,
+        http_config: HTTPServerConfig | None = None,
     ):
         """
         Initialize the webhook server.
@@ -342,6 +355,7 @@ class WebhookServer:
             on_event: Callback when event is received.
             on_sync_start: Callback when sync starts.
             on_sync_complete: Callback when sync completes.
+            http_config: Worker pool and request limits for the HTTP server.
         """
         self.reverse_sync = reverse_sync
         self.host = host
@@ -350,17 +364,23 @@ class WebhookServer:
         self.output_path = output_path
         self.secret = secret
         self.debounce_seconds = debounce_seconds
+        self.http_config = http_config or HTTPServerConfig()
 
         self._on_event = on_event
         self._on_sync_start = on_sync_start
         self._on_sync_complete = on_sync_complete
 
-        self._server: HTTPServer | None = None
+        self._server: PooledHTTPServer | None = None
         self._running = False
         self._last_sync_time: float = 0
         self._sync_lock = threading.Lock()
+        # Requests are served concurrently; only one pull may write the file
+        self._sync_run_lock = threading.Lock()
         self._pending_sync = False
         self._pending_timer: threading.Timer | None = None
+        # Issue key -> latest payload with merged changelog (None: fetch it)
+        self._dirty_issues: dict[str, dict] = {}
+        self._full_pull_pending = False
 
         self.parser = WebhookParser()
         self.stats = WebhookStats()
@@ -379,7 +399,7 @@ class WebhookServer:
         WebhookHandler.webhook_server = self
 
         # Create server
-        self._server = HTTPServer((self.host, self.port), WebhookHandler)
+        self._server = PooledHTTPServer((self.host, self.port), WebhookHandler, self.http_config)
         self._running = True
 
         self.logger.info(f"Webhook server starting on {self.host}:{self.port}")
@@ -403,7 +423,7 @@ class WebhookServer:
         WebhookHandler.webhook_server = self
 
         # Create server
-        self._server = HTTPServer((self.host, self.port), WebhookHandler)
+        self._server = PooledHTTPServer((self.host, self.port), WebhookHandler, self.http_config)
         self._running = True
 
         thread = threading.Thread(target=self._server.serve_forever, daemon=True)
@@ -421,8 +441,11 @@ class WebhookServer:
                 self._pending_timer.cancel()
                 self._pending_timer = None
             self._pending_sync = False
+            self._dirty_issues.clear()
+            self._full_pull_pending = False
         if self._server:
             self._server.shutdown()
+            self._server.server_close()
             self._server = None
         self.logger.info("Webhook server stopped")
 
@@ -444,6 +467,7 @@ class WebhookServer:
 
         # Check if we should trigger sync
         if self._should_sync(event):
+            self._mark_dirty(event)
             self._trigger_sync()
 
     def _should_sync(self, event: WebhookEvent) -> bool:
@@ -465,6 +489,34 @@ class WebhookServer:
 
         return True
 
+    def _mark_dirty(self, event: WebhookEvent) -> None:
+        """
+        Record which issue an event touched for the next sync.
+
+        Changelogs of events for the same issue are merged so the reverse
+        sync can tell whether the latest payload covers every change.
+        Created and deleted issues, changes to the epic itself and updates
+        without a changelog (whose changes are unknown) need a full pull.
+        """
+        with self._sync_lock:
+            new_items = (event.raw_payload.get("changelog") or {}).get("items", [])
+            if (
+                not event.issue_key
+                or event.issue_key == self.epic_key
+                or event.event_type != WebhookEventType.ISSUE_UPDATED
+                or not new_items
+            ):
+                self._full_pull_pending = True
+                return
+
+            previous = self._dirty_issues.get(event.issue_key, {})
+            items = list(previous.get("changelog", {}).get("items", []))
+            items.extend(new_items)
+            self._dirty_issues[event.issue_key] = {
+                **event.raw_payload,
+                "changelog": {"items": items},
+            }
+
     def _trigger_sync(self) -> None:
         """Trigger a reverse sync with debouncing."""
         now = time.time()
@@ -509,18 +561,38 @@ class WebhookServer:
             self.logger.warning("Cannot sync: epic_key or output_path not configured")
             return
 
+        with self._sync_run_lock:
+            self._run_sync(self.epic_key, self.output_path)
+
+    def _run_sync(self, epic_key: str, output_path: str) -> None:
+        """Pull the issues collected since the last sync."""
+        with self._sync_lock:
+            dirty = self._dirty_issues
+            full_pull = self._full_pull_pending or not dirty
+            self._dirty_issues = {}
+            self._full_pull_pending = False
+
         self.stats.syncs_triggered += 1
 
         try:
             if self._on_sync_start:
                 self._on_sync_start()
 
-            self.logger.info("Starting reverse sync...")
-
-            result = self.reverse_sync.pull(
-                epic_key=self.epic_key,
-                output_path=self.output_path,
-            )
+            if full_pull:
+                self.logger.info("Starting reverse sync...")
+                result = self.reverse_sync.pull(
+                    epic_key=epic_key,
+                    output_path=output_path,
+                )
+            else:
+                self.logger.info(f"Starting reverse sync of {len(dirty)} issue(s)...")
+                self.stats.targeted_syncs += 1
+                result = self.reverse_sync.pull_issues(
+                    epic_key=epic_key,
+                    issue_keys=dirty.keys(),
+                    output_path=output_path,
+                    payloads=dirty,
+                )
 
             if result.success:
                 self.stats.syncs_successful += 1
@@ -565,6 +637,8 @@ class WebhookServer:
             "syncs_triggered": self.stats.syncs_triggered,
             "syncs_successful": self.stats.syncs_successful,
             "syncs_failed": self.stats.syncs_failed,
+            "targeted_syncs": self.stats.targeted_syncs,
+            "http": self._server.stats_snapshot() if self._server else None,
         }
 
 
@@ -18,38 +18,17 @@ This file now contains only:
 - run_sync (main sync operation)
 - main() CLI entry point
 - run() CLI runner
+
+Command modules, adapters and application services are imported inside the
+branch that uses them, so a run only pays for the command it selects.
 """
 
 import argparse
 import logging
+import os
 import sys
 from pathlib import Path
 
-from spectryn.adapters import ADFFormatter, EnvironmentConfigProvider, JiraAdapter, MarkdownParser
-from spectryn.application import SyncOrchestrator
-from spectryn.core.domain.events import EventBus
-
-from .commands.backup import (
-    list_backups,
-    list_rollback_points,
-    list_sessions,
-    run_diff,
-    run_restore,
-    run_rollback,
-    run_rollback_preview,
-    run_rollback_to_timestamp,
-)
-from .commands.fields import run_generate_field_mapping, run_list_custom_fields, run_list_sprints
-from .commands.pull import run_bidirectional_sync, run_pull
-from .commands.snapshot import run_clear_snapshot, run_list_snapshots
-from .commands.sync import (
-    run_attachment_sync,
-    run_multi_epic,
-    run_multi_tracker_sync,
-    run_parallel_files,
-    run_sync_links,
-)
-from .commands.watch import run_schedule, run_watch, run_webhook
 from .exit_codes import ExitCode
 from .output import Console, Symbols
 from .parser import create_parser
@@ -143,6 +122,13 @@ def run_sync(
     Returns:
         Exit code (0 for success, 1 for errors).
     """
+    from spectryn.adapters.config import EnvironmentConfigProvider
+    from spectryn.adapters.formatters import ADFFormatter
+    from spectryn.adapters.jira import JiraAdapter
+    from spectryn.adapters.parsers import MarkdownParser
+    from spectryn.application.sync import SyncOrchestrator
+    from spectryn.core.domain.events import EventBus
+
     # Load configuration with optional config file
     config_file = Path(args.config) if args.config else None
     config_provider = EnvironmentConfigProvider(
@@ -194,6 +180,9 @@ def run_sync(
     console.info(f"Mode: {'Execute' if args.execute else 'Dry-run'}")
     if getattr(args, "incremental", False):
         console.info("Incremental: Enabled (only changed stories)")
+    concurrency = getattr(args, "concurrency", 1)
+    if isinstance(concurrency, int) and concurrency > 1:
+        console.info(f"Concurrency: {concurrency} stories per phase")
     if args.execute and config.sync.backup_enabled:
         console.info("Backup: Enabled")
 
@@ -254,6 +243,9 @@ def run_sync(
     config.sync.incremental = getattr(args, "incremental", False)
     config.sync.force_full_sync = getattr(args, "force_full_sync", False)
 
+    # Configure per-phase concurrency
+    config.sync.concurrency = concurrency if isinstance(concurrency, int) and concurrency > 1 else 1
+
     # Configure source file update (writeback tracker info)
     config.sync.update_source_file = getattr(args, "update_source", False)
 
@@ -272,6 +264,31 @@ def run_sync(
         state_store=state_store,
     )
 
+    # Optionally drive the sync phases through the async adapter
+    if getattr(args, "async_mode", False) is True:
+        try:
+            async_tracker = tracker.get_async_client()
+        except ImportError:
+            console.warning("aiohttp is not installed; falling back to synchronous sync")
+        else:
+            from spectryn.application.sync import AsyncSyncOrchestrator
+
+            orchestrator = AsyncSyncOrchestrator(
+                tracker=tracker,
+                parser=parser,
+                formatter=formatter,
+                config=config.sync,
+                async_tracker=async_tracker,
+                event_bus=event_bus,
+                state_store=state_store,
+                max_concurrency=(
+                    concurrency
+                    if isinstance(concurrency, int) and concurrency > 1
+                    else AsyncSyncOrchestrator.DEFAULT_CONCURRENCY
+                ),
+            )
+            console.info("Engine: async")
+
     # Interactive mode
     if args.interactive:
         from .interactive import run_interactive
@@ -1070,81 +1087,113 @@ def main() -> int:
     if args.list_sessions:
         from spectryn.application.sync import StateStore
 
+        from .commands.backup import list_sessions
+
         return list_sessions(StateStore())
 
     # Handle list-backups (requires epic key)
     if args.list_backups:
         from spectryn.application.sync import BackupManager
 
+        from .commands.backup import list_backups
+
         return list_backups(BackupManager(), args.epic)
 
     # Handle restore-backup (requires backup ID, optionally epic key)
     if args.restore_backup:
+        from .commands.backup import run_restore
+
         return run_restore(args)
 
     # Handle diff-backup or diff-latest
     if args.diff_backup or args.diff_latest:
+        from .commands.backup import run_diff
+
         return run_diff(args)
 
     # Handle rollback
     if args.rollback:
+        from .commands.backup import run_rollback
+
         return run_rollback(args)
 
     # Handle list-rollback-points
     if getattr(args, "list_rollback_points", False):
+        from .commands.backup import list_rollback_points
+
         return list_rollback_points(args)
 
     # Handle rollback-preview
     if getattr(args, "rollback_preview", None):
+        from .commands.backup import run_rollback_preview
+
         return run_rollback_preview(args)
 
     # Handle rollback-to-timestamp
     if getattr(args, "rollback_to_timestamp", None):
+        from .commands.backup import run_rollback_to_timestamp
+
         return run_rollback_to_timestamp(args)
 
     # Handle bidirectional sync
     if getattr(args, "bidirectional", False):
         if not args.input or not args.epic:
             parser.error("--bidirectional requires --input/-i and --epic/-e to be specified")
+        from .commands.pull import run_bidirectional_sync
+
         return run_bidirectional_sync(args)
 
     # Handle pull (reverse sync from Jira to markdown)
     if args.pull:
         if not args.epic:
             parser.error("--pull requires --epic/-e to be specified")
+        from .commands.pull import run_pull
+
         return run_pull(args)
 
     # Handle list-snapshots
     if args.list_snapshots:
+        from .commands.snapshot import run_list_snapshots
+
         return run_list_snapshots()
 
     # Handle clear-snapshot
     if args.clear_snapshot:
         if not args.epic:
             parser.error("--clear-snapshot requires --epic/-e to be specified")
+        from .commands.snapshot import run_clear_snapshot
+
         return run_clear_snapshot(args.epic)
 
     # Handle watch mode
     if args.watch:
-        if not args.input or not args.epic:
-            parser.error("--watch requires --input/-i and --epic/-e to be specified")
+        if not (args.input or getattr(args, "input_dir", None)) or not args.epic:
+            parser.error(
+                "--watch requires --input/-f or --input-dir/-d and --epic/-e to be specified"
+            )
+        from .commands.watch import run_watch
+
         return run_watch(args)
 
     # Handle scheduled sync
     if args.schedule:
         if not args.input or not args.epic:
             parser.error("--schedule requires --input/-i and --epic/-e to be specified")
+        from .commands.watch import run_schedule
+
         return run_schedule(args)
 
     # Handle webhook server
     if args.webhook:
         if not args.epic:
             parser.error("--webhook requires --epic/-e to be specified")
+        from .commands.watch import run_webhook
+
         return run_webhook(args)
 
     # Handle WebSocket server
     if getattr(args, "websocket", False):
-        from .commands import run_websocket
+        from .commands.watch import run_websocket
 
         # Handle --no-aiohttp flag
         if getattr(args, "no_aiohttp", False):
@@ -1167,6 +1216,8 @@ def main() -> int:
     if args.multi_epic or args.list_epics:
         if not args.input:
             parser.error("--multi-epic and --list-epics require --input/-i to be specified")
+        from .commands.sync import run_multi_epic
+
         return run_multi_epic(args)
 
     # Handle parallel file processing
@@ -1177,12 +1228,16 @@ def main() -> int:
             parser.error(
                 "--parallel-files requires --input-dir, --input, or --input-files to be specified"
             )
+        from .commands.sync import run_parallel_files
+
         return run_parallel_files(args)
 
     # Handle multi-tracker sync
     if getattr(args, "multi_tracker", False) or getattr(args, "trackers", None):
         if not args.input:
             parser.error("--multi-tracker requires --input/-i to be specified")
+        from .commands.sync import run_multi_tracker_sync
+
         return run_multi_tracker_sync(args)
 
     # Handle link sync
@@ -1191,23 +1246,33 @@ def main() -> int:
             parser.error(
                 "--sync-links and --analyze-links require --input/-i and --epic/-e to be specified"
             )
+        from .commands.sync import run_sync_links
+
         return run_sync_links(args)
 
     # Handle attachment sync
     if args.sync_attachments:
         if not args.input or not args.epic:
             parser.error("--sync-attachments requires --input/-f and --epic/-e to be specified")
+        from .commands.sync import run_attachment_sync
+
         return run_attachment_sync(args)
 
     # Handle field mapping commands
     if args.list_custom_fields:
+        from .commands.fields import run_list_custom_fields
+
         return run_list_custom_fields(args)
 
     if args.generate_field_mapping:
+        from .commands.fields import run_generate_field_mapping
+
         return run_generate_field_mapping(args)
 
     # Handle sprint listing
     if args.list_sprints:
+        from .commands.fields import run_list_sprints
+
         return run_list_sprints(args)
 
     # Handle resume-session (loads args from session)
@@ -1577,12 +1642,46 @@ def main() -> int:
             health_server.stop()
 
 
+def _enable_parse_cache() -> None:
+    """
+    Install the persistent parse cache for this process.
+
+    Set ``SPECTRA_PARSE_CACHE=0`` to disable it, or ``SPECTRA_PARSE_CACHE_DIR``
+    to store entries outside the workspace cache directory.
+    """
+    if os.environ.get("SPECTRA_PARSE_CACHE", "1").lower() in ("0", "false", "no", "off"):
+        return
+
+    from spectryn.core.parse_cache import ParseCache, set_parse_cache
+
+    set_parse_cache(ParseCache(os.environ.get("SPECTRA_PARSE_CACHE_DIR") or None))
+
+
+def _enable_parse_processes() -> None:
+    """
+    Let parsers parse large spec directories in worker processes.
+
+    Set ``SPECTRA_PARSE_PROCESSES`` to the number of processes, or to 1 to
+    parse in-process (default: CPU count).
+    """
+    from spectryn.core.parse_pool import set_parse_processes
+
+    try:
+        processes = int(os.environ.get("SPECTRA_PARSE_PROCESSES", "0"))
+    except ValueError:
+        processes = 0
+    set_parse_processes(max(processes, 0))
+
+
 def run() -> None:
     """
     Entry point for the console script.
 
-    Calls main() and exits with its return code.
+    Enables the parse cache and process parsing, calls main() and exits
+    with its return code.
     """
+    _enable_parse_cache()
+    _enable_parse_processes()
     sys.exit(main())
 
 
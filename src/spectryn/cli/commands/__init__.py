@@ -3,32 +3,96 @@ CLI Commands Package - Command handlers for spectra CLI.
 
 This package contains command handler modules extracted from app.py for
 better code organization and maintainability.
+
+Handlers are exported lazily (PEP 562): importing the package is cheap, and
+accessing a handler imports only the module that defines it.
 """
 
-from .backup import (
-    list_backups,
-    list_rollback_points,
-    list_sessions,
-    run_diff,
-    run_restore,
-    run_rollback,
-    run_rollback_preview,
-    run_rollback_to_timestamp,
-)
-from .fields import run_generate_field_mapping, run_list_custom_fields, run_list_sprints
-from .pull import run_bidirectional_sync, run_pull
-from .rest_api import run_rest_api
-from .snapshot import run_clear_snapshot, run_list_snapshots
-from .sync import (
-    run_attachment_sync,
-    run_multi_epic,
-    run_multi_tracker_sync,
-    run_parallel_files,
-    run_sync,
-    run_sync_links,
-)
-from .validation import validate_markdown
-from .watch import run_schedule, run_watch, run_webhook, run_websocket
+import importlib
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from .backup import (
+        list_backups,
+        list_rollback_points,
+        list_sessions,
+        run_diff,
+        run_restore,
+        run_rollback,
+        run_rollback_preview,
+        run_rollback_to_timestamp,
+    )
+    from .fields import run_generate_field_mapping, run_list_custom_fields, run_list_sprints
+    from .pull import run_bidirectional_sync, run_pull
+    from .rest_api import run_rest_api
+    from .snapshot import run_clear_snapshot, run_list_snapshots
+    from .sync import (
+        run_attachment_sync,
+        run_multi_epic,
+        run_multi_tracker_sync,
+        run_parallel_files,
+        run_sync,
+        run_sync_links,
+    )
+    from .validation import validate_markdown
+    from .watch import run_schedule, run_watch, run_webhook, run_websocket
+
+
+# Command handler -> module that defines it
+_COMMANDS: dict[str, str] = {
+    # Backup commands
+    "list_backups": "backup",
+    "list_rollback_points": "backup",
+    "list_sessions": "backup",
+    "run_diff": "backup",
+    "run_restore": "backup",
+    "run_rollback": "backup",
+    "run_rollback_preview": "backup",
+    "run_rollback_to_timestamp": "backup",
+    # Field commands
+    "run_generate_field_mapping": "fields",
+    "run_list_custom_fields": "fields",
+    "run_list_sprints": "fields",
+    # Pull commands
+    "run_bidirectional_sync": "pull",
+    "run_pull": "pull",
+    # API commands
+    "run_rest_api": "rest_api",
+    # Snapshot commands
+    "run_clear_snapshot": "snapshot",
+    "run_list_snapshots": "snapshot",
+    # Sync commands
+    "run_attachment_sync": "sync",
+    "run_multi_epic": "sync",
+    "run_multi_tracker_sync": "sync",
+    "run_parallel_files": "sync",
+    "run_sync": "sync",
+    "run_sync_links": "sync",
+    # Validation
+    "validate_markdown": "validation",
+    # Watch/Schedule commands
+    "run_schedule": "watch",
+    "run_watch": "watch",
+    "run_webhook": "watch",
+    "run_websocket": "watch",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a command handler on first access."""
+    module_name = _COMMANDS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes including not-yet-imported handlers."""
+    return sorted(set(globals()) | set(_COMMANDS))
 
 
 __all__ = [
@@ -581,6 +581,7 @@ def run_multi_tracker_sync(args) -> int:
     from spectryn.adapters.parsers import MarkdownParser
     from spectryn.application.sync.multi_tracker import (
         MultiTrackerSyncOrchestrator,
+        SyncStrategy,
         TrackerTarget,
     )
     from spectryn.cli.logging import setup_logging
@@ -647,6 +648,14 @@ def run_multi_tracker_sync(args) -> int:
         console.error("No tracker targets specified. Use --trackers type:epic_key")
         return ExitCode.CONFIG_ERROR
 
+    # Primary first when one is named, otherwise all trackers at once
+    strategy_arg = getattr(args, "tracker_strategy", None)
+    if strategy_arg:
+        strategy = SyncStrategy(strategy_arg)
+    else:
+        strategy = SyncStrategy.PRIMARY_FIRST if primary_tracker else SyncStrategy.PARALLEL
+    concurrency = max(getattr(args, "concurrency", 1) or 1, 1)
+
     # Create orchestrator
     parser = MarkdownParser()
     formatter = ADFFormatter()
@@ -655,6 +664,7 @@ def run_multi_tracker_sync(args) -> int:
         parser=parser,
         config=config.sync,
         formatter=formatter,
+        strategy=strategy,
     )
 
     # Add targets
@@ -674,6 +684,7 @@ def run_multi_tracker_sync(args) -> int:
                         name=name,
                         is_primary=target_config.get("is_primary", False),
                         formatter=formatter,
+                        max_concurrency=concurrency,
                     )
                 )
                 console.success(f"Added: {name}")
@@ -705,7 +716,8 @@ def run_multi_tracker_sync(args) -> int:
         icon = "success" if status.success else "fail"
         console.item(
             f"{status.tracker_name}: {status.stories_synced} synced, "
-            f"{status.stories_created} created, {status.stories_updated} updated",
+            f"{status.stories_created} created, {status.stories_updated} updated "
+            f"({status.duration_seconds:.2f}s)",
             icon,
         )
         if status.errors:
@@ -34,8 +34,8 @@ def run_watch(args) -> int:
     """
     Run watch mode - auto-sync on file changes.
 
-    Monitors the markdown file and triggers sync whenever
-    changes are detected.
+    Monitors the markdown file, or the story files of a directory, and
+    triggers a sync of the changed files whenever changes are detected.
 
     Args:
         args: Parsed command-line arguments.
@@ -57,13 +57,18 @@ def run_watch(args) -> int:
         quiet=getattr(args, "quiet", False),
     )
 
-    markdown_path = args.input
+    input_dir = getattr(args, "input_dir", None)
+    markdown_path = args.input or input_dir
     epic_key = args.epic
     debounce = getattr(args, "debounce", 2.0)
     poll_interval = getattr(args, "poll_interval", 1.0)
+    backend = getattr(args, "watch_backend", "auto")
     dry_run = not getattr(args, "execute", False)
 
     # Validate markdown exists
+    if not args.input and not Path(markdown_path).is_dir():
+        console.error(f"Directory not found: {markdown_path}")
+        return ExitCode.FILE_NOT_FOUND
     if not Path(markdown_path).exists():
         console.error(f"Markdown file not found: {markdown_path}")
         return ExitCode.FILE_NOT_FOUND
@@ -134,6 +139,7 @@ def run_watch(args) -> int:
         debounce_seconds=debounce,
         poll_interval=poll_interval,
         on_change_detected=display.show_change_detected,
+        backend=backend,
         on_sync_start=display.show_sync_start,
         on_sync_complete=display.show_sync_complete,
     )
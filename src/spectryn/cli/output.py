@@ -7,8 +7,11 @@ Provides pretty-printed output with colors and formatting.
 import sys
 from dataclasses import dataclass
 from enum import Enum
+from typing import TYPE_CHECKING
 
-from spectryn.application.sync import SyncResult
+
+if TYPE_CHECKING:
+    from spectryn.application.sync import SyncResult
 
 
 # =============================================================================
@@ -1395,7 +1398,7 @@ class Console:
             self.print(f"*** {banner} ***")
         self.print()
 
-    def sync_result(self, result: SyncResult) -> None:
+    def sync_result(self, result: "SyncResult") -> None:
         """
         Print a formatted sync result summary.
 
@@ -238,6 +238,20 @@ def _add_execution_arguments(parser: argparse.ArgumentParser) -> None:
         action="store_true",
         help="Force full sync even when --incremental is set",
     )
+    group.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Process up to N stories concurrently within each sync phase (default: 1)",
+    )
+    group.add_argument(
+        "--async",
+        dest="async_mode",
+        action="store_true",
+        help="Run sync phases on the asyncio engine (requires aiohttp; "
+        "uses --concurrency as the in-flight request limit)",
+    )
     parser.add_argument(
         "--update-source",
         action="store_true",
@@ -739,6 +753,14 @@ def _add_watch_arguments(parser: argparse.ArgumentParser) -> None:
         metavar="SECONDS",
         help="How often to check for file changes (default: 1.0)",
     )
+    parser.add_argument(
+        "--watch-backend",
+        type=str,
+        choices=["auto", "inotify", "poll"],
+        default="auto",
+        help="How watch mode detects changes: inotify (Linux), stat polling, "
+        "or auto to use inotify where available (default: auto)",
+    )
 
 
 def _add_schedule_arguments(parser: argparse.ArgumentParser) -> None:
@@ -1108,6 +1130,14 @@ def _add_multi_tracker_arguments(parser: argparse.ArgumentParser) -> None:
         metavar="NAME",
         help="Name of primary tracker for ID generation in multi-tracker mode",
     )
+    parser.add_argument(
+        "--tracker-strategy",
+        type=str,
+        choices=["parallel", "sequential", "primary_first"],
+        metavar="STRATEGY",
+        help="How to sync multi-tracker targets: parallel, sequential or primary_first "
+        "(default: primary_first with --primary-tracker, otherwise parallel)",
+    )
 
 
 def _add_attachment_arguments(parser: argparse.ArgumentParser) -> None:
@@ -5,15 +5,28 @@ Events are immutable records of something that occurred.
 They enable loose coupling and audit trails.
 """
 
+import logging
+import threading
+from collections import deque
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 
 from .value_objects import IssueKey, StoryId
 
 
+if TYPE_CHECKING:
+    from spectryn.core.ports.event_store import EventStorePort
+
+
+logger = logging.getLogger(__name__)
+
+# Events kept in EventBus history by default
+DEFAULT_HISTORY_LIMIT = 10_000
+
+
 @dataclass(frozen=True)
 class DomainEvent:
     """Base class for all domain events."""
@@ -190,11 +203,43 @@ class EventBus:
     Simple event bus for publishing and subscribing to domain events.
 
     This enables loose coupling between components.
+
+    Published events are kept in a bounded history (a ring buffer), so
+    long-running modes (watch, scheduler, webhook server) use flat memory.
+    Events evicted from the history can be spilled to an event store, and
+    noisy event types can be sampled. Handlers always receive every event.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        history_limit: int | None = DEFAULT_HISTORY_LIMIT,
+        history_sampling: dict[type[DomainEvent], int] | None = None,
+        spill_store: "EventStorePort | None" = None,
+        spill_stream_id: str = "history:events",
+        spill_batch_size: int = 100,
+    ) -> None:
+        """
+        Initialize the event bus.
+
+        Args:
+            history_limit: Maximum events kept in history (None for unbounded).
+            history_sampling: Keep only 1 in N events of these types in history.
+            spill_store: Event store that events evicted from history are appended to.
+            spill_stream_id: Stream receiving spilled events.
+            spill_batch_size: Evicted events buffered per append to the spill store.
+        """
         self._handlers: dict[type[DomainEvent], list[Callable[[DomainEvent], None]]] = {}
-        self._history: list[DomainEvent] = []
+        self._history: deque[tuple[int, DomainEvent]] = deque(maxlen=history_limit)
+        self._history_sampling = dict(history_sampling or {})
+        self._sample_counts: dict[type[DomainEvent], int] = {}
+        self._cursor = 0
+        self._history_lock = threading.Lock()
+
+        self._spill_store = spill_store
+        self._spill_stream_id = spill_stream_id
+        self._spill_batch_size = spill_batch_size
+        self._spill_pending: list[DomainEvent] = []
+        self._spill_lock = threading.Lock()
 
     def subscribe(
         self,
@@ -208,7 +253,7 @@ class EventBus:
 
     def publish(self, event: DomainEvent) -> None:
         """Publish an event to all subscribers."""
-        self._history.append(event)
+        self._record(event)
 
         # Call specific handlers
         for handler in self._handlers.get(type(event), []):
@@ -218,10 +263,65 @@ class EventBus:
         for handler in self._handlers.get(DomainEvent, []):
             handler(event)
 
-    def get_history(self) -> list[DomainEvent]:
-        """Get all published events."""
-        return self._history.copy()
+    def _record(self, event: DomainEvent) -> None:
+        """Add an event to history, evicting (and spilling) the oldest if full."""
+        with self._history_lock:
+            rate = self._history_sampling.get(type(event), 1)
+            if rate > 1:
+                seen = self._sample_counts.get(type(event), 0)
+                self._sample_counts[type(event)] = seen + 1
+                if seen % rate:
+                    return
+
+            full = self._history.maxlen is not None and len(self._history) == self._history.maxlen
+            if full and self._spill_store is not None:
+                self._spill_pending.append(self._history[0][1] if self._history else event)
+            spill_due = len(self._spill_pending) >= self._spill_batch_size
+
+            self._cursor += 1
+            self._history.append((self._cursor, event))
+
+        if spill_due:
+            self.flush_spill()
+
+    def flush_spill(self) -> None:
+        """Append events evicted from history to the spill store."""
+        if self._spill_store is None:
+            return
+
+        with self._spill_lock:
+            with self._history_lock:
+                batch, self._spill_pending = self._spill_pending, []
+            if not batch:
+                return
+            try:
+                self._spill_store.append(self._spill_stream_id, batch)
+            except Exception as e:
+                # History is best-effort; never fail a publish over it
+                logger.warning(f"Failed to spill {len(batch)} events from history: {e}")
+
+    @property
+    def history_cursor(self) -> int:
+        """Get the cursor of the most recent event in history (0 if none yet)."""
+        return self._cursor
+
+    def get_history(self, since: int | None = None) -> list[DomainEvent]:
+        """
+        Get published events still held in history.
+
+        Args:
+            since: Only return events recorded after this cursor (see
+                ``history_cursor``). Events already evicted are not returned.
+
+        Returns:
+            Events in publish order.
+        """
+        with self._history_lock:
+            if since is None:
+                return [event for _, event in self._history]
+            return [event for cursor, event in self._history if cursor > since]
 
     def clear_history(self) -> None:
         """Clear event history."""
-        self._history.clear()
+        with self._history_lock:
+            self._history.clear()
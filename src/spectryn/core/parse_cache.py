@@ -0,0 +1,492 @@
+"""
+Parse Cache - Persistent, content-addressed cache of parsed documents.
+
+Every command that reads a spec parses it from scratch, which dominates
+run time for large markdown trees that rarely change. The parse cache
+stores the ``UserStory``/``Epic`` graph a parser produced, keyed by:
+
+- the document content (and path, for file sources)
+- the parser name, operation and options
+- a fingerprint of the parser and domain model source code
+
+so identical input to an identical parser is served from disk. Upgrading
+spectryn, or editing a parser, changes the fingerprint and old entries are
+simply never read again.
+
+Entries are zlib-compressed JSON under the workspace cache directory.
+Decoding only ever builds domain model objects (entities, value objects,
+enums), so a file planted in the cache directory cannot execute code the
+way an unpickled one could. Caching is applied transparently to every
+``DocumentParserPort`` implementation; it is disabled until
+``set_parse_cache`` installs a cache (the console entry point does this,
+see ``SPECTRA_PARSE_CACHE``).
+"""
+
+from __future__ import annotations
+
+import contextvars
+import dataclasses
+import functools
+import hashlib
+import json
+import logging
+import os
+import sys
+import threading
+import zlib
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date, datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any, TypeVar
+
+from spectryn.core.domain import entities, enums, value_objects
+from spectryn.core.ports.document_parser import DocumentParserPort
+
+
+logger = logging.getLogger(__name__)
+
+
+T = TypeVar("T")
+
+
+# Bump when the entry layout or key derivation changes
+PARSE_CACHE_FORMAT = 2
+
+# Strings at least this long, or containing newlines, are document content
+# rather than paths (mirrors how parsers interpret their source argument)
+_MAX_PATH_LENGTH = 4096
+
+_MISSING = object()
+
+# Set while a cached parse runs, so nested parser calls are not cached twice
+_in_cached_parse: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "spectryn_in_cached_parse", default=False
+)
+
+
+@dataclass
+class ParseCacheStats:
+    """
+    Parse cache counters.
+
+    Attributes:
+        hits: Lookups served from the cache
+        misses: Lookups that found no entry
+        writes: Entries stored
+        errors: Unreadable entries or failed writes
+    """
+
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    errors: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        """Convert to dictionary."""
+        return dataclasses.asdict(self)
+
+
+class ParseCache:
+    """
+    Content-addressed store of parse results.
+
+    Example:
+        >>> set_parse_cache(ParseCache())
+        >>> MarkdownParser().parse_stories("EPIC.md")  # parses and stores
+        >>> MarkdownParser().parse_stories("EPIC.md")  # served from cache
+    """
+
+    def __init__(self, cache_dir: str | Path | None = None, compress_level: int = 6) -> None:
+        """
+        Initialize the parse cache.
+
+        Args:
+            cache_dir: Directory for entries. Defaults to ``parse`` under the
+                current workspace's cache directory, resolved on first use.
+            compress_level: zlib compression level for stored entries.
+        """
+        self._cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+        self.compress_level = compress_level
+        self.stats = ParseCacheStats()
+        self._lock = threading.Lock()
+
+    @property
+    def cache_dir(self) -> Path:
+        """Get the directory holding cache entries."""
+        if self._cache_dir is None:
+            from spectryn.core.workspace import get_workspace_manager
+
+            self._cache_dir = get_workspace_manager().current_paths.cache_dir / "parse"
+        return self._cache_dir
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.bin"
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self.stats, counter, getattr(self.stats, counter) + 1)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Get a cached parse result.
+
+        Args:
+            key: Entry key (see ``make_key``)
+            default: Value returned when there is no usable entry
+
+        Returns:
+            A fresh copy of the cached result, or ``default``.
+        """
+        path = self._entry_path(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            self._count("misses")
+            return default
+        except OSError as e:
+            logger.debug(f"Cannot read parse cache entry {path}: {e}")
+            self._count("errors")
+            return default
+
+        try:
+            value = _decode(json.loads(zlib.decompress(data)))
+        except Exception as e:
+            # Truncated, corrupt or no longer decodable: drop it and re-parse
+            logger.debug(f"Discarding unreadable parse cache entry {path}: {e}")
+            self._count("errors")
+            path.unlink(missing_ok=True)
+            return default
+
+        self._count("hits")
+        return value
+
+    def put(self, key: str, value: Any) -> bool:
+        """
+        Store a parse result.
+
+        The value is serialized immediately, so later mutation by the caller
+        does not affect the stored entry.
+
+        Args:
+            key: Entry key (see ``make_key``)
+            value: Parse result to store
+
+        Returns:
+            True if the entry was written.
+        """
+        try:
+            data = zlib.compress(
+                json.dumps(_encode(value), separators=(",", ":")).encode("utf-8"),
+                self.compress_level,
+            )
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Parse result for {key} is not cacheable: {e}")
+            self._count("errors")
+            return False
+
+        path = self._entry_path(key)
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path.write_bytes(data)
+            temp_path.replace(path)
+        except OSError as e:
+            logger.debug(f"Cannot write parse cache entry {path}: {e}")
+            temp_path.unlink(missing_ok=True)
+            self._count("errors")
+            return False
+
+        self._count("writes")
+        return True
+
+    def clear(self) -> int:
+        """
+        Remove all cache entries.
+
+        Returns:
+            Number of entries removed.
+        """
+        if not self.cache_dir.exists():
+            return 0
+
+        removed = 0
+        for path in self.cache_dir.glob("*/*.bin"):
+            path.unlink(missing_ok=True)
+            removed += 1
+        return removed
+
+
+@functools.cache
+def _domain_types() -> dict[str, type]:
+    """Dataclasses and enums an entry may contain, by class name."""
+    types: dict[str, type] = {}
+    for module in (entities, value_objects, enums):
+        for obj in vars(module).values():
+            if (
+                isinstance(obj, type)
+                and obj.__module__ == module.__name__
+                and (dataclasses.is_dataclass(obj) or issubclass(obj, Enum))
+            ):
+                types[obj.__qualname__] = obj
+    return types
+
+
+def _encode(value: Any) -> Any:
+    """
+    Convert a parse result to JSON-compatible data.
+
+    JSON objects are reserved for tagged values (``{"t": kind, ...}``), so
+    tuples, dicts, datetimes, enums and domain dataclasses survive the round
+    trip with their types.
+
+    Raises:
+        TypeError: If the value contains anything but builtins and domain types.
+    """
+    if value is None or (
+        isinstance(value, str | bool | int | float) and not isinstance(value, Enum)
+    ):
+        return value
+    if isinstance(value, list):
+        return [_encode(item) for item in value]
+    if isinstance(value, tuple):
+        return {"t": "tuple", "v": [_encode(item) for item in value]}
+    if isinstance(value, dict):
+        return {"t": "dict", "v": [[_encode(k), _encode(v)] for k, v in value.items()]}
+    if isinstance(value, datetime):
+        return {"t": "datetime", "v": value.isoformat()}
+    if isinstance(value, date):
+        return {"t": "date", "v": value.isoformat()}
+
+    name = type(value).__qualname__
+    if _domain_types().get(name) is type(value):
+        if isinstance(value, Enum):
+            return {"t": "enum", "c": name, "v": value.name}
+        if dataclasses.is_dataclass(value):
+            fields = {f.name: _encode(getattr(value, f.name)) for f in dataclasses.fields(value)}
+            return {"t": "obj", "c": name, "v": fields}
+    raise TypeError(f"cannot encode {type(value).__module__}.{name}")
+
+
+def _decode(data: Any) -> Any:
+    """
+    Rebuild a parse result from ``_encode`` output.
+
+    Dataclasses are restored field by field without calling ``__init__``
+    (as unpickling did), so stored values are not re-validated.
+
+    Raises:
+        ValueError: If the data references an unknown tag, type or field.
+    """
+    if isinstance(data, list):
+        return [_decode(item) for item in data]
+    if not isinstance(data, dict):
+        return data
+
+    kind = data.get("t")
+    if kind == "tuple":
+        return tuple(_decode(item) for item in data["v"])
+    if kind == "dict":
+        return {_decode(k): _decode(v) for k, v in data["v"]}
+    if kind == "datetime":
+        return datetime.fromisoformat(data["v"])
+    if kind == "date":
+        return date.fromisoformat(data["v"])
+
+    cls = _domain_types().get(data.get("c", ""))
+    if kind == "enum" and cls is not None and issubclass(cls, Enum):
+        return cls[data["v"]]
+    if kind == "obj" and cls is not None and dataclasses.is_dataclass(cls):
+        names = {f.name for f in dataclasses.fields(cls)}
+        if not names.issuperset(data["v"]):
+            raise ValueError(f"unknown fields for {cls.__qualname__}")
+        obj = cls.__new__(cls)
+        for name, value in data["v"].items():
+            object.__setattr__(obj, name, _decode(value))
+        return obj
+    raise ValueError(f"unknown parse cache value: {kind!r} {data.get('c')!r}")
+
+
+def parser_fingerprint(parser_class: type) -> str | None:
+    """
+    Fingerprint a parser implementation.
+
+    Hashes the spectryn version, the class's ``parse_cache_version``, and the
+    source files of every package defining a parser class in its MRO plus the
+    domain model, so any change to parsing code or entities yields a new
+    fingerprint.
+
+    Args:
+        parser_class: DocumentParserPort subclass
+
+    Returns:
+        Hex fingerprint, or None if the implementation's source cannot be found.
+    """
+    return _parser_fingerprint(parser_class)
+
+
+@functools.cache
+def _parser_fingerprint(parser_class: type) -> str | None:
+    from spectryn import __version__
+
+    directories = {Path(entities.__file__).parent}
+    for cls in parser_class.__mro__:
+        if not issubclass(cls, DocumentParserPort):
+            continue
+        module_file = getattr(sys.modules.get(cls.__module__), "__file__", None)
+        if module_file is None:
+            return None
+        directories.add(Path(module_file).parent)
+
+    digest = hashlib.sha256(f"{PARSE_CACHE_FORMAT}:{__version__}".encode())
+    digest.update(str(getattr(parser_class, "parse_cache_version", "")).encode())
+    try:
+        for directory in sorted(directories):
+            for path in sorted(directory.glob("*.py")):
+                digest.update(path.name.encode())
+                digest.update(path.read_bytes())
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def _canonical(value: Any) -> str | None:
+    """Render an option value deterministically, or None if unsupported."""
+    if value is None or isinstance(value, str | bytes | int | float | bool | Enum):
+        return repr(value)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        fields = {f.name: getattr(value, f.name) for f in dataclasses.fields(value)}
+        rendered = _canonical(fields)
+        return None if rendered is None else f"{type(value).__qualname__}{rendered}"
+
+    if isinstance(value, dict):
+        items = [(_canonical(k), _canonical(v)) for k, v in value.items()]
+    elif isinstance(value, list | tuple | set | frozenset):
+        items = [(_canonical(item), "") for item in value]
+    else:
+        return None
+    if any(k is None or v is None for k, v in items):
+        return None
+    if isinstance(value, dict | set | frozenset):
+        items.sort()
+    return f"{type(value).__name__}[{','.join(f'{k}:{v}' for k, v in items)}]"
+
+
+def _read_source(source: Any) -> tuple[str, bytes] | None:
+    """
+    Resolve a parser source to (identity, content bytes).
+
+    Returns None for sources that cannot be cached, such as directories.
+    """
+    if isinstance(source, str) and ("\n" in source or len(source) >= _MAX_PATH_LENGTH):
+        return "", source.encode("utf-8")
+    if not isinstance(source, str | Path):
+        return None
+
+    path = Path(source)
+    try:
+        if path.is_file():
+            # Parsers may derive IDs or titles from the file name
+            return str(path.resolve()), path.read_bytes()
+        if path.exists():
+            return None
+    except OSError:
+        return None
+
+    # A short string that is not a file is parsed as content
+    return ("", source.encode("utf-8")) if isinstance(source, str) else None
+
+
+def make_key(
+    parser: DocumentParserPort, operation: str, source_id: str, content: bytes
+) -> str | None:
+    """
+    Derive the cache key for parsing content with a parser.
+
+    Args:
+        parser: Parser instance
+        operation: Parser method name (e.g. ``parse_stories``)
+        source_id: Resolved file path, or empty for content strings
+        content: Document bytes
+
+    Returns:
+        Hex key, or None if the parser's options cannot be represented.
+    """
+    fingerprint = parser_fingerprint(type(parser))
+    options = parser.parse_cache_options()
+    rendered_options = None if options is None else _canonical(options)
+    if fingerprint is None or rendered_options is None:
+        return None
+
+    digest = hashlib.sha256()
+    for part in (
+        fingerprint,
+        f"{type(parser).__module__}.{type(parser).__qualname__}",
+        parser.name,
+        operation,
+        rendered_options,
+        source_id,
+    ):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    digest.update(content)
+    return digest.hexdigest()
+
+
+def cached_parse(
+    parser: DocumentParserPort, operation: str, source: Any, parse: Callable[[], T]
+) -> T:
+    """
+    Run a parse through the installed parse cache.
+
+    Falls through to ``parse`` when no cache is installed, the parser opts
+    out, the source is not cacheable, or another cached parse is already
+    running in this context (e.g. a parser delegating to itself or wrapping
+    another parser).
+
+    Args:
+        parser: Parser instance
+        operation: Parser method name
+        source: Source passed to the parser method
+        parse: Performs the actual parse
+
+    Returns:
+        The parse result.
+    """
+    cache = _parse_cache
+    if cache is None or not parser.parse_cache_enabled or _in_cached_parse.get():
+        return parse()
+
+    resolved = _read_source(source)
+    key = None if resolved is None else make_key(parser, operation, *resolved)
+    if key is None:
+        return parse()
+
+    cached = cache.get(key, _MISSING)
+    if cached is not _MISSING:
+        return cached  # type: ignore[no-any-return]
+
+    token = _in_cached_parse.set(True)
+    try:
+        result = parse()
+    finally:
+        _in_cached_parse.reset(token)
+
+    cache.put(key, result)
+    return result
+
+
+# Global parse cache (disabled until set)
+_parse_cache: ParseCache | None = None
+
+
+def get_parse_cache() -> ParseCache | None:
+    """Get the installed parse cache, if any."""
+    return _parse_cache
+
+
+def set_parse_cache(cache: ParseCache | None) -> None:
+    """Install the global parse cache, or disable caching with None."""
+    global _parse_cache
+    _parse_cache = cache
@@ -0,0 +1,188 @@
+"""
+Parse Pool - Parse many documents across processes.
+
+Parsing is pure-Python, regex-heavy CPU work, so threads serialize on the
+GIL. The parse pool ships file paths to worker processes, each holding a
+copy of the parser, and returns the parse results as compact pickles so
+parsing large spec trees scales with core count. Callers keep
+network-bound work (syncing) on threads.
+
+Workers share the parent's parse cache directory, if a parse cache is
+installed (see ``spectryn.core.parse_cache``). They are started with the
+forkserver (or spawn) method, never fork, so callers may be multi-threaded.
+
+Parsers only start pools implicitly (e.g. ``MarkdownParser`` reading a
+directory) once ``set_parse_processes`` opts in; the console entry point
+does this, see ``SPECTRA_PARSE_PROCESSES``.
+
+Example:
+    >>> results = parse_files(MarkdownParser(), paths, operation="parse_epics")
+    >>> for parsed in results:
+    ...     epics = parsed.unwrap()
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from spectryn.core.exceptions import ParserError
+from spectryn.core.parse_cache import ParseCache, get_parse_cache, set_parse_cache
+from spectryn.core.ports.document_parser import DocumentParserPort
+
+
+logger = logging.getLogger(__name__)
+
+
+# Below this many files, process startup costs more than it saves
+MIN_FILES_FOR_PROCESSES = 8
+
+# Forking a multi-threaded process can deadlock on locks held by other
+# threads (logging handlers, caches), so workers never start with fork
+_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+# Per-process state, set by the pool initializer
+_worker_parser: DocumentParserPort | None = None
+
+
+@dataclass
+class ParsedFile:
+    """
+    Result of parsing a single file.
+
+    Attributes:
+        path: File that was parsed
+        result: Return value of the parser operation
+        error: Exception raised by the parser, if it failed
+    """
+
+    path: Path
+    result: Any = None
+    error: BaseException | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the file parsed without error."""
+        return self.error is None
+
+    def unwrap(self) -> Any:
+        """Get the result, re-raising the parser's exception if it failed."""
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+def can_parse_in_processes(parser: DocumentParserPort) -> bool:
+    """Check whether a parser can be shipped to worker processes."""
+    try:
+        pickle.dumps(parser)
+    except Exception:
+        return False
+    return True
+
+
+def _init_worker(parser: DocumentParserPort, cache_dir: Path | None) -> None:
+    global _worker_parser
+    _worker_parser = parser
+    set_parse_cache(ParseCache(cache_dir) if cache_dir else None)
+
+
+def _parse_in_worker(operation: str, path: Path) -> bytes:
+    """Parse one file in a worker, returning the pickled outcome."""
+    assert _worker_parser is not None
+    return _dump_outcome(_parse_one(_worker_parser, operation, path))
+
+
+def _parse_one(parser: DocumentParserPort, operation: str, path: Path) -> ParsedFile:
+    try:
+        return ParsedFile(path, result=getattr(parser, operation)(path))
+    except Exception as e:
+        return ParsedFile(path, error=e)
+
+
+def _dump_outcome(parsed: ParsedFile) -> bytes:
+    try:
+        return pickle.dumps(parsed, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as e:
+        # Unpicklable exception (or result): report it as a parser error
+        error = ParserError(str(parsed.error or e), source=str(parsed.path))
+        return pickle.dumps(ParsedFile(parsed.path, error=error), protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def parse_files(
+    parser: DocumentParserPort,
+    paths: list[Path],
+    operation: str = "parse_stories",
+    max_workers: int | None = None,
+    min_files: int = MIN_FILES_FOR_PROCESSES,
+) -> list[ParsedFile]:
+    """
+    Parse files in worker processes.
+
+    Falls back to parsing in the calling process when there are fewer than
+    ``min_files`` files, only one worker, the parser cannot be pickled, or
+    process pools are unavailable.
+
+    Args:
+        parser: Parser to run; a copy is sent to each worker
+        paths: Files to parse
+        operation: Parser method to call with each path
+        max_workers: Worker processes (default: CPU count)
+        min_files: Minimum number of files worth starting processes for
+
+    Returns:
+        One ParsedFile per path, in input order. Parser exceptions are
+        captured per file rather than raised.
+    """
+    workers = min(max_workers or os.cpu_count() or 1, len(paths))
+    if workers <= 1 or len(paths) < min_files or not can_parse_in_processes(parser):
+        return [_parse_one(parser, operation, path) for path in paths]
+
+    cache = get_parse_cache()
+    cache_dir = cache.cache_dir if cache else None
+    # Several files per task keeps IPC overhead low on large trees
+    chunksize = max(1, len(paths) // (workers * 4))
+
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context(_START_METHOD),
+            initializer=_init_worker,
+            initargs=(parser, cache_dir),
+        ) as executor:
+            payloads = list(
+                executor.map(_parse_in_worker, [operation] * len(paths), paths, chunksize=chunksize)
+            )
+    except (BrokenProcessPool, OSError, NotImplementedError) as e:
+        logger.warning(f"Process pool unavailable ({e}), parsing {len(paths)} files in-process")
+        return [_parse_one(parser, operation, path) for path in paths]
+
+    logger.debug(f"Parsed {len(paths)} files with {workers} processes")
+    return [pickle.loads(payload) for payload in payloads]
+
+
+# Worker processes for implicit parses (1 = parse in-process, 0 = CPU count)
+_parse_processes = 1
+
+
+def get_parse_processes() -> int:
+    """Get the worker processes parsers may start for implicit multi-file parses."""
+    return _parse_processes
+
+
+def set_parse_processes(processes: int) -> None:
+    """
+    Set the worker processes parsers may start for implicit multi-file parses.
+
+    Args:
+        processes: Worker processes (0 = CPU count, 1 = parse in-process)
+    """
+    global _parse_processes
+    _parse_processes = processes
@@ -980,6 +980,7 @@ class SyncConfig:
     incremental: bool = False  # Enable incremental sync (only changed stories)
     incremental_state_dir: str | None = None  # Dir to store sync state
     force_full_sync: bool = False  # Force full sync even if incremental enabled
+    incremental_full_fetch_hours: float = 24.0  # Re-fetch every epic child after this long
 
     # Delta sync settings (field-level)
     delta_sync: bool = False  # Enable delta sync (only changed fields)
@@ -989,6 +990,9 @@ class SyncConfig:
     # Source file update settings
     update_source_file: bool = False  # Write tracker info back to source file
 
+    # Execution settings
+    concurrency: int = 1  # Max stories processed concurrently per phase (1 = sequential)
+
 
 @dataclass
 class AppConfig:
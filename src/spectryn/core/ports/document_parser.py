@@ -23,8 +23,12 @@ Implementations:
 - GoogleSheetsParser: Parse Google Sheets via API
 """
 
+import functools
+import logging
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
 from spectryn.core.domain.entities import Epic, UserStory
 
@@ -41,8 +45,45 @@ class DocumentParserPort(ABC):
 
     Parsers convert source documents (Markdown, YAML, etc.)
     into domain entities.
+
+    ``parse_stories`` and ``parse_epic`` implementations are wrapped so their
+    results are served from the parse cache (``spectryn.core.parse_cache``)
+    when one is installed.
     """
 
+    # Whether results may be cached; parsers whose source is a remote
+    # document ID rather than content must opt out
+    parse_cache_enabled: bool = True
+
+    # Bump to invalidate cached results when output changes for reasons
+    # outside the parser's source code (e.g. bundled data files)
+    parse_cache_version: str = "1"
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        for operation in ("parse_stories", "parse_epic"):
+            method = cls.__dict__.get(operation)
+            if callable(method) and not getattr(method, "__isabstractmethod__", False):
+                setattr(cls, operation, _with_parse_cache(operation, method))
+
+    def parse_cache_options(self) -> dict[str, Any] | None:
+        """
+        Get the options that affect this parser's output.
+
+        Used in parse cache keys. The default collects public instance
+        attributes, skipping loggers; attributes the cache cannot represent
+        (clients, callables) disable caching for the instance. Override to
+        include private state or return None to never cache.
+
+        Returns:
+            Option values, or None if results must not be cached
+        """
+        return {
+            name: value
+            for name, value in vars(self).items()
+            if not name.startswith("_") and not isinstance(value, logging.Logger)
+        }
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -109,3 +150,18 @@ class DocumentParserPort(ABC):
             List of validation error messages (empty if valid)
         """
         ...
+
+
+def _with_parse_cache(operation: str, method: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a parser method so single-source calls go through the parse cache."""
+
+    @functools.wraps(method)
+    def wrapper(self: DocumentParserPort, *args: Any, **kwargs: Any) -> Any:
+        if len(args) != 1 or kwargs:
+            return method(self, *args, **kwargs)
+
+        from spectryn.core.parse_cache import cached_parse
+
+        return cached_parse(self, operation, args[0], lambda: method(self, *args))
+
+    return wrapper
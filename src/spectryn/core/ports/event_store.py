@@ -122,6 +122,28 @@ class EventQuery:
     reverse: bool = False
 
 
+@dataclass
+class ProjectionSnapshot:
+    """
+    Saved projection state for a stream.
+
+    Attributes:
+        name: Projection name (a stream keeps one snapshot per projection).
+        sequence: Sequence number of the last event applied to the state.
+        event_id: ID of that event, to detect streams rewritten since.
+        version: Projection snapshot version.
+        data: JSON-encoded projection state.
+        created_at: When the snapshot was taken.
+    """
+
+    name: str
+    sequence: int
+    event_id: str
+    data: bytes
+    version: str = ""
+    created_at: datetime = field(default_factory=datetime.now)
+
+
 class EventStorePort(ABC):
     """
     Abstract interface for event store implementations.
@@ -151,16 +173,22 @@ class EventStorePort(ABC):
         events: list[DomainEvent],
         expected_version: int | None = None,
         metadata: dict[str, Any] | None = None,
+        sync: bool = True,
     ) -> list[StoredEvent]:
         """
         Append events to a stream.
 
+        All events are written in one operation, so appending a batch is
+        much cheaper than appending its events one by one.
+
         Args:
             stream_id: The stream to append to.
             events: Events to append.
             expected_version: Expected last sequence number for optimistic concurrency.
                               If provided and doesn't match, raises ConcurrencyError.
             metadata: Optional metadata to attach to all events.
+            sync: Whether to flush the events to stable storage before returning.
+                  Stores without a separate sync step ignore it.
 
         Returns:
             List of stored events with assigned sequence numbers.
@@ -263,6 +291,31 @@ class EventStorePort(ABC):
         events = list(self.read(stream_id, from_sequence=info.last_sequence))
         return events[0] if events else None
 
+    def save_snapshot(self, stream_id: str, snapshot: ProjectionSnapshot) -> None:
+        """
+        Save a projection snapshot next to a stream.
+
+        Replaces any snapshot of the same projection. The default
+        implementation does not store snapshots.
+
+        Args:
+            stream_id: The stream the projection was built from.
+            snapshot: The snapshot to save.
+        """
+
+    def load_snapshot(self, stream_id: str, name: str) -> ProjectionSnapshot | None:
+        """
+        Load the latest snapshot of a projection for a stream.
+
+        Args:
+            stream_id: The stream identifier.
+            name: The projection name.
+
+        Returns:
+            The snapshot, or None if there is none.
+        """
+        return None
+
 
 class ConcurrencyError(Exception):
     """
@@ -344,6 +344,11 @@ class ServerConfig:
         cors_origins: Allowed CORS origins (None = disabled).
         enable_subscriptions: Enable WebSocket subscriptions.
         subscription_path: WebSocket endpoint for subscriptions.
+        max_workers: Requests handled concurrently.
+        max_queued_connections: Connections waiting for a worker before
+            new ones are refused with 503.
+        max_request_size: Maximum request body size in bytes.
+        keep_alive_timeout: Idle seconds before a kept-alive connection closes.
     """
 
     host: str = "0.0.0.0"
@@ -357,6 +362,10 @@ class ServerConfig:
     cors_origins: list[str] | None = None
     enable_subscriptions: bool = True
     subscription_path: str = "/graphql/subscriptions"
+    max_workers: int = 16
+    max_queued_connections: int = 64
+    max_request_size: int = 10 * 1024 * 1024  # 10MB
+    keep_alive_timeout: float = 5.0
 
 
 @dataclass
@@ -9,7 +9,9 @@ Implementations:
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass, field
+from datetime import datetime
 from enum import Enum
 from typing import Any
 
@@ -285,6 +287,58 @@ class IssueTrackerPort(ABC):
         """
         ...
 
+    def iter_epic_children(self, epic_key: str) -> Iterator[list[IssueData]]:
+        """
+        Stream the children of an epic page by page.
+
+        Trackers with paginated search APIs override this to yield each page
+        as it arrives. The default yields get_epic_children() as one page.
+
+        Args:
+            epic_key: The epic's key
+
+        Yields:
+            Lists of child issues, one list per page
+        """
+        yield self.get_epic_children(epic_key)
+
+    def get_epic_children_updated_since(
+        self,
+        epic_key: str,
+        since: datetime,
+        child_keys: Sequence[str] = (),
+    ) -> list[IssueData] | None:
+        """
+        Fetch the children of an epic that changed at or after a time.
+
+        Lets callers keep a local snapshot of an epic's children and only
+        re-download what changed. A child counts as changed when it or one
+        of its subtasks was updated. Children removed from the epic are not
+        reported, so callers should still re-fetch everything periodically.
+
+        Args:
+            epic_key: The epic's key
+            since: Timezone-aware high-water mark of the previous fetch
+            child_keys: Children known from the previous fetch, whose
+                subtask changes should be reported too
+
+        Returns:
+            Changed children with the same data get_epic_children() returns,
+            or None if the tracker can't filter by update time
+        """
+        return None
+
+    @property
+    def epic_children_include_subtasks(self) -> bool:
+        """
+        Whether get_epic_children() returns each child with its subtasks.
+
+        Trackers whose epic search already fetches subtasks override this to
+        return True, letting callers reuse those results instead of reading
+        every child again with get_issue().
+        """
+        return False
+
     # -------------------------------------------------------------------------
     # Write Operations
     # -------------------------------------------------------------------------
@@ -404,6 +404,10 @@ class ServerConfig:
         docs_path: Path for API documentation.
         max_request_size: Maximum request body size in bytes.
         request_timeout: Request timeout in seconds.
+        max_workers: Requests handled concurrently.
+        max_queued_connections: Connections waiting for a worker before
+            new ones are refused with 503.
+        keep_alive_timeout: Idle seconds before a kept-alive connection closes.
     """
 
     host: str = "0.0.0.0"
@@ -415,6 +419,9 @@ class ServerConfig:
     docs_path: str = "/docs"
     max_request_size: int = 10 * 1024 * 1024  # 10MB
     request_timeout: float = 30.0
+    max_workers: int = 16
+    max_queued_connections: int = 64
+    keep_alive_timeout: float = 5.0
 
 
 @dataclass
@@ -0,0 +1,216 @@
+"""Tests for ETag / Last-Modified revalidation of GET requests."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from spectryn.adapters.async_base import ConditionalRequestCache, GitHubRateLimiter
+from spectryn.adapters.cache import SqliteCache
+from spectryn.adapters.github.client import GitHubApiClient
+from spectryn.adapters.gitlab.client import GitLabApiClient
+from spectryn.adapters.jira.cached_client import CachedJiraApiClient
+from spectryn.adapters.jira.client import JiraApiClient
+
+
+def _response(status: int = 200, body: dict | None = None, headers: dict | None = None):
+    response = MagicMock()
+    response.status_code = status
+    response.ok = status < 400
+    response.text = "" if body is None else "{...}"
+    response.json.return_value = body
+    response.headers = headers or {}
+    return response
+
+
+class TestConditionalRequestCache:
+    """Tests for ConditionalRequestCache."""
+
+    def test_first_get_is_unconditional(self):
+        cache = ConditionalRequestCache()
+        kwargs: dict = {}
+
+        key, cached = cache.prepare("GET", "https://api/x", kwargs)
+
+        assert key == "http:https://api/x"
+        assert cached is None
+        assert "headers" not in kwargs
+
+    def test_stored_validators_make_get_conditional(self):
+        cache = ConditionalRequestCache()
+        key, _ = cache.prepare("GET", "https://api/x", {"params": {"b": 2, "a": 1}})
+        cache.store(
+            key,
+            _response(headers={"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}),
+            {"id": 1},
+        )
+
+        kwargs = {"params": {"a": 1, "b": 2}, "headers": {"Accept": "json"}}
+        _, cached = cache.prepare("GET", "https://api/x", kwargs)
+
+        assert cached is not None
+        assert kwargs["headers"] == {
+            "Accept": "json",
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+        }
+        assert cache.not_modified(cached) == {"id": 1}
+        assert cache.stats["revalidated"] == 1
+        assert cache.stats["not_modified_rate"] == 1.0
+
+    def test_responses_without_validators_are_not_stored(self):
+        cache = ConditionalRequestCache()
+        key, _ = cache.prepare("GET", "https://api/x", {})
+
+        cache.store(key, _response(headers={}), {"id": 1})
+        cache.store(key, _response(headers={"ETag": MagicMock()}), {"id": 1})
+
+        assert cache.stats["stored"] == 0
+
+    def test_non_get_and_caller_conditionals_are_skipped(self):
+        cache = ConditionalRequestCache()
+
+        assert cache.prepare("POST", "https://api/x", {}) == (None, None)
+        assert cache.prepare("GET", "https://api/x", {"headers": {"If-None-Match": "x"}}) == (
+            None,
+            None,
+        )
+
+    def test_persistent_backend(self, tmp_path):
+        with SqliteCache(db_path=tmp_path / "http.db") as backend:
+            cache = ConditionalRequestCache(backend=backend)
+            key, _ = cache.prepare("GET", "https://api/x", {})
+            cache.store(key, _response(headers={"ETag": '"v1"'}), [{"id": 1}])
+
+            reopened = ConditionalRequestCache(backend=backend)
+            _, cached = reopened.prepare("GET", "https://api/x", {})
+            assert cached == {"etag": '"v1"', "last_modified": None, "body": [{"id": 1}]}
+
+
+@pytest.fixture
+def session():
+    return MagicMock()
+
+
+def _github(session) -> GitHubApiClient:
+    with patch("spectryn.adapters.github.client.requests.Session", return_value=session):
+        return GitHubApiClient(
+            token="token",
+            owner="owner",
+            repo="repo",
+            requests_per_second=10,
+            burst_size=2,
+            conditional_cache=ConditionalRequestCache(),
+        )
+
+
+def _gitlab(session) -> GitLabApiClient:
+    with patch("spectryn.adapters.gitlab.client.requests.Session", return_value=session):
+        return GitLabApiClient(
+            token="token",
+            project_id="1",
+            requests_per_hour=0,
+            conditional_cache=ConditionalRequestCache(),
+        )
+
+
+def _jira(session) -> JiraApiClient:
+    with patch("spectryn.adapters.jira.client.requests.Session", return_value=session):
+        return JiraApiClient(
+            base_url="https://test.atlassian.net",
+            email="user@example.com",
+            api_token="token",
+            requests_per_second=None,
+            conditional_cache=ConditionalRequestCache(),
+        )
+
+
+class TestClientRevalidation:
+    """Tests for conditional GETs in the tracker HTTP clients."""
+
+    @pytest.mark.parametrize("make_client", [_github, _gitlab, _jira])
+    def test_304_is_served_from_stored_body(self, make_client, session):
+        client = make_client(session)
+        session.request.side_effect = [
+            _response(200, {"title": "Issue"}, {"ETag": '"abc"'}),
+            _response(304),
+        ]
+
+        first = client.get("issues/1")
+        second = client.get("issues/1")
+
+        assert first == second == {"title": "Issue"}
+        headers = session.request.call_args_list[1].kwargs["headers"]
+        assert headers["If-None-Match"] == '"abc"'
+        assert client._conditional_cache.stats["revalidated"] == 1
+
+    def test_changed_resource_replaces_stored_body(self, session):
+        client = _github(session)
+        session.request.side_effect = [
+            _response(200, {"v": 1}, {"ETag": '"1"'}),
+            _response(200, {"v": 2}, {"ETag": '"2"'}),
+            _response(304),
+        ]
+
+        client.get("issues/1")
+        assert client.get("issues/1") == {"v": 2}
+        assert client.get("issues/1") == {"v": 2}
+        assert session.request.call_args_list[2].kwargs["headers"]["If-None-Match"] == '"2"'
+
+    def test_github_304_refunds_rate_limit_token(self, session):
+        client = _github(session)
+        session.request.side_effect = [
+            _response(200, {"v": 1}, {"ETag": '"1"'}),
+            _response(304),
+        ]
+        limiter = client._rate_limiter
+        assert isinstance(limiter, GitHubRateLimiter)
+
+        client.get("issues/1")
+        client.get("issues/1")
+
+        assert limiter.stats["total_requests"] == 1
+
+    def test_disabled_by_default(self, session):
+        with patch("spectryn.adapters.github.client.requests.Session", return_value=session):
+            client = GitHubApiClient(token="token", owner="owner", repo="repo")
+        session.request.return_value = _response(200, {"v": 1}, {"ETag": '"1"'})
+
+        client.get("issues/1")
+        client.get("issues/1")
+
+        assert "headers" not in session.request.call_args.kwargs
+
+
+class TestCachedJiraRevalidation:
+    """Tests for revalidation in CachedJiraApiClient."""
+
+    def test_expired_entry_is_revalidated(self, session):
+        with patch("spectryn.adapters.jira.client.requests.Session", return_value=session):
+            client = CachedJiraApiClient(
+                base_url="https://test.atlassian.net",
+                email="user@example.com",
+                api_token="token",
+                requests_per_second=None,
+            )
+        session.request.side_effect = [
+            _response(200, {"key": "PROJ-1"}, {"ETag": '"1"'}),
+            _response(304),
+        ]
+
+        assert client.get_issue("PROJ-1") == {"key": "PROJ-1"}
+        client.invalidate_issue_cache("PROJ-1")
+        assert client.get_issue("PROJ-1") == {"key": "PROJ-1"}
+
+        assert client.cache_stats["conditional"]["revalidated"] == 1
+
+    def test_can_be_disabled(self, session):
+        with patch("spectryn.adapters.jira.client.requests.Session", return_value=session):
+            client = CachedJiraApiClient(
+                base_url="https://test.atlassian.net",
+                email="user@example.com",
+                api_token="token",
+                conditional_requests=False,
+            )
+
+        assert client._conditional_cache is None
+        assert "conditional" not in client.cache_stats
@@ -4,6 +4,7 @@ import json
 import uuid
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -19,6 +20,7 @@ from spectryn.core.ports.event_store import (
     ConcurrencyError,
     EventQuery,
     EventStorePort,
+    ProjectionSnapshot,
     StoredEvent,
     make_epic_stream_id,
     make_sync_stream_id,
@@ -477,6 +479,167 @@ class TestFileEventStore:
         # We should get 2 valid events + 1 more = 3 total
         assert len(events) == 3
 
+    def test_read_from_sequence_uses_index(
+        self, file_store: FileEventStore, sample_events: list[DomainEvent]
+    ) -> None:
+        """Test that reads resolve sequence ranges through the offset index."""
+        stream_id = "test-stream"
+        file_store.append(stream_id, sample_events)
+
+        events = list(file_store.read(stream_id, from_sequence=2, to_sequence=2))
+
+        assert [e.event_type for e in events] == ["StoryUpdated"]
+        index_path = file_store._stream_to_path(stream_id).with_name("test-stream.jsonl.idx")
+        assert index_path.exists()
+
+    def test_index_rebuilt_when_missing(
+        self, file_store: FileEventStore, sample_events: list[DomainEvent]
+    ) -> None:
+        """Test that streams without an index (or with a stale one) stay readable."""
+        stream_id = "test-stream"
+        file_store.append(stream_id, sample_events[:2])
+        stream_path = file_store._stream_to_path(stream_id)
+        stream_path.with_name("test-stream.jsonl.idx").unlink()
+
+        assert [e.sequence_number for e in file_store.read(stream_id)] == [0, 1]
+
+        # Lines written outside the store are picked up incrementally
+        line = stream_path.read_text().splitlines()[0]
+        with open(stream_path, "a") as f:
+            f.write(line + "\n")
+
+        assert len(list(file_store.read(stream_id))) == 3
+        assert file_store.append(stream_id, sample_events[2:3])[0].sequence_number == 3
+
+    def test_segments_roll_at_size_threshold(
+        self, tmp_path: Path, sample_events: list[DomainEvent]
+    ) -> None:
+        """Test that appends start new segments once a segment is full."""
+        store = FileEventStore(tmp_path, max_segment_bytes=1)
+        stream_id = "sync:PROJ-100:session1"
+
+        for event in sample_events:
+            store.append(stream_id, [event])
+
+        stream_path = store._stream_to_path(stream_id)
+        assert stream_path.with_name("session1.jsonl.3").exists()
+        assert store.list_streams() == [stream_id]
+
+        events = list(store.read(stream_id, from_sequence=1))
+        assert [e.sequence_number for e in events] == [1, 2, 3]
+        last = store.get_last_event(stream_id)
+        assert last is not None
+        assert last.event_type == "SyncCompleted"
+
+        info = store.get_stream_info(stream_id)
+        assert info is not None
+        assert info.event_count == 4
+
+        store.delete_stream(stream_id)
+        assert not list(stream_path.parent.glob("session1.*"))
+
+    def test_query_merges_streams_in_global_order(
+        self, file_store: FileEventStore, sample_events: list[DomainEvent]
+    ) -> None:
+        """Test that cross-stream queries interleave events by global position."""
+        for i, event in enumerate(sample_events):
+            file_store.append(f"sync:PROJ:session{i % 2}", [event])
+
+        events = list(file_store.query(EventQuery()))
+        assert [e.event_type for e in events] == [e.event_type for e in sample_events]
+        assert [e.stream_id for e in events] == [
+            "sync:PROJ:session0",
+            "sync:PROJ:session1",
+            "sync:PROJ:session0",
+            "sync:PROJ:session1",
+        ]
+
+        newest = list(file_store.query(EventQuery(reverse=True, limit=2)))
+        assert [e.event_type for e in newest] == ["SyncCompleted", "StoryUpdated"]
+
+    def test_append_without_sync_skips_fsync(
+        self, file_store: FileEventStore, sample_events: list[DomainEvent]
+    ) -> None:
+        """Test that sync=False appends without forcing data to disk."""
+        with patch("spectryn.adapters.event_store.file_store.os.fsync") as fsync:
+            file_store.append("test-stream", sample_events[:2], sync=False)
+            fsync.assert_not_called()
+
+            file_store.append("test-stream", sample_events[2:3])
+            fsync.assert_called_once()
+
+        assert len(list(file_store.read("test-stream"))) == 3
+
+    def test_snapshot_roundtrip(
+        self, file_store: FileEventStore, sample_events: list[DomainEvent]
+    ) -> None:
+        """Test saving and loading a projection snapshot beside the stream."""
+        file_store.append("sync:PROJ:s1", sample_events)
+        file_store.save_snapshot(
+            "sync:PROJ:s1",
+            ProjectionSnapshot(
+                name="Stats", sequence=3, event_id="evt-3", data=b"state\nbytes", version="2"
+            ),
+        )
+
+        snapshot = file_store.load_snapshot("sync:PROJ:s1", "Stats")
+        assert snapshot is not None
+        assert (snapshot.sequence, snapshot.event_id, snapshot.version) == (3, "evt-3", "2")
+        assert snapshot.data == b"state\nbytes"
+        assert file_store.load_snapshot("sync:PROJ:s1", "Other") is None
+        assert file_store.list_streams() == ["sync:PROJ:s1"]
+
+    def test_corrupt_snapshot_is_ignored(self, file_store: FileEventStore) -> None:
+        """Test that an unreadable snapshot file loads as no snapshot."""
+        file_store.save_snapshot(
+            "test-stream", ProjectionSnapshot(name="Stats", sequence=0, event_id="e", data=b"")
+        )
+        snapshot_path = next(file_store.base_path.rglob("*.snap-Stats"))
+        snapshot_path.write_bytes(b"not json")
+
+        assert file_store.load_snapshot("test-stream", "Stats") is None
+
+    def test_delete_stream_removes_snapshots(
+        self, file_store: FileEventStore, sample_events: list[DomainEvent]
+    ) -> None:
+        """Test that deleting a stream deletes its snapshots."""
+        file_store.append("test-stream", sample_events)
+        file_store.save_snapshot(
+            "test-stream", ProjectionSnapshot(name="Stats", sequence=3, event_id="e", data=b"x")
+        )
+
+        file_store.delete_stream("test-stream")
+
+        assert file_store.load_snapshot("test-stream", "Stats") is None
+
+    def test_compact_rewrites_only_corrupted_segments(
+        self, tmp_path: Path, sample_events: list[DomainEvent]
+    ) -> None:
+        """Test that compaction leaves clean segments untouched."""
+        store = FileEventStore(tmp_path, max_segment_bytes=1)
+        stream_id = "test-stream"
+        store.append(stream_id, sample_events[:2])
+        store.append(stream_id, sample_events[2:])
+
+        first_segment = store._stream_to_path(stream_id)
+        second_segment = first_segment.with_name("test-stream.jsonl.1")
+        with open(second_segment, "a") as f:
+            f.write("not valid json\n")
+        clean_inode = first_segment.stat().st_ino
+        store.save_snapshot(
+            stream_id, ProjectionSnapshot(name="Stats", sequence=3, event_id="e", data=b"x")
+        )
+
+        assert store.compact_stream(stream_id) == 4
+        assert store.load_snapshot(stream_id, "Stats") is None
+
+        assert first_segment.stat().st_ino == clean_inode
+        assert "not valid json" not in second_segment.read_text()
+        assert len(list(store.read(stream_id))) == 4
+        info = store.get_stream_info(stream_id)
+        assert info is not None
+        assert info.event_count == 4
+
 
 # =============================================================================
 # StoredEvent Tests
@@ -0,0 +1,155 @@
+"""
+Tests for the pooled HTTP server runtime.
+"""
+
+import socket
+import threading
+import time
+from http.client import HTTPConnection
+
+import pytest
+
+from spectryn.adapters.http.server import (
+    HTTPServerConfig,
+    HTTPServerStats,
+    PooledHTTPServer,
+    PooledRequestHandler,
+)
+
+
+class EchoHandler(PooledRequestHandler):
+    """Echoes POST bodies; GET /slow blocks until released."""
+
+    release = threading.Event()
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if self.path == "/slow":
+            self.release.wait(timeout=5)
+        self._reply(self.path.encode())
+
+    def do_POST(self):
+        body = self.read_body()
+        if body is not None:
+            self._reply(body)
+
+    def _reply(self, data: bytes) -> None:
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+@pytest.fixture
+def serve():
+    """Start pooled servers on free ports and shut them down afterwards."""
+    servers = []
+
+    def _serve(**config):
+        EchoHandler.release.clear()
+        server = PooledHTTPServer(("127.0.0.1", 0), EchoHandler, HTTPServerConfig(**config))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield _serve
+
+    EchoHandler.release.set()
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def _connect(server: PooledHTTPServer) -> HTTPConnection:
+    return HTTPConnection("127.0.0.1", server.server_address[1], timeout=5)
+
+
+class TestPooledHTTPServer:
+    """Tests for PooledHTTPServer."""
+
+    def test_slow_request_does_not_block_others(self, serve):
+        """A request stuck in a handler leaves other workers free."""
+        server = serve(max_workers=2)
+        slow = _connect(server)
+        slow.request("GET", "/slow")
+
+        fast = _connect(server)
+        fast.request("GET", "/fast")
+        assert fast.getresponse().read() == b"/fast"
+
+        EchoHandler.release.set()
+        assert slow.getresponse().read() == b"/slow"
+
+    def test_keep_alive_reuses_connection(self, serve):
+        """Several requests are served over one connection."""
+        server = serve()
+        conn = _connect(server)
+
+        for path in ("/a", "/b", "/c"):
+            conn.request("GET", path)
+            response = conn.getresponse()
+            assert response.read() == path.encode()
+            assert not response.will_close
+
+        stats = server.stats_snapshot()
+        assert stats["connections_accepted"] == 1
+        assert stats["requests_handled"] == 3
+
+    def test_body_size_limit(self, serve):
+        """Bodies above the limit are refused with 413."""
+        server = serve(max_body_bytes=8)
+        conn = _connect(server)
+
+        conn.request("POST", "/", body=b"small")
+        assert conn.getresponse().read() == b"small"
+
+        conn = _connect(server)
+        conn.request("POST", "/", body=b"x" * 64)
+        response = conn.getresponse()
+        assert response.status == 413
+        assert server.stats_snapshot()["bodies_rejected"] == 1
+
+    def test_rejects_when_saturated(self, serve):
+        """Connections beyond workers and queue get an immediate 503."""
+        server = serve(max_workers=1, max_queue_size=1)
+        busy = _connect(server)
+        busy.request("GET", "/slow")
+        deadline = time.monotonic() + 5
+        while server.stats_snapshot()["active_workers"] < 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        queued = socket.create_connection(server.server_address, timeout=5)
+        rejected = socket.create_connection(server.server_address, timeout=5)
+        try:
+            assert rejected.recv(64).startswith(b"HTTP/1.1 503")
+            stats = server.stats_snapshot()
+            assert stats["connections_rejected"] == 1
+            assert stats["peak_queue_depth"] == 1
+        finally:
+            queued.close()
+            rejected.close()
+            EchoHandler.release.set()
+            busy.getresponse().read()
+
+
+class TestHTTPServerStats:
+    """Tests for HTTPServerStats."""
+
+    def test_latency_summary(self):
+        """Averages and percentiles are derived from recorded latencies."""
+        stats = HTTPServerStats(requests_handled=4, total_latency_ms=40.0)
+        stats.recent_latencies_ms.extend([5.0, 5.0, 10.0, 20.0])
+
+        assert stats.avg_latency_ms == 10.0
+        assert stats.latency_percentile(50) == 10.0
+        assert stats.latency_percentile(95) == 20.0
+        assert stats.to_dict()["p95_latency_ms"] == 20.0
+
+    def test_empty_stats(self):
+        """Empty stats report zeros."""
+        stats = HTTPServerStats()
+
+        assert stats.avg_latency_ms == 0.0
+        assert stats.avg_queue_wait_ms == 0.0
+        assert stats.latency_percentile(95) == 0.0
@@ -4,6 +4,7 @@ Tests for JiraAdapter.
 Tests the Jira implementation of IssueTrackerPort.
 """
 
+from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -127,13 +128,86 @@ class TestJiraAdapterReadOperations:
 
     def test_get_epic_children(self, adapter, mock_issue_data):
         """Test getting epic children."""
-        adapter._client.search_jql.return_value = {"issues": [mock_issue_data]}
+        adapter._client.iter_search_jql.return_value = iter([[mock_issue_data]])
 
         result = adapter.get_epic_children("TEST-1")
 
         assert len(result) == 1
         assert result[0].key == "TEST-123"
 
+    def test_get_epic_children_collects_all_pages(self, adapter, mock_issue_data):
+        """Test epic children are gathered from every search page."""
+        second = {**mock_issue_data, "key": "TEST-124"}
+        adapter._client.iter_search_jql.return_value = iter([[mock_issue_data], [second]])
+
+        result = adapter.get_epic_children("TEST-1")
+
+        assert [issue.key for issue in result] == ["TEST-123", "TEST-124"]
+
+    def test_iter_epic_children_yields_parsed_pages(self, adapter, mock_issue_data):
+        """Test iter_epic_children streams parsed pages with prefetch enabled."""
+        adapter._client.iter_search_jql.return_value = iter([[mock_issue_data]])
+
+        pages = list(adapter.iter_epic_children("TEST-1"))
+
+        assert len(pages) == 1
+        assert isinstance(pages[0][0], IssueData)
+        assert adapter._client.iter_search_jql.call_args.kwargs["prefetch"] is True
+
+    def test_get_epic_children_updated_since_uses_relative_window(self, adapter, mock_issue_data):
+        """Test the updated-since query is relative to server time and covers subtasks."""
+        adapter._client.iter_search_jql.return_value = iter([[mock_issue_data]])
+        since = datetime.now(timezone.utc) - timedelta(minutes=10)
+
+        result = adapter.get_epic_children_updated_since("TEST-1", since, ["TEST-123"])
+
+        jql = adapter._client.iter_search_jql.call_args.args[0]
+        assert jql.startswith("(parent = TEST-1 OR parent in (TEST-123)) AND updated >= ")
+        assert 'updated >= "-13m"' in jql
+        assert [issue.key for issue in result] == ["TEST-123"]
+
+    def test_get_epic_children_updated_since_refetches_subtask_parents(
+        self, adapter, mock_issue_data
+    ):
+        """Test a changed subtask brings back its parent story."""
+        subtask = {
+            "key": "TEST-200",
+            "fields": {"summary": "Sub", "parent": {"key": "TEST-123"}},
+        }
+        adapter._client.iter_search_jql.side_effect = [
+            iter([[subtask]]),
+            iter([[mock_issue_data]]),
+        ]
+        since = datetime.now(timezone.utc)
+
+        result = adapter.get_epic_children_updated_since("TEST-1", since, ["TEST-123"])
+
+        parent_jql = adapter._client.iter_search_jql.call_args_list[1].args[0]
+        assert parent_jql.startswith("key in (TEST-123)")
+        assert [issue.key for issue in result] == ["TEST-123"]
+
+    def test_get_epic_children_updated_since_batches_child_keys(self, adapter, mock_issue_data):
+        """Test large epics split the child keys across several bounded queries."""
+        second = {**mock_issue_data, "key": "TEST-124"}
+        adapter._client.iter_search_jql.side_effect = [
+            iter([[mock_issue_data]]),
+            iter([[second]]),
+            iter([]),
+        ]
+        child_keys = [f"TEST-{n}" for n in range(1000, 1250)]
+        since = datetime.now(timezone.utc)
+
+        result = adapter.get_epic_children_updated_since("TEST-1", since, child_keys)
+
+        queries = [call.args[0] for call in adapter._client.iter_search_jql.call_args_list]
+        assert len(queries) == 3
+        assert queries[0].startswith("(parent = TEST-1 OR parent in (TEST-1000, ")
+        assert "TEST-1099)" in queries[0]
+        assert "TEST-1100" not in queries[0]
+        assert queries[1].startswith("parent in (TEST-1100, ")
+        assert queries[2].startswith("parent in (TEST-1200, ")
+        assert [issue.key for issue in result] == ["TEST-123", "TEST-124"]
+
     def test_get_issue_comments(self, adapter):
         """Test getting issue comments."""
         adapter._client.get.return_value = {
@@ -157,11 +231,12 @@ class TestJiraAdapterReadOperations:
 
     def test_search_issues(self, adapter, mock_issue_data):
         """Test searching issues."""
-        adapter._client.search_jql.return_value = {"issues": [mock_issue_data]}
+        adapter._client.iter_search_jql.return_value = iter([[mock_issue_data]])
 
         result = adapter.search_issues("project = TEST")
 
         assert len(result) == 1
+        assert adapter._client.iter_search_jql.call_args.kwargs["max_results"] == 50
 
 
 class TestJiraAdapterWriteOperations:
@@ -564,6 +639,133 @@ class TestJiraAdapterTransitionWorkflow:
 
         assert result is False
 
+    def _mock_workflow(
+        self,
+        adapter,
+        statuses: list[str],
+        transitions: dict[str, list[dict]],
+        definition: dict | None = None,
+    ):
+        """Serve a scripted status sequence, per-status transitions and a workflow definition."""
+        from spectryn.core.ports.issue_tracker import IssueTrackerError
+
+        state = {"status": statuses[0]}
+        status_reads = iter(statuses[1:])
+
+        def get(path, params=None):
+            if path.endswith("/transitions"):
+                return {"transitions": transitions.get(state["status"], [])}
+            if path in ("workflowscheme/project", "workflow/search"):
+                if definition is None:
+                    raise IssueTrackerError("Forbidden")
+                if path == "workflow/search":
+                    return {"values": [definition]}
+                return {"values": [{"workflowScheme": {"defaultWorkflow": "Sub-task flow"}}]}
+            if params and "issuetype" in params.get("fields", ""):
+                return {
+                    "fields": {
+                        "status": {"name": state["status"]},
+                        "issuetype": {"id": "10003", "name": "Sub-task"},
+                        "project": {"id": "10000", "key": "TEST"},
+                    }
+                }
+            state["status"] = next(status_reads, state["status"])
+            return {"fields": {"status": {"name": state["status"]}}}
+
+        def post(path, json=None):
+            for transition in transitions.get(state["status"], []):
+                if transition["id"] == json["transition"]["id"]:
+                    state["status"] = transition["to"]["name"]
+            return {}
+
+        adapter._client.get.side_effect = get
+        adapter._client.post.side_effect = post
+
+    WORKFLOW_DEFINITION = {
+        "statuses": [
+            {"id": "1", "name": "Open"},
+            {"id": "3", "name": "In Progress"},
+            {"id": "10001", "name": "Done"},
+        ],
+        "transitions": [
+            {"id": "4", "name": "Start", "from": ["1"], "to": "3", "type": "directed"},
+            {"id": "5", "name": "Resolve", "from": ["3"], "to": "10001", "type": "directed"},
+        ],
+    }
+
+    def test_transition_follows_shortest_planned_path(self, adapter):
+        """Multi-hop transitions are planned from the workflow definition."""
+        adapter._dry_run = False
+        transitions = {
+            "Open": [{"id": "4", "name": "Start", "to": {"name": "In Progress"}}],
+            "In Progress": [
+                {
+                    "id": "5",
+                    "name": "Resolve",
+                    "to": {"name": "Done"},
+                    "fields": {"resolution": {"required": True}},
+                }
+            ],
+        }
+        self._mock_workflow(adapter, ["Open"], transitions, self.WORKFLOW_DEFINITION)
+
+        assert adapter.transition_issue("TEST-123", "Done") is True
+
+        posted = [c.kwargs["json"] for c in adapter._client.post.call_args_list]
+        assert [p["transition"]["id"] for p in posted] == ["4", "5"]
+        assert posted[1]["fields"] == {"resolution": {"name": "Done"}}
+
+    def test_transition_without_known_path_does_not_move_issue(self, adapter):
+        """Without a known path to the target, no exploratory transitions run."""
+        adapter._dry_run = False
+        transitions = {
+            "Open": [{"id": "4", "name": "Start", "to": {"name": "In Progress"}}],
+            "In Progress": [{"id": "5", "name": "Resolve", "to": {"name": "Done"}}],
+        }
+        self._mock_workflow(adapter, ["Open"], transitions)
+
+        assert adapter.transition_issue("TEST-123", "Done") is False
+        adapter._client.post.assert_not_called()
+
+    def test_transition_without_definition_uses_current_transitions(self, adapter):
+        """A target reachable from the current status needs no workflow definition."""
+        adapter._dry_run = False
+        transitions = {"Open": [{"id": "5", "name": "Resolve", "to": {"name": "Done"}}]}
+        self._mock_workflow(adapter, ["Open"], transitions)
+
+        assert adapter.transition_issue("TEST-123", "Done") is True
+
+    def test_transition_reuses_cached_workflow_graph(self, adapter):
+        """A second issue in the same workflow needs no transitions lookups."""
+        adapter._dry_run = False
+        transitions = {
+            "Open": [{"id": "4", "name": "Start", "to": {"name": "In Progress"}}],
+            "In Progress": [{"id": "5", "name": "Resolve", "to": {"name": "Done"}}],
+        }
+        self._mock_workflow(adapter, ["Open"], transitions, self.WORKFLOW_DEFINITION)
+        assert adapter.transition_issue("TEST-1", "Done") is True
+
+        self._mock_workflow(adapter, ["Open"], transitions, self.WORKFLOW_DEFINITION)
+        adapter._client.get.reset_mock()
+        assert adapter.transition_issue("TEST-2", "Done") is True
+
+        paths = [c.args[0] for c in adapter._client.get.call_args_list]
+        assert not any(path.endswith("/transitions") for path in paths)
+        # One read to plan, one read to verify
+        assert len(paths) == 2
+
+    def test_transition_failure_invalidates_workflow_graph(self, adapter):
+        """A rejected transition drops the cached graph so it is relearned."""
+        from spectryn.core.ports.issue_tracker import IssueTrackerError
+
+        adapter._dry_run = False
+        transitions = {"Open": [{"id": "5", "name": "Resolve", "to": {"name": "Done"}}]}
+        self._mock_workflow(adapter, ["Open"], transitions)
+        adapter._client.post.side_effect = IssueTrackerError("Transition not allowed")
+
+        assert adapter.transition_issue("TEST-123", "Done") is False
+        assert adapter._metadata_cache.size == 0
+
     def test_do_transition_success(self, adapter):
         """Test executing a single transition."""
         adapter._dry_run = False
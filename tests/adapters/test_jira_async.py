@@ -10,6 +10,7 @@ Tests cover:
 - AsyncJiraApiClient functionality
 """
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -326,6 +327,168 @@ class TestAsyncJiraAdapterWriteOperations:
                 assert all(r[1] is True for r in results)
 
 
+class TestAsyncJiraAdapterLiveWrites:
+    """Tests for AsyncJiraAdapter write operations against the API client."""
+
+    async def _connect(self, mock_tracker_config, mock_client, concurrency=5):
+        from spectryn.adapters.jira.async_adapter import AsyncJiraAdapter
+
+        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+        mock_client.__aexit__ = AsyncMock()
+        with patch(
+            "spectryn.adapters.jira.async_adapter.AsyncJiraApiClient",
+            return_value=mock_client,
+        ):
+            adapter = AsyncJiraAdapter(
+                config=mock_tracker_config, dry_run=False, concurrency=concurrency
+            )
+            await adapter.connect()
+        return adapter
+
+    @pytest.mark.asyncio
+    async def test_update_descriptions_aligns_failures(self, mock_tracker_config):
+        """Failed updates are reported in input order with their error."""
+        from spectryn.core.ports.issue_tracker import IssueTrackerError
+
+        async def update_issue(key, fields):
+            if key == "TEST-2":
+                raise IssueTrackerError("Forbidden")
+            return {}
+
+        mock_client = MagicMock()
+        mock_client.update_issue = AsyncMock(side_effect=update_issue)
+        adapter = await self._connect(mock_tracker_config, mock_client)
+
+        results = await adapter.update_descriptions_async(
+            [("TEST-1", {"type": "doc"}), ("TEST-2", {"type": "doc"}), ("TEST-3", {"type": "doc"})]
+        )
+
+        assert results == [
+            ("TEST-1", True, None),
+            ("TEST-2", False, "Forbidden"),
+            ("TEST-3", True, None),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_create_subtasks_sends_subtask_fields(self, mock_tracker_config):
+        """Created subtasks carry parent, issue type and story points."""
+        mock_client = MagicMock()
+        mock_client.create_issue = AsyncMock(side_effect=[{"key": "TEST-10"}, {}])
+        adapter = await self._connect(mock_tracker_config, mock_client)
+
+        results = await adapter.create_subtasks_async(
+            [
+                {"project_key": "TEST", "parent_key": "TEST-1", "summary": "A", "story_points": 3},
+                {"project_key": "TEST", "parent_key": "TEST-1", "summary": "B"},
+            ]
+        )
+
+        assert results == [("TEST-10", True, None), (None, False, "Failed to create subtask")]
+        fields = mock_client.create_issue.call_args_list[0].args[0]
+        assert fields["parent"] == {"key": "TEST-1"}
+        assert fields["issuetype"] == {"name": "Sub-task"}
+        assert 3.0 in fields.values()
+
+    @pytest.mark.asyncio
+    async def test_transition_issues_reuse_learned_workflow(self, mock_tracker_config):
+        """Issues sharing a workflow look up transitions only once."""
+        statuses = {"TEST-1": "Open", "TEST-2": "Open"}
+
+        async def get_issue(key, fields=None):
+            return {
+                "fields": {"status": {"name": statuses[key]}, "issuetype": {"name": "Sub-task"}}
+            }
+
+        async def transition_issue(key, transition_id, fields=None):
+            statuses[key] = "Resolved"
+
+        mock_client = MagicMock()
+        mock_client.get_issue = AsyncMock(side_effect=get_issue)
+        mock_client.get = AsyncMock(
+            return_value={
+                "transitions": [
+                    {"id": "5", "name": "Resolve", "to": {"name": "Resolved"}, "fields": {}}
+                ]
+            }
+        )
+        mock_client.transition_issue = AsyncMock(side_effect=transition_issue)
+        # Serialized so the second issue finds the first one's learned graph
+        adapter = await self._connect(mock_tracker_config, mock_client, concurrency=1)
+
+        results = await adapter.transition_issues_async(
+            [("TEST-1", "Resolved"), ("TEST-2", "Resolved")]
+        )
+
+        assert results == [("TEST-1", True, None), ("TEST-2", True, None)]
+        assert mock_client.get.await_count == 1
+        assert mock_client.transition_issue.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_transitions_load_workflow_once(self, mock_tracker_config):
+        """Concurrent transitions in one workflow scope share a single graph load."""
+        statuses = {"TEST-1": "Open", "TEST-2": "Open", "TEST-3": "Open"}
+
+        async def get_issue(key, fields=None):
+            return {
+                "fields": {
+                    "status": {"name": statuses[key]},
+                    "issuetype": {"id": "10003", "name": "Sub-task"},
+                    "project": {"id": "10000"},
+                }
+            }
+
+        async def get(path, params=None):
+            # Yield so the other transitions run while the scheme is loading
+            await asyncio.sleep(0)
+            if path == "workflowscheme/project":
+                return {}
+            return {
+                "transitions": [
+                    {"id": "5", "name": "Resolve", "to": {"name": "Resolved"}, "fields": {}}
+                ]
+            }
+
+        async def transition_issue(key, transition_id, fields=None):
+            statuses[key] = "Resolved"
+
+        mock_client = MagicMock()
+        mock_client.get_issue = AsyncMock(side_effect=get_issue)
+        mock_client.get = AsyncMock(side_effect=get)
+        mock_client.transition_issue = AsyncMock(side_effect=transition_issue)
+        adapter = await self._connect(mock_tracker_config, mock_client, concurrency=3)
+
+        results = await adapter.transition_issues_async(
+            [("TEST-1", "Resolved"), ("TEST-2", "Resolved"), ("TEST-3", "Resolved")]
+        )
+
+        assert all(ok for _, ok, _ in results)
+        scheme_loads = [
+            call
+            for call in mock_client.get.await_args_list
+            if call.args[0] == "workflowscheme/project"
+        ]
+        assert len(scheme_loads) == 1
+
+    @pytest.mark.asyncio
+    async def test_transition_without_known_path_does_not_move_issue(self, mock_tracker_config):
+        """Without a known path to the target, no exploratory transitions run."""
+        mock_client = MagicMock()
+        mock_client.get_issue = AsyncMock(
+            return_value={"fields": {"status": {"name": "Open"}, "issuetype": {"name": "Task"}}}
+        )
+        mock_client.get = AsyncMock(
+            return_value={"transitions": [{"id": "4", "to": {"name": "In Progress"}}]}
+        )
+        mock_client.transition_issue = AsyncMock()
+        adapter = await self._connect(mock_tracker_config, mock_client)
+
+        results = await adapter.transition_issues_async([("TEST-1", "Done")])
+
+        assert results[0][:2] == ("TEST-1", False)
+        assert "No known transition path" in results[0][2]
+        mock_client.transition_issue.assert_not_awaited()
+
+
 class TestAsyncJiraAdapterParseIssue:
     """Tests for AsyncJiraAdapter._parse_issue method."""
 
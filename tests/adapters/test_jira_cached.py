@@ -8,7 +8,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from spectryn.adapters.cache import MemoryCache
+from spectryn.adapters.cache import MemoryCache, SqliteCache
 from spectryn.adapters.jira.cached_client import CachedJiraApiClient
 
 
@@ -82,6 +82,22 @@ class TestCachedJiraApiClientInit:
 
             assert client._cache.backend == custom_backend
 
+    def test_init_with_named_cache_backend(self, tmp_path):
+        """Test selecting the SQLite backend by name."""
+        with patch("requests.Session"):
+            client = CachedJiraApiClient(
+                base_url="https://test.atlassian.net",
+                email="test@example.com",
+                api_token="test_token",
+                cache_backend="sqlite",
+                cache_path=tmp_path / "cache.db",
+                cache_ttl=120.0,
+            )
+
+            assert isinstance(client._cache.backend, SqliteCache)
+            assert client._cache.backend.default_ttl == 120.0
+            client._cache.backend.close()
+
     def test_init_with_custom_ttl(self):
         """Test initialization with custom TTL."""
         with patch("requests.Session"):
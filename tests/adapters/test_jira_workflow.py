@@ -0,0 +1,181 @@
+"""Tests for the Jira workflow graph and transition planner."""
+
+import pytest
+
+from spectryn.adapters.jira.workflow import (
+    TransitionWalk,
+    WorkflowGraph,
+    WorkflowTransition,
+    status_matches,
+    workflow_name_for,
+)
+from spectryn.core.ports.issue_tracker import TransitionError
+
+
+def _transition(transition_id: str, to_status: str, **extra) -> dict:
+    return {"id": transition_id, "name": f"To {to_status}", "to": {"name": to_status}, **extra}
+
+
+class TestWorkflowTransition:
+    """Tests for WorkflowTransition.from_api."""
+
+    def test_from_api(self):
+        transition = WorkflowTransition.from_api(
+            _transition("5", "Done", fields={"resolution": {"required": True}})
+        )
+
+        assert transition.id == "5"
+        assert transition.to_status == "Done"
+        assert transition.requires_resolution is True
+
+    def test_from_api_without_fields(self):
+        assert WorkflowTransition.from_api(_transition("4", "Open")).requires_resolution is False
+
+
+class TestStatusMatches:
+    """Tests for status_matches."""
+
+    def test_case_insensitive_equality(self):
+        assert status_matches("In Progress", "in progress")
+
+    def test_target_contained_in_status(self):
+        assert status_matches("Resolved - Fixed", "Resolved")
+
+    def test_mismatch(self):
+        assert not status_matches("Open", "Done")
+
+
+class TestWorkflowGraph:
+    """Tests for WorkflowGraph planning."""
+
+    def _graph(self) -> WorkflowGraph:
+        graph = WorkflowGraph()
+        graph.add_transitions("Analyze", [_transition("7", "Open")])
+        graph.add_transitions(
+            "Open", [_transition("4", "In Progress"), _transition("301", "Analyze")]
+        )
+        graph.add_transitions("In Progress", [_transition("5", "Done"), _transition("3", "Open")])
+        return graph
+
+    def test_shortest_path(self):
+        path = self._graph().plan("Analyze", "Done")
+
+        assert [t.id for t in path] == ["7", "4", "5"]
+
+    def test_already_at_target(self):
+        assert self._graph().plan("Done", "done") == []
+
+    def test_unreachable_target(self):
+        assert self._graph().plan("Analyze", "Cancelled") is None
+
+    def test_plans_are_memoized_until_graph_changes(self):
+        graph = self._graph()
+
+        first = graph.plan("Open", "Done")
+        assert graph.plan("open", "DONE") is first
+
+        graph.add_transitions("Open", [_transition("9", "Done")])
+        assert [t.id for t in graph.plan("Open", "Done")] == ["9"]
+
+    def test_knows_explored_statuses(self):
+        graph = self._graph()
+
+        assert graph.knows("open")
+        assert not graph.knows("Done")
+
+    def test_definition_seeds_unexplored_statuses(self):
+        graph = WorkflowGraph()
+        graph.add_transitions("Open", [_transition("4", "In Progress", fields={"x": {}})])
+        graph.add_definition(WORKFLOW_DEFINITION)
+
+        assert [t.id for t in graph.plan("Open", "Done")] == ["4", "5"]
+        # Edges read from the transitions API are kept over the definition's
+        assert graph.transitions["open"][0].name == "To In Progress"
+        assert not graph.knows("In Progress")
+
+    def test_definition_global_transitions_apply_to_every_status(self):
+        graph = WorkflowGraph()
+        graph.add_definition(WORKFLOW_DEFINITION)
+
+        assert [t.id for t in graph.plan("Done", "Open")] == ["11"]
+        assert [t.id for t in graph.plan("In Progress", "Open")] == ["11"]
+
+
+WORKFLOW_DEFINITION = {
+    "statuses": [
+        {"id": "1", "name": "Open"},
+        {"id": "3", "name": "In Progress"},
+        {"id": "10001", "name": "Done"},
+    ],
+    "transitions": [
+        {"id": "1", "name": "Create", "from": [], "to": "1", "type": "initial"},
+        {"id": "11", "name": "Reopen", "from": [], "to": "1", "type": "global"},
+        {"id": "4", "name": "Start", "from": ["1"], "to": "3", "type": "directed"},
+        {"id": "5", "name": "Resolve", "from": ["3"], "to": "10001", "type": "directed"},
+    ],
+}
+
+
+class TestWorkflowNameFor:
+    """Tests for workflow_name_for."""
+
+    def test_issue_type_mapping(self):
+        scheme = {
+            "values": [
+                {
+                    "workflowScheme": {
+                        "defaultWorkflow": "jira",
+                        "issueTypeMappings": {"10002": "Bug workflow"},
+                    }
+                }
+            ]
+        }
+
+        assert workflow_name_for(scheme, "10002") == "Bug workflow"
+        assert workflow_name_for(scheme, "10003") == "jira"
+
+    def test_no_scheme(self):
+        assert workflow_name_for({"values": []}, "10002") is None
+
+
+class TestTransitionWalk:
+    """Tests for TransitionWalk."""
+
+    def test_steps_along_known_path(self):
+        graph = WorkflowGraph()
+        graph.add_definition(WORKFLOW_DEFINITION)
+        walk = TransitionWalk(graph, "Open", "Done", max_hops=5)
+        available = {
+            "Open": [_transition("4", "In Progress")],
+            "In Progress": [_transition("5", "Done")],
+        }
+
+        executed = []
+        while not walk.done:
+            if walk.needs_transitions:
+                walk.learn(available[walk.current_status])
+            transition = walk.next_transition()
+            executed.append(transition.id)
+            walk.advance(transition)
+
+        assert executed == ["4", "5"]
+        assert graph.knows("Open")
+        assert graph.knows("In Progress")
+
+    def test_unknown_path_fails_without_moving(self):
+        graph = WorkflowGraph()
+        graph.add_transitions("Open", [_transition("4", "In Progress")])
+        walk = TransitionWalk(graph, "Open", "Done", max_hops=5)
+
+        with pytest.raises(TransitionError, match="No known transition path"):
+            walk.next_transition()
+        assert walk.hops == 0
+
+    def test_hop_limit(self):
+        walk = TransitionWalk(TestWorkflowGraph()._graph(), "Analyze", "Done", max_hops=2)
+
+        walk.advance(walk.next_transition())
+        walk.advance(walk.next_transition())
+
+        with pytest.raises(TransitionError, match="after 2 transitions"):
+            walk.next_transition()
@@ -1,5 +1,7 @@
 """Tests for Markdown parser adapter."""
 
+import pytest
+
 
 class TestMarkdownParser:
     """Tests for MarkdownParser."""
@@ -533,3 +535,136 @@ class TestFlexibleStoryIdPrefixes:
         stories = markdown_parser.parse_stories(content)
         assert len(stories) == 1
         assert str(stories[0].id) == "PROJ-001"
+
+
+class TestFieldExtractionEdgeCases:
+    """Field and section extraction on layouts the regex extractors accept.
+
+    Expected values are the parser's output before story blocks were
+    tokenized, so any faster extraction has to reproduce them.
+    """
+
+    NEXT_LINE_VALUE = """### US-001: Next line value
+
+**Story Points**:
+5
+**Priority**: High
+"""
+
+    STRAY_BOLD = """### US-002: Stray bold
+
+**Status**: In Progress with **bold** later
+**Story Points**: 3 **
+**Priority**: Low
+"""
+
+    TABLE_CONTINUATION = """### US-003: Table continuation
+
+| Field | Value |
+|-------|-------|
+| **Story Points** | 8
+continued |
+| **Priority** | Critical |
+| **Status** | Done |
+"""
+
+    ALIASES_AND_CASE = """### US-006: Aliases
+
+**points**: 21
+**PRIORITY**: low
+**status**:    done
+
+#### Technical Notes
+Some notes with **Story Points**: 99 inside.
+"""
+
+    @pytest.mark.parametrize(
+        ("content", "field", "expected"),
+        [
+            (NEXT_LINE_VALUE, "Story Points", "5"),
+            (NEXT_LINE_VALUE, "Status", ""),
+            (STRAY_BOLD, "Status", "In Progress with **bold** later"),
+            (STRAY_BOLD, "Story Points", "3 **"),
+            (STRAY_BOLD, "Priority", "Low"),
+            (TABLE_CONTINUATION, "Story Points", "8\ncontinued"),
+            (TABLE_CONTINUATION, "Priority", "Critical"),
+            (ALIASES_AND_CASE, "Story Points", "99 inside."),
+            (ALIASES_AND_CASE, "Priority", "low"),
+            (ALIASES_AND_CASE, "Status", "done"),
+        ],
+        ids=[
+            "next-line-value",
+            "next-line-missing",
+            "stray-bold-status",
+            "stray-bold-points",
+            "stray-bold-priority",
+            "table-continuation",
+            "table-after-continuation",
+            "alias-first-match",
+            "uppercase-label",
+            "lowercase-label",
+        ],
+    )
+    def test_extract_field(self, markdown_parser, content, field, expected):
+        """Test field values match the regex extractors."""
+        assert markdown_parser._extract_field(content, field) == expected
+
+    def test_value_on_next_line(self, markdown_parser):
+        """Test an inline field whose value starts on the next line."""
+        stories = markdown_parser.parse_stories(self.NEXT_LINE_VALUE)
+        assert stories[0].story_points == 5
+
+    def test_blockquote_fields_and_inline_links(self, markdown_parser):
+        """Test blockquote fields, tracker shorthand and inline links."""
+        content = """### US-005: Blockquote
+
+> **Story Points**: 13
+> **Priority**: High
+> **Jira:** [PROJ-12](https://jira.example.com/browse/PROJ-12)
+
+**Blocks:** PROJ-1, PROJ-2
+**Depends on:** OTHER-7
+"""
+        story = markdown_parser.parse_stories(content)[0]
+        assert story.story_points == 13
+        assert str(story.external_key) == "PROJ-12"
+        assert story.links == [
+            ("blocks", "PROJ-1"),
+            ("blocks", "PROJ-2"),
+            ("depends on", "OTHER-7"),
+        ]
+
+    def test_sections(self, markdown_parser):
+        """Test checkbox, commit, link and comment sections."""
+        content = """### US-007: Sections
+
+**Story Points**: 1
+
+## Acceptance Criteria
+- [x] Top-level heading AC
+- [ ] Second item
+
+#### Subtasks
+| # | Subtask | Description | SP | Status |
+|---|---------|-------------|----|--------|
+| 1 | Do it | Detail | 1 | Done |
+
+#### Related Commits
+| Commit | Message |
+|--------|---------|
+| `abc1234` | Fix it |
+
+#### Links
+| blocks | PROJ-9 |
+- relates to: PROJ-10
+
+#### Comments
+> **@alice** (2025-01-15):
+> Hello there
+"""
+        story = markdown_parser.parse_stories(content)[0]
+        assert list(story.acceptance_criteria.items) == ["Top-level heading AC", "Second item"]
+        assert [(t.name, t.story_points) for t in story.subtasks] == [("Do it", 1)]
+        assert [(c.hash, c.message) for c in story.commits] == [("abc1234", "Fix it")]
+        assert story.links == [("blocks", "PROJ-9"), ("relates to", "PROJ-10")]
+        assert [(c.author, c.body) for c in story.comments] == [("alice", "Hello there")]
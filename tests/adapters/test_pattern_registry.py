@@ -0,0 +1,78 @@
+"""Tests for the compile-once parser pattern registry."""
+
+import re
+
+import pytest
+
+from spectryn.adapters.parsers import PATTERNS, PatternRegistry, TolerantPatterns
+
+
+@pytest.fixture
+def registry():
+    registry = PatternRegistry()
+    registry.register_format("bold", lambda name: rf"\*\*{re.escape(name)}\*\*", re.IGNORECASE)
+    return registry
+
+
+class TestPatternRegistry:
+    """Tests for PatternRegistry."""
+
+    def test_compiles_once_per_key(self, registry):
+        first = registry.get("Status", "bold")
+
+        assert registry.get("Status", "bold") is first
+        assert first.flags & re.IGNORECASE
+        assert first.search("**status**")
+        assert registry.misses == 1
+        assert registry.get_stats()["hits"] == 1
+
+    def test_keys_by_field_and_format(self, registry):
+        registry.register_format("plain", re.escape)
+
+        registry.get("Status", "bold")
+        registry.get("Priority", "bold")
+        registry.get("Status", "plain")
+
+        assert registry.misses == 3
+        assert registry.size == 3
+
+    def test_unknown_format(self, registry):
+        with pytest.raises(KeyError):
+            registry.get("Status", "missing")
+
+    def test_reregistering_format_drops_its_patterns(self, registry):
+        old = registry.get("Status", "bold")
+
+        registry.register_format("bold", lambda name: rf"__{name}__")
+
+        new = registry.get("Status", "bold")
+        assert new is not old
+        assert new.search("__Status__")
+
+    def test_clear(self, registry):
+        registry.get("Status", "bold")
+        registry.clear()
+
+        assert registry.size == 0
+        assert registry.get_stats() == {
+            "size": 0,
+            "formats": 1,
+            "hits": 0,
+            "misses": 0,
+            "hit_rate": 0.0,
+        }
+
+
+class TestSharedRegistry:
+    """Tests for the registry shared by the markdown-family parsers."""
+
+    def test_tolerant_patterns_are_reused(self):
+        pattern = TolerantPatterns.field_pattern("Story Points", "table")
+        misses = PATTERNS.misses
+
+        assert TolerantPatterns.field_pattern("Story Points", "table") is pattern
+        assert TolerantPatterns.field_pattern("Story Points", "other") is (
+            TolerantPatterns.field_pattern("Story Points", "all")
+        )
+        assert PATTERNS.misses <= misses + 1
+        assert pattern.search("| **Story  Points** | 5 |").group(1) == "5"
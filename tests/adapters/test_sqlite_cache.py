@@ -0,0 +1,227 @@
+"""Tests for the SQLite cache backend."""
+
+import sqlite3
+import time
+from pathlib import Path
+
+import pytest
+
+from spectryn.adapters.cache import (
+    CacheManager,
+    FileCache,
+    MemoryCache,
+    SqliteCache,
+    create_cache_backend,
+)
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> Path:
+    return tmp_path / "cache" / "cache.db"
+
+
+@pytest.fixture
+def cache(db_path: Path):
+    cache = SqliteCache(db_path=db_path, default_ttl=60.0, cleanup_on_start=False)
+    yield cache
+    cache.close()
+
+
+class TestSqliteCacheBasics:
+    """Basic tests for SqliteCache."""
+
+    def test_init_creates_wal_database(self, cache: SqliteCache, db_path: Path) -> None:
+        assert db_path.exists()
+        mode = cache._conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+    def test_set_and_get(self, cache: SqliteCache) -> None:
+        cache.set("issue:PROJ-1", {"summary": "Test", "points": 3})
+
+        assert cache.get("issue:PROJ-1") == {"summary": "Test", "points": 3}
+        assert cache.get("missing") is None
+        assert cache.get_stats().hits == 1
+        assert cache.get_stats().misses == 1
+
+    def test_overwrite(self, cache: SqliteCache) -> None:
+        cache.set("key", "old")
+        cache.set("key", "new")
+
+        assert cache.get("key") == "new"
+        assert cache.size == 1
+
+    def test_delete_and_exists(self, cache: SqliteCache) -> None:
+        cache.set("key", "value")
+
+        assert cache.exists("key")
+        assert cache.delete("key")
+        assert not cache.exists("key")
+        assert not cache.delete("key")
+
+    def test_clear(self, cache: SqliteCache) -> None:
+        cache.set_many({"a": 1, "b": 2}, tags={"tag"})
+
+        assert cache.clear() == 2
+        assert cache.size == 0
+        assert cache.invalidate_by_tag("tag") == 0
+
+    def test_persistence(self, db_path: Path) -> None:
+        with SqliteCache(db_path=db_path) as first:
+            first.set("key", [1, 2, 3])
+
+        with SqliteCache(db_path=db_path) as second:
+            assert second.get("key") == [1, 2, 3]
+
+    def test_in_memory_database(self) -> None:
+        with SqliteCache(db_path=":memory:") as cache:
+            cache.set("key", "value")
+            assert cache.get("key") == "value"
+
+
+class TestSqliteCacheExpiry:
+    """TTL tests for SqliteCache."""
+
+    def test_expired_entry_is_a_miss(self, cache: SqliteCache) -> None:
+        cache.set("key", "value", ttl=0.01)
+        time.sleep(0.02)
+
+        assert cache.get("key") is None
+        assert cache.get_stats().expirations == 1
+        assert cache.size == 0
+
+    def test_no_expiry(self, db_path: Path) -> None:
+        with SqliteCache(db_path=db_path, default_ttl=None) as cache:
+            cache.set("key", "value")
+            row = cache._conn.execute("SELECT expires_at FROM entries").fetchone()
+            assert row[0] is None
+
+    def test_cleanup_on_start(self, db_path: Path) -> None:
+        with SqliteCache(db_path=db_path) as cache:
+            cache.set("stale", "value", ttl=0.01, tags={"tag"})
+            cache.set("fresh", "value", ttl=60)
+        time.sleep(0.02)
+
+        with SqliteCache(db_path=db_path) as cache:
+            assert cache.get_stats().expirations == 1
+            assert cache.exists("fresh")
+            count = cache._conn.execute("SELECT COUNT(*) FROM entry_tags").fetchone()[0]
+            assert count == 0
+
+
+class TestSqliteCacheTags:
+    """Tag invalidation tests for SqliteCache."""
+
+    def test_invalidate_by_tag(self, cache: SqliteCache) -> None:
+        cache.set("issue:1", "a", tags={"issue:PROJ-1", "project:PROJ"})
+        cache.set("comments:1", "b", tags={"issue:PROJ-1"})
+        cache.set("issue:2", "c", tags={"project:PROJ"})
+
+        assert cache.invalidate_by_tag("issue:PROJ-1") == 2
+        assert cache.get("issue:1") is None
+        assert cache.get("issue:2") == "c"
+        assert cache.invalidate_by_tag("project:PROJ") == 1
+
+    def test_overwrite_replaces_tags(self, cache: SqliteCache) -> None:
+        cache.set("key", "v1", tags={"old"})
+        cache.set("key", "v2", tags={"new"})
+
+        assert cache.invalidate_by_tag("old") == 0
+        assert cache.invalidate_by_tag("new") == 1
+
+
+class TestSqliteCacheBulk:
+    """Bulk operation tests for SqliteCache."""
+
+    def test_set_many_and_get_many(self, cache: SqliteCache) -> None:
+        items = {f"issue:{i}": {"n": i} for i in range(1200)}
+        cache.set_many(items, tags={"bulk"})
+
+        found = cache.get_many([*items, "missing"])
+
+        assert found == items
+        assert cache.get_stats().sets == 1200
+        assert cache.get_stats().hits == 1200
+        assert cache.get_stats().misses == 1
+        assert cache.invalidate_by_tag("bulk") == 1200
+
+    def test_get_many_skips_expired(self, cache: SqliteCache) -> None:
+        cache.set("stale", 1, ttl=0.01)
+        cache.set("fresh", 2)
+        time.sleep(0.02)
+
+        assert cache.get_many(["stale", "fresh"]) == {"fresh": 2}
+
+    def test_unserializable_batch_is_not_cached(self, cache: SqliteCache) -> None:
+        circular: list = []
+        circular.append(circular)
+
+        cache.set_many({"ok": 1, "circular": circular})
+
+        assert cache.size == 0
+
+
+class TestSqliteCacheHitCounts:
+    """Batched hit-count tests for SqliteCache."""
+
+    def _stored_hits(self, cache: SqliteCache, key: str) -> int:
+        return cache._conn.execute(
+            "SELECT hit_count FROM entries WHERE key = ?", (key,)
+        ).fetchone()[0]
+
+    def test_hits_are_buffered(self, cache: SqliteCache) -> None:
+        cache.set("key", "value")
+        for _ in range(5):
+            cache.get("key")
+
+        assert self._stored_hits(cache, "key") == 0
+        assert cache.get_hit_count("key") == 5
+
+        assert cache.flush() == 1
+        assert self._stored_hits(cache, "key") == 5
+
+    def test_flush_threshold(self, db_path: Path) -> None:
+        with SqliteCache(db_path=db_path, hit_flush_threshold=3) as cache:
+            cache.set("key", "value")
+            for _ in range(3):
+                cache.get("key")
+
+            assert self._stored_hits(cache, "key") == 3
+
+    def test_close_flushes(self, db_path: Path) -> None:
+        cache = SqliteCache(db_path=db_path)
+        cache.set("key", "value")
+        cache.get("key")
+        cache.close()
+
+        with sqlite3.connect(db_path) as conn:
+            row = conn.execute("SELECT hit_count FROM entries").fetchone()
+        assert row[0] == 1
+
+
+class TestCacheBackendSelection:
+    """Tests for selecting a cache backend by name."""
+
+    def test_create_cache_backend(self, tmp_path: Path) -> None:
+        assert isinstance(create_cache_backend("memory", max_size=5), MemoryCache)
+        assert isinstance(create_cache_backend("file", path=tmp_path / "files"), FileCache)
+
+        backend = create_cache_backend("sqlite", path=tmp_path / "cache.db", default_ttl=10)
+        assert isinstance(backend, SqliteCache)
+        assert backend.default_ttl == 10
+        backend.close()
+
+    def test_unknown_backend(self) -> None:
+        with pytest.raises(ValueError, match="Unknown cache backend"):
+            create_cache_backend("lmdb")
+
+    def test_manager_get_issues(self, cache: SqliteCache) -> None:
+        manager = CacheManager(backend=cache)
+        manager.set_issue("PROJ-1", {"key": "PROJ-1"})
+        manager.set_issue("PROJ-2", {"key": "PROJ-2"})
+
+        assert manager.get_issues(["PROJ-1", "PROJ-2", "PROJ-3"]) == {
+            "PROJ-1": {"key": "PROJ-1"},
+            "PROJ-2": {"key": "PROJ-2"},
+        }
+        assert manager.invalidate_issue("PROJ-1") == 1
+        assert CacheManager(backend="memory").get_issues(["PROJ-1"]) == {}
@@ -0,0 +1,208 @@
+"""Tests for the tiered cache and single-flight load coalescing."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from spectryn.adapters.cache import (
+    CacheManager,
+    CacheStats,
+    MemoryCache,
+    SingleFlight,
+    SqliteCache,
+    TieredCache,
+    create_cache_backend,
+)
+
+
+@pytest.fixture
+def l2():
+    return MemoryCache(max_size=100, default_ttl=60)
+
+
+@pytest.fixture
+def cache(l2):
+    return TieredCache(l2, l1_max_size=2, l1_ttl=30)
+
+
+def _blocking_fetch(calls: list, release: threading.Event):
+    def fetch():
+        calls.append(threading.current_thread().name)
+        release.wait(5)
+        return {"key": "PROJ-1"}
+
+    return fetch
+
+
+def _wait_for(condition) -> None:
+    deadline = time.time() + 5
+    while not condition() and time.time() < deadline:
+        time.sleep(0.001)
+
+
+class TestTieredCache:
+    """Tests for TieredCache."""
+
+    def test_writes_go_to_both_tiers(self, cache, l2):
+        cache.set("key", "value", tags={"tag"})
+
+        assert cache.l1.get("key") == "value"
+        assert l2.get("key") == "value"
+        assert cache.get("key") == "value"
+        assert cache.get_stats().hits == 1
+
+    def test_l2_hit_is_promoted(self, cache, l2):
+        l2.set("key", "value")
+
+        assert cache.get("key") == "value"
+        assert cache.l1.get("key") == "value"
+        assert cache.get_stats().promotions == 1
+
+        cache.get("key")
+        assert cache.get_stats().promotions == 1
+
+    def test_miss_in_both_tiers(self, cache):
+        assert cache.get("missing") is None
+        assert cache.get_stats().misses == 1
+
+    def test_l1_eviction_is_a_demotion(self, cache):
+        for key in ("a", "b", "c"):
+            cache.set(key, key.upper())
+
+        stats = cache.get_stats()
+        assert stats.demotions == 1
+        assert stats.evictions == 1
+        assert not cache.l1.exists("a")
+        assert cache.get("a") == "A"
+        assert cache.get_stats().promotions == 1
+
+    def test_l1_ttl_caps_entry_ttl(self, cache):
+        cache.set("long", 1, ttl=3600)
+        cache.set("short", 2, ttl=5)
+
+        assert cache.l1.get_entry("long").ttl_remaining <= 30
+        assert cache.l1.get_entry("short").ttl_remaining <= 5
+
+    def test_tag_invalidation_drops_promoted_entries(self, cache, l2):
+        l2.set("promoted", "value", tags={"issue:PROJ-1"})
+        cache.get("promoted")
+
+        assert cache.invalidate_by_tag("issue:PROJ-1") == 1
+        assert cache.get("promoted") is None
+
+    def test_delete_and_clear(self, cache, l2):
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        assert cache.delete("a")
+        assert not cache.exists("a")
+        assert not cache.delete("a")
+        assert cache.clear() == 1
+        assert cache.size == 0
+
+    def test_get_many_reads_l2_once_for_misses(self, cache, l2):
+        cache.set("a", 1)
+        l2.set_many({"b": 2, "c": 3})
+
+        assert cache.get_many(["a", "b", "missing"]) == {"a": 1, "b": 2}
+        stats = cache.get_stats()
+        assert (stats.hits, stats.misses, stats.promotions) == (2, 1, 1)
+
+    def test_over_sqlite(self, tmp_path):
+        with SqliteCache(db_path=tmp_path / "cache.db") as sqlite:
+            sqlite.set("key", {"persisted": True})
+
+            cache = TieredCache(sqlite)
+            assert cache.get("key") == {"persisted": True}
+            assert cache.get_stats().promotions == 1
+
+    def test_selectable_by_name(self, tmp_path):
+        cache = create_cache_backend("tiered", path=tmp_path / "cache.db", max_size=10)
+
+        assert isinstance(cache, TieredCache)
+        assert isinstance(cache.l2, SqliteCache)
+        assert cache.l1.max_size == 10
+        cache.l2.close()
+
+
+class TestSingleFlight:
+    """Tests for single-flight load coalescing."""
+
+    def test_concurrent_loads_share_one_call(self):
+        flight = SingleFlight()
+        calls: list = []
+        release = threading.Event()
+        fetch = _blocking_fetch(calls, release)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(flight.do, "key", fetch) for _ in range(4)]
+            _wait_for(lambda: len(calls) == 1)
+            time.sleep(0.1)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert len(calls) == 1
+        assert sorted(shared for _, shared in results) == [False, True, True, True]
+        assert flight.in_flight == 0
+
+    def test_error_reaches_every_waiter(self):
+        flight = SingleFlight()
+        release = threading.Event()
+
+        def fail():
+            release.wait(5)
+            raise RuntimeError("boom")
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = [pool.submit(flight.do, "key", fail) for _ in range(2)]
+            _wait_for(lambda: flight.in_flight == 1)
+            time.sleep(0.1)
+            release.set()
+            for future in futures:
+                with pytest.raises(RuntimeError, match="boom"):
+                    future.result()
+
+        assert flight.do("key", lambda: 1) == (1, False)
+
+    def test_tiered_get_or_set_coalesces(self, cache):
+        calls: list = []
+        release = threading.Event()
+        fetch = _blocking_fetch(calls, release)
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [pool.submit(cache.get_or_set, "key", fetch) for _ in range(3)]
+            _wait_for(lambda: len(calls) == 1)
+            time.sleep(0.1)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert len(calls) == 1
+        assert results == [{"key": "PROJ-1"}] * 3
+        assert cache.get_stats().coalesced + cache.get_stats().hits >= 2
+
+    def test_manager_get_or_fetch_issue_coalesces(self):
+        manager = CacheManager(backend=MemoryCache())
+        calls: list = []
+        release = threading.Event()
+        fetch = _blocking_fetch(calls, release)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(manager.get_or_fetch_issue, "PROJ-1", fetch) for _ in range(4)]
+            _wait_for(lambda: len(calls) == 1)
+            time.sleep(0.1)
+            release.set()
+            for future in futures:
+                assert future.result() == {"key": "PROJ-1"}
+
+        assert len(calls) == 1
+        assert manager.get_issue("PROJ-1") == {"key": "PROJ-1"}
+
+    def test_stats_report_tier_counters(self):
+        stats = CacheStats(promotions=2, demotions=1, coalesced=3)
+
+        assert stats.to_dict()["promotions"] == 2
+        assert stats.to_dict()["coalesced"] == 3
+        stats.reset()
+        assert (stats.promotions, stats.demotions, stats.coalesced) == (0, 0, 0)
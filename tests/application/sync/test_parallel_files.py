@@ -7,6 +7,8 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from spectryn.adapters.parsers import MarkdownParser
+from spectryn.application.sync.multi_epic import MultiEpicSyncOrchestrator, MultiEpicSyncResult
 from spectryn.application.sync.parallel_files import (
     FileProgress,
     FileSyncResult,
@@ -539,3 +541,49 @@ class TestParallelFilesIntegration:
 
         # Should show speedup if total time is less than sum of individual times
         assert "speedup" in summary.lower() or "Duration" in summary
+
+    def test_files_parsed_before_sync_threads(self, tmp_path, sample_epic_content):
+        """Test that files are parsed up front and synced with the parsed epics."""
+        paths = []
+        for i in range(8):
+            path = tmp_path / f"epic{i}.md"
+            path.write_text(sample_epic_content, encoding="utf-8")
+            paths.append(str(path))
+
+        processor = ParallelFileProcessor(
+            tracker=MagicMock(),
+            parser=MarkdownParser(),
+            formatter=MagicMock(),
+            config=MagicMock(dry_run=True),
+            parallel_config=ParallelFilesConfig(parse_processes=2),
+        )
+
+        with patch.object(
+            MultiEpicSyncOrchestrator, "sync", return_value=MultiEpicSyncResult()
+        ) as sync:
+            result = processor.process(paths)
+
+        assert result.files_total == 8
+        assert sync.call_count == 8
+        for call in sync.call_args_list:
+            epics = call.kwargs["epics"]
+            assert [str(e.key) for e in epics] == ["TEST-100"]
+            assert len(epics[0].stories) == 2
+
+    def test_parse_stage_disabled(self, tmp_path, sample_epic_content):
+        """Test that parse_processes=1 leaves parsing to the sync threads."""
+        paths = []
+        for i in range(8):
+            path = tmp_path / f"epic{i}.md"
+            path.write_text(sample_epic_content, encoding="utf-8")
+            paths.append(Path(path))
+
+        processor = ParallelFileProcessor(
+            tracker=MagicMock(),
+            parser=MarkdownParser(),
+            formatter=MagicMock(),
+            config=MagicMock(dry_run=True),
+            parallel_config=ParallelFilesConfig(parse_processes=1),
+        )
+
+        assert processor._parse_files(paths) == {}
@@ -0,0 +1,270 @@
+"""Tests for the asyncio sync engine."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from spectryn.application.sync import AsyncSyncOrchestrator
+from spectryn.core.domain.entities import Subtask, UserStory
+from spectryn.core.domain.enums import Status
+from spectryn.core.domain.events import (
+    CommentAdded,
+    EventBus,
+    StatusTransitioned,
+    StoryUpdated,
+    SubtaskCreated,
+)
+from spectryn.core.domain.value_objects import CommitRef, Description, StoryId
+from spectryn.core.ports.config_provider import SyncConfig
+from spectryn.core.ports.issue_tracker import IssueData, IssueTrackerPort
+
+
+class FakeAsyncTracker:
+    """In-memory AsyncIssueTrackerPort that records each batch call."""
+
+    def __init__(self, issues: dict[str, IssueData], failing: frozenset[str] = frozenset()):
+        self.issues = issues
+        self.failing = failing
+        self.calls: dict[str, list] = {}
+        self.connected = False
+
+    async def __aenter__(self):
+        self.connected = True
+        return self
+
+    async def __aexit__(self, *exc):
+        self.connected = False
+
+    def _record(self, name, items):
+        self.calls.setdefault(name, []).append(list(items))
+
+    def _outcome(self, key):
+        if key in self.failing:
+            return (key, False, f"{key} rejected")
+        return (key, True, None)
+
+    async def get_issues_async(self, issue_keys):
+        self._record("get_issues", issue_keys)
+        return [self.issues[k] for k in issue_keys if k in self.issues]
+
+    async def update_descriptions_async(self, updates):
+        self._record("update_descriptions", updates)
+        return [self._outcome(key) for key, _ in updates]
+
+    async def create_subtasks_async(self, subtasks):
+        self._record("create_subtasks", subtasks)
+        return [
+            (None, False, "create rejected")
+            if st["parent_key"] in self.failing
+            else (f"{st['parent_key']}-NEW{i}", True, None)
+            for i, st in enumerate(subtasks)
+        ]
+
+    async def transition_issues_async(self, transitions):
+        self._record("transition_issues", transitions)
+        return [self._outcome(key) for key, _ in transitions]
+
+    async def add_comments_async(self, comments):
+        self._record("add_comments", comments)
+        return [self._outcome(key) for key, _ in comments]
+
+
+def _children() -> list[IssueData]:
+    return [
+        IssueData(
+            key=f"TEST-{i}",
+            summary=f"Story {i}",
+            status="Open",
+            subtasks=[
+                IssueData(key=f"TEST-{i}0", summary=f"Task {i}-a", status="Open"),
+                IssueData(key=f"TEST-{i}1", summary=f"Task {i}-old", status="Done"),
+            ],
+        )
+        for i in range(1, 4)
+    ]
+
+
+def _stories() -> list[UserStory]:
+    return [
+        UserStory(
+            id=StoryId(f"US-{i:03d}"),
+            title=f"Story {i}",
+            description=Description(role="user", want="a feature", benefit="value"),
+            status=Status.DONE if i == 1 else Status.IN_PROGRESS,
+            subtasks=[
+                Subtask(name=f"Task {i}-a", description="a", story_points=1),
+                Subtask(name=f"Task {i}-b", description="b", story_points=2),
+            ],
+            commits=[CommitRef(hash="abc1234", message="Implement")],
+        )
+        for i in range(1, 4)
+    ]
+
+
+def _build(mock_formatter, async_tracker, dry_run=False, include_subtasks=True):
+    children = _children()
+    tracker = Mock(spec=IssueTrackerPort)
+    tracker.epic_children_include_subtasks = include_subtasks
+    tracker.iter_epic_children.return_value = iter([children])
+    tracker.get_issue.side_effect = lambda key: next(c for c in children if c.key == key)
+    tracker.get_issue_comments.return_value = []
+    tracker.update_subtask.return_value = True
+    parser = Mock()
+    parser.parse_stories.return_value = _stories()
+    event_bus = EventBus()
+    orchestrator = AsyncSyncOrchestrator(
+        tracker=tracker,
+        parser=parser,
+        formatter=mock_formatter,
+        config=SyncConfig(dry_run=dry_run, backup_enabled=False),
+        async_tracker=async_tracker,
+        event_bus=event_bus,
+        max_concurrency=4,
+    )
+    return orchestrator, tracker, event_bus
+
+
+@pytest.fixture
+def async_tracker():
+    return FakeAsyncTracker({issue.key: issue for issue in _children()})
+
+
+class TestAsyncSyncOrchestrator:
+    """Tests for AsyncSyncOrchestrator phases."""
+
+    def test_full_sync_batches_each_phase(self, mock_formatter, async_tracker):
+        orchestrator, tracker, event_bus = _build(mock_formatter, async_tracker)
+
+        result = orchestrator.sync("/path/to/doc.md", "TEST-1")
+
+        assert result.success
+        assert result.stories_updated == 3
+        assert result.subtasks_updated == 3
+        assert result.subtasks_created == 3
+        assert result.comments_added == 3
+        assert result.statuses_updated == 1
+
+        # One batched call per phase, nothing issued per story
+        assert [len(c) for c in async_tracker.calls["update_descriptions"]] == [3]
+        assert [len(c) for c in async_tracker.calls["create_subtasks"]] == [3]
+        assert [len(c) for c in async_tracker.calls["add_comments"]] == [3]
+        assert async_tracker.calls["transition_issues"] == [[("TEST-10", "Resolved")]]
+        tracker.get_issue.assert_not_called()
+        tracker.update_issue_description.assert_not_called()
+        tracker.create_subtask.assert_not_called()
+        assert tracker.update_subtask.call_count == 3
+        assert not async_tracker.connected
+
+        created = async_tracker.calls["create_subtasks"][0]
+        assert [st["summary"] for st in created] == ["Task 1-b", "Task 2-b", "Task 3-b"]
+        assert created[0]["project_key"] == "TEST"
+        assert created[0]["story_points"] == 2
+
+        types = [type(e) for e in event_bus.get_history()]
+        assert types.count(StoryUpdated) == 3
+        assert types.count(SubtaskCreated) == 3
+        assert types.count(CommentAdded) == 3
+        assert types.count(StatusTransitioned) == 1
+
+    def test_subtasks_sync_in_markdown_order_per_story(self, mock_formatter, async_tracker):
+        orchestrator, tracker, event_bus = _build(mock_formatter, async_tracker)
+        stories = _stories()
+        # New, existing, new: the existing subtask is updated between the creates
+        stories[0].subtasks = [
+            Subtask(name="Task 1-b", description="b", story_points=2),
+            Subtask(name="Task 1-a", description="a", story_points=1),
+            Subtask(name="Task 1-c", description="c", story_points=3),
+        ]
+        orchestrator.parser.parse_stories.return_value = stories
+        timeline: list[str] = []
+        tracker.update_subtask.side_effect = lambda **kwargs: (
+            timeline.append(kwargs["issue_key"]) or True
+        )
+        event_bus.subscribe(SubtaskCreated, lambda e: timeline.append(e.subtask_name))
+
+        result = orchestrator.sync("/path/to/doc.md", "TEST-1")
+
+        assert result.subtasks_created == 4
+        story_1 = [entry for entry in timeline if entry in {"Task 1-b", "TEST-10", "Task 1-c"}]
+        assert story_1 == ["Task 1-b", "TEST-10", "Task 1-c"]
+        # Creates are still batched across stories, one batch per position
+        assert [len(c) for c in async_tracker.calls["create_subtasks"]] == [1, 2, 1]
+
+    def test_events_match_sync_commands(self, mock_formatter, async_tracker):
+        orchestrator, _, event_bus = _build(mock_formatter, async_tracker)
+
+        orchestrator.sync("/path/to/doc.md", "TEST-1")
+
+        created = [e for e in event_bus.get_history() if isinstance(e, SubtaskCreated)]
+        assert [(e.parent_key, e.subtask_name, e.story_points) for e in created] == [
+            ("TEST-1", "Task 1-b", 2),
+            ("TEST-2", "Task 2-b", 2),
+            ("TEST-3", "Task 3-b", 2),
+        ]
+        assert all(e.subtask_key for e in created)
+        (transitioned,) = [e for e in event_bus.get_history() if isinstance(e, StatusTransitioned)]
+        assert (transitioned.issue_key, transitioned.from_status) == ("TEST-10", "Open")
+        assert transitioned.to_status == "Resolved"
+
+    def test_failures_are_recorded_per_operation(self, mock_formatter):
+        async_tracker = FakeAsyncTracker(
+            {issue.key: issue for issue in _children()}, failing=frozenset({"TEST-2", "TEST-10"})
+        )
+        orchestrator, _, _ = _build(mock_formatter, async_tracker)
+
+        result = orchestrator.sync("/path/to/doc.md", "TEST-1")
+
+        failed = {(f.operation, f.issue_key) for f in result.failed_operations}
+        assert failed == {
+            ("update_description", "TEST-2"),
+            ("create_subtask", "TEST-2"),
+            ("add_comment", "TEST-2"),
+            ("transition_status", "TEST-10"),
+        }
+        assert result.stories_updated == 2
+        assert result.subtasks_created == 2
+        assert result.comments_added == 2
+        assert result.statuses_updated == 0
+
+    def test_fetches_subtasks_missing_from_analysis(self, mock_formatter, async_tracker):
+        orchestrator, tracker, _ = _build(mock_formatter, async_tracker, include_subtasks=False)
+
+        result = orchestrator.sync("/path/to/doc.md", "TEST-1")
+
+        assert result.success
+        assert async_tracker.calls["get_issues"][0] == ["TEST-1", "TEST-2", "TEST-3"]
+        assert result.subtasks_updated == 3
+        tracker.get_issue.assert_not_called()
+
+    def test_skips_existing_commit_comments(self, mock_formatter, async_tracker):
+        orchestrator, tracker, _ = _build(mock_formatter, async_tracker)
+        tracker.get_issue_comments.return_value = [{"body": "Related Commits: abc1234"}]
+
+        result = orchestrator.sync("/path/to/doc.md", "TEST-1")
+
+        assert result.comments_added == 0
+        assert "add_comments" not in async_tracker.calls
+
+    def test_dry_run_uses_sync_phases(self, mock_formatter, async_tracker):
+        orchestrator, _, _ = _build(mock_formatter, async_tracker, dry_run=True)
+
+        result = orchestrator.sync("/path/to/doc.md", "TEST-1")
+
+        assert result.dry_run
+        assert async_tracker.calls == {}
+
+    def test_phase_error_is_recorded(self, mock_formatter, async_tracker):
+        async def boom(updates):
+            raise RuntimeError("connection reset")
+
+        async_tracker.update_descriptions_async = boom
+        orchestrator, _, _ = _build(mock_formatter, async_tracker)
+
+        result = orchestrator.sync("/path/to/doc.md", "TEST-1")
+
+        assert not result.success
+        assert any(
+            f.operation == "update_descriptions" and "connection reset" in f.error
+            for f in result.failed_operations
+        )
+        assert result.subtasks_created == 3
@@ -1,5 +1,6 @@
 """Tests for backup functionality."""
 
+import json
 from unittest.mock import MagicMock
 
 import pytest
@@ -254,6 +255,56 @@ class TestBackupManager:
         assert loaded.backup_id == backup.backup_id
         assert loaded.issue_count == 1
 
+    def test_create_backup_counts_comments_per_issue(self, manager, mock_tracker):
+        """Should record each issue's own comment count, failures as zero."""
+        counts = {"PROJ-100": [{"id": "1"}], "PROJ-200": RuntimeError("boom")}
+
+        def get_comments(key):
+            result = counts[key]
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        mock_tracker.get_issue_comments.side_effect = get_comments
+
+        backup = manager.create_backup(mock_tracker, "PROJ-1", "/path/to/file.md")
+
+        assert [(i.key, i.comments_count) for i in backup.issues] == [
+            ("PROJ-100", 1),
+            ("PROJ-200", 0),
+        ]
+
+    def test_create_backup_sequential(self, backup_dir, mock_tracker):
+        """max_workers=1 should read comments serially."""
+        manager = BackupManager(backup_dir=backup_dir, max_workers=1)
+
+        backup = manager.create_backup(mock_tracker, "PROJ-1", "/path/to/file.md")
+
+        assert [i.comments_count for i in backup.issues] == [2, 2]
+        assert mock_tracker.get_issue_comments.call_count == 2
+
+    def test_save_backup_matches_json_dump_layout(self, manager):
+        """Streamed backups should read back like a single json.dump."""
+        backup = Backup(
+            backup_id="test_backup_456",
+            epic_key="PROJ-1",
+            markdown_path="/path/to/file.md",
+            issues=[
+                IssueSnapshot(
+                    key="PROJ-100",
+                    summary="Story 1",
+                    description={"type": "doc", "content": []},
+                    subtasks=[IssueSnapshot(key="PROJ-101", summary="Sub 1")],
+                ),
+                IssueSnapshot(key="PROJ-200", summary="Story 2"),
+            ],
+            metadata={"trigger": "pre_sync"},
+        )
+
+        path = manager.save_backup(backup, sanitize=False)
+
+        assert path.read_text() == json.dumps(backup.to_dict(), indent=2)
+
     def test_list_backups(self, manager, mock_tracker):
         """Should list all backups."""
         # Create multiple backups for different epics
@@ -389,6 +389,25 @@ class TestTransitionStatusCommand:
         assert undo_result.success
         mock_tracker.transition_issue.assert_called_with("PROJ-123", "Open")
 
+    def test_record_success_publishes_and_allows_undo(self, mock_tracker):
+        event_bus = EventBus()
+        cmd = TransitionStatusCommand(
+            tracker=mock_tracker,
+            issue_key="PROJ-123",
+            target_status="Done",
+            event_bus=event_bus,
+            dry_run=False,
+        )
+
+        result = cmd.record_success("In Progress")
+
+        assert result.success
+        (event,) = event_bus.get_history()
+        assert (event.from_status, event.to_status) == ("In Progress", "Done")
+        mock_tracker.transition_issue.assert_not_called()
+        cmd.undo()
+        mock_tracker.transition_issue.assert_called_with("PROJ-123", "In Progress")
+
     def test_undo_without_execute(self, mock_tracker):
         cmd = TransitionStatusCommand(
             tracker=mock_tracker, issue_key="PROJ-123", target_status="Done"
@@ -839,3 +858,196 @@ class TestSyncOrchestratorGracefulDegradation:
 
         # failed_operations should be a list (even if empty)
         assert isinstance(result.failed_operations, list)
+
+
+class TestSyncOrchestratorConcurrency:
+    """Tests for concurrent per-story phase execution."""
+
+    def _build_stories(self, count: int):
+        from spectryn.core.domain.entities import Subtask, UserStory
+        from spectryn.core.domain.enums import Status
+        from spectryn.core.domain.value_objects import Description, StoryId
+
+        return [
+            UserStory(
+                id=StoryId(f"US-{i:03d}"),
+                title=f"Story {i:03d}",
+                description=Description(role="dev", want=f"feature {i}", benefit="value"),
+                status=Status.DONE,
+                subtasks=[
+                    Subtask(name=f"Task {i}-a", description="a", story_points=1),
+                    Subtask(name=f"Task {i}-b", description="b", story_points=1),
+                ],
+            )
+            for i in range(1, count + 1)
+        ]
+
+    def _build_tracker(self, count: int):
+        import threading
+
+        tracker = Mock()
+        tracker.get_epic_children.return_value = [
+            IssueData(key=f"TEST-{i}", summary=f"Story {i:03d}", status="Open")
+            for i in range(1, count + 1)
+        ]
+        tracker.get_issue.side_effect = lambda key: IssueData(key=key, summary="", status="Open")
+        tracker.get_issue_comments.return_value = []
+        tracker.update_issue_description.return_value = True
+        tracker.create_subtask.return_value = "TEST-999"
+
+        tracker.calls_by_parent = {}
+        tracker.active = 0
+        tracker.peak = 0
+        lock = threading.Lock()
+
+        def create_subtask(parent_key, summary, **kwargs):
+            with lock:
+                tracker.active += 1
+                tracker.peak = max(tracker.peak, tracker.active)
+                tracker.calls_by_parent.setdefault(parent_key, []).append(summary)
+            threading.Event().wait(0.01)
+            with lock:
+                tracker.active -= 1
+            return "TEST-999"
+
+        tracker.create_subtask.side_effect = create_subtask
+        return tracker
+
+    def _run(self, mock_formatter, concurrency: int, count: int = 12, tracker=None):
+        from spectryn.application.sync.orchestrator import SyncOrchestrator
+        from spectryn.core.ports.config_provider import SyncConfig
+
+        parser = Mock()
+        parser.parse_stories.return_value = self._build_stories(count)
+        tracker = tracker or self._build_tracker(count)
+        config = SyncConfig(
+            dry_run=False,
+            backup_enabled=False,
+            sync_statuses=False,
+            concurrency=concurrency,
+        )
+        orchestrator = SyncOrchestrator(
+            tracker=tracker, parser=parser, formatter=mock_formatter, config=config
+        )
+        progress = []
+
+        def progress_callback(phase, item="", overall=0.0, current=0, total=0):
+            if isinstance(item, str):
+                progress.append((phase, current, total))
+
+        result = orchestrator.sync("/path/to/doc.md", "TEST-1", progress_callback=progress_callback)
+        return result, tracker, progress
+
+    def test_concurrent_counts_match_sequential(self, mock_formatter):
+        """Concurrent execution produces the same counters as a serial run."""
+        serial, _, _ = self._run(mock_formatter, concurrency=1)
+        concurrent, _, _ = self._run(mock_formatter, concurrency=4)
+
+        assert concurrent.success
+        assert concurrent.stories_updated == serial.stories_updated == 12
+        assert concurrent.subtasks_created == serial.subtasks_created == 24
+
+    def test_concurrent_runs_in_parallel_and_keeps_issue_order(self, mock_formatter):
+        """Stories fan out over workers while subtasks of one issue stay ordered."""
+        _, tracker, _ = self._run(mock_formatter, concurrency=4)
+
+        assert 1 < tracker.peak <= 4
+        for i in range(1, 13):
+            assert tracker.calls_by_parent[f"TEST-{i}"] == [f"Task {i}-a", f"Task {i}-b"]
+
+    def test_concurrent_progress_is_exact(self, mock_formatter):
+        """Each item is reported exactly once with a consistent total."""
+        _, _, progress = self._run(mock_formatter, concurrency=4)
+
+        subtask_updates = [p for p in progress if p[0] == "Syncing subtasks"]
+        assert [current for _, current, _ in subtask_updates] == list(range(25))
+        assert all(total == 24 for _, _, total in subtask_updates)
+
+    def test_concurrent_failures_are_merged_in_story_order(self, mock_formatter):
+        """Failures from workers are collected in markdown story order."""
+        tracker = self._build_tracker(6)
+        tracker.update_issue_description.side_effect = IssueTrackerError("boom")
+
+        result, _, _ = self._run(mock_formatter, concurrency=3, count=6, tracker=tracker)
+
+        assert not result.success
+        failed = [f for f in result.failed_operations if f.operation == "update_description"]
+        assert [f.story_id for f in failed] == [f"US-{i:03d}" for i in range(1, 7)]
+
+
+class TestSyncOrchestratorSubtaskPrefetch:
+    """Tests for reusing analyze-phase subtasks during subtask sync."""
+
+    def _build_tracker(self, include_subtasks: bool):
+        from spectryn.core.ports.issue_tracker import IssueTrackerPort
+
+        children = [
+            IssueData(
+                key=f"TEST-{i}",
+                summary=f"Story {i:03d}",
+                status="Open",
+                subtasks=[IssueData(key=f"TEST-{i}0", summary=f"Task {i}-a", status="Open")],
+            )
+            for i in range(1, 4)
+        ]
+        tracker = Mock(spec=IssueTrackerPort)
+        tracker.epic_children_include_subtasks = include_subtasks
+        tracker.iter_epic_children.return_value = iter([children])
+        tracker.get_issue.side_effect = lambda key: next(c for c in children if c.key == key)
+        tracker.update_subtask.return_value = True
+        tracker.create_subtask.return_value = "TEST-999"
+        return tracker
+
+    def _sync(self, tracker, mock_formatter):
+        from spectryn.application.sync.orchestrator import SyncOrchestrator
+        from spectryn.core.domain.entities import Subtask, UserStory
+        from spectryn.core.domain.value_objects import StoryId
+        from spectryn.core.ports.config_provider import SyncConfig
+
+        parser = Mock()
+        parser.parse_stories.return_value = [
+            UserStory(
+                id=StoryId(f"US-{i:03d}"),
+                title=f"Story {i:03d}",
+                subtasks=[
+                    Subtask(name=f"Task {i}-a", description="a", story_points=1),
+                    Subtask(name=f"Task {i}-b", description="b", story_points=1),
+                ],
+            )
+            for i in range(1, 4)
+        ]
+        config = SyncConfig(
+            dry_run=False,
+            backup_enabled=False,
+            sync_descriptions=False,
+            sync_comments=False,
+            sync_statuses=False,
+        )
+        orchestrator = SyncOrchestrator(
+            tracker=tracker, parser=parser, formatter=mock_formatter, config=config
+        )
+        return orchestrator.sync("/path/to/doc.md", "TEST-1")
+
+    def test_prefetched_subtasks_skip_per_story_reads(self, mock_formatter):
+        """Subtasks returned with epic children are reused without get_issue."""
+        tracker = self._build_tracker(include_subtasks=True)
+
+        result = self._sync(tracker, mock_formatter)
+
+        assert result.success
+        tracker.get_issue.assert_not_called()
+        assert result.subtasks_updated == 3
+        assert result.subtasks_created == 3
+        updated = sorted(call.kwargs["issue_key"] for call in tracker.update_subtask.call_args_list)
+        assert updated == ["TEST-10", "TEST-20", "TEST-30"]
+
+    def test_falls_back_to_get_issue_without_prefetched_subtasks(self, mock_formatter):
+        """Trackers that don't return subtasks with children are read per story."""
+        tracker = self._build_tracker(include_subtasks=False)
+
+        result = self._sync(tracker, mock_formatter)
+
+        assert result.success
+        assert tracker.get_issue.call_count == 3
+        assert result.subtasks_updated == 3
+        assert result.subtasks_created == 3
@@ -1,17 +1,24 @@
 """Tests for the event sourcing integration module."""
 
+import json
+import pickle
+import time
 from datetime import datetime, timedelta
+from typing import Any
+from unittest.mock import patch
 
 import pytest
 
 from spectryn.adapters.event_store import MemoryEventStore
 from spectryn.application.sync.event_sourcing import (
+    Durability,
     EpicHistory,
     EpicHistoryProjection,
     EventReplayer,
     EventSourcedBus,
     SyncSessionProjection,
     SyncSessionStats,
+    _flush_buffered_buses,
     create_event_sourced_bus,
     get_epic_history,
 )
@@ -28,7 +35,7 @@ from spectryn.core.domain.events import (
     SyncCompleted,
     SyncStarted,
 )
-from spectryn.core.ports.event_store import make_sync_stream_id
+from spectryn.core.ports.event_store import ProjectionSnapshot, make_sync_stream_id
 
 
 # =============================================================================
@@ -197,6 +204,113 @@ class TestEventSourcedBus:
         assert bus.stream_id == stream_id
 
 
+class TestEventSourcedBusWriteBehind:
+    """Tests for group-commit (write-behind) persistence."""
+
+    def test_events_buffered_until_flush_size(self, event_store: MemoryEventStore) -> None:
+        """Test that buffered events are appended in one group commit."""
+        bus = EventSourcedBus(
+            event_store, "stream", durability="batch", flush_size=3, flush_interval=60
+        )
+
+        with patch.object(event_store, "append", wraps=event_store.append) as append:
+            for i in range(7):
+                bus.publish(SubtaskCreated(subtask_name=str(i)))
+
+            assert [len(c.args[1]) for c in append.call_args_list] == [3, 3]
+            assert bus.pending_count == 1
+            bus.close()
+            assert [len(c.args[1]) for c in append.call_args_list] == [3, 3, 1]
+        assert [e.event.subtask_name for e in event_store.read("stream")] == [
+            str(i) for i in range(7)
+        ]
+
+    def test_subscribers_notified_before_flush(self, event_store: MemoryEventStore) -> None:
+        """Test that write-behind does not delay subscribers."""
+        bus = EventSourcedBus(event_store, "stream", durability="batch", flush_interval=60)
+        received: list[DomainEvent] = []
+        bus.subscribe(SyncStarted, received.append)
+
+        bus.publish(SyncStarted())
+
+        assert len(received) == 1
+        assert event_store.get_stream_info("stream") is None
+        bus.flush()
+
+    def test_flushes_after_interval(self, event_store: MemoryEventStore) -> None:
+        """Test that buffered events are flushed by the timer."""
+        bus = EventSourcedBus(event_store, "stream", durability="batch", flush_interval=0.01)
+
+        bus.publish(SyncStarted())
+
+        deadline = datetime.now() + timedelta(seconds=5)
+        while bus.pending_count and datetime.now() < deadline:
+            time.sleep(0.01)
+        assert len(list(event_store.read("stream"))) == 1
+
+    def test_context_manager_flushes(self, event_store: MemoryEventStore) -> None:
+        """Test that leaving a with block flushes buffered events."""
+        with EventSourcedBus(event_store, "stream", durability=Durability.NONE) as bus:
+            bus.publish_batch([SyncStarted(), SyncCompleted()])
+
+        assert len(list(event_store.read("stream"))) == 2
+
+    def test_durability_controls_sync(self, event_store: MemoryEventStore) -> None:
+        """Test that only NONE durability appends without syncing."""
+        with patch.object(event_store, "append", wraps=event_store.append) as append:
+            for durability in Durability:
+                bus = EventSourcedBus(event_store, durability.value, durability=durability)
+                bus.publish(SyncStarted())
+                bus.close()
+
+        assert [c.kwargs["sync"] for c in append.call_args_list] == [True, True, False]
+
+    def test_failed_flush_keeps_events_buffered(self, event_store: MemoryEventStore) -> None:
+        """Test that events are not lost when a group commit fails."""
+        bus = EventSourcedBus(event_store, "stream", durability="batch", flush_interval=60)
+        bus.publish(SyncStarted())
+
+        with (
+            patch.object(event_store, "append", side_effect=OSError("disk full")),
+            pytest.raises(OSError),
+        ):
+            bus.flush()
+
+        assert bus.pending_count == 1
+        bus.flush()
+        assert len(list(event_store.read("stream"))) == 1
+
+    def test_failed_timed_flush_is_retried(self, event_store: MemoryEventStore) -> None:
+        """Test a failed timed flush re-arms the timer with backoff."""
+        bus = EventSourcedBus(event_store, "stream", durability="batch", flush_interval=0.01)
+        append = event_store.append
+        failures = [OSError("disk full"), OSError("disk full")]
+
+        def flaky_append(*args: Any, **kwargs: Any) -> Any:
+            if failures:
+                raise failures.pop()
+            return append(*args, **kwargs)
+
+        with patch.object(event_store, "append", side_effect=flaky_append) as mock_append:
+            bus.publish(SyncStarted())
+
+            deadline = datetime.now() + timedelta(seconds=5)
+            while bus.pending_count and datetime.now() < deadline:
+                time.sleep(0.01)
+
+        assert mock_append.call_count == 3
+        assert len(list(event_store.read("stream"))) == 1
+
+    def test_buffered_buses_flushed_at_exit(self, event_store: MemoryEventStore) -> None:
+        """Test the exit hook flushes every buffered bus."""
+        bus = EventSourcedBus(event_store, "stream", durability="batch", flush_interval=60)
+        bus.publish(SyncStarted())
+
+        _flush_buffered_buses()
+
+        assert len(list(event_store.read("stream"))) == 1
+
+
 # =============================================================================
 # EventReplayer Tests
 # =============================================================================
@@ -298,11 +412,216 @@ class TestEventReplayer:
         assert stored[1].event_type == "SyncCompleted"
 
 
+class CountingProjection(SyncSessionProjection):
+    """Session projection that snapshots every 3 events and counts applies."""
+
+    snapshot_every = 3
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.applied = 0
+
+    def apply(self, event: DomainEvent) -> None:
+        self.applied += 1
+        super().apply(event)
+
+
+class TestProjectionSnapshots:
+    """Tests for snapshot-accelerated projection replay."""
+
+    def test_snapshot_saved_after_cadence(
+        self, event_store: MemoryEventStore, sample_sync_events: list[DomainEvent]
+    ) -> None:
+        """Test that a full replay saves the state at the last event."""
+        event_store.append("test-stream", sample_sync_events)
+
+        EventReplayer(event_store).replay_with_projection("test-stream", CountingProjection())
+
+        snapshot = event_store.load_snapshot("test-stream", "CountingProjection")
+        assert snapshot is not None
+        assert snapshot.sequence == len(sample_sync_events) - 1
+        assert snapshot.event_id == sample_sync_events[-1].event_id
+
+    def test_replay_resumes_from_snapshot(
+        self, event_store: MemoryEventStore, sample_sync_events: list[DomainEvent]
+    ) -> None:
+        """Test that later replays apply only events after the snapshot."""
+        event_store.append("test-stream", sample_sync_events[:6])
+        replayer = EventReplayer(event_store)
+        replayer.replay_with_projection("test-stream", CountingProjection())
+        event_store.append("test-stream", sample_sync_events[6:])
+
+        projection = CountingProjection()
+        stats = replayer.replay_with_projection("test-stream", projection)
+
+        full_store = MemoryEventStore()
+        full_store.append("test-stream", sample_sync_events)
+        expected = EventReplayer(full_store).replay_with_projection(
+            "test-stream", SyncSessionProjection()
+        )
+        assert projection.applied == 3
+        assert stats == expected
+
+    def test_short_tail_keeps_previous_snapshot(
+        self, event_store: MemoryEventStore, sample_sync_events: list[DomainEvent]
+    ) -> None:
+        """Test that fewer than snapshot_every new events do not re-snapshot."""
+        event_store.append("test-stream", sample_sync_events[:6])
+        replayer = EventReplayer(event_store)
+        replayer.replay_with_projection("test-stream", CountingProjection())
+        event_store.append("test-stream", sample_sync_events[6:8])
+
+        replayer.replay_with_projection("test-stream", CountingProjection())
+
+        snapshot = event_store.load_snapshot("test-stream", "CountingProjection")
+        assert snapshot is not None
+        assert snapshot.sequence == 5
+
+    def test_version_mismatch_replays_from_start(
+        self, event_store: MemoryEventStore, sample_sync_events: list[DomainEvent]
+    ) -> None:
+        """Test that snapshots of another projection version are ignored."""
+        event_store.append("test-stream", sample_sync_events)
+        replayer = EventReplayer(event_store)
+        replayer.replay_with_projection("test-stream", CountingProjection())
+
+        projection = CountingProjection()
+        with patch.object(CountingProjection, "snapshot_version", "3"):
+            replayer.replay_with_projection("test-stream", projection)
+
+        assert projection.applied == len(sample_sync_events)
+
+    def test_rewritten_stream_invalidates_snapshot(
+        self, event_store: MemoryEventStore, sample_sync_events: list[DomainEvent]
+    ) -> None:
+        """Test that a snapshot whose last event changed is not restored."""
+        event_store.append("test-stream", sample_sync_events)
+        replayer = EventReplayer(event_store)
+        replayer.replay_with_projection("test-stream", CountingProjection())
+
+        event_store.clear_stream("test-stream")
+        event_store.append("test-stream", [SyncStarted(epic_key="PROJ-200") for _ in range(9)])
+        projection = CountingProjection()
+        stats = replayer.replay_with_projection("test-stream", projection)
+
+        assert projection.applied == 9
+        assert stats.epic_key == "PROJ-200"
+        assert not stats.is_complete
+
+    def test_partial_replay_ignores_snapshots(
+        self, event_store: MemoryEventStore, sample_sync_events: list[DomainEvent]
+    ) -> None:
+        """Test that replays from a sequence neither load nor save snapshots."""
+        event_store.append("test-stream", sample_sync_events)
+        projection = CountingProjection()
+
+        EventReplayer(event_store).replay_with_projection("test-stream", projection, 2)
+
+        assert projection.applied == len(sample_sync_events) - 2
+        assert event_store.load_snapshot("test-stream", "CountingProjection") is None
+
+    def test_snapshot_failure_does_not_break_replay(
+        self, event_store: MemoryEventStore, sample_sync_events: list[DomainEvent]
+    ) -> None:
+        """Test that a failing snapshot write is logged, not raised."""
+        event_store.append("test-stream", sample_sync_events)
+
+        with patch.object(event_store, "save_snapshot", side_effect=OSError("disk full")):
+            stats = EventReplayer(event_store).replay_with_projection(
+                "test-stream", CountingProjection()
+            )
+
+        assert stats.is_complete
+
+    def test_snapshot_is_json(
+        self, event_store: MemoryEventStore, sample_sync_events: list[DomainEvent]
+    ) -> None:
+        """Test that snapshots hold the statistics as JSON."""
+        event_store.append("test-stream", sample_sync_events)
+        stats = EventReplayer(event_store).replay_with_projection(
+            "test-stream", CountingProjection()
+        )
+
+        snapshot = event_store.load_snapshot("test-stream", "CountingProjection")
+        assert snapshot is not None
+        assert SyncSessionStats.from_dict(json.loads(snapshot.data)) == stats
+
+    def test_non_json_snapshot_replays_from_start(
+        self, event_store: MemoryEventStore, sample_sync_events: list[DomainEvent]
+    ) -> None:
+        """Test that a snapshot that is not JSON is never loaded."""
+        event_store.append("test-stream", sample_sync_events)
+        last = list(event_store.read("test-stream"))[-1]
+        event_store.save_snapshot(
+            "test-stream",
+            ProjectionSnapshot(
+                name="CountingProjection",
+                sequence=last.sequence_number,
+                event_id=last.event_id,
+                data=pickle.dumps(SyncSessionStats(epic_key="FORGED")),
+                version=CountingProjection.snapshot_version,
+            ),
+        )
+
+        projection = CountingProjection()
+        stats = EventReplayer(event_store).replay_with_projection("test-stream", projection)
+
+        assert projection.applied == len(sample_sync_events)
+        assert stats.epic_key == "PROJ-100"
+
+    def test_epic_history_snapshot_keeps_open_session(
+        self, event_store: MemoryEventStore, sample_sync_events: list[DomainEvent]
+    ) -> None:
+        """Test that a session in progress survives a snapshot round trip."""
+        event_store.append("test-stream", sample_sync_events[:-1])
+        replayer = EventReplayer(event_store)
+        with patch.object(EpicHistoryProjection, "snapshot_every", 1):
+            replayer.replay_with_projection("test-stream", EpicHistoryProjection("PROJ-100"))
+            event_store.append("test-stream", sample_sync_events[-1:])
+            history = replayer.replay_with_projection(
+                "test-stream", EpicHistoryProjection("PROJ-100")
+            )
+
+        assert history.total_events == len(sample_sync_events)
+        assert len(history.sessions) == 1
+        assert history.sessions[0].is_complete
+
+
 # =============================================================================
 # Projection Tests
 # =============================================================================
 
 
+class TestProjectionStateSerialization:
+    """Tests for projection state dictionaries."""
+
+    def test_sync_session_stats_round_trip(self) -> None:
+        """Test that session statistics survive to_dict/from_dict."""
+        stats = SyncSessionStats(
+            session_id="s1",
+            epic_key="PROJ-100",
+            started_at=datetime(2025, 1, 15, 10, 0),
+            stories_updated=3,
+            errors=["boom"],
+            is_dry_run=False,
+        )
+
+        assert SyncSessionStats.from_dict(json.loads(json.dumps(stats.to_dict()))) == stats
+
+    def test_epic_history_round_trip(self) -> None:
+        """Test that epic history and its sessions survive to_dict/from_dict."""
+        history = EpicHistory(
+            epic_key="PROJ-100",
+            total_sessions=1,
+            total_events=4,
+            first_sync_at=datetime(2025, 1, 15, 10, 0),
+            last_sync_at=datetime(2025, 1, 15, 10, 0),
+            sessions=[SyncSessionStats(epic_key="PROJ-100", is_complete=True)],
+        )
+
+        assert EpicHistory.from_dict(json.loads(json.dumps(history.to_dict()))) == history
+
+
 class TestSyncSessionProjection:
     """Tests for SyncSessionProjection."""
 
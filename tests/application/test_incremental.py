@@ -5,7 +5,9 @@ Tests change detection, fingerprinting, and incremental sync operations.
 """
 
 import tempfile
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -13,13 +15,17 @@ from spectryn.application.sync.incremental import (
     ChangeDetectionResult,
     ChangeTracker,
     IncrementalSyncStats,
+    RemoteSnapshot,
     StoryFingerprint,
     compute_story_hash,
     stories_differ,
 )
+from spectryn.application.sync.orchestrator import SyncOrchestrator
 from spectryn.core.domain.entities import Subtask, UserStory
 from spectryn.core.domain.enums import Priority, Status
 from spectryn.core.domain.value_objects import Description, StoryId
+from spectryn.core.ports.config_provider import SyncConfig
+from spectryn.core.ports.issue_tracker import IssueData, IssueLink, IssueTrackerPort, LinkType
 
 
 # =============================================================================
@@ -582,3 +588,142 @@ class TestIncrementalSyncIntegration:
         tracker4 = ChangeTracker(storage_dir=temp_storage_dir)
         assert tracker4.load("EPIC-200", "/doc.md")
         assert tracker4.previous_story_count == 1
+
+
+# =============================================================================
+# Remote Snapshot Tests
+# =============================================================================
+
+
+class TestRemoteSnapshot:
+    """Tests for RemoteSnapshot and its persistence in ChangeTracker."""
+
+    def test_merge_replaces_changed_and_appends_new(self):
+        """Merging keeps cached order, replaces changed issues and appends new ones."""
+        t0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        t1 = t0 + timedelta(hours=1)
+        snapshot = RemoteSnapshot.from_issues(
+            "EPIC-1",
+            [IssueData(key="A-1", summary="one"), IssueData(key="A-2", summary="two")],
+            t0,
+        )
+
+        merged = snapshot.merge(
+            [IssueData(key="A-2", summary="two!"), IssueData(key="A-3", summary="three")], t1
+        )
+
+        assert list(merged.issues) == ["A-1", "A-2", "A-3"]
+        assert merged.issues["A-2"].summary == "two!"
+        assert merged.watermark == t1
+        assert merged.full_fetched_at == t0
+        assert snapshot.issues["A-2"].summary == "two"
+
+    def test_needs_full_fetch(self):
+        """A snapshot needs a full fetch once its last full fetch is too old."""
+        t0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        snapshot = RemoteSnapshot.from_issues("EPIC-1", [], t0)
+
+        assert not snapshot.needs_full_fetch(t0 + timedelta(hours=1), timedelta(hours=24))
+        assert snapshot.needs_full_fetch(t0 + timedelta(hours=24), timedelta(hours=24))
+
+    def test_saved_with_change_tracker_state(self, temp_storage_dir, sample_story):
+        """The snapshot, matches and source hash round-trip through the state file."""
+        doc = Path(temp_storage_dir) / "doc.md"
+        doc.write_text("# Epic")
+        issue = IssueData(
+            key="A-1",
+            summary="one",
+            description={"type": "doc"},
+            subtasks=[IssueData(key="A-2", summary="sub", status="Done")],
+            links=[IssueLink(link_type=LinkType.BLOCKS, target_key="B-1")],
+        )
+        fetched_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+        tracker = ChangeTracker(storage_dir=temp_storage_dir)
+        tracker.load("EPIC-1", str(doc))
+        tracker.detect_changes([sample_story])
+        tracker.set_remote_snapshot(RemoteSnapshot.from_issues("EPIC-1", [issue], fetched_at))
+        tracker.save("EPIC-1", str(doc), matches={"US-001": "A-1"})
+
+        tracker2 = ChangeTracker(storage_dir=temp_storage_dir)
+        assert tracker2.load("EPIC-1", str(doc))
+        assert tracker2.source_unchanged(str(doc))
+        assert tracker2.previous_matches == {"US-001": "A-1"}
+        snapshot = tracker2.remote_snapshot
+        assert snapshot is not None
+        assert snapshot.watermark == fetched_at
+        assert snapshot.issues["A-1"] == issue
+
+        doc.write_text("# Epic, edited")
+        assert not tracker2.source_unchanged(str(doc))
+
+
+class TestIncrementalOrchestratorFetch:
+    """Tests for SyncOrchestrator's use of the incremental state."""
+
+    @pytest.fixture
+    def doc(self, temp_storage_dir):
+        path = Path(temp_storage_dir) / "EPIC.md"
+        path.write_text("# Epic\n")
+        return path
+
+    @pytest.fixture
+    def tracker(self):
+        tracker = MagicMock(spec=IssueTrackerPort)
+        tracker.iter_epic_children.side_effect = lambda key: iter(
+            [[IssueData(key="A-1", summary="Test Story")]]
+        )
+        tracker.epic_children_include_subtasks = True
+        tracker.get_epic_children_updated_since.return_value = []
+        return tracker
+
+    def _orchestrator(self, tracker, parser, state_dir):
+        config = SyncConfig(
+            dry_run=False,
+            incremental=True,
+            incremental_state_dir=state_dir,
+            backup_enabled=False,
+            sync_descriptions=False,
+            sync_subtasks=False,
+            sync_comments=False,
+            sync_statuses=False,
+        )
+        return SyncOrchestrator(
+            tracker=tracker, parser=parser, formatter=MagicMock(), config=config
+        )
+
+    def test_second_sync_of_unchanged_source_skips_parse_and_full_fetch(
+        self, tracker, doc, temp_storage_dir, sample_story
+    ):
+        """An unchanged file and quiet epic cost one updated-since query."""
+        parser = MagicMock()
+        parser.parse_stories.return_value = [sample_story]
+
+        first = self._orchestrator(tracker, parser, temp_storage_dir).sync(str(doc), "EPIC-1")
+        assert first.matched_stories == [("US-001", "A-1")]
+
+        second = self._orchestrator(tracker, parser, temp_storage_dir).sync(str(doc), "EPIC-1")
+
+        assert parser.parse_stories.call_count == 1
+        assert tracker.iter_epic_children.call_count == 1
+        tracker.get_epic_children_updated_since.assert_called_once()
+        args = tracker.get_epic_children_updated_since.call_args.args
+        assert args[0] == "EPIC-1"
+        assert args[2] == ["A-1"]
+        assert second.matched_stories == [("US-001", "A-1")]
+        assert second.stories_skipped == 1
+
+    def test_full_fetch_when_tracker_cannot_filter(
+        self, tracker, doc, temp_storage_dir, sample_story
+    ):
+        """Trackers without update filtering fall back to fetching every child."""
+        tracker.get_epic_children_updated_since.return_value = None
+        parser = MagicMock()
+        parser.parse_stories.return_value = [sample_story]
+
+        self._orchestrator(tracker, parser, temp_storage_dir).sync(str(doc), "EPIC-1")
+        doc.write_text("# Epic, edited\n")
+        self._orchestrator(tracker, parser, temp_storage_dir).sync(str(doc), "EPIC-1")
+
+        assert parser.parse_stories.call_count == 2
+        assert tracker.iter_epic_children.call_count == 2
@@ -0,0 +1,86 @@
+"""Tests for indexed title matching."""
+
+import random
+
+import pytest
+
+from spectryn.application.sync.matching import TitleIndex, normalize_issue_title
+from spectryn.core.domain.entities import UserStory
+from spectryn.core.domain.value_objects import StoryId
+
+
+def _story(title: str) -> UserStory:
+    return UserStory(id=StoryId("US-001"), title=title)
+
+
+def _linear_first_match(story: UserStory, issue_titles: list[str]) -> int | None:
+    for position, title in enumerate(issue_titles):
+        if story.matches_title(title):
+            return position
+    return None
+
+
+class TestNormalizeIssueTitle:
+    """Tests for normalize_issue_title."""
+
+    def test_lowercases_and_strips_punctuation(self) -> None:
+        assert normalize_issue_title("Story: Add  Login!") == "story add login"
+
+    def test_keeps_future_suffix(self) -> None:
+        """Only the markdown side drops the '(future)' suffix."""
+        assert normalize_issue_title("Login (future)") == "login future"
+
+
+class TestTitleIndex:
+    """Tests for TitleIndex."""
+
+    def test_empty_index(self) -> None:
+        assert TitleIndex([]).first_match("anything") is None
+
+    def test_exact_match(self) -> None:
+        index = TitleIndex(["alpha", "beta", "gamma"])
+        assert index.first_match("beta") == 1
+
+    def test_query_contained_in_title(self) -> None:
+        index = TitleIndex(["alpha", "prefix beta suffix"])
+        assert index.first_match("beta") == 1
+
+    def test_title_contained_in_query(self) -> None:
+        index = TitleIndex(["alpha", "beta"])
+        assert index.first_match("the beta story") == 1
+
+    def test_first_match_wins_over_exact(self) -> None:
+        """A containment match earlier in the list beats a later exact match."""
+        index = TitleIndex(["story 10", "story 1"])
+        assert index.first_match("story 1") == 0
+
+    def test_no_match(self) -> None:
+        index = TitleIndex(["alpha", "beta"])
+        assert index.first_match("delta") is None
+
+    def test_empty_title_matches_everything(self) -> None:
+        index = TitleIndex(["alpha", ""])
+        assert index.first_match("delta") == 1
+
+    def test_separator_in_titles_falls_back(self) -> None:
+        index = TitleIndex(["al\x00pha", "beta"])
+        assert index.first_match("pha") == 0
+        assert index.first_match("be") == 1
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_linear_scan(self, seed: int) -> None:
+        """Indexed lookups agree with UserStory.matches_title first-match scans."""
+        rng = random.Random(seed)
+        words = ["login", "user", "api", "story", "1", "10", "add", "fix", "(future)", "-"]
+
+        def title() -> str:
+            return " ".join(rng.choice(words) for _ in range(rng.randint(1, 4)))
+
+        issue_titles = [title() for _ in range(60)]
+        index = TitleIndex([normalize_issue_title(t) for t in issue_titles])
+
+        for _ in range(200):
+            story = _story(title())
+            assert index.first_match(story.normalize_title()) == _linear_first_match(
+                story, issue_titles
+            )
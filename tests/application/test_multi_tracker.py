@@ -1,5 +1,6 @@
 """Tests for multi-tracker sync module."""
 
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -538,3 +539,172 @@ class TestMultiTrackerIntegration:
         assert result.total_trackers == 2
         # Primary should be first in results
         assert result.tracker_statuses[0].tracker_name == "Primary"
+
+
+# =============================================================================
+# Parallel Fan-out Tests
+# =============================================================================
+
+
+def _barrier_tracker(name, barrier, calls):
+    """Tracker whose connection test waits for all parties of a barrier."""
+    tracker = MagicMock()
+    tracker.name = name
+
+    def test_connection():
+        calls.append(name)
+        barrier.wait(timeout=5)
+        return True
+
+    tracker.test_connection.side_effect = test_connection
+    tracker.get_epic_children.return_value = []
+    return tracker
+
+
+class TestParallelFanOut:
+    """Tests for the parallel and primary-first strategies."""
+
+    def test_parallel_syncs_trackers_concurrently(self, mock_parser, sample_markdown):
+        """All trackers are in flight at once; results keep target order."""
+        barrier = threading.Barrier(3)
+        calls: list[str] = []
+        orchestrator = MultiTrackerSyncOrchestrator(
+            parser=mock_parser,
+            config=SyncConfig(dry_run=True),
+            strategy=SyncStrategy.PARALLEL,
+        )
+        for name in ("Jira", "GitHub", "Linear"):
+            orchestrator.add_target(
+                TrackerTarget(tracker=_barrier_tracker(name, barrier, calls), epic_key="1")
+            )
+
+        result = orchestrator.sync(sample_markdown)
+
+        assert result.successful_trackers == 3
+        assert [s.tracker_name for s in result.tracker_statuses] == ["Jira", "GitHub", "Linear"]
+        assert all(s.duration_seconds > 0 for s in result.tracker_statuses)
+        assert "duration_seconds" in result.to_dict()["tracker_statuses"][0]
+
+    def test_primary_first_then_rest_concurrently(self, mock_parser, sample_markdown):
+        """The primary completes before the mirrors, which run together."""
+        barrier = threading.Barrier(2)
+        calls: list[str] = []
+        primary = MagicMock()
+        primary.name = "Primary"
+        primary.test_connection.side_effect = lambda: calls.append("Primary") or True
+        primary.get_epic_children.return_value = []
+
+        orchestrator = MultiTrackerSyncOrchestrator(
+            parser=mock_parser,
+            config=SyncConfig(dry_run=True),
+            strategy=SyncStrategy.PRIMARY_FIRST,
+        )
+        orchestrator.add_target(
+            TrackerTarget(tracker=_barrier_tracker("A", barrier, calls), epic_key="1")
+        )
+        orchestrator.add_target(TrackerTarget(tracker=primary, epic_key="2", is_primary=True))
+        orchestrator.add_target(
+            TrackerTarget(tracker=_barrier_tracker("B", barrier, calls), epic_key="3")
+        )
+
+        result = orchestrator.sync(sample_markdown)
+
+        assert calls[0] == "Primary"
+        assert [s.tracker_name for s in result.tracker_statuses] == ["Primary", "A", "B"]
+        assert result.success
+
+    def test_failures_are_isolated(self, mock_parser, sample_markdown):
+        """One tracker failing does not affect the others."""
+        broken = MagicMock()
+        broken.name = "Broken"
+        broken.test_connection.side_effect = RuntimeError("boom")
+        healthy = MagicMock()
+        healthy.name = "Healthy"
+        healthy.test_connection.return_value = True
+        healthy.get_epic_children.return_value = []
+
+        orchestrator = MultiTrackerSyncOrchestrator(
+            parser=mock_parser,
+            config=SyncConfig(dry_run=True),
+            strategy=SyncStrategy.PARALLEL,
+        )
+        orchestrator.add_target(TrackerTarget(tracker=broken, epic_key="1"))
+        orchestrator.add_target(TrackerTarget(tracker=healthy, epic_key="2"))
+
+        result = orchestrator.sync(sample_markdown)
+
+        assert result.failed_trackers == 1
+        assert result.partial_success
+        assert result.tracker_statuses[0].errors == ["boom"]
+        assert result.tracker_statuses[1].stories_synced == 1
+
+    def test_per_target_story_concurrency(self, sample_markdown, mock_formatter):
+        """Stories sync concurrently within a target and merge in order."""
+        parser = MagicMock()
+        parser.parse_stories.return_value = [
+            UserStory(id=StoryId(f"US-{i:03d}"), title=f"Story {i}", status=Status.PLANNED)
+            for i in range(1, 5)
+        ]
+        barrier = threading.Barrier(4)
+        tracker = MagicMock()
+        tracker.name = "Jira"
+        tracker.test_connection.return_value = True
+        tracker.get_epic_children.return_value = []
+
+        def create_issue(**kwargs):
+            barrier.wait(timeout=5)
+            return f"KEY-{kwargs['summary'][3:6]}"
+
+        tracker.create_issue.side_effect = create_issue
+        orchestrator = MultiTrackerSyncOrchestrator(
+            parser=parser,
+            config=SyncConfig(dry_run=False),
+            formatter=mock_formatter,
+            strategy=SyncStrategy.PARALLEL,
+        )
+        orchestrator.add_target(
+            TrackerTarget(tracker=tracker, epic_key="PROJ-1", max_concurrency=4)
+        )
+
+        result = orchestrator.sync(sample_markdown)
+
+        status = result.tracker_statuses[0]
+        assert status.stories_created == 4
+        assert list(status.key_mappings) == ["US-001", "US-002", "US-003", "US-004"]
+        assert status.key_mappings["US-003"] == "KEY-003"
+
+    def test_failing_progress_callback_keeps_results(self, sample_markdown, mock_formatter):
+        """Progress is reported from the calling thread and its errors are logged."""
+        parser = MagicMock()
+        parser.parse_stories.return_value = [
+            UserStory(id=StoryId(f"US-{i:03d}"), title=f"Story {i}", status=Status.PLANNED)
+            for i in range(1, 4)
+        ]
+        tracker = MagicMock()
+        tracker.name = "Jira"
+        tracker.test_connection.return_value = True
+        tracker.get_epic_children.return_value = []
+        tracker.create_issue.side_effect = lambda **kwargs: f"KEY-{kwargs['summary'][6:]}"
+        threads: set[str] = set()
+
+        def on_progress(tracker_name, phase, current, total):
+            threads.add(threading.current_thread().name)
+            raise RuntimeError("display closed")
+
+        orchestrator = MultiTrackerSyncOrchestrator(
+            parser=parser,
+            config=SyncConfig(dry_run=False),
+            formatter=mock_formatter,
+            strategy=SyncStrategy.PARALLEL,
+        )
+        orchestrator.add_target(
+            TrackerTarget(tracker=tracker, epic_key="PROJ-1", max_concurrency=3)
+        )
+
+        result = orchestrator.sync(sample_markdown, progress_callback=on_progress)
+
+        status = result.tracker_statuses[0]
+        assert status.errors == []
+        assert status.stories_created == 3
+        assert list(status.key_mappings) == ["US-001", "US-002", "US-003"]
+        assert not any(name.startswith("spectryn-Jira") for name in threads)
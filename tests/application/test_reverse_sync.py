@@ -2,7 +2,7 @@
 Tests for reverse sync (pull from Jira to markdown).
 """
 
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -416,6 +416,156 @@ class TestReverseSyncOrchestrator:
         assert orchestrator._extract_story_id("Just a title") is None
 
 
+class TestPullIssues:
+    """Tests for targeted per-issue pulls."""
+
+    @pytest.fixture
+    def markdown_file(self, tmp_path):
+        """Write an epic with two linked stories."""
+        stories = [
+            UserStory(
+                id=StoryId("US-001"),
+                title="First Story",
+                story_points=3,
+                status=Status.IN_PROGRESS,
+                external_key=IssueKey("PROJ-101"),
+                subtasks=[
+                    Subtask(number=1, name="Build it", story_points=1, status=Status.PLANNED),
+                ],
+            ),
+            UserStory(
+                id=StoryId("US-002"),
+                title="Second Story",
+                story_points=5,
+                status=Status.PLANNED,
+                external_key=IssueKey("PROJ-102"),
+            ),
+        ]
+        epic = Epic(key=IssueKey("PROJ-100"), title="Test Epic", stories=stories)
+        path = tmp_path / "epic.md"
+        path.write_text(MarkdownWriter().write_epic(epic), encoding="utf-8")
+        return path
+
+    @pytest.fixture
+    def orchestrator(self):
+        """Create an orchestrator that writes changes."""
+        return ReverseSyncOrchestrator(tracker=Mock(), config=SyncConfig(dry_run=False))
+
+    def test_patches_only_fetched_issue(self, orchestrator, markdown_file):
+        """Only the dirty story is fetched and rewritten in place."""
+        orchestrator.tracker.get_issue.return_value = IssueData(
+            key="PROJ-101",
+            summary="US-001: First Story",
+            status="Done",
+            story_points=8,
+            subtasks=[IssueData(key="PROJ-110", summary="Build it", status="Done")],
+        )
+        original = markdown_file.read_text(encoding="utf-8")
+
+        result = orchestrator.pull_issues("PROJ-100", ["PROJ-101"], str(markdown_file))
+
+        assert result.success
+        assert result.updated_stories == ["PROJ-101"]
+        orchestrator.tracker.get_issue.assert_called_once_with("PROJ-101")
+        orchestrator.tracker.get_epic_children.assert_not_called()
+
+        content = markdown_file.read_text(encoding="utf-8")
+        first, second = content.split("US-002", 1)
+        assert "### ✅ US-001: First Story" in first
+        assert "| **Status** | ✅ Done |" in first
+        assert "| **Story Points** | 8 |" in first
+        assert "| Build it |  | 1 | ✅ Done |" in first
+        assert second == original.split("US-002", 1)[1]
+
+    def test_uses_sufficient_payload(self, orchestrator, markdown_file):
+        """A payload covering every changed field saves the fetch."""
+        payload = {
+            "issue": {
+                "key": "PROJ-102",
+                "fields": {"summary": "US-002: Renamed Story", "status": {"name": "Done"}},
+            },
+            "changelog": {"items": [{"field": "status"}, {"field": "summary"}]},
+        }
+
+        result = orchestrator.pull_issues(
+            "PROJ-100", ["PROJ-102"], str(markdown_file), payloads={"PROJ-102": payload}
+        )
+
+        assert result.stories_updated == 1
+        orchestrator.tracker.get_issue.assert_not_called()
+        content = markdown_file.read_text(encoding="utf-8")
+        assert "### ✅ US-002: Renamed Story" in content
+        assert "| **Story Points** | 5 |" in content
+
+    def test_fetches_when_payload_misses_fields(self, orchestrator, markdown_file):
+        """Changes the payload cannot describe are fetched from the tracker."""
+        orchestrator.tracker.get_issue.return_value = IssueData(
+            key="PROJ-102", summary="US-002: Second Story", status="Planned", story_points=5
+        )
+        payload = {
+            "issue": {"key": "PROJ-102", "fields": {"summary": "x", "status": {"name": "Open"}}},
+            "changelog": {"items": [{"field": "Story Points"}]},
+        }
+
+        result = orchestrator.pull_issues(
+            "PROJ-100", ["PROJ-102"], str(markdown_file), payloads={"PROJ-102": payload}
+        )
+
+        assert result.stories_pulled == 1
+        assert result.stories_updated == 0
+        orchestrator.tracker.get_issue.assert_called_once_with("PROJ-102")
+
+    def test_description_change_falls_back_to_full_pull(self, orchestrator, markdown_file):
+        """Changes to fields that cannot be patched in place pull the whole epic."""
+        changed = IssueData(
+            key="PROJ-102",
+            summary="US-002: Second Story",
+            status="Planned",
+            description="**As a** user **I want** a brand new description **So that** it syncs",
+            story_points=5,
+        )
+        orchestrator.tracker.get_issue.side_effect = lambda key: (
+            changed
+            if key == "PROJ-102"
+            else IssueData(key="PROJ-100", summary="Test Epic", status="Open")
+        )
+        orchestrator.tracker.get_epic_children.return_value = [changed]
+        payload = {
+            "issue": {"key": "PROJ-102", "fields": {"summary": "x", "status": {"name": "Open"}}},
+            "changelog": {"items": [{"field": "description"}]},
+        }
+
+        result = orchestrator.pull_issues(
+            "PROJ-100", ["PROJ-102"], str(markdown_file), payloads={"PROJ-102": payload}
+        )
+
+        assert result.success
+        orchestrator.tracker.get_epic_children.assert_called_once_with("PROJ-100")
+        assert "brand new description" in markdown_file.read_text(encoding="utf-8")
+
+    def test_unknown_issue_falls_back_to_full_pull(self, orchestrator, markdown_file):
+        """An issue missing from the file triggers a full pull."""
+        orchestrator.tracker.get_issue.side_effect = lambda key: IssueData(
+            key=key, summary="Brand new", status="Open"
+        )
+        orchestrator.tracker.get_epic_children.return_value = []
+
+        orchestrator.pull_issues("PROJ-100", ["PROJ-999"], str(markdown_file))
+
+        orchestrator.tracker.get_epic_children.assert_called_once_with("PROJ-100")
+
+    def test_missing_file_falls_back_to_full_pull(self, orchestrator, tmp_path):
+        """Without a file to patch the whole epic is pulled."""
+        orchestrator.tracker.get_issue.return_value = IssueData(
+            key="PROJ-100", summary="Test Epic", status="Open"
+        )
+        orchestrator.tracker.get_epic_children.return_value = []
+
+        orchestrator.pull_issues("PROJ-100", ["PROJ-101"], str(tmp_path / "missing.md"))
+
+        orchestrator.tracker.get_epic_children.assert_called_once_with("PROJ-100")
+
+
 class TestPullResult:
     """Tests for PullResult dataclass."""
 
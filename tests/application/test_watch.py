@@ -2,6 +2,7 @@
 Tests for watch mode - auto-sync on file changes.
 """
 
+import sys
 import tempfile
 import time
 from pathlib import Path
@@ -181,6 +182,83 @@ class TestFileWatcher:
         assert hash1 != hash3
 
 
+class TestDirectoryWatcher:
+    """Tests for FileWatcher watching directory trees."""
+
+    @pytest.fixture(params=["poll", "inotify"])
+    def backend(self, request):
+        """Run each test against both backends."""
+        if request.param == "inotify" and not sys.platform.startswith("linux"):
+            pytest.skip("inotify is Linux-only")
+        return request.param
+
+    def _watch(self, path, backend, batches):
+        watcher = FileWatcher(str(path), debounce_seconds=0.2, poll_interval=0.05, backend=backend)
+        watcher.on_batch(batches.append)
+        watcher.start()
+        return watcher
+
+    def test_burst_is_one_batch_of_changed_files(self, tmp_path, backend):
+        """Changes to several files in a burst arrive as a single batch."""
+        (tmp_path / "a.md").write_text("# A")
+        (tmp_path / "b.md").write_text("# B")
+        (tmp_path / "notes.txt").write_text("ignored")
+        batches = []
+
+        watcher = self._watch(tmp_path, backend, batches)
+        assert watcher.backend_name == backend
+        time.sleep(0.1)
+        (tmp_path / "a.md").write_text("# A2")
+        (tmp_path / "c.md").write_text("# C")
+        (tmp_path / "notes.txt").write_text("still ignored")
+        (tmp_path / "b.md").unlink()
+        time.sleep(0.6)
+        watcher.stop()
+
+        assert len(batches) == 1
+        events = {Path(c.path).name: c.event for c in batches[0]}
+        assert events == {
+            "a.md": WatchEvent.MODIFIED,
+            "b.md": WatchEvent.DELETED,
+            "c.md": WatchEvent.CREATED,
+        }
+
+    def test_new_subdirectory_is_watched(self, tmp_path, backend):
+        """Files in directories created after start are picked up."""
+        batches = []
+
+        watcher = self._watch(tmp_path, backend, batches)
+        time.sleep(0.1)
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "story.md").write_text("# Story")
+        time.sleep(0.6)
+        (tmp_path / "sub" / "story.md").write_text("# Story v2")
+        time.sleep(0.6)
+        watcher.stop()
+
+        events = [(Path(c.path).name, c.event) for batch in batches for c in batch]
+        assert events == [("story.md", WatchEvent.CREATED), ("story.md", WatchEvent.MODIFIED)]
+
+    def test_unchanged_content_is_not_reported(self, tmp_path, backend):
+        """Rewriting a file with the same content reports nothing."""
+        story = tmp_path / "story.md"
+        story.write_text("# Same")
+        batches = []
+
+        watcher = self._watch(tmp_path, backend, batches)
+        time.sleep(0.1)
+        story.write_text("# Same")
+        time.sleep(0.6)
+        watcher.stop()
+
+        assert batches == []
+
+    def test_unknown_backend(self, tmp_path):
+        """An unknown backend name is rejected."""
+        with pytest.raises(ValueError):
+            FileWatcher(str(tmp_path), backend="kqueue")
+
+
 class TestWatchOrchestrator:
     """Tests for WatchOrchestrator class."""
 
@@ -257,6 +335,79 @@ class TestWatchOrchestrator:
         assert watch.stats.syncs_triggered >= 1
         mock_orchestrator.sync.assert_called()
 
+    def test_one_sync_per_batch(self, mock_orchestrator, tmp_path):
+        """A burst of changes across a directory triggers a single sync."""
+        (tmp_path / "US-001.md").write_text("# One")
+        (tmp_path / "US-002.md").write_text("# Two")
+
+        watch = WatchOrchestrator(
+            orchestrator=mock_orchestrator,
+            markdown_path=str(tmp_path),
+            epic_key="PROJ-123",
+            debounce_seconds=0.2,
+            poll_interval=0.05,
+        )
+
+        watch.start_async()
+        time.sleep(0.1)
+        (tmp_path / "US-001.md").write_text("# One v2")
+        (tmp_path / "US-002.md").unlink()
+        time.sleep(0.6)
+        watch.stop()
+
+        assert watch.stats.changes_detected == 2
+        assert watch.stats.syncs_triggered == 1
+        mock_orchestrator.sync.assert_called_once_with(
+            markdown_path=str(tmp_path), epic_key="PROJ-123"
+        )
+
+    def test_directory_syncs_only_changed_files(self, mock_orchestrator, tmp_path):
+        """Changed spec files in a watched directory are synced one by one."""
+        for name in ("US-001.md", "US-002.md", "US-003.md"):
+            (tmp_path / name).write_text(f"# {name}")
+        watch = WatchOrchestrator(
+            orchestrator=mock_orchestrator, markdown_path=str(tmp_path), epic_key="PROJ-123"
+        )
+
+        watch._handle_changes(
+            [
+                FileChange(path=str(tmp_path / "US-003.md"), event=WatchEvent.MODIFIED),
+                FileChange(path=str(tmp_path / "US-001.md"), event=WatchEvent.CREATED),
+            ]
+        )
+
+        synced = [call.kwargs["markdown_path"] for call in mock_orchestrator.sync.call_args_list]
+        assert synced == [str(tmp_path / "US-001.md"), str(tmp_path / "US-003.md")]
+        assert watch.stats.syncs_triggered == 2
+
+    @pytest.mark.parametrize(
+        ("name", "event"),
+        [
+            ("EPIC.md", WatchEvent.MODIFIED),
+            ("US-001.md", WatchEvent.DELETED),
+            ("nested/US-009.md", WatchEvent.MODIFIED),
+        ],
+    )
+    def test_directory_sync_falls_back_to_whole_tree(
+        self, mock_orchestrator, tmp_path, name, event
+    ):
+        """Changes the per-file sync cannot cover sync the whole directory."""
+        (tmp_path / "US-002.md").write_text("# Two")
+        watch = WatchOrchestrator(
+            orchestrator=mock_orchestrator, markdown_path=str(tmp_path), epic_key="PROJ-123"
+        )
+
+        watch._handle_changes(
+            [
+                FileChange(path=str(tmp_path / "US-002.md"), event=WatchEvent.MODIFIED),
+                FileChange(path=str(tmp_path / name), event=event),
+            ]
+        )
+
+        mock_orchestrator.sync.assert_called_once_with(
+            markdown_path=str(tmp_path), epic_key="PROJ-123"
+        )
+
     def test_callbacks(self, mock_orchestrator, tmp_path):
         """Test that callbacks are invoked."""
         test_file = tmp_path / "test.md"
@@ -301,6 +301,83 @@ class TestWebhookServer:
         )
         assert not server._should_sync(comment_event)
 
+    def test_sync_pulls_only_dirty_issues(self, webhook_server, mock_reverse_sync):
+        """Test that issue updates are pulled per issue with merged changelogs."""
+        server = webhook_server(epic_key="PROJ-100", output_path="/test.md")
+
+        for field_name in ("status", "summary"):
+            server._mark_dirty(
+                WebhookEvent(
+                    event_type=WebhookEventType.ISSUE_UPDATED,
+                    issue_key="PROJ-123",
+                    epic_key="PROJ-100",
+                    changelog=[{"field": field_name}],
+                    raw_payload={"changelog": {"items": [{"field": field_name}]}},
+                )
+            )
+        server._mark_dirty(
+            WebhookEvent(
+                event_type=WebhookEventType.ISSUE_UPDATED,
+                issue_key="PROJ-124",
+                epic_key="PROJ-100",
+                changelog=[{"field": "status"}],
+                raw_payload={"changelog": {"items": [{"field": "status"}]}},
+            )
+        )
+
+        server._execute_sync()
+
+        mock_reverse_sync.pull.assert_not_called()
+        kwargs = mock_reverse_sync.pull_issues.call_args.kwargs
+        assert set(kwargs["issue_keys"]) == {"PROJ-123", "PROJ-124"}
+        assert set(kwargs["payloads"]) == {"PROJ-123", "PROJ-124"}
+        assert kwargs["payloads"]["PROJ-123"]["changelog"]["items"] == [
+            {"field": "status"},
+            {"field": "summary"},
+        ]
+        assert server.stats.targeted_syncs == 1
+
+    @pytest.mark.parametrize("unknown_first", [True, False])
+    def test_event_without_changelog_triggers_full_pull(
+        self, webhook_server, mock_reverse_sync, unknown_first
+    ):
+        """Test that an update with unknown changes pulls the whole epic."""
+        server = webhook_server(epic_key="PROJ-100", output_path="/test.md")
+        described = WebhookEvent(
+            event_type=WebhookEventType.ISSUE_UPDATED,
+            issue_key="PROJ-123",
+            changelog=[{"field": "description"}],
+            raw_payload={"changelog": {"items": [{"field": "description"}]}},
+        )
+        unknown = WebhookEvent(event_type=WebhookEventType.ISSUE_UPDATED, issue_key="PROJ-123")
+
+        for event in [unknown, described] if unknown_first else [described, unknown]:
+            server._mark_dirty(event)
+        server._execute_sync()
+
+        mock_reverse_sync.pull.assert_called_once_with(epic_key="PROJ-100", output_path="/test.md")
+        mock_reverse_sync.pull_issues.assert_not_called()
+
+    def test_epic_event_triggers_full_pull(self, webhook_server, mock_reverse_sync):
+        """Test that changes to the epic itself pull the whole epic."""
+        server = webhook_server(epic_key="PROJ-100", output_path="/test.md")
+
+        server._mark_dirty(
+            WebhookEvent(
+                event_type=WebhookEventType.ISSUE_UPDATED,
+                issue_key="PROJ-123",
+                changelog=[{"field": "status"}],
+                raw_payload={"changelog": {"items": [{"field": "status"}]}},
+            )
+        )
+        server._mark_dirty(
+            WebhookEvent(event_type=WebhookEventType.ISSUE_UPDATED, issue_key="PROJ-100")
+        )
+        server._execute_sync()
+
+        mock_reverse_sync.pull.assert_called_once_with(epic_key="PROJ-100", output_path="/test.md")
+        mock_reverse_sync.pull_issues.assert_not_called()
+
     def test_get_status(self, webhook_server):
         """Test getting server status."""
         server = webhook_server(
@@ -132,3 +132,36 @@ def benchmark_group_domain():
 def benchmark_group_specification():
     """Marker for specification benchmarks."""
     return "specification"
+
+
+# =============================================================================
+# Sync Benchmark Report
+# =============================================================================
+
+# (benchmark name, measurement extra_info) of the sync benchmarks that ran
+SYNC_MEASUREMENTS: list[tuple[str, dict]] = []
+
+
+@pytest.fixture
+def sync_report(request):
+    """Record a sync measurement for the end-of-session report."""
+
+    def record(measurement) -> None:
+        SYNC_MEASUREMENTS.append((request.node.name, measurement.as_extra_info()))
+
+    return record
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Print wall time, requests and peak memory of the sync benchmarks."""
+    if not SYNC_MEASUREMENTS:
+        return
+    terminalreporter.section("sync benchmarks")
+    terminalreporter.write_line(
+        f"{'benchmark':<48} {'wall (s)':>9} {'requests':>9} {'429s':>6} {'peak (MB)':>10}"
+    )
+    for name, info in SYNC_MEASUREMENTS:
+        terminalreporter.write_line(
+            f"{name:<48} {info['wall_seconds']:>9.3f} {info['requests']:>9} "
+            f"{info['throttled']:>6} {info['peak_memory_mb']:>10.1f}"
+        )
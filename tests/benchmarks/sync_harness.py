@@ -0,0 +1,345 @@
+"""
+End-to-end sync benchmark harness.
+
+Provides an in-memory IssueTrackerPort with simulated network behaviour
+(per-call latency, jitter, rate limiting and paginated epic searches),
+generators for matching markdown/tracker epics, and a helper that records
+request counts and peak memory for a single sync run.
+"""
+
+import random
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+from spectryn.core.ports.issue_tracker import IssueData, IssueTrackerPort
+
+
+EPIC_KEY = "BENCH-1"
+
+
+@dataclass(frozen=True)
+class LatencyProfile:
+    """
+    Simulated network behaviour of a tracker.
+
+    Attributes:
+        latency_ms: Base latency of every request.
+        jitter_ms: Uniform random latency added on top of the base.
+        throttle_rate: Fraction of requests answered with a 429 first.
+        retry_after_ms: Wait before a throttled request is retried.
+        page_size: Issues per page of an epic children search.
+        children_include_subtasks: Whether epic searches return subtasks.
+        seed: Seed of the jitter/throttling RNG, for repeatable runs.
+    """
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    throttle_rate: float = 0.0
+    retry_after_ms: float = 0.0
+    page_size: int = 100
+    children_include_subtasks: bool = True
+    seed: int = 42
+
+
+@dataclass
+class RequestStats:
+    """Requests issued against a LatencyTracker."""
+
+    by_operation: Counter[str] = field(default_factory=Counter)
+    throttled: int = 0
+
+    @property
+    def total(self) -> int:
+        """Total requests, counting each throttled attempt."""
+        return sum(self.by_operation.values()) + self.throttled
+
+
+class LatencyTracker(IssueTrackerPort):
+    """
+    In-memory tracker that behaves like a remote one.
+
+    Every port call counts as one request (one per page for epic searches)
+    and sleeps for the profile's latency. A throttled request costs an
+    extra request and the retry-after wait, like an adapter's retry loop.
+    Writes are applied to the in-memory issues, so reads see them.
+    """
+
+    def __init__(self, issues: list[IssueData], profile: LatencyProfile | None = None):
+        self.profile = profile or LatencyProfile()
+        self.stats = RequestStats()
+        self._issues = {issue.key: issue for issue in issues}
+        self._issues.update({st.key: st for issue in issues for st in issue.subtasks})
+        self._children = [issue.key for issue in issues]
+        # Keys after the generated stories and their first subtasks
+        self._next_key = 2 * len(issues) + 2
+        self._rng = random.Random(self.profile.seed)
+        self._lock = threading.Lock()
+
+    def _request(self, operation: str) -> None:
+        profile = self.profile
+        with self._lock:
+            self.stats.by_operation[operation] += 1
+            throttled = self._rng.random() < profile.throttle_rate
+            if throttled:
+                self.stats.throttled += 1
+            delay = profile.latency_ms + self._rng.uniform(0, profile.jitter_ms)
+        if throttled:
+            delay += profile.retry_after_ms + profile.latency_ms
+        if delay > 0:
+            time.sleep(delay / 1000)
+
+    # -------------------------------------------------------------------------
+    # Configuration
+    # -------------------------------------------------------------------------
+
+    @property
+    def name(self) -> str:
+        return "Benchmark"
+
+    @property
+    def is_connected(self) -> bool:
+        return True
+
+    def test_connection(self) -> bool:
+        self._request("test_connection")
+        return True
+
+    @property
+    def epic_children_include_subtasks(self) -> bool:
+        return self.profile.children_include_subtasks
+
+    # -------------------------------------------------------------------------
+    # Reads
+    # -------------------------------------------------------------------------
+
+    def get_current_user(self) -> dict[str, Any]:
+        self._request("get_current_user")
+        return {"accountId": "bench", "displayName": "Benchmark"}
+
+    def get_issue(self, issue_key: str) -> IssueData:
+        self._request("get_issue")
+        if issue_key == EPIC_KEY:
+            return IssueData(key=EPIC_KEY, summary="Benchmark Epic", issue_type="Epic")
+        return self._issues[issue_key]
+
+    def iter_epic_children(self, epic_key: str) -> Iterator[list[IssueData]]:
+        page_size = self.profile.page_size
+        for start in range(0, len(self._children), page_size):
+            self._request("search_page")
+            yield [self._issues[key] for key in self._children[start : start + page_size]]
+
+    def get_epic_children(self, epic_key: str) -> list[IssueData]:
+        return [issue for page in self.iter_epic_children(epic_key) for issue in page]
+
+    def get_issue_comments(self, issue_key: str) -> list[dict]:
+        self._request("get_issue_comments")
+        return list(self._issues[issue_key].comments)
+
+    def get_issue_status(self, issue_key: str) -> str:
+        self._request("get_issue_status")
+        return self._issues[issue_key].status
+
+    def search_issues(self, query: str, max_results: int = 50) -> list[IssueData]:
+        self._request("search_issues")
+        return list(self._issues.values())[:max_results]
+
+    def get_available_transitions(self, issue_key: str) -> list[dict]:
+        self._request("get_available_transitions")
+        return [{"id": "1", "name": "Done", "to": {"name": "Done"}}]
+
+    def format_description(self, markdown: str) -> Any:
+        return markdown
+
+    # -------------------------------------------------------------------------
+    # Writes
+    # -------------------------------------------------------------------------
+
+    def update_issue_description(self, issue_key: str, description: Any) -> bool:
+        self._request("update_issue_description")
+        self._issues[issue_key].description = description
+        return True
+
+    def update_issue_story_points(self, issue_key: str, story_points: float) -> bool:
+        self._request("update_issue_story_points")
+        self._issues[issue_key].story_points = story_points
+        return True
+
+    def create_subtask(  # noqa: PLR0917 - matches IssueTrackerPort
+        self,
+        parent_key: str,
+        summary: str,
+        description: Any,
+        project_key: str,
+        story_points: int | None = None,
+        assignee: str | None = None,
+        priority: str | None = None,
+    ) -> str | None:
+        self._request("create_subtask")
+        with self._lock:
+            key = f"{project_key}-{self._next_key}"
+            self._next_key += 1
+        subtask = IssueData(key=key, summary=summary, description=description, status="Open")
+        self._issues[key] = subtask
+        self._issues[parent_key].subtasks.append(subtask)
+        return key
+
+    def update_subtask(
+        self,
+        issue_key: str,
+        description: Any | None = None,
+        story_points: int | None = None,
+        assignee: str | None = None,
+        priority_id: str | None = None,
+    ) -> bool:
+        self._request("update_subtask")
+        return True
+
+    def add_comment(self, issue_key: str, body: Any) -> bool:
+        self._request("add_comment")
+        self._issues[issue_key].comments.append({"body": body})
+        return True
+
+    def transition_issue(self, issue_key: str, target_status: str) -> bool:
+        self._request("transition_issue")
+        self._issues[issue_key].status = target_status
+        return True
+
+
+# =============================================================================
+# Epic Generators
+# =============================================================================
+
+
+def generate_epic_markdown(num_stories: int, subtasks_per_story: int = 3) -> str:
+    """Generate an epic document with the given number of stories."""
+    parts = ["# Epic: Benchmark Epic\n"]
+    for i in range(1, num_stories + 1):
+        status = "✅ Done" if i % 4 == 0 else "🔄 In Progress"
+        rows = "\n".join(
+            f"| {j} | Task {i}.{j} | Work item {j} for story {i} | {j} | 📋 Planned |"
+            for j in range(1, subtasks_per_story + 1)
+        )
+        parts.append(
+            f"""
+### US-{i:05d}: Story {i:05d}
+
+| Field | Value |
+|-------|-------|
+| **Story Points** | {i % 8 + 1} |
+| **Priority** | 🟡 Medium |
+| **Status** | {status} |
+
+#### Description
+
+**As a** user
+**I want** feature number {i}
+**So that** the benchmark has work to do
+
+#### Acceptance Criteria
+
+- [ ] Criterion A for story {i}
+- [x] Criterion B for story {i}
+
+#### Subtasks
+
+| # | Subtask | Description | SP | Status |
+|---|---------|-------------|----|--------|
+{rows}
+
+#### Related Commits
+
+| Commit | Message |
+|--------|---------|
+| `a{i:06x}` | Implement story {i} |
+
+---
+"""
+        )
+    return "".join(parts)
+
+
+def generate_tracker_issues(num_stories: int, subtasks_per_story: int = 3) -> list[IssueData]:
+    """
+    Generate tracker issues matching generate_epic_markdown.
+
+    Every story exists in the tracker with a stale description and its
+    first subtask, so a sync updates descriptions, creates the remaining
+    subtasks, comments commits and transitions finished stories.
+    """
+    issues = []
+    for i in range(1, num_stories + 1):
+        subtasks = []
+        if subtasks_per_story:
+            key = f"BENCH-{num_stories + i + 1}"
+            subtasks.append(IssueData(key=key, summary=f"Task {i}.1", status="Open"))
+        issues.append(
+            IssueData(
+                key=f"BENCH-{i + 1}",
+                summary=f"Story {i:05d}",
+                description=f"Old description {i}",
+                status="In Progress",
+                issue_type="Story",
+                story_points=float(i % 8 + 1),
+                subtasks=subtasks,
+            )
+        )
+    return issues
+
+
+# =============================================================================
+# Measurement
+# =============================================================================
+
+
+@dataclass
+class SyncMeasurement:
+    """Wall time, requests and peak memory of one sync run."""
+
+    wall_seconds: float
+    requests: int
+    throttled: int
+    peak_memory_mb: float
+    requests_by_operation: dict[str, int]
+
+    def as_extra_info(self) -> dict[str, Any]:
+        """Flatten for pytest-benchmark's extra_info."""
+        return {
+            "wall_seconds": round(self.wall_seconds, 4),
+            "requests": self.requests,
+            "throttled": self.throttled,
+            "peak_memory_mb": round(self.peak_memory_mb, 2),
+            "requests_by_operation": self.requests_by_operation,
+        }
+
+
+def measure_sync(run: Callable[[], Any], tracker: LatencyTracker) -> SyncMeasurement:
+    """
+    Run a sync once under tracemalloc and record what it cost.
+
+    Args:
+        run: Runs the sync against ``tracker``.
+        tracker: The tracker the sync talks to (fresh, so counts start at 0).
+
+    Returns:
+        SyncMeasurement for the run.
+    """
+    tracemalloc.start()
+    started = time.perf_counter()
+    try:
+        run()
+        wall = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return SyncMeasurement(
+        wall_seconds=wall,
+        requests=tracker.stats.total,
+        throttled=tracker.stats.throttled,
+        peak_memory_mb=peak / (1024 * 1024),
+        requests_by_operation=dict(tracker.stats.by_operation),
+    )
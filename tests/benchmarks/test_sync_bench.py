@@ -0,0 +1,156 @@
+"""
+End-to-end sync benchmarks.
+
+Runs the push, pull and bidirectional sync orchestrators against an
+in-memory tracker that simulates request latency, 429 rate limiting and
+paginated epic searches (see sync_harness.py), for epics of 100, 1,000
+and 10,000 stories. Besides the wall time measured by pytest-benchmark,
+every benchmark records the requests issued and the peak memory of one
+extra run in its ``extra_info``, so saved baselines track all three.
+
+Run with:
+    make bench-sync
+    pytest tests/benchmarks/test_sync_bench.py -m benchmark --benchmark-save=sync
+    pytest tests/benchmarks/test_sync_bench.py -m benchmark --benchmark-compare
+"""
+
+from pathlib import Path
+
+import pytest
+
+from spectryn.adapters import ADFFormatter
+from spectryn.adapters.parsers import MarkdownParser
+from spectryn.application.sync import (
+    BidirectionalSyncOrchestrator,
+    ReverseSyncOrchestrator,
+    SyncOrchestrator,
+)
+from spectryn.application.sync.conflict import ResolutionStrategy, SnapshotStore
+from spectryn.core.ports.config_provider import SyncConfig
+
+from .sync_harness import (
+    EPIC_KEY,
+    LatencyProfile,
+    LatencyTracker,
+    generate_epic_markdown,
+    generate_tracker_issues,
+    measure_sync,
+)
+
+
+# Sync runs take seconds to minutes at the larger sizes
+pytestmark = [pytest.mark.benchmark, pytest.mark.timeout(1800)]
+
+# Epic size -> timed rounds
+SIZES = {100: 5, 1000: 3, 10000: 1}
+
+# A tracker a few milliseconds away that throttles 5% of requests
+NETWORK = LatencyProfile(
+    latency_ms=2.0,
+    jitter_ms=1.0,
+    throttle_rate=0.05,
+    retry_after_ms=5.0,
+    page_size=50,
+)
+
+
+def _config() -> SyncConfig:
+    return SyncConfig(dry_run=False, backup_enabled=False)
+
+
+class SyncScenario:
+    """Builds a fresh tracker and workspace for each sync run."""
+
+    def __init__(self, tmp_path: Path, num_stories: int, profile: LatencyProfile | None = None):
+        self.tmp_path = tmp_path
+        self.num_stories = num_stories
+        self.profile = profile
+        self.markdown = generate_epic_markdown(num_stories)
+        self._runs = 0
+
+    def tracker(self) -> LatencyTracker:
+        return LatencyTracker(generate_tracker_issues(self.num_stories), self.profile)
+
+    def workspace(self) -> Path:
+        self._runs += 1
+        workspace = self.tmp_path / f"run-{self._runs}"
+        workspace.mkdir()
+        (workspace / "EPIC.md").write_text(self.markdown, encoding="utf-8")
+        return workspace
+
+
+def _push(tracker: LatencyTracker, workspace: Path) -> None:
+    orchestrator = SyncOrchestrator(tracker, MarkdownParser(), ADFFormatter(), _config())
+    result = orchestrator.sync(str(workspace / "EPIC.md"), EPIC_KEY)
+    assert result.success, result.errors
+
+
+def _pull(tracker: LatencyTracker, workspace: Path) -> None:
+    orchestrator = ReverseSyncOrchestrator(tracker, _config())
+    result = orchestrator.pull(EPIC_KEY, workspace / "PULLED.md")
+    assert result.success, result.errors
+
+
+def _bidirectional(tracker: LatencyTracker, workspace: Path) -> None:
+    orchestrator = BidirectionalSyncOrchestrator(
+        tracker, _config(), snapshot_store=SnapshotStore(workspace / "snapshots")
+    )
+    result = orchestrator.sync(
+        str(workspace / "EPIC.md"), EPIC_KEY, resolution_strategy=ResolutionStrategy.FORCE_LOCAL
+    )
+    assert result.success, result.errors
+
+
+def run_sync_benchmark(benchmark, sync_report, scenario: SyncScenario, sync, rounds: int) -> None:
+    """Time ``sync`` on fresh state per round, then record one measured run."""
+
+    def setup():
+        return (scenario.tracker(), scenario.workspace()), {}
+
+    benchmark.pedantic(sync, setup=setup, rounds=rounds, iterations=1)
+
+    tracker = scenario.tracker()
+    workspace = scenario.workspace()
+    measurement = measure_sync(lambda: sync(tracker, workspace), tracker)
+    benchmark.extra_info.update(measurement.as_extra_info())
+    benchmark.extra_info["stories"] = scenario.num_stories
+    sync_report(measurement)
+
+
+# =============================================================================
+# Sync Benchmarks
+# =============================================================================
+
+
+@pytest.mark.parametrize("num_stories", list(SIZES))
+class TestSyncBenchmarks:
+    """Benchmark each sync direction over growing epics."""
+
+    def test_push(self, benchmark, sync_report, tmp_path, num_stories):
+        """Benchmark markdown -> tracker sync."""
+        scenario = SyncScenario(tmp_path, num_stories)
+        run_sync_benchmark(benchmark, sync_report, scenario, _push, SIZES[num_stories])
+
+    def test_pull(self, benchmark, sync_report, tmp_path, num_stories):
+        """Benchmark tracker -> markdown sync."""
+        scenario = SyncScenario(tmp_path, num_stories)
+        run_sync_benchmark(benchmark, sync_report, scenario, _pull, SIZES[num_stories])
+
+    def test_bidirectional(self, benchmark, sync_report, tmp_path, num_stories):
+        """Benchmark bidirectional sync with local changes winning."""
+        scenario = SyncScenario(tmp_path, num_stories)
+        run_sync_benchmark(benchmark, sync_report, scenario, _bidirectional, SIZES[num_stories])
+
+
+class TestNetworkSyncBenchmarks:
+    """Benchmark syncs against a slow, rate-limited tracker."""
+
+    def test_push_with_latency(self, benchmark, sync_report, tmp_path):
+        """Benchmark push where request count dominates wall time."""
+        scenario = SyncScenario(tmp_path, 100, NETWORK)
+        run_sync_benchmark(benchmark, sync_report, scenario, _push, rounds=2)
+
+    def test_pull_with_latency(self, benchmark, sync_report, tmp_path):
+        """Benchmark pull paging through the epic's children."""
+        scenario = SyncScenario(tmp_path, 1000, NETWORK)
+        run_sync_benchmark(benchmark, sync_report, scenario, _pull, rounds=2)
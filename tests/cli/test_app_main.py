@@ -129,6 +129,16 @@ class TestCreateParser:
         args = parser.parse_args(["--watch", "-f", "test.md", "-e", "PROJ-123", "--debounce", "5"])
         assert args.debounce == 5
 
+    def test_parser_watch_directory_and_backend(self):
+        """Test watch mode with --input-dir and --watch-backend."""
+        parser = create_parser()
+        args = parser.parse_args(
+            ["--watch", "-d", "stories", "-e", "PROJ-123", "--watch-backend", "poll"]
+        )
+        assert args.input_dir == "stories"
+        assert args.watch_backend == "poll"
+        assert parser.parse_args(["--watch", "-d", "s", "-e", "P-1"]).watch_backend == "auto"
+
     def test_parser_webhook_port_flag(self):
         """Test --webhook-port argument."""
         parser = create_parser()
@@ -671,7 +671,7 @@ class TestRunSync:
 
     def test_run_sync_config_errors(self, console, base_cli_args, capsys):
         """Test run_sync returns error on config validation failure."""
-        with patch("spectryn.cli.app.EnvironmentConfigProvider") as MockProvider:
+        with patch("spectryn.adapters.config.EnvironmentConfigProvider") as MockProvider:
             mock_provider = MockProvider.return_value
             mock_provider.validate.return_value = ["Missing JIRA_URL"]
 
@@ -685,7 +685,7 @@ class TestRunSync:
         """Test run_sync returns error when markdown file not found."""
         base_cli_args.input = "/nonexistent/path/epic.md"
 
-        with patch("spectryn.cli.app.EnvironmentConfigProvider") as MockProvider:
+        with patch("spectryn.adapters.config.EnvironmentConfigProvider") as MockProvider:
             mock_provider = MockProvider.return_value
             mock_provider.validate.return_value = []
             mock_provider.config_file_path = None
@@ -705,8 +705,8 @@ class TestRunSync:
         base_cli_args.input = str(md_file)
 
         with (
-            patch("spectryn.cli.app.EnvironmentConfigProvider") as MockProvider,
-            patch("spectryn.cli.app.JiraAdapter") as MockAdapter,
+            patch("spectryn.adapters.config.EnvironmentConfigProvider") as MockProvider,
+            patch("spectryn.adapters.jira.JiraAdapter") as MockAdapter,
         ):
             mock_provider = MockProvider.return_value
             mock_provider.validate.return_value = []
@@ -731,9 +731,9 @@ class TestRunSync:
         base_cli_args.no_confirm = False
 
         with (
-            patch("spectryn.cli.app.EnvironmentConfigProvider") as MockProvider,
-            patch("spectryn.cli.app.JiraAdapter") as MockAdapter,
-            patch("spectryn.cli.app.SyncOrchestrator") as MockOrchestrator,
+            patch("spectryn.adapters.config.EnvironmentConfigProvider") as MockProvider,
+            patch("spectryn.adapters.jira.JiraAdapter") as MockAdapter,
+            patch("spectryn.application.sync.SyncOrchestrator") as MockOrchestrator,
             patch("spectryn.application.sync.StateStore") as MockStateStore,
         ):
             mock_provider = MockProvider.return_value
@@ -765,9 +765,9 @@ class TestRunSync:
         base_cli_args.input = str(md_file)
 
         with (
-            patch("spectryn.cli.app.EnvironmentConfigProvider") as MockProvider,
-            patch("spectryn.cli.app.JiraAdapter") as MockAdapter,
-            patch("spectryn.cli.app.SyncOrchestrator") as MockOrchestrator,
+            patch("spectryn.adapters.config.EnvironmentConfigProvider") as MockProvider,
+            patch("spectryn.adapters.jira.JiraAdapter") as MockAdapter,
+            patch("spectryn.application.sync.SyncOrchestrator") as MockOrchestrator,
             patch("spectryn.application.sync.StateStore") as MockStateStore,
         ):
             mock_provider = MockProvider.return_value
@@ -803,9 +803,9 @@ class TestRunSync:
         base_cli_args.export = str(export_file)
 
         with (
-            patch("spectryn.cli.app.EnvironmentConfigProvider") as MockProvider,
-            patch("spectryn.cli.app.JiraAdapter") as MockAdapter,
-            patch("spectryn.cli.app.SyncOrchestrator") as MockOrchestrator,
+            patch("spectryn.adapters.config.EnvironmentConfigProvider") as MockProvider,
+            patch("spectryn.adapters.jira.JiraAdapter") as MockAdapter,
+            patch("spectryn.application.sync.SyncOrchestrator") as MockOrchestrator,
             patch("spectryn.application.sync.StateStore") as MockStateStore,
         ):
             mock_provider = MockProvider.return_value
@@ -0,0 +1,87 @@
+"""
+Tests for CLI startup cost.
+
+Imports run in fresh interpreters so modules loaded by other tests don't
+hide eager imports.
+"""
+
+import ast
+import subprocess
+import sys
+
+import pytest
+
+
+# Generous ceiling for importing the CLI entry point; eager adapter
+# imports alone used to take well over a second. Wall-clock timing depends
+# on machine load, so it is only checked in benchmark runs.
+IMPORT_BUDGET_SECONDS = 1.0
+
+# Modules that must only load when a command needs them
+HEAVY_MODULES = [
+    "spectryn.adapters.asana",
+    "spectryn.adapters.jira",
+    "spectryn.adapters.llm",
+    "spectryn.adapters.websocket",
+    "spectryn.application.sync",
+    "spectryn.cli.commands.sync",
+    "aiohttp",
+    "requests",
+]
+
+
+def _run(code: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=60,
+    )
+
+
+def _cumulative_import_seconds(stderr: str, module: str) -> float:
+    """Read a module's cumulative import time from ``-X importtime`` output."""
+    for line in stderr.splitlines():
+        parts = [part.strip() for part in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1]) / 1_000_000
+    raise AssertionError(f"{module} not found in import timings")
+
+
+class TestStartup:
+    """Tests for lazy CLI imports."""
+
+    def test_cli_import_skips_heavy_modules(self):
+        """Importing the CLI loads no tracker, LLM or command modules."""
+        result = _run(
+            "import sys, spectryn.cli.app\n"
+            f"print([m for m in {HEAVY_MODULES!r} if m in sys.modules])"
+        )
+
+        assert result.stdout.strip() == "[]"
+
+    @pytest.mark.benchmark
+    def test_cli_import_within_budget(self):
+        """Importing the CLI stays within the startup budget."""
+        _run("import spectryn.cli.app")  # Warm bytecode caches
+        result = _run("import spectryn.cli.app")
+
+        assert _cumulative_import_seconds(result.stderr, "spectryn") < IMPORT_BUDGET_SECONDS
+
+    @pytest.mark.parametrize(
+        ("name", "module"),
+        [
+            ("JiraAdapter", "spectryn.adapters.jira"),
+            ("run_pull", "spectryn.cli.commands.pull"),
+        ],
+    )
+    def test_lazy_exports_import_defining_module(self, name, module):
+        """Lazy package exports import only the module that defines them."""
+        package = module.rsplit(".", 1)[0]
+        result = _run(
+            f"import sys\nfrom {package} import {name}\n"
+            f"print([m in sys.modules for m in ({module!r}, 'spectryn.adapters.asana')])"
+        )
+
+        assert ast.literal_eval(result.stdout.strip()) == [True, False]
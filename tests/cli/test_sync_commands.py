@@ -56,6 +56,8 @@ def mock_args():
     # Multi-tracker specific
     args.trackers = []
     args.primary_tracker = None
+    args.tracker_strategy = None
+    args.concurrency = 1
     # Attachment specific
     args.attachment_mode = "upload"
     # Sync links specific
@@ -0,0 +1,109 @@
+"""
+Tests for the domain event bus.
+"""
+
+from unittest.mock import MagicMock
+
+from spectryn.adapters.event_store import MemoryEventStore
+from spectryn.core.domain.events import (
+    DEFAULT_HISTORY_LIMIT,
+    DomainEvent,
+    EventBus,
+    SubtaskUpdated,
+    SyncStarted,
+)
+
+
+class TestEventBusHistory:
+    """Tests for EventBus history retention."""
+
+    def test_history_is_bounded_by_default(self):
+        """Test that history keeps only the most recent events."""
+        bus = EventBus()
+
+        for i in range(DEFAULT_HISTORY_LIMIT + 5):
+            bus.publish(SyncStarted(markdown_path=str(i)))
+
+        history = bus.get_history()
+        assert len(history) == DEFAULT_HISTORY_LIMIT
+        assert history[0].markdown_path == "5"
+
+    def test_unbounded_history(self):
+        """Test that history_limit=None keeps every event."""
+        bus = EventBus(history_limit=None)
+
+        for _ in range(20):
+            bus.publish(SyncStarted())
+
+        assert len(bus.get_history()) == 20
+
+    def test_get_history_since_cursor(self):
+        """Test reading only events published after a cursor."""
+        bus = EventBus(history_limit=10)
+        bus.publish(SyncStarted(markdown_path="a"))
+        cursor = bus.history_cursor
+        bus.publish(SyncStarted(markdown_path="b"))
+        bus.publish(SyncStarted(markdown_path="c"))
+
+        assert [e.markdown_path for e in bus.get_history(since=cursor)] == ["b", "c"]
+        assert bus.get_history(since=bus.history_cursor) == []
+
+    def test_cursor_survives_eviction_and_clear(self):
+        """Test that cursors stay valid as history is evicted or cleared."""
+        bus = EventBus(history_limit=2)
+        for path in "abcd":
+            bus.publish(SyncStarted(markdown_path=path))
+        cursor = bus.history_cursor
+        bus.clear_history()
+        bus.publish(SyncStarted(markdown_path="e"))
+
+        assert cursor == 4
+        assert [e.markdown_path for e in bus.get_history(since=cursor)] == ["e"]
+
+    def test_sampling_thins_history_but_not_handlers(self):
+        """Test that sampled event types are thinned in history only."""
+        bus = EventBus(history_sampling={SubtaskUpdated: 10})
+        handler = MagicMock()
+        bus.subscribe(DomainEvent, handler)
+
+        for _ in range(25):
+            bus.publish(SubtaskUpdated())
+        bus.publish(SyncStarted())
+
+        assert handler.call_count == 26
+        assert [type(e) for e in bus.get_history()] == [SubtaskUpdated] * 3 + [SyncStarted]
+
+    def test_evicted_events_spill_to_event_store(self):
+        """Test that events evicted from history are appended in batches."""
+        store = MemoryEventStore()
+        bus = EventBus(history_limit=3, spill_store=store, spill_batch_size=2)
+
+        for path in "abcdefg":
+            bus.publish(SyncStarted(markdown_path=path))
+
+        spilled = [e.event.markdown_path for e in store.read("history:events")]
+        assert spilled == ["a", "b", "c", "d"]
+        assert [e.markdown_path for e in bus.get_history()] == ["e", "f", "g"]
+
+    def test_flush_spill_writes_partial_batch(self):
+        """Test that flush_spill writes pending evicted events."""
+        store = MemoryEventStore()
+        bus = EventBus(history_limit=1, spill_store=store, spill_stream_id="spill")
+
+        bus.publish(SyncStarted(markdown_path="a"))
+        bus.publish(SyncStarted(markdown_path="b"))
+        bus.flush_spill()
+
+        assert [e.event.markdown_path for e in store.read("spill")] == ["a"]
+
+    def test_spill_failure_does_not_break_publish(self):
+        """Test that a failing spill store is logged, not raised."""
+        store = MagicMock()
+        store.append.side_effect = OSError("disk full")
+        bus = EventBus(history_limit=1, spill_store=store, spill_batch_size=1)
+
+        bus.publish(SyncStarted())
+        bus.publish(SyncStarted())
+
+        store.append.assert_called_once()
+        assert len(bus.get_history()) == 1
@@ -0,0 +1,229 @@
+"""
+Tests for the persistent parse cache.
+"""
+
+import json
+import os
+import pickle
+import zlib
+from unittest.mock import patch
+
+import pytest
+
+from spectryn.adapters.parsers import MarkdownParser
+from spectryn.adapters.parsers.schema_validation import ValidatingParser
+from spectryn.core.parse_cache import (
+    ParseCache,
+    get_parse_cache,
+    parser_fingerprint,
+    set_parse_cache,
+)
+
+
+EPIC_MARKDOWN = """# PROJ-100: Cache Epic
+
+### 📋 PROJ-101: First Story
+
+| Field | Value |
+|-------|-------|
+| **Story Points** | 3 |
+| **Status** | 📋 Planned |
+
+#### Description
+
+**As a** user
+**I want** cached parsing
+**So that** commands start faster
+
+### 📋 PROJ-102: Second Story
+
+| Field | Value |
+|-------|-------|
+| **Story Points** | 5 |
+| **Status** | ✅ Done |
+
+#### Description
+
+**As a** developer
+**I want** fewer re-parses
+**So that** CI is cheaper
+"""
+
+
+class _Exploit:
+    """Pickles to a call that creates a marker file when loaded."""
+
+    def __init__(self, path):
+        self.path = path
+
+    def __reduce__(self):
+        return (os.mkdir, (self.path,))
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Install a parse cache for the duration of a test."""
+    parse_cache = ParseCache(tmp_path / "parse")
+    set_parse_cache(parse_cache)
+    yield parse_cache
+    set_parse_cache(None)
+
+
+@pytest.fixture
+def epic_file(tmp_path):
+    path = tmp_path / "EPIC.md"
+    path.write_text(EPIC_MARKDOWN, encoding="utf-8")
+    return path
+
+
+class TestParseCache:
+    """Tests for ParseCache storage."""
+
+    def test_disabled_by_default(self):
+        assert get_parse_cache() is None
+
+    def test_put_and_get_roundtrip(self, tmp_path):
+        cache = ParseCache(tmp_path)
+
+        assert cache.put("ab" * 32, {"stories": [1, 2]})
+        assert cache.get("ab" * 32) == {"stories": [1, 2]}
+        assert cache.get("cd" * 32, "missing") == "missing"
+        assert cache.stats.to_dict() == {"hits": 1, "misses": 1, "writes": 1, "errors": 0}
+
+    def test_corrupt_entry_is_discarded(self, tmp_path):
+        cache = ParseCache(tmp_path)
+        cache.put("ab" * 32, [1])
+        entry = next(tmp_path.glob("*/*.bin"))
+        entry.write_bytes(b"not zlib")
+
+        assert cache.get("ab" * 32) is None
+        assert cache.stats.errors == 1
+        assert not entry.exists()
+
+    def test_pickled_entry_is_not_executed(self, tmp_path):
+        cache = ParseCache(tmp_path)
+        cache.put("ab" * 32, [1])
+        entry = next(tmp_path.glob("*/*.bin"))
+        marker = tmp_path / "pwned"
+        payload = pickle.dumps(_Exploit(str(marker)))
+        entry.write_bytes(zlib.compress(payload))
+
+        assert cache.get("ab" * 32) is None
+        assert not marker.exists()
+        assert not entry.exists()
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"t": "obj", "c": "Path", "v": {}},
+            {"t": "obj", "c": "UserStory", "v": {"__class__": "x"}},
+            {"t": "enum", "c": "UserStory", "v": "PLANNED"},
+            {"t": "mystery"},
+        ],
+        ids=["unknown-type", "unknown-field", "not-an-enum", "unknown-tag"],
+    )
+    def test_entries_only_decode_domain_types(self, tmp_path, payload):
+        cache = ParseCache(tmp_path)
+        cache.put("ab" * 32, [1])
+        entry = next(tmp_path.glob("*/*.bin"))
+        entry.write_bytes(zlib.compress(json.dumps(payload).encode()))
+
+        assert cache.get("ab" * 32, "missing") == "missing"
+        assert cache.stats.errors == 1
+
+    def test_non_domain_values_are_not_cached(self, tmp_path):
+        cache = ParseCache(tmp_path)
+
+        assert not cache.put("ab" * 32, [object()])
+        assert cache.stats.errors == 1
+        assert not list(tmp_path.glob("*/*.bin"))
+
+    def test_clear(self, tmp_path):
+        cache = ParseCache(tmp_path)
+        cache.put("ab" * 32, 1)
+        cache.put("cd" * 32, 2)
+
+        assert cache.clear() == 2
+        assert cache.get("ab" * 32) is None
+
+
+class TestCachedParsing:
+    """Tests for transparent caching of DocumentParserPort implementations."""
+
+    def test_second_parse_is_served_from_cache(self, cache, epic_file):
+        first = MarkdownParser().parse_stories(epic_file)
+
+        with patch.object(MarkdownParser, "_parse_all_stories") as parse_all:
+            second = MarkdownParser().parse_stories(epic_file)
+
+        parse_all.assert_not_called()
+        assert [str(s.id) for s in second] == [str(s.id) for s in first] == ["PROJ-101", "PROJ-102"]
+        assert second[1].story_points == 5
+        assert cache.stats.hits == 1
+        assert cache.stats.writes == 1
+
+    def test_content_change_invalidates(self, cache, epic_file):
+        MarkdownParser().parse_stories(epic_file)
+        epic_file.write_text(EPIC_MARKDOWN.replace("PROJ-102", "PROJ-103"), encoding="utf-8")
+
+        stories = MarkdownParser().parse_stories(epic_file)
+
+        assert [str(s.id) for s in stories] == ["PROJ-101", "PROJ-103"]
+        assert cache.stats.hits == 0
+
+    def test_content_string_source(self, cache):
+        MarkdownParser().parse_epic(EPIC_MARKDOWN)
+        epic = MarkdownParser().parse_epic(EPIC_MARKDOWN)
+
+        assert epic is not None
+        assert len(epic.stories) == 2
+        assert cache.stats.hits == 1
+
+    def test_operations_and_options_are_keyed_separately(self, cache, epic_file):
+        MarkdownParser().parse_stories(epic_file)
+        MarkdownParser().parse_epic(epic_file)
+        MarkdownParser(story_pattern=MarkdownParser.STORY_PATTERN).parse_stories(epic_file)
+
+        assert cache.stats.hits == 0
+        assert cache.stats.writes == 3
+
+    def test_cached_epic_matches_parsed_epic(self, cache, epic_file):
+        parsed = MarkdownParser().parse_epic(epic_file)
+        cached = MarkdownParser().parse_epic(epic_file)
+
+        assert cache.stats.hits == 1
+        assert cached == parsed
+        assert cached.stories[0].acceptance_criteria == parsed.stories[0].acceptance_criteria
+
+    def test_mutating_result_does_not_affect_cache(self, cache, epic_file):
+        MarkdownParser().parse_stories(epic_file)[0].title = "Changed"
+
+        stories = MarkdownParser().parse_stories(epic_file)
+
+        assert stories[0].title == "First Story"
+
+    def test_parser_upgrade_invalidates(self, cache, epic_file):
+        MarkdownParser().parse_stories(epic_file)
+
+        with patch("spectryn.core.parse_cache.parser_fingerprint", return_value="upgraded"):
+            MarkdownParser().parse_stories(epic_file)
+
+        assert cache.stats.hits == 0
+        assert cache.stats.writes == 2
+
+    def test_directory_sources_bypass_cache(self, cache, tmp_path, epic_file):
+        MarkdownParser().parse_stories(tmp_path)
+
+        assert cache.stats.to_dict() == {"hits": 0, "misses": 0, "writes": 0, "errors": 0}
+
+    def test_validating_parser_caches_wrapped_parser_only(self, cache, epic_file):
+        parser = ValidatingParser(MarkdownParser())
+        parser.parse_stories(epic_file)
+        parser.parse_stories(epic_file)
+
+        assert cache.stats.hits == 1
+        assert parser.last_validation_result is not None
+
+    def test_fingerprint_is_stable(self):
+        assert parser_fingerprint(MarkdownParser) == parser_fingerprint(MarkdownParser)
+        assert parser_fingerprint(MarkdownParser) is not None
@@ -0,0 +1,142 @@
+"""
+Tests for parsing files in worker processes.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from spectryn.adapters.parsers import MarkdownParser
+from spectryn.core.parse_cache import ParseCache, set_parse_cache
+from spectryn.core.parse_pool import (
+    can_parse_in_processes,
+    get_parse_processes,
+    parse_files,
+    set_parse_processes,
+)
+
+
+STORY_TEMPLATE = """# {story_id}: Story {number}
+
+> **Story ID**: {story_id}
+> **Points**: {number}
+> **Status**: Planned
+
+## User Story
+
+**As a** user
+**I want** story {number}
+**So that** it is parsed in a worker
+"""
+
+
+def write_story_files(directory, count):
+    paths = []
+    for number in range(1, count + 1):
+        path = directory / f"US-{number:03d}.md"
+        path.write_text(
+            STORY_TEMPLATE.format(story_id=f"US-{number:03d}", number=number), encoding="utf-8"
+        )
+        paths.append(path)
+    return paths
+
+
+class UnpicklableParser(MarkdownParser):
+    """Markdown parser holding state that cannot be sent to a process."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.hook = lambda story: story
+
+
+class TestParseFiles:
+    """Tests for parse_files."""
+
+    def test_parses_in_processes_preserving_order(self, tmp_path):
+        paths = write_story_files(tmp_path, 6)
+
+        results = parse_files(MarkdownParser(), paths, max_workers=2, min_files=1)
+
+        assert [parsed.path for parsed in results] == paths
+        assert [str(parsed.unwrap()[0].id) for parsed in results] == [
+            f"US-{n:03d}" for n in range(1, 7)
+        ]
+
+    def test_workers_are_not_forked(self, tmp_path):
+        paths = write_story_files(tmp_path, 2)
+
+        with patch(
+            "spectryn.core.parse_pool.ProcessPoolExecutor", side_effect=OSError("no pools")
+        ) as executor:
+            parse_files(MarkdownParser(), paths, max_workers=2, min_files=1)
+
+        assert executor.call_args.kwargs["mp_context"].get_start_method() != "fork"
+
+    def test_errors_are_captured_per_file(self, tmp_path):
+        paths = write_story_files(tmp_path, 2)
+        missing = tmp_path / "US-999.md"
+
+        results = parse_files(MarkdownParser(), [paths[0], missing, paths[1]], min_files=1)
+
+        assert [parsed.ok for parsed in results] == [True, False, True]
+        with pytest.raises(FileNotFoundError):
+            results[1].unwrap()
+
+    def test_small_batches_parse_in_process(self, tmp_path):
+        paths = write_story_files(tmp_path, 2)
+
+        with patch("spectryn.core.parse_pool.ProcessPoolExecutor") as executor:
+            results = parse_files(MarkdownParser(), paths)
+
+        executor.assert_not_called()
+        assert all(parsed.ok for parsed in results)
+
+    def test_unpicklable_parser_parses_in_process(self, tmp_path):
+        paths = write_story_files(tmp_path, 3)
+        parser = UnpicklableParser()
+
+        with patch("spectryn.core.parse_pool.ProcessPoolExecutor") as executor:
+            results = parse_files(parser, paths, min_files=1)
+
+        assert not can_parse_in_processes(parser)
+        executor.assert_not_called()
+        assert len(results) == 3
+
+    def test_workers_write_to_parent_parse_cache(self, tmp_path):
+        (tmp_path / "specs").mkdir()
+        paths = write_story_files(tmp_path / "specs", 4)
+        set_parse_cache(ParseCache(tmp_path / "cache"))
+        try:
+            parse_files(MarkdownParser(), paths, max_workers=2, min_files=1)
+        finally:
+            set_parse_cache(None)
+
+        assert len(list((tmp_path / "cache").glob("*/*.bin"))) == 4
+
+
+class TestDirectoryParsing:
+    """Tests for MarkdownParser directory parsing through the pool."""
+
+    def test_directory_parses_in_process_by_default(self, tmp_path):
+        write_story_files(tmp_path, 10)
+
+        with patch("spectryn.core.parse_pool.ProcessPoolExecutor") as executor:
+            stories = MarkdownParser().parse_stories(tmp_path)
+
+        assert get_parse_processes() == 1
+        executor.assert_not_called()
+        assert len(stories) == 10
+
+    def test_large_directory_matches_serial_parse(self, tmp_path):
+        write_story_files(tmp_path, 10)
+        parser = MarkdownParser()
+
+        set_parse_processes(2)
+        try:
+            parallel = parser.parse_stories(tmp_path)
+        finally:
+            set_parse_processes(1)
+        serial = [s for path in sorted(tmp_path.glob("*.md")) for s in parser.parse_stories(path)]
+
+        assert [str(s.id) for s in parallel] == [str(s.id) for s in serial]
+        assert [s.story_points for s in parallel] == list(range(1, 11))
@@ -191,6 +191,66 @@ class TestJiraApiClientIntegration:
             assert result["total"] == 2
             mock_request.assert_called_once()
 
+    def test_iter_search_jql_follows_next_page_token(self, jira_config):
+        """Test iter_search_jql paginates until the last page."""
+        client = JiraApiClient(
+            base_url=jira_config.url,
+            email=jira_config.email,
+            api_token=jira_config.api_token,
+            dry_run=True,
+        )
+        pages = [
+            {"issues": [{"key": "TEST-1"}, {"key": "TEST-2"}], "nextPageToken": "p2"},
+            {"issues": [{"key": "TEST-3"}], "nextPageToken": "p3", "isLast": True},
+        ]
+
+        with patch.object(client, "search_jql", side_effect=pages) as mock_search:
+            result = list(client.iter_search_jql("parent = TEST-0", ["summary"], page_size=2))
+
+        assert [[i["key"] for i in page] for page in result] == [["TEST-1", "TEST-2"], ["TEST-3"]]
+        assert mock_search.call_args_list[0].kwargs["next_page_token"] is None
+        assert mock_search.call_args_list[1].kwargs["next_page_token"] == "p2"
+
+    def test_iter_search_jql_respects_max_results(self, jira_config):
+        """Test iter_search_jql stops once max_results issues are yielded."""
+        client = JiraApiClient(
+            base_url=jira_config.url,
+            email=jira_config.email,
+            api_token=jira_config.api_token,
+            dry_run=True,
+        )
+        page = {"issues": [{"key": f"TEST-{i}"} for i in range(3)], "nextPageToken": "next"}
+
+        with patch.object(client, "search_jql", return_value=page) as mock_search:
+            result = list(
+                client.iter_search_jql("project = TEST", ["summary"], page_size=3, max_results=5)
+            )
+
+        assert [len(p) for p in result] == [3, 2]
+        assert mock_search.call_args_list[1].kwargs["max_results"] == 2
+
+    def test_iter_search_jql_prefetches_next_page(self, jira_config):
+        """Test prefetch mode streams every page in order."""
+        client = JiraApiClient(
+            base_url=jira_config.url,
+            email=jira_config.email,
+            api_token=jira_config.api_token,
+            dry_run=True,
+        )
+        pages = [
+            {"issues": [{"key": "TEST-1"}], "nextPageToken": "p2"},
+            {"issues": [{"key": "TEST-2"}], "isLast": True},
+        ]
+
+        with patch.object(client, "search_jql", side_effect=pages) as mock_search:
+            stream = client.iter_search_jql("parent = TEST-0", ["summary"], prefetch=True)
+            first = next(stream)
+            rest = list(stream)
+
+        assert first == [{"key": "TEST-1"}]
+        assert rest == [[{"key": "TEST-2"}]]
+        assert mock_search.call_count == 2
+
     def test_connection_test_success(self, jira_config, mock_myself_response):
         """Test connection test returns True on success."""
         client = JiraApiClient(